@@ -41,6 +41,9 @@ from .hole_pattern_checker import (
     HolePatternChecker, HoleLocation, HoleType, AlignmentResult,
     EdgeDistanceResult, HoleStandardResult, PatternMatch, PatternCheckReport, CheckStatus,
 )
+from .hole_matcher import (
+    PointMatching, RigidTransform2D, match_points, register_points,
+)
 from .red_flag_scanner import (
     RedFlagScanner, ScanResult, PartData, Severity, FlagCategory, quick_scan,
 )
@@ -166,6 +169,10 @@ __all__ = [
     "PatternMatch",
     "PatternCheckReport",
     "CheckStatus",
+    "PointMatching",
+    "RigidTransform2D",
+    "match_points",
+    "register_points",
     "RedFlagScanner",
     "ScanResult",
     "DrawingPart",
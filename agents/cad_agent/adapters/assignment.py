@@ -0,0 +1,172 @@
+"""
+Assignment
+==========
+One-to-one assignment over sparse candidate pairs.
+
+Matching problems in the checkers (holes on mating plates, BOM lines to
+drawings) produce a few candidate pairs per item. Pairs whose two ends
+have no other candidate are taken directly; the remaining pairs are solved
+exactly by successive shortest augmenting paths over the sparse candidate
+graph, so the cost follows the ambiguity rather than the input size.
+Results are deterministic for a given candidate list.
+
+Usage:
+    from agents.cad_agent.adapters.assignment import solve_assignment
+
+    chosen = solve_assignment([(0, 0, 0.02), (0, 1, 0.01), (1, 1, 0.03)])
+"""
+
+import heapq
+import itertools
+import math
+from typing import Optional
+
+_ROW, _COL = 0, 1
+
+
+def _shortest_path_assignment(
+    adjacency: dict[int, list[tuple[int, float]]],
+    unpaired: float,
+) -> dict[int, int]:
+    """
+    Minimum-cost assignment on a sparse bipartite graph.
+
+    Successive shortest augmenting paths (Dijkstra with potentials). Every
+    row also has a private "unpaired" column at cost ``unpaired``, so each
+    row can always be placed; rows that end up there are left out of the
+    result. Each search stops at the first free column it reaches.
+
+    Ties go to the lowest index, as with the Hungarian solver this
+    replaced: rows are placed in index order, each row tries its columns
+    in (cost, column) order, and equal-distance nodes are settled first
+    come, first served, so a later row never displaces an earlier one or
+    takes a higher column for no gain.
+
+    Args:
+        adjacency: row -> [(column, cost)]
+        unpaired: Cost of leaving a row without a real column
+
+    Returns:
+        row -> column for paired rows
+    """
+    ordered = {row: sorted(adjacency[row], key=lambda option: (option[1], option[0])) for row in sorted(adjacency)}
+
+    def options(row):
+        yield from ordered[row]
+        yield ("unpaired", row), unpaired
+
+    # Potentials keep reduced costs (cost - u[row] - v[col]) non-negative
+    u = {row: min(cost for _, cost in options(row)) for row in ordered}
+    v: dict = {}
+    row_col: dict = {}
+    col_row: dict = {}
+
+    for start in ordered:
+        row_dist = {start: 0.0}
+        col_dist: dict = {}
+        reached_from: dict = {}
+        settled_cols: list = []
+        settled: set = set()
+        heap = [(0.0, 0, _ROW, start)]
+        tie = itertools.count(1)
+        free_col, total = None, 0.0
+
+        while heap:
+            dist, _, kind, node = heapq.heappop(heap)
+            if kind == _COL:
+                if dist > col_dist[node]:
+                    continue
+                settled.add(node)
+                settled_cols.append(node)
+                owner = col_row.get(node)
+                if owner is None:
+                    free_col, total = node, dist
+                    break
+                if dist < row_dist.get(owner, math.inf):
+                    row_dist[owner] = dist
+                    heapq.heappush(heap, (dist, next(tie), _ROW, owner))
+                continue
+            if dist > row_dist[node]:
+                continue
+            for col, cost in options(node):
+                if col in settled:
+                    continue
+                # Clamped so rounding can't open a negative cycle
+                reduced = dist + max(0.0, cost - u[node] - v.get(col, 0.0))
+                if reduced < col_dist.get(col, math.inf):
+                    col_dist[col] = reduced
+                    reached_from[col] = node
+                    heapq.heappush(heap, (reduced, next(tie), _COL, col))
+
+        # Shift potentials of everything closer than the free column
+        for row, dist in row_dist.items():
+            if dist < total:
+                u[row] += total - dist
+        for col in settled_cols:
+            if col_dist[col] < total:
+                v[col] = v.get(col, 0.0) + col_dist[col] - total
+
+        # Augment along the path back to the start row
+        col = free_col
+        while True:
+            row = reached_from[col]
+            previous = row_col.get(row)
+            row_col[row] = col
+            col_row[col] = row
+            if row == start:
+                break
+            col = previous
+
+    return {row: col for row, col in row_col.items() if not (isinstance(col, tuple) and col[0] == "unpaired")}
+
+
+def solve_assignment(
+    edges: list[tuple[int, int, float]],
+    unpaired_cost: Optional[float] = None,
+) -> list[tuple[int, int, float]]:
+    """
+    Least-cost one-to-one subset of candidate edges.
+
+    Args:
+        edges: (left index, right index, cost) candidates
+        unpaired_cost: Cost of a pair not made. None pairs as many items as
+            possible before minimising cost (costs must be >= 0); a number
+            gives plain minimum total cost, e.g. 0 with cost = -score to
+            maximise the summed score
+
+    Returns:
+        Chosen edges (unordered)
+    """
+    degree_a: dict[int, int] = {}
+    degree_b: dict[int, int] = {}
+    for i, j, _ in edges:
+        degree_a[i] = degree_a.get(i, 0) + 1
+        degree_b[j] = degree_b.get(j, 0) + 1
+
+    chosen = [
+        e for e in edges
+        if degree_a[e[0]] == 1 and degree_b[e[1]] == 1 and (unpaired_cost is None or e[2] < unpaired_cost)
+    ]
+    ambiguous = [e for e in edges if degree_a[e[0]] > 1 or degree_b[e[1]] > 1]
+    if not ambiguous:
+        return chosen
+
+    adjacency: dict[int, list[tuple[int, float]]] = {}
+    costs = {}
+    for i, j, cost in ambiguous:
+        adjacency.setdefault(i, []).append((j, cost))
+        costs[(i, j)] = cost
+
+    if unpaired_cost is None:
+        # Leaving a row unpaired costs more than any full set of real pairs,
+        # so the solver maximises the number of pairs before minimising cost
+        unpaired = (len(adjacency) + 1) * (max(costs.values()) + 1.0)
+    else:
+        unpaired = unpaired_cost
+
+    for i, j in sorted(_shortest_path_assignment(adjacency, unpaired).items()):
+        chosen.append((i, j, costs[(i, j)]))
+    return chosen
+
+
+__all__ = ["solve_assignment"]
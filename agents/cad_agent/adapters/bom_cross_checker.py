@@ -16,6 +16,13 @@ References:
 - ACHE_CHECKLIST.md: BOM verification requirements
 - VERIFICATION_REQUIREMENTS.md: Cross-check workflow
 
+Matching:
+- Normalized keys are computed once per BOM item and drawing
+- Candidates come from blocking indexes (exact part number, part number
+  and description n-grams) instead of comparing every pair
+- Items are paired one-to-one by optimal assignment (most matches, then
+  highest total score), so results do not depend on BOM order
+
 Usage:
     from agents.cad_agent.adapters.bom_cross_checker import BOMChecker
 
@@ -26,11 +33,26 @@ Usage:
 import re
 import logging
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Optional, Union
 from enum import Enum
 
+from .assignment import solve_assignment
+
 logger = logging.getLogger("cad_agent.bom-cross-checker")
 
+# Minimum score for a BOM item and drawing to be paired
+MATCH_THRESHOLD = 0.5
+
+# Common material aliases
+MATERIAL_ALIASES = {
+    "a36": ["a36", "hr", "hot rolled", "crs"],
+    "a572": ["a572", "hsla", "high strength"],
+    "ss304": ["ss304", "304", "stainless 304", "18-8"],
+    "ss316": ["ss316", "316", "stainless 316"],
+    "al6061": ["al6061", "6061", "aluminum 6061"],
+    "galv": ["galv", "galvanized", "hdg", "g90"],
+}
+
 
 # =============================================================================
 # ENUMS & DATA MODELS
@@ -79,6 +101,18 @@ class DrawingPart:
     page_number: int = 0
 
 
+@dataclass
+class MatchKeys:
+    """Normalized fields of a BOM item or drawing, computed once for matching."""
+    part_number: str
+    description: str
+    material: str
+    finish: str
+    has_material: bool
+    has_finish: bool
+    weight: Optional[float]
+
+
 @dataclass
 class ItemMatch:
     """Result of matching BOM item to drawing part."""
@@ -124,6 +158,117 @@ class BOMCheckResult:
         }
 
 
+# =============================================================================
+# SIMILARITY (on normalized keys)
+# =============================================================================
+
+def _part_number_similarity(n1: str, n2: str) -> float:
+    if n1 == n2:
+        return 1.0
+
+    # Check if one contains the other
+    if n1 in n2 or n2 in n1:
+        return 0.9
+
+    # Check prefix match (common for revisions)
+    min_len = min(len(n1), len(n2))
+    matching = sum(1 for a, b in zip(n1, n2) if a == b)
+    if matching >= min_len * 0.8:
+        return 0.8
+
+    return matching / max(len(n1), len(n2)) if max(len(n1), len(n2)) > 0 else 0
+
+
+def _description_similarity(n1: str, n2: str) -> float:
+    if not n1 or not n2:
+        return 0.5  # Can't compare
+
+    if n1 == n2:
+        return 1.0
+
+    # Word-based comparison
+    words1 = set(n1.split())
+    words2 = set(n2.split())
+
+    if not words1 or not words2:
+        return 0.5
+
+    intersection = words1 & words2
+    union = words1 | words2
+
+    return len(intersection) / len(union) if union else 0
+
+
+def _material_similarity(n1: str, n2: str) -> float:
+    if n1 == n2:
+        return 1.0
+
+    # Check aliases
+    for base, alts in MATERIAL_ALIASES.items():
+        in1 = any(a in n1 for a in alts)
+        in2 = any(a in n2 for a in alts)
+        if in1 and in2:
+            return 0.9
+
+    # Check for common words
+    if any(word in n2 for word in n1.split()):
+        return 0.7
+
+    return 0.0
+
+
+# =============================================================================
+# CANDIDATE BLOCKING
+# =============================================================================
+
+def _ngrams(text: str, n: int = 3) -> set[str]:
+    if len(text) <= n:
+        return {text} if text else set()
+    return {text[k:k + n] for k in range(len(text) - n + 1)}
+
+
+class _CandidateIndex:
+    """
+    Blocking indexes over drawing keys.
+
+    Candidates for a BOM item are drawings with the same normalized part
+    number, plus the drawings sharing the most part-number and description
+    n-grams. N-grams found in a large share of drawings (common prefixes)
+    carry no signal and are not indexed.
+    """
+
+    def __init__(self, keys: list[MatchKeys], max_candidates: int = 20, max_share: float = 0.05):
+        self.max_candidates = max_candidates
+        self.by_part_number: dict[str, list[int]] = {}
+        self.part_grams: dict[str, list[int]] = {}
+        self.description_grams: dict[str, list[int]] = {}
+        for j, key in enumerate(keys):
+            self.by_part_number.setdefault(key.part_number, []).append(j)
+            for gram in _ngrams(key.part_number):
+                self.part_grams.setdefault(gram, []).append(j)
+            for gram in _ngrams(key.description):
+                self.description_grams.setdefault(gram, []).append(j)
+
+        limit = max(50, int(len(keys) * max_share))
+        for grams in (self.part_grams, self.description_grams):
+            for gram in [g for g, postings in grams.items() if len(postings) > limit]:
+                del grams[gram]
+
+    def _top_shared(self, grams: set[str], postings: dict[str, list[int]]) -> list[int]:
+        shared: dict[int, int] = {}
+        for gram in grams:
+            for j in postings.get(gram, ()):
+                shared[j] = shared.get(j, 0) + 1
+        ranked = sorted(shared.items(), key=lambda item: (-item[1], item[0]))
+        return [j for j, _ in ranked[:self.max_candidates]]
+
+    def candidates(self, key: MatchKeys) -> list[int]:
+        found = set(self.by_part_number.get(key.part_number, ()))
+        found.update(self._top_shared(_ngrams(key.part_number), self.part_grams))
+        found.update(self._top_shared(_ngrams(key.description), self.description_grams))
+        return sorted(found)
+
+
 # =============================================================================
 # BOM CROSS-CHECKER
 # =============================================================================
@@ -143,9 +288,20 @@ class BOMChecker:
         self,
         weight_tolerance: float = 0.10,
         strict_material_match: bool = False,
+        max_candidates: int = 20,
+        exhaustive_below: int = 100,
     ):
+        """
+        Args:
+            weight_tolerance: Allowed BOM vs drawing weight difference (fraction)
+            strict_material_match: Treat material differences as mismatches
+            max_candidates: Drawings kept per n-gram blocking index per BOM item
+            exhaustive_below: Score every pair when there are at most this many drawings
+        """
         self.weight_tolerance = weight_tolerance
         self.strict_material_match = strict_material_match
+        self.max_candidates = max_candidates
+        self.exhaustive_below = exhaustive_below
 
     def verify_bom(
         self,
@@ -165,27 +321,31 @@ class BOMChecker:
         logger.info(f"Verifying BOM: {len(bom_items)} items vs {len(drawing_parts)} drawings")
 
         matches = []
-        used_drawings = set()
         missing_from_drawings = []
         missing_from_bom = []
 
-        # Match each BOM item to a drawing
-        for bom_item in bom_items:
-            best_match = None
-            best_score = 0.0
-
-            for i, drawing in enumerate(drawing_parts):
-                if i in used_drawings:
-                    continue
-
-                score = self._calculate_match_score(bom_item, drawing)
-                if score > best_score:
-                    best_score = score
-                    best_match = (i, drawing)
-
-            if best_match and best_score >= 0.5:
-                idx, drawing = best_match
-                used_drawings.add(idx)
+        drawing_keys = [self._match_keys(d) for d in drawing_parts]
+        index = _CandidateIndex(drawing_keys, self.max_candidates)
+
+        # Score candidates (every pair for small drawing sets)
+        exhaustive = len(drawing_parts) <= self.exhaustive_below
+        scores: dict[tuple[int, int], float] = {}
+        for i, bom_item in enumerate(bom_items):
+            keys = self._match_keys(bom_item)
+            candidates = range(len(drawing_parts)) if exhaustive else index.candidates(keys)
+            for j in candidates:
+                score = self._score_keys(keys, drawing_keys[j])
+                if score >= MATCH_THRESHOLD:
+                    scores[(i, j)] = score
+
+        # Optimal one-to-one pairing with the highest total score
+        chosen = solve_assignment([(i, j, -score) for (i, j), score in scores.items()], unpaired_cost=0.0)
+        assigned = {i: j for i, j, _ in chosen}
+        logger.debug(f"Scored {len(scores)} candidate pairs of {len(bom_items) * len(drawing_parts)}")
+
+        for i, bom_item in enumerate(bom_items):
+            if i in assigned:
+                drawing = drawing_parts[assigned[i]]
 
                 # Determine match status and issues
                 status, issues = self._evaluate_match(bom_item, drawing)
@@ -195,7 +355,7 @@ class BOMChecker:
                     drawing_part=drawing,
                     status=status,
                     issues=issues,
-                    score=best_score,
+                    score=scores[(i, assigned[i])],
                 ))
             else:
                 # No matching drawing found
@@ -209,6 +369,7 @@ class BOMChecker:
                 ))
 
         # Find drawings not in BOM
+        used_drawings = set(assigned.values())
         for i, drawing in enumerate(drawing_parts):
             if i not in used_drawings:
                 missing_from_bom.append(drawing)
@@ -253,36 +414,52 @@ class BOMChecker:
             summary=summary,
         )
 
+    def _match_keys(self, part: Union[BOMItem, DrawingPart]) -> MatchKeys:
+        """Normalize the fields used for matching once per item."""
+        return MatchKeys(
+            part_number=self._normalize_part_number(part.part_number),
+            description=self._normalize(part.description),
+            material=self._normalize(part.material),
+            finish=self._normalize(part.finish),
+            has_material=bool(part.material),
+            has_finish=bool(part.finish),
+            weight=part.weight_each if isinstance(part, BOMItem) else part.weight,
+        )
+
     def _calculate_match_score(
         self,
         bom_item: BOMItem,
         drawing: DrawingPart,
     ) -> float:
         """Calculate how well a BOM item matches a drawing."""
+        return self._score_keys(self._match_keys(bom_item), self._match_keys(drawing))
+
+    def _score_keys(self, bom: MatchKeys, drawing: MatchKeys) -> float:
+        """Match score (0-1) from precomputed keys."""
         score = 0.0
         max_score = 0.0
 
         # Part number match (highest weight)
         max_score += 50
-        pn_score = self._compare_part_numbers(bom_item.part_number, drawing.part_number)
+        pn_score = _part_number_similarity(bom.part_number, drawing.part_number)
         score += pn_score * 50
 
         # Description match
         max_score += 20
-        desc_score = self._compare_descriptions(bom_item.description, drawing.description)
+        desc_score = _description_similarity(bom.description, drawing.description)
         score += desc_score * 20
 
         # Material match
         max_score += 15
-        if bom_item.material and drawing.material:
-            mat_score = self._compare_materials(bom_item.material, drawing.material)
+        if bom.has_material and drawing.has_material:
+            mat_score = _material_similarity(bom.material, drawing.material)
             score += mat_score * 15
 
         # Weight match
         max_score += 10
-        if bom_item.weight_each and drawing.weight:
-            diff = abs(bom_item.weight_each - drawing.weight)
-            diff_pct = diff / bom_item.weight_each if bom_item.weight_each > 0 else 1.0
+        if bom.weight and drawing.weight:
+            diff = abs(bom.weight - drawing.weight)
+            diff_pct = diff / bom.weight if bom.weight > 0 else 1.0
             if diff_pct <= 0.05:
                 score += 10
             elif diff_pct <= 0.15:
@@ -290,8 +467,8 @@ class BOMChecker:
 
         # Finish match
         max_score += 5
-        if bom_item.finish and drawing.finish:
-            if self._normalize(bom_item.finish) == self._normalize(drawing.finish):
+        if bom.has_finish and drawing.has_finish:
+            if bom.finish == drawing.finish:
                 score += 5
 
         return score / max_score if max_score > 0 else 0.0
@@ -347,78 +524,15 @@ class BOMChecker:
 
     def _compare_part_numbers(self, pn1: str, pn2: str) -> float:
         """Compare two part numbers with fuzzy matching."""
-        # Normalize
-        n1 = self._normalize_part_number(pn1)
-        n2 = self._normalize_part_number(pn2)
-
-        if n1 == n2:
-            return 1.0
-
-        # Check if one contains the other
-        if n1 in n2 or n2 in n1:
-            return 0.9
-
-        # Check prefix match (common for revisions)
-        min_len = min(len(n1), len(n2))
-        matching = sum(1 for a, b in zip(n1, n2) if a == b)
-        if matching >= min_len * 0.8:
-            return 0.8
-
-        return matching / max(len(n1), len(n2)) if max(len(n1), len(n2)) > 0 else 0
+        return _part_number_similarity(self._normalize_part_number(pn1), self._normalize_part_number(pn2))
 
     def _compare_descriptions(self, desc1: str, desc2: str) -> float:
         """Compare descriptions with fuzzy matching."""
-        n1 = self._normalize(desc1)
-        n2 = self._normalize(desc2)
-
-        if not n1 or not n2:
-            return 0.5  # Can't compare
-
-        if n1 == n2:
-            return 1.0
-
-        # Word-based comparison
-        words1 = set(n1.split())
-        words2 = set(n2.split())
-
-        if not words1 or not words2:
-            return 0.5
-
-        intersection = words1 & words2
-        union = words1 | words2
-
-        return len(intersection) / len(union) if union else 0
+        return _description_similarity(self._normalize(desc1), self._normalize(desc2))
 
     def _compare_materials(self, mat1: str, mat2: str) -> float:
         """Compare materials with fuzzy matching."""
-        n1 = self._normalize(mat1)
-        n2 = self._normalize(mat2)
-
-        if n1 == n2:
-            return 1.0
-
-        # Common material aliases
-        aliases = {
-            "a36": ["a36", "hr", "hot rolled", "crs"],
-            "a572": ["a572", "hsla", "high strength"],
-            "ss304": ["ss304", "304", "stainless 304", "18-8"],
-            "ss316": ["ss316", "316", "stainless 316"],
-            "al6061": ["al6061", "6061", "aluminum 6061"],
-            "galv": ["galv", "galvanized", "hdg", "g90"],
-        }
-
-        # Check aliases
-        for base, alts in aliases.items():
-            in1 = any(a in n1 for a in alts)
-            in2 = any(a in n2 for a in alts)
-            if in1 and in2:
-                return 0.9
-
-        # Check for common words
-        if any(word in n2 for word in n1.split()):
-            return 0.7
-
-        return 0.0
+        return _material_similarity(self._normalize(mat1), self._normalize(mat2))
 
     def _normalize(self, text: str) -> str:
         """Normalize text for comparison."""
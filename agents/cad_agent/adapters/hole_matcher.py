@@ -0,0 +1,402 @@
+"""
+Hole Matcher
+============
+Spatial-index matching of two hole patterns.
+
+Used by HolePatternChecker and CrossPartValidator to pair holes on mating
+parts. Plates such as tube sheets and header plates carry thousands of
+holes, so pairing every hole against every other one is too slow.
+
+- Candidate pairs come from a uniform grid hash (cell = tolerance), queried
+  with NumPy, so each hole only looks at its neighbouring cells
+- Pairing is one-to-one and optimal: most holes matched, then least total
+  offset (see assignment.solve_assignment)
+- Optional registration finds the in-plane rotation and translation that
+  brings pattern B onto pattern A (holes given in each part's own
+  coordinates)
+
+Without NumPy the candidate search falls back to a pairwise scan and
+registration is skipped.
+
+Usage:
+    from agents.cad_agent.adapters.hole_matcher import match_points, register_points
+
+    transform = register_points(points_a, points_b, tolerance=0.0625)
+    result = match_points(points_a, transform.apply(points_b), tolerance=0.0625)
+"""
+
+import itertools
+import logging
+import math
+from dataclasses import dataclass, field
+from typing import Sequence
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+from .assignment import solve_assignment
+
+logger = logging.getLogger("cad_agent.hole-matcher")
+
+Point = Sequence[float]
+
+# Keep grid keys inside int64: at most 2^20 cells per axis
+_MAX_CELLS_PER_AXIS = 1 << 20
+
+# Candidate pairs materialised at once per grid query
+_PAIR_CHUNK = 1 << 20
+
+
+# =============================================================================
+# DATA MODELS
+# =============================================================================
+
+@dataclass
+class RigidTransform2D:
+    """Rotation about Z followed by a translation in XY; Z is unchanged."""
+    rotation: float = 0.0  # radians
+    dx: float = 0.0
+    dy: float = 0.0
+
+    @property
+    def degrees(self) -> float:
+        return math.degrees(self.rotation)
+
+    @property
+    def is_identity(self) -> bool:
+        return self.rotation == 0.0 and self.dx == 0.0 and self.dy == 0.0
+
+    def apply(self, points):
+        """Transform points given as an (n, d) array or a list of tuples (d >= 2)."""
+        if self.is_identity:
+            return points
+        cos_t, sin_t = math.cos(self.rotation), math.sin(self.rotation)
+        if NUMPY_AVAILABLE and isinstance(points, np.ndarray):
+            out = points.astype(float, copy=True)
+            out[:, 0] = cos_t * points[:, 0] - sin_t * points[:, 1] + self.dx
+            out[:, 1] = sin_t * points[:, 0] + cos_t * points[:, 1] + self.dy
+            return out
+        return [
+            (cos_t * p[0] - sin_t * p[1] + self.dx, sin_t * p[0] + cos_t * p[1] + self.dy, *p[2:])
+            for p in points
+        ]
+
+    def describe(self) -> str:
+        return f"rotated {self.degrees:.2f}°, offset ({self.dx:.4f}\", {self.dy:.4f}\")"
+
+
+@dataclass
+class PointMatching:
+    """One-to-one pairing of two point sets."""
+    pairs: list[tuple[int, int]] = field(default_factory=list)  # (index in A, index in B), by A
+    distances: list[float] = field(default_factory=list)
+    unmatched_a: list[int] = field(default_factory=list)
+    unmatched_b: list[int] = field(default_factory=list)
+
+
+# =============================================================================
+# GRID INDEX
+# =============================================================================
+
+def _metric(diff, metric: str):
+    if metric == "chebyshev":
+        return np.abs(diff).max(axis=1)
+    return np.sqrt((diff * diff).sum(axis=1))
+
+
+class GridIndex:
+    """
+    Uniform grid hash over points for fixed-radius neighbour queries.
+
+    Points are bucketed into cubic cells; a query visits the 3^d cells
+    around it. Cell keys are sorted once so lookups are binary searches.
+    """
+
+    def __init__(self, points, cell: float):
+        """
+        Args:
+            points: (n, d) coordinates
+            cell: Cell size; queries must use a radius no larger than this
+        """
+        self.points = np.asarray(points, dtype=float).reshape(len(points), -1)
+        n, dims = self.points.shape
+        self.dims = dims
+        if n:
+            low = self.points.min(axis=0)
+            extent = float((self.points.max(axis=0) - low).max())
+        else:
+            low, extent = np.zeros(dims), 0.0
+        self.cell = max(cell, extent / _MAX_CELLS_PER_AXIS, 1e-12)
+        self.origin = low - self.cell
+        cells = self._cells(self.points)
+        self.shape = (cells.max(axis=0) + 2) if n else np.ones(dims, dtype=np.int64)
+        self.strides = np.cumprod(np.concatenate([self.shape[1:], [1]])[::-1])[::-1].astype(np.int64)
+        keys = cells @ self.strides
+        self.order = np.argsort(keys, kind="stable")
+        self.keys = keys[self.order]
+
+    def _cells(self, points):
+        return np.floor((points - self.origin) / self.cell).astype(np.int64)
+
+    def query(self, queries, radius: float, metric: str = "euclidean"):
+        """
+        All (query, point) pairs within radius.
+
+        Args:
+            queries: (m, d) coordinates
+            radius: Search radius (<= cell size)
+            metric: "euclidean" or "chebyshev" (max per-axis offset)
+
+        Returns:
+            (query indices, point indices, distances) arrays
+        """
+        if radius > self.cell:
+            raise ValueError(f"radius {radius} exceeds grid cell {self.cell}")
+        if not len(queries) or not len(self.points):
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        queries = np.asarray(queries, dtype=float).reshape(len(queries), -1)
+        found_q, found_p, found_d = [], [], []
+
+        query_cells = self._cells(queries)
+        for offset in itertools.product((-1, 0, 1), repeat=self.dims):
+            cells = query_cells + np.array(offset)
+            valid = np.all((cells >= 0) & (cells < self.shape), axis=1)
+            keys = cells @ self.strides
+            starts = np.searchsorted(self.keys, keys, side="left")
+            counts = np.where(valid, np.searchsorted(self.keys, keys, side="right") - starts, 0)
+            for q, pos in _expand(starts, counts):
+                p = self.order[pos]
+                dist = _metric(queries[q] - self.points[p], metric)
+                keep = dist <= radius
+                found_q.append(q[keep])
+                found_p.append(p[keep])
+                found_d.append(dist[keep])
+
+        if not found_q:
+            empty = np.empty(0, dtype=np.int64)
+            return empty, empty, np.empty(0)
+        return np.concatenate(found_q), np.concatenate(found_p), np.concatenate(found_d)
+
+
+def _expand(starts, counts):
+    """Yield (row, position) arrays covering [start, start + count) per row, in chunks."""
+    cumulative = np.cumsum(counts)
+    first = 0
+    while first < len(counts):
+        base = cumulative[first - 1] if first else 0
+        last = max(int(np.searchsorted(cumulative, base + _PAIR_CHUNK, side="right")), first + 1)
+        block = counts[first:last]
+        total = int(block.sum())
+        if total:
+            rows = np.repeat(np.arange(first, last), block)
+            offsets = np.arange(total) - np.repeat(np.cumsum(block) - block, block)
+            yield rows, np.repeat(starts[first:last], block) + offsets
+        first = last
+
+
+# =============================================================================
+# MATCHING
+# =============================================================================
+
+def _distance(a: Point, b: Point, metric: str) -> float:
+    if metric == "chebyshev":
+        return max(abs(x - y) for x, y in zip(a, b))
+    return math.sqrt(sum((x - y) ** 2 for x, y in zip(a, b)))
+
+
+def _candidate_edges(points_a, points_b, tolerance: float, metric: str) -> list[tuple[int, int, float]]:
+    """(i, j, distance) for every A/B pair within tolerance."""
+    if NUMPY_AVAILABLE:
+        index = GridIndex(points_b, tolerance)
+        qi, pj, dist = index.query(points_a, tolerance, metric)
+        return list(zip(qi.tolist(), pj.tolist(), dist.tolist()))
+    edges = []
+    for i, a in enumerate(points_a):
+        for j, b in enumerate(points_b):
+            d = _distance(a, b, metric)
+            if d <= tolerance:
+                edges.append((i, j, d))
+    return edges
+
+
+def match_points(
+    points_a: Sequence[Point],
+    points_b: Sequence[Point],
+    tolerance: float,
+    metric: str = "euclidean",
+) -> PointMatching:
+    """
+    Pair points of A with points of B one-to-one within a tolerance.
+
+    Args:
+        points_a: Coordinates of pattern A (tuples or an (n, d) array)
+        points_b: Coordinates of pattern B, same dimension
+        tolerance: Largest allowed offset between paired points
+        metric: "euclidean" (straight-line offset) or "chebyshev"
+            (each axis offset within tolerance)
+
+    Returns:
+        PointMatching with pairs ordered by A index
+    """
+    n_a, n_b = len(points_a), len(points_b)
+    edges = _candidate_edges(points_a, points_b, tolerance, metric) if n_a and n_b else []
+    chosen = sorted(solve_assignment(edges))
+
+    matched_a = {i for i, _, _ in chosen}
+    matched_b = {j for _, j, _ in chosen}
+    return PointMatching(
+        pairs=[(i, j) for i, j, _ in chosen],
+        distances=[d for _, _, d in chosen],
+        unmatched_a=[i for i in range(n_a) if i not in matched_a],
+        unmatched_b=[j for j in range(n_b) if j not in matched_b],
+    )
+
+
+def nearest_points(
+    queries: Sequence[Point],
+    points: Sequence[Point],
+    metric: str = "euclidean",
+) -> list[tuple[int, float]]:
+    """
+    Nearest point (index, distance) for each query, with no distance limit.
+
+    Intended for the few holes left unmatched; each query scans all points.
+    """
+    if not len(queries):
+        return []
+    if not len(points):
+        return [(-1, math.inf) for _ in queries]
+    if not NUMPY_AVAILABLE:
+        nearest = []
+        for q in queries:
+            dists = [_distance(q, p, metric) for p in points]
+            j = min(range(len(dists)), key=dists.__getitem__)
+            nearest.append((j, dists[j]))
+        return nearest
+    pts = np.asarray(points, dtype=float).reshape(len(points), -1)
+    nearest = []
+    for q in np.asarray(queries, dtype=float).reshape(len(queries), -1):
+        dists = _metric(pts - q, metric)
+        j = int(np.argmin(dists))
+        nearest.append((j, float(dists[j])))
+    return nearest
+
+
+# =============================================================================
+# REGISTRATION
+# =============================================================================
+
+def _score(index: GridIndex, moved, tolerance: float) -> tuple[int, float]:
+    """(points of B landing within tolerance of A, summed nearest offsets)."""
+    q, _, dist = index.query(moved, tolerance)
+    if not len(q):
+        return 0, 0.0
+    best = np.full(len(moved), np.inf)
+    np.minimum.at(best, q, dist)
+    hit = np.isfinite(best)
+    return int(hit.sum()), float(best[hit].sum())
+
+
+def _fit(source, target) -> RigidTransform2D:
+    """Least-squares rotation + translation taking source XY onto target XY."""
+    src_c, tgt_c = source.mean(axis=0), target.mean(axis=0)
+    s, t = source - src_c, target - tgt_c
+    angle = math.atan2(float((s[:, 0] * t[:, 1] - s[:, 1] * t[:, 0]).sum()),
+                       float((s[:, 0] * t[:, 0] + s[:, 1] * t[:, 1]).sum()))
+    cos_t, sin_t = math.cos(angle), math.sin(angle)
+    dx = float(tgt_c[0] - (cos_t * src_c[0] - sin_t * src_c[1]))
+    dy = float(tgt_c[1] - (sin_t * src_c[0] + cos_t * src_c[1]))
+    return RigidTransform2D(angle, dx, dy)
+
+
+def register_points(
+    points_a: Sequence[Point],
+    points_b: Sequence[Point],
+    tolerance: float,
+    max_anchors: int = 16,
+) -> RigidTransform2D:
+    """
+    Find the in-plane rotation and translation that best lays B onto A.
+
+    Two far-apart holes of A are used as anchors; holes of B at the same
+    radius from B's centroid and the same spacing propose transforms,
+    each scored by how many holes of B land within tolerance of A. The
+    best proposal is refined by least squares over its matched holes.
+    The identity is kept unless a proposal matches more holes.
+
+    Args:
+        points_a: Reference pattern (x, y[, z])
+        points_b: Pattern to move onto A
+        tolerance: Offset at which two holes count as coincident
+        max_anchors: Candidate holes of B tried per anchor
+
+    Returns:
+        RigidTransform2D to apply to B (identity if nothing better is found)
+    """
+    if not NUMPY_AVAILABLE or not len(points_a) or not len(points_b):
+        return RigidTransform2D()
+
+    a = np.asarray(points_a, dtype=float).reshape(len(points_a), -1)[:, :2]
+    b = np.asarray(points_b, dtype=float).reshape(len(points_b), -1)[:, :2]
+    index = GridIndex(a, tolerance)
+
+    best = RigidTransform2D()
+    best_score = _score(index, b, tolerance)
+
+    def consider(transform: RigidTransform2D):
+        nonlocal best, best_score
+        score = _score(index, transform.apply(b), tolerance)
+        if score[0] > best_score[0] or (score[0] == best_score[0] and score[1] < best_score[1] - 1e-9):
+            best, best_score = transform, score
+
+    center_a, center_b = a.mean(axis=0), b.mean(axis=0)
+    anchor1 = int(np.argmax(((a - center_a) ** 2).sum(axis=1)))
+    anchor2 = int(np.argmax(((a - a[anchor1]) ** 2).sum(axis=1)))
+    radius = float(np.hypot(*(a[anchor1] - center_a)))
+    spacing = float(np.hypot(*(a[anchor2] - a[anchor1])))
+    angle_a = math.atan2(*(a[anchor2] - a[anchor1])[::-1])
+
+    radius_error = np.abs(np.hypot(*(b - center_b).T) - radius)
+    for b1 in np.argsort(radius_error, kind="stable")[:max_anchors]:
+        if spacing == 0.0:
+            consider(RigidTransform2D(0.0, *(a[anchor1] - b[b1])))
+            continue
+        spacing_error = np.abs(np.hypot(*(b - b[b1]).T) - spacing)
+        order = np.argsort(spacing_error, kind="stable")[:max_anchors]
+        for b2 in order[spacing_error[order] <= 2 * tolerance]:
+            angle = angle_a - math.atan2(*(b[b2] - b[b1])[::-1])
+            cos_t, sin_t = math.cos(angle), math.sin(angle)
+            x, y = b[b1]
+            consider(RigidTransform2D(
+                angle,
+                float(a[anchor1][0] - (cos_t * x - sin_t * y)),
+                float(a[anchor1][1] - (sin_t * x + cos_t * y)),
+            ))
+
+    # Refine on the holes the best proposal pairs up
+    for _ in range(2):
+        if best.is_identity:
+            break
+        matching = match_points(a, best.apply(b), tolerance)
+        if len(matching.pairs) < 2:
+            break
+        ia, ib = np.array(matching.pairs).T
+        consider(_fit(b[ib], a[ia]))
+
+    if not best.is_identity:
+        logger.debug(f"Registered pattern B: {best.describe()}, {best_score[0]} holes coincide")
+    return best
+
+
+__all__ = [
+    "GridIndex",
+    "PointMatching",
+    "RigidTransform2D",
+    "match_points",
+    "nearest_points",
+    "register_points",
+]
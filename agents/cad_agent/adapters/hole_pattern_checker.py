@@ -36,6 +36,7 @@ from .standards_db import (
     validate_hole_size,
     validate_edge_distance,
 )
+from .hole_matcher import match_points, nearest_points, register_points
 
 logger = logging.getLogger("cad_agent.hole-pattern-checker")
 
@@ -169,14 +170,20 @@ class HolePatternChecker:
         holes_a: list[HoleLocation],
         holes_b: list[HoleLocation],
         tolerance: Optional[float] = None,
+        register: bool = False,
     ) -> AlignmentResult:
         """
         Verify that hole patterns on two mating parts align.
 
+        Each hole pairs with at most one hole on the other part, choosing
+        the pairing that aligns the most holes with the least total offset.
+
         Args:
             holes_a: Holes from part A
             holes_b: Holes from part B
             tolerance: Alignment tolerance (default 1/16")
+            register: Holes are in each part's own coordinates; first find
+                the in-plane rotation/offset that lays B onto A
 
         Returns:
             AlignmentResult with match details
@@ -185,48 +192,50 @@ class HolePatternChecker:
 
         logger.info(f"Checking alignment: {len(holes_a)} holes vs {len(holes_b)} holes")
 
-        matches = []
-        unmatched_a = list(holes_a)
-        unmatched_b = list(holes_b)
-        max_misalignment = 0.0
-
-        # Find matching holes
-        for hole_a in holes_a:
-            best_match = None
-            best_distance = float('inf')
-
-            for hole_b in holes_b:
-                distance = self._calculate_distance(hole_a, hole_b)
+        points_a = [(h.x, h.y, h.z) for h in holes_a]
+        points_b = [(h.x, h.y, h.z) for h in holes_b]
+        transform = register_points(points_a, points_b, tolerance) if register else None
+        if transform is not None:
+            points_b = transform.apply(points_b)
 
-                if distance < best_distance:
-                    best_distance = distance
-                    best_match = hole_b
+        # One-to-one pairing within tolerance (grid index + optimal assignment)
+        pairing = match_points(points_a, points_b, tolerance)
+        paired = {i: (j, d) for (i, j), d in zip(pairing.pairs, pairing.distances)}
+        nearest = dict(zip(
+            pairing.unmatched_a,
+            nearest_points([points_a[i] for i in pairing.unmatched_a], points_b),
+        ))
 
-            if best_match and best_distance <= tolerance:
-                # Good match
+        matches = []
+        max_misalignment = 0.0
+        for i, hole_a in enumerate(holes_a):
+            if i in paired:
+                j, distance = paired[i]
                 matches.append(PatternMatch(
                     hole_a=hole_a,
-                    hole_b=best_match,
-                    distance=best_distance,
+                    hole_b=holes_b[j],
+                    distance=distance,
                     is_aligned=True,
-                    message=f"Aligned within {best_distance:.4f}\"",
+                    message=f"Aligned within {distance:.4f}\"",
                 ))
-
-                if hole_a in unmatched_a:
-                    unmatched_a.remove(hole_a)
-                if best_match in unmatched_b:
-                    unmatched_b.remove(best_match)
-
-            elif best_match:
-                # Close but out of tolerance
+            elif holes_b:
+                # Report the closest hole, which is out of tolerance or already paired
+                j, distance = nearest[i]
+                if distance <= tolerance:
+                    message = f"No free mating hole (nearest {distance:.4f}\" away is paired with another hole)"
+                else:
+                    message = f"Misaligned by {distance:.4f}\" (tolerance {tolerance}\")"
                 matches.append(PatternMatch(
                     hole_a=hole_a,
-                    hole_b=best_match,
-                    distance=best_distance,
+                    hole_b=holes_b[j],
+                    distance=distance,
                     is_aligned=False,
-                    message=f"Misaligned by {best_distance:.4f}\" (tolerance {tolerance}\")",
+                    message=message,
                 ))
-                max_misalignment = max(max_misalignment, best_distance)
+                max_misalignment = max(max_misalignment, distance)
+
+        unmatched_a = [holes_a[i] for i in pairing.unmatched_a]
+        unmatched_b = [holes_b[j] for j in pairing.unmatched_b]
 
         # Determine overall status
         if all(m.is_aligned for m in matches) and not unmatched_a and not unmatched_b:
@@ -243,6 +252,9 @@ class HolePatternChecker:
             status = CheckStatus.PASS
             message = "Pattern alignment verified"
 
+        if transform is not None and not transform.is_identity:
+            message += f" after registering B ({transform.describe()})"
+
         return AlignmentResult(
             status=status,
             matches=matches,
@@ -29,11 +29,17 @@ Usage:
     )
 """
 
-from typing import Optional
+from typing import Iterable, Optional
 from dataclasses import dataclass, field
 from enum import Enum
 import math
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
 
 # =============================================================================
 # ENUMS & DATA CLASSES
@@ -239,6 +245,160 @@ def check_2d_box_overlap(box_a: BoundingBox, box_b: BoundingBox) -> tuple[bool,
     return False, min(gaps) if gaps else 0.0
 
 
+# =============================================================================
+# BROAD PHASE
+# =============================================================================
+
+# Below this many items the plain pairwise loop is cheaper than building arrays
+BROAD_PHASE_MIN_ITEMS = 64
+
+# Candidate pairs materialised at once while sweeping
+_PAIR_CHUNK = 1 << 20
+
+
+def _sweep_axis(lo: "np.ndarray", hi: "np.ndarray", reach: float):
+    """
+    Sort-and-sweep along one axis.
+
+    Yields (i, j) index arrays, i < j, covering every pair whose intervals
+    overlap by more than -reach (reach=0: positive overlap; reach=t: gap < t).
+    The set may include a few extra pairs at float rounding boundaries;
+    callers re-check exactly.
+    """
+    order = np.argsort(lo, kind="stable")
+    lo_sorted = lo[order]
+    ends = np.searchsorted(lo_sorted, np.nextafter(hi[order] + reach, np.inf), side="left")
+    positions = np.arange(len(lo))
+    # Each sorted position pairs with the later positions starting before it ends
+    yield from _expand_ranges(order, positions + 1, ends, order)
+
+
+def _axis_overlap(lo: "np.ndarray", hi: "np.ndarray", i: "np.ndarray", j: "np.ndarray") -> "np.ndarray":
+    """Per-axis overlap for pairs, computed exactly as check_box_overlap does."""
+    return np.minimum(hi[i], hi[j]) - np.maximum(lo[i], lo[j])
+
+
+def find_candidate_pairs(lo: "np.ndarray", hi: "np.ndarray", reach: float = 0.0) -> "np.ndarray":
+    """
+    Pairs of boxes whose intervals overlap by more than -reach on every axis.
+
+    Sweeps along the axis that yields the fewest candidates and filters the
+    rest with array math.
+
+    Args:
+        lo: (n, d) array of box minimums
+        hi: (n, d) array of box maximums
+        reach: Gap still counted as touching (0 = strictly overlapping)
+
+    Returns:
+        (k, 2) int array of index pairs (i < j), sorted
+    """
+    n, dims = lo.shape
+    if n < 2:
+        return np.empty((0, 2), dtype=np.int64)
+
+    # Pick the sweep axis with the fewest candidate pairs
+    def candidates_on(axis):
+        lo_sorted = np.sort(lo[:, axis])
+        ends = np.searchsorted(lo_sorted, np.nextafter(np.sort(hi[:, axis]) + reach, np.inf))
+        return int(ends.sum())
+
+    sweep = min(range(dims), key=candidates_on)
+
+    found = []
+    for i, j in _sweep_axis(lo[:, sweep], hi[:, sweep], reach):
+        keep = np.ones(len(i), dtype=bool)
+        for axis in range(dims):
+            if axis != sweep:
+                keep &= _axis_overlap(lo[:, axis], hi[:, axis], i, j) > -reach
+        if keep.any():
+            found.append(np.stack([i[keep], j[keep]], axis=1))
+    return _sorted_unique_pairs(found, n)
+
+
+def _sorted_unique_pairs(chunks: list, n: int) -> "np.ndarray":
+    if not chunks:
+        return np.empty((0, 2), dtype=np.int64)
+    pairs = np.concatenate(chunks).astype(np.int64)
+    keys = np.unique(pairs[:, 0] * n + pairs[:, 1])
+    return np.stack([keys // n, keys % n], axis=1)
+
+
+def _near_axis(lo: "np.ndarray", hi: "np.ndarray", tolerance: float):
+    """
+    Yields (i, j) index arrays for pairs separated on one axis by a gap
+    below the tolerance (overlap <= 0 and > -tolerance).
+
+    Intervals either end before the other starts (hi_i <= lo_j < hi_i + tol),
+    or one is zero-length and lies inside the other (overlap exactly 0).
+    Only those pairs are enumerated, so the cost follows the output rather
+    than the number of pairs overlapping on this axis.
+    """
+    order = np.argsort(lo, kind="stable")
+    lo_sorted = lo[order]
+    starts = np.searchsorted(lo_sorted, hi, side="left")
+    ends = np.searchsorted(lo_sorted, np.nextafter(hi + tolerance, np.inf), side="left")
+    yield from _expand_ranges(np.arange(len(lo)), starts, ends, order)
+
+    points = np.flatnonzero(lo == hi)
+    if len(points):
+        # Intervals containing each zero-length one: lo_i <= v, then hi_i >= v
+        prefix = np.searchsorted(lo_sorted, lo[points], side="right")
+        for i, j in _expand_ranges(points, np.zeros_like(prefix), prefix, order):
+            inside = hi[j] >= lo[i]
+            yield i[inside], j[inside]
+
+
+def _expand_ranges(rows: "np.ndarray", starts: "np.ndarray", ends: "np.ndarray", order: "np.ndarray"):
+    """Yield (row, order[k]) for k in [start, end) per row, in bounded chunks, as (min, max) pairs."""
+    counts = np.maximum(ends - starts, 0)
+    cumulative = np.cumsum(counts)
+    first = 0
+    while first < len(rows):
+        base = cumulative[first - 1] if first else 0
+        last = max(int(np.searchsorted(cumulative, base + _PAIR_CHUNK, side="right")), first + 1)
+        block_counts = counts[first:last]
+        total = int(block_counts.sum())
+        if total:
+            a = np.repeat(rows[first:last], block_counts)
+            offsets = np.arange(total) - np.repeat(np.cumsum(block_counts) - block_counts, block_counts)
+            b = order[np.repeat(starts[first:last], block_counts) + offsets]
+            distinct = a != b
+            a, b = a[distinct], b[distinct]
+            yield np.minimum(a, b), np.maximum(a, b)
+        first = last
+
+
+def _reportable_pairs(lo: "np.ndarray", hi: "np.ndarray", tolerance: float) -> "np.ndarray":
+    """
+    Pairs the pairwise checks could report, in (i, j) order.
+
+    check_box_overlap reports a pair when it overlaps on every axis, or when
+    its smallest gap over the separated axes is below the tolerance. The
+    second case is a one-axis condition, so each axis is searched on its own
+    for near-touching intervals.
+    """
+    n, dims = lo.shape
+    found = [find_candidate_pairs(lo, hi, 0.0)]
+    if tolerance > 0:
+        for axis in range(dims):
+            for i, j in _near_axis(lo[:, axis], hi[:, axis], tolerance):
+                if len(i):
+                    found.append(np.stack([i, j], axis=1))
+    return _sorted_unique_pairs(found, n)
+
+
+def _pair_indices(boxes: list[BoundingBox], tolerance: float, dims: int = 3) -> Iterable[tuple[int, int]]:
+    """Index pairs to check: all pairs for small inputs, broad-phase candidates otherwise."""
+    n = len(boxes)
+    if not NUMPY_AVAILABLE or n < BROAD_PHASE_MIN_ITEMS:
+        return ((i, j) for i in range(n) for j in range(i + 1, n))
+    fields = ("x", "y", "z")[:dims]
+    lo = np.array([[getattr(b, f + "_min") for f in fields] for b in boxes], dtype=float)
+    hi = np.array([[getattr(b, f + "_max") for f in fields] for b in boxes], dtype=float)
+    return map(tuple, _reportable_pairs(lo, hi, tolerance).tolist())
+
+
 # =============================================================================
 # CIRCLE CLEARANCE CHECKS
 # =============================================================================
@@ -640,43 +800,43 @@ def check_assembly_interference(
         total_components=len(components)
     )
 
-    # Check all pairs
-    for i in range(len(components)):
-        for j in range(i + 1, len(components)):
-            comp_a = components[i]
-            comp_b = components[j]
-
-            overlaps, dist = check_box_overlap(comp_a.bounds, comp_b.bounds)
-
-            if overlaps:
-                analysis.interferences.append(InterferenceResult(
-                    has_interference=True,
-                    component_a=comp_a.name,
-                    component_b=comp_b.name,
-                    overlap_distance=dist,
-                    severity=SeverityLevel.CRITICAL,
-                    location=(
-                        (comp_a.bounds.center[0] + comp_b.bounds.center[0]) / 2,
-                        (comp_a.bounds.center[1] + comp_b.bounds.center[1]) / 2,
-                        (comp_a.bounds.center[2] + comp_b.bounds.center[2]) / 2,
-                    ),
-                    message=f"Interference between {comp_a.name} and {comp_b.name}: {abs(dist):.3f}\" overlap"
-                ))
-
-            elif dist < clearance_tolerance:
-                analysis.interferences.append(InterferenceResult(
-                    has_interference=False,
-                    component_a=comp_a.name,
-                    component_b=comp_b.name,
-                    overlap_distance=dist,
-                    severity=SeverityLevel.WARNING,
-                    location=(
-                        (comp_a.bounds.center[0] + comp_b.bounds.center[0]) / 2,
-                        (comp_a.bounds.center[1] + comp_b.bounds.center[1]) / 2,
-                        (comp_a.bounds.center[2] + comp_b.bounds.center[2]) / 2,
-                    ),
-                    message=f"Low clearance between {comp_a.name} and {comp_b.name}: {dist:.3f}\""
-                ))
+    # Check candidate pairs (all pairs for small assemblies)
+    pairs = _pair_indices([c.bounds for c in components], clearance_tolerance)
+    for i, j in pairs:
+        comp_a = components[i]
+        comp_b = components[j]
+
+        overlaps, dist = check_box_overlap(comp_a.bounds, comp_b.bounds)
+
+        if overlaps:
+            analysis.interferences.append(InterferenceResult(
+                has_interference=True,
+                component_a=comp_a.name,
+                component_b=comp_b.name,
+                overlap_distance=dist,
+                severity=SeverityLevel.CRITICAL,
+                location=(
+                    (comp_a.bounds.center[0] + comp_b.bounds.center[0]) / 2,
+                    (comp_a.bounds.center[1] + comp_b.bounds.center[1]) / 2,
+                    (comp_a.bounds.center[2] + comp_b.bounds.center[2]) / 2,
+                ),
+                message=f"Interference between {comp_a.name} and {comp_b.name}: {abs(dist):.3f}\" overlap"
+            ))
+
+        elif dist < clearance_tolerance:
+            analysis.interferences.append(InterferenceResult(
+                has_interference=False,
+                component_a=comp_a.name,
+                component_b=comp_b.name,
+                overlap_distance=dist,
+                severity=SeverityLevel.WARNING,
+                location=(
+                    (comp_a.bounds.center[0] + comp_b.bounds.center[0]) / 2,
+                    (comp_a.bounds.center[1] + comp_b.bounds.center[1]) / 2,
+                    (comp_a.bounds.center[2] + comp_b.bounds.center[2]) / 2,
+                ),
+                message=f"Low clearance between {comp_a.name} and {comp_b.name}: {dist:.3f}\""
+            ))
 
     return analysis
 
@@ -696,37 +856,34 @@ def check_2d_clearances(
         List of ClearanceResult
     """
     results = []
+    boxes = [BoundingBox(**ent["bounds"]) for ent in entities]
+
+    for i, j in _pair_indices(boxes, min_clearance, dims=2):
+        ent_a = entities[i]
+        ent_b = entities[j]
 
-    for i in range(len(entities)):
-        for j in range(i + 1, len(entities)):
-            ent_a = entities[i]
-            ent_b = entities[j]
-
-            box_a = BoundingBox(**ent_a["bounds"])
-            box_b = BoundingBox(**ent_b["bounds"])
-
-            overlaps, dist = check_2d_box_overlap(box_a, box_b)
-
-            if overlaps:
-                results.append(ClearanceResult(
-                    passes=False,
-                    clearance_type=ClearanceType.STRUCTURAL,
-                    measured=dist,
-                    required=min_clearance,
-                    severity=SeverityLevel.CRITICAL,
-                    location=f"{ent_a.get('name', 'Entity A')} vs {ent_b.get('name', 'Entity B')}",
-                    message=f"Overlap detected: {abs(dist):.3f}\""
-                ))
-            elif dist < min_clearance:
-                results.append(ClearanceResult(
-                    passes=False,
-                    clearance_type=ClearanceType.STRUCTURAL,
-                    measured=dist,
-                    required=min_clearance,
-                    severity=SeverityLevel.WARNING,
-                    location=f"{ent_a.get('name', 'Entity A')} vs {ent_b.get('name', 'Entity B')}",
-                    message=f"Clearance {dist:.3f}\" below min {min_clearance:.3f}\""
-                ))
+        overlaps, dist = check_2d_box_overlap(boxes[i], boxes[j])
+
+        if overlaps:
+            results.append(ClearanceResult(
+                passes=False,
+                clearance_type=ClearanceType.STRUCTURAL,
+                measured=dist,
+                required=min_clearance,
+                severity=SeverityLevel.CRITICAL,
+                location=f"{ent_a.get('name', 'Entity A')} vs {ent_b.get('name', 'Entity B')}",
+                message=f"Overlap detected: {abs(dist):.3f}\""
+            ))
+        elif dist < min_clearance:
+            results.append(ClearanceResult(
+                passes=False,
+                clearance_type=ClearanceType.STRUCTURAL,
+                measured=dist,
+                required=min_clearance,
+                severity=SeverityLevel.WARNING,
+                location=f"{ent_a.get('name', 'Entity A')} vs {ent_b.get('name', 'Entity B')}",
+                message=f"Clearance {dist:.3f}\" below min {min_clearance:.3f}\""
+            ))
 
     return results
 
@@ -852,6 +1009,7 @@ __all__ = [
     # Box operations
     "check_box_overlap",
     "check_2d_box_overlap",
+    "find_candidate_pairs",
     # Circle clearances
     "check_circle_clearance",
     "get_fan_tip_clearance_range",
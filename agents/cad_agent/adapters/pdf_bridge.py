@@ -16,6 +16,8 @@ import logging
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+from ..extraction_cache import ExtractionCache, get_extraction_cache
+
 logger = logging.getLogger("cad_agent.pdf-bridge")
 
 
@@ -42,8 +44,15 @@ class PDFBridge:
     Keeps all heavy imports lazy-loaded.
     """
     
-    def __init__(self, dpi: int = 300):
+    def __init__(self, dpi: int = 300, cache: Optional[ExtractionCache] = None):
+        """
+        Args:
+            dpi: Rasterization resolution for OCR
+            cache: Extraction cache (default: the shared one). Pass
+                ExtractionCache(cache_dir=None) to OCR without caching.
+        """
         self.dpi = dpi
+        self.cache = get_extraction_cache() if cache is None else cache
         self._patterns = {
             "dimension": re.compile(r'(\d+\.?\d*)\s*(mm|in|")?'),
             "part_number": re.compile(r'P/?N[:\s]*([A-Z0-9\-]+)', re.I),
@@ -53,22 +62,45 @@ class PDFBridge:
     
     def extract_from_pdf(self, pdf_path: str) -> List[DrawingData]:
         """Extract data from all pages of a PDF."""
-        # Lazy imports
-        from pdf2image import convert_from_path
-        import pytesseract
-        
         logger.info(f"📄 Processing: {pdf_path}")
-        images = convert_from_path(pdf_path, dpi=self.dpi)
+        record = self.cache.get_record(pdf_path)
+        if record is not None:
+            pages = range(1, record.page_count + 1)
+            texts = self.cache.get_ocr(pdf_path, pages, self.dpi,
+                                       lambda missing: self._ocr_pages(pdf_path, missing))
+            page_texts = [texts.get(n, "") for n in pages]
+        else:
+            page_texts = self._ocr_all(pdf_path)
         
         results = []
-        for i, img in enumerate(images):
-            text = pytesseract.image_to_string(img)
+        for i, text in enumerate(page_texts):
             data = self._parse_text(text)
             results.append(data)
             logger.info(f"  Page {i+1}: {len(data.dimensions)} dimensions found")
             
         return results
     
+    def _ocr_pages(self, pdf_path: str, pages: List[int]) -> Dict[int, str]:
+        """OCR the given pages, rasterizing one page at a time."""
+        # Lazy imports
+        from pdf2image import convert_from_path
+        import pytesseract
+        
+        texts = {}
+        for n in pages:
+            for img in convert_from_path(pdf_path, dpi=self.dpi, first_page=n, last_page=n):
+                texts[n] = pytesseract.image_to_string(img)
+                img.close()
+        return texts
+    
+    def _ocr_all(self, pdf_path: str) -> List[str]:
+        """OCR every page when the page count cannot be read."""
+        from pdf2image import convert_from_path
+        import pytesseract
+        
+        return [pytesseract.image_to_string(img)
+                for img in convert_from_path(pdf_path, dpi=self.dpi)]
+    
     def _parse_text(self, text: str) -> DrawingData:
         """Parse OCR text into structured data."""
         # Extract part number
@@ -9,16 +9,21 @@ Consolidates:
 """
 
 from .standards_hub import StandardsHub, get_standards_hub
-from .component_lookup import ComponentLookup
-from .rules_engine import RulesEngine, ValidationRule
+from .component_lookup import ComponentLookup, get_component_lookup
+from .search_index import SearchIndex
+from .rules_engine import RulesEngine, ValidationRule, CompiledRule, get_rules_engine
 from .template_engine import TemplateEngine, ReportTemplate
 
 __all__ = [
     "StandardsHub",
     "get_standards_hub",
     "ComponentLookup",
+    "get_component_lookup",
+    "SearchIndex",
     "RulesEngine",
     "ValidationRule",
+    "CompiledRule",
+    "get_rules_engine",
     "TemplateEngine",
     "ReportTemplate",
 ]
@@ -9,16 +9,21 @@ Supports:
 - Pipe schedules
 - Flanges
 - Materials
+
+Searches read a precomputed SearchIndex (designations, property text,
+bigrams for typo tolerance, numeric ranges) built once per instance.
 """
 
 import json
 from pathlib import Path
 from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional
 from functools import lru_cache
 from enum import Enum
 import re
 
+from .search_index import SearchIndex
+
 
 class ComponentCategory(str, Enum):
     """Component categories."""
@@ -174,6 +179,17 @@ class ComponentLookup:
                 standard="ASTM"
             )
 
+        # Precompute search structures; doc ids follow component order
+        self._search = SearchIndex()
+        self._specs: List[ComponentSpec] = []
+        for key, spec in self._components.items():
+            self._search.add(
+                [spec.designation.upper().replace(" ", ""), key],
+                text=str(spec.properties).upper(),
+                numbers=spec.properties,
+            )
+            self._specs.append(spec)
+
     # ==================== SEARCH METHODS ====================
 
     def search(self, query: str, category: Optional[str] = None) -> List[ComponentSpec]:
@@ -188,32 +204,18 @@ class ComponentLookup:
             List of matching ComponentSpec objects
         """
         query_upper = query.upper().replace(" ", "")
-        results: List[Tuple[float, ComponentSpec]] = []
-
-        for key, spec in self._components.items():
-            if category and spec.category != category:
-                continue
-
-            score = self._match_score(query_upper, key, spec)
-            if score > 0:
-                results.append((score, spec))
-
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [spec for _, spec in results]
-
-    def _match_score(self, query: str, key: str, spec: ComponentSpec) -> float:
-        """Calculate match score."""
-        # Exact match
-        if query == key or query == spec.designation.upper():
-            return 1.0
-        # Partial match
-        if query in key or query in spec.designation.upper():
-            return 0.7
-        # Property match
-        props_str = str(spec.properties).upper()
-        if query in props_str:
-            return 0.3
-        return 0.0
+        results: List[ComponentSpec] = []
+        seen = set()
+
+        # Exact match, then partial match, then property match
+        for lookup in (self._search.exact, self._search.name_contains, self._search.text_contains):
+            for doc in lookup(query_upper):
+                spec = self._specs[doc]
+                if doc in seen or (category and spec.category != category):
+                    continue
+                seen.add(doc)
+                results.append(spec)
+        return results
 
     def fuzzy_search(self, query: str, threshold: float = 0.5) -> List[ComponentSpec]:
         """
@@ -226,44 +228,29 @@ class ComponentLookup:
         Returns:
             List of matching ComponentSpec objects
         """
-        query_upper = query.upper().replace(" ", "").replace("X", "X")
-        results: List[Tuple[float, ComponentSpec]] = []
-
-        for key, spec in self._components.items():
-            designation = spec.designation.upper().replace(" ", "")
-
-            # Calculate similarity
-            similarity = self._levenshtein_similarity(query_upper, designation)
-
-            if similarity >= threshold:
-                results.append((similarity, spec))
-
-        results.sort(key=lambda x: x[0], reverse=True)
-        return [spec for _, spec in results[:10]]
+        query_upper = query.upper().replace(" ", "")
 
-    def _levenshtein_similarity(self, s1: str, s2: str) -> float:
-        """Calculate Levenshtein similarity (0-1)."""
-        if s1 == s2:
-            return 1.0
-        len1, len2 = len(s1), len(s2)
-        if len1 == 0 or len2 == 0:
-            return 0.0
+        # Ten most similar designations (Levenshtein), best first
+        results = self._search.similar(query_upper, threshold, limit=10)
+        return [self._specs[doc] for _, doc in results]
 
-        # Create distance matrix
-        d = [[0] * (len2 + 1) for _ in range(len1 + 1)]
-        for i in range(len1 + 1):
-            d[i][0] = i
-        for j in range(len2 + 1):
-            d[0][j] = j
+    def filter_by_property(self, prop: str, min_value: Optional[float] = None,
+                           max_value: Optional[float] = None,
+                           category: Optional[str] = None) -> List[ComponentSpec]:
+        """
+        Find components by numeric property range.
 
-        for i in range(1, len1 + 1):
-            for j in range(1, len2 + 1):
-                cost = 0 if s1[i-1] == s2[j-1] else 1
-                d[i][j] = min(d[i-1][j] + 1, d[i][j-1] + 1, d[i-1][j-1] + cost)
+        Args:
+            prop: Property name (e.g. "Zx", "Ix", "Fy")
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            category: Optional category filter
 
-        distance = d[len1][len2]
-        max_len = max(len1, len2)
-        return 1.0 - (distance / max_len)
+        Returns:
+            Matching ComponentSpec objects in ascending property order
+        """
+        specs = (self._specs[doc] for doc in self._search.in_range(prop, min_value, max_value))
+        return [spec for spec in specs if not category or spec.category == category]
 
     # ==================== DIRECT LOOKUPS ====================
 
@@ -366,3 +353,15 @@ class ComponentLookup:
     def list_gauges(self) -> List[str]:
         """List all available sheet gauges."""
         return sorted(self.SHEET_GAUGES.keys(), key=int)
+
+
+# Singleton instance
+_component_lookup: Optional[ComponentLookup] = None
+
+
+def get_component_lookup() -> ComponentLookup:
+    """Get or create singleton ComponentLookup instance."""
+    global _component_lookup
+    if _component_lookup is None:
+        _component_lookup = ComponentLookup()
+    return _component_lookup
@@ -8,9 +8,13 @@ Features:
 - Dynamic rule evaluation
 - Rule versioning and overrides
 - Standard-specific rule sets
+- Rules compiled once into evaluation plans (CompiledRule)
+- Batch evaluation over many records, vectorized with NumPy for numeric
+  comparisons when available
 """
 
 import json
+import operator
 import yaml
 from pathlib import Path
 from dataclasses import dataclass, field
@@ -19,6 +23,18 @@ from enum import Enum
 from functools import lru_cache
 import re
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Largest magnitude float64 holds exactly, for vectorized numeric comparisons
+_EXACT_FLOAT = 2 ** 53
+
+# Records per batch below which vectorizing a rule is not worth it
+VECTORIZE_MIN_RECORDS = 64
+
 
 class RuleSeverity(str, Enum):
     """Rule violation severity levels."""
@@ -127,6 +143,271 @@ class RuleViolation:
         }
 
 
+# ==================== LOOKUP TABLES & FORMULAS ====================
+
+# AISC Table J3.4 values
+EDGE_DISTANCES = {
+    0.5: {"rolled": 0.75, "sheared": 0.875},
+    0.625: {"rolled": 0.875, "sheared": 1.125},
+    0.75: {"rolled": 1.0, "sheared": 1.25},
+    0.875: {"rolled": 1.125, "sheared": 1.5},
+    1.0: {"rolled": 1.25, "sheared": 1.75},
+}
+
+
+def _edge_distance_table(data: Dict[str, Any]) -> Any:
+    bolt_size = data.get("bolt_diameter", 0.75)
+    edge_type = data.get("edge_type", "rolled")
+    return EDGE_DISTANCES.get(bolt_size, {}).get(edge_type, 1.0)
+
+
+def _fillet_weld_table(data: Dict[str, Any]) -> Any:
+    """AWS D1.1 Table 5.8."""
+    thickness = data.get("base_metal_thickness", 0.5)
+    if thickness <= 0.25:
+        return 0.125  # 1/8"
+    elif thickness <= 0.5:
+        return 0.1875  # 3/16"
+    elif thickness <= 0.75:
+        return 0.25  # 1/4"
+    else:
+        return 0.3125  # 5/16"
+
+
+def _pressure_wall_thickness(data: Dict[str, Any]) -> Any:
+    """ASME B31.3 Equation 3a."""
+    P = data.get("design_pressure", 150)
+    D = data.get("pipe_od", 4.5)
+    S = data.get("allowable_stress", 20000)
+    E = data.get("joint_factor", 1.0)
+    W = data.get("weld_factor", 1.0)
+    Y = data.get("y_coefficient", 0.4)
+    c = data.get("corrosion_allowance", 0.0625)
+
+    t = (P * D) / (2 * (S * E * W + P * Y)) + c
+    return t
+
+
+# Reference tables and formulas rule values can name; bound when a rule is compiled
+LOOKUP_TABLES: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "edge_distance_table": _edge_distance_table,
+    "fillet_weld_table": _fillet_weld_table,
+}
+FORMULAS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "pressure_wall_thickness": _pressure_wall_thickness,
+}
+
+
+# ==================== COMPILED RULES ====================
+
+_OPERATORS: Dict[RuleOperator, Callable[[Any, Any], Any]] = {
+    RuleOperator.EQUALS: operator.eq,
+    RuleOperator.NOT_EQUALS: operator.ne,
+    RuleOperator.GREATER_THAN: operator.gt,
+    RuleOperator.GREATER_THAN_OR_EQUAL: operator.ge,
+    RuleOperator.LESS_THAN: operator.lt,
+    RuleOperator.LESS_THAN_OR_EQUAL: operator.le,
+    RuleOperator.IN: lambda actual, expected: actual in expected,
+    RuleOperator.NOT_IN: lambda actual, expected: actual not in expected,
+    RuleOperator.BETWEEN: lambda actual, expected: expected[0] <= actual <= expected[1],
+    RuleOperator.MATCHES: lambda actual, expected: bool(re.match(expected, str(actual))),
+    RuleOperator.EXISTS: lambda actual, expected: actual is not None,
+}
+
+# Operators NumPy evaluates the same way on exact numbers
+_VECTOR_OPERATORS = {
+    RuleOperator.EQUALS, RuleOperator.NOT_EQUALS,
+    RuleOperator.GREATER_THAN, RuleOperator.GREATER_THAN_OR_EQUAL,
+    RuleOperator.LESS_THAN, RuleOperator.LESS_THAN_OR_EQUAL,
+}
+
+
+def _is_exact_number(value: Any) -> bool:
+    """Plain int/float that float64 represents exactly (bool excluded)."""
+    kind = type(value)
+    return kind is float or (kind is int and -_EXACT_FLOAT <= value <= _EXACT_FLOAT)
+
+
+def compile_field(path: str) -> Callable[[Dict[str, Any]], Any]:
+    """Accessor for a field, with dotted paths split once."""
+    if "." not in path:
+        return lambda data: data.get(path)
+    parts = tuple(path.split("."))
+
+    def get(data: Dict[str, Any]) -> Any:
+        value = data
+        for part in parts:
+            if isinstance(value, dict):
+                value = value.get(part)
+            else:
+                return None
+        return value
+    return get
+
+
+def compile_value(value: Any) -> Callable[[Dict[str, Any]], Any]:
+    """Resolver for a rule value: constant, multiplier of another field, lookup or formula."""
+    if not isinstance(value, dict):
+        return lambda data: value
+
+    base = None
+    if "multiplier" in value and "base_field" in value:
+        multiplier = value["multiplier"]
+        base = compile_field(value["base_field"])
+    table = LOOKUP_TABLES.get(value["lookup"], lambda data: None) if "lookup" in value else None
+    formula = FORMULAS.get(value["formula"], lambda data: None) if "formula" in value else None
+
+    def resolve(data: Dict[str, Any]) -> Any:
+        if base is not None:
+            base_value = base(data)
+            if base_value is not None:
+                return multiplier * base_value
+        if table is not None:
+            return table(data)
+        if formula is not None:
+            return formula(data)
+        return value
+    return resolve
+
+
+class CompiledRule:
+    """
+    Evaluation plan for one ValidationRule.
+
+    Field path, value resolution and operator are bound once; severity,
+    message and enabled are read from the rule at evaluation time. Changing
+    a rule's field, operator or value needs add_rule() again.
+    """
+
+    def __init__(self, rule: ValidationRule):
+        self.rule = rule
+        self.actual = compile_field(rule.field)
+        self.expected = compile_value(rule.value)
+
+        try:
+            op = RuleOperator(rule.operator)
+        except ValueError:
+            op = None
+        compare = _OPERATORS.get(op, lambda actual, expected: False)
+        if op == RuleOperator.MATCHES and isinstance(rule.value, str):
+            try:
+                pattern = re.compile(rule.value)
+            except re.error:
+                pass
+            else:
+                def compare(actual: Any, expected: Any) -> bool:
+                    return bool(pattern.match(str(actual)))
+        self._compare = compare
+
+        # Vectorizable: numeric comparison against a constant or a multiple of another field
+        self._vector_op = op if op in _VECTOR_OPERATORS else None
+        self._vector_constant = None
+        self._vector_base = None
+        value = rule.value
+        if self._vector_op is None:
+            pass
+        elif _is_exact_number(value):
+            self._vector_constant = value
+        elif (isinstance(value, dict) and "multiplier" in value and "base_field" in value
+              and _is_exact_number(value["multiplier"])):
+            self._vector_base = compile_field(value["base_field"])
+            self._vector_base_field = value["base_field"]
+            self._multiplier = value["multiplier"]
+
+    def passes(self, actual: Any, expected: Any) -> bool:
+        try:
+            return bool(self._compare(actual, expected))
+        except (TypeError, ValueError):
+            return False
+
+    def evaluate(self, data: Dict[str, Any]) -> Optional[RuleViolation]:
+        """Violation for one record, or None when it passes or the field is absent."""
+        actual = self.actual(data)
+        if actual is None:
+            return None  # Field not present, skip rule
+        expected = self.expected(data)
+        if self.passes(actual, expected):
+            return None
+        rule = self.rule
+        return RuleViolation(
+            rule_id=rule.id,
+            rule_name=rule.name,
+            severity=rule.severity,
+            message=rule.message,
+            suggestion=rule.suggestion,
+            field=rule.field,
+            actual_value=actual,
+            expected_value=expected,
+            standard_reference=f"{rule.standard} {rule.section}" if rule.section else rule.standard
+        )
+
+    def evaluate_many(self, batch: "BatchColumns") -> List[tuple]:
+        """(record index, violation) for every failing record, in record order."""
+        records = batch.records
+        actuals = batch.values(self.rule.field, self.actual)
+        vectorized = NUMPY_AVAILABLE and len(records) >= VECTORIZE_MIN_RECORDS and (
+            self._vector_constant is not None or self._vector_base is not None
+        )
+        if not vectorized:
+            failures = ((i, self.evaluate(records[i])) for i, a in enumerate(actuals) if a is not None)
+            return [(i, v) for i, v in failures if v is not None]
+
+        # Exact numbers are decided by one NumPy comparison; other present
+        # values go through the scalar plan
+        values, numeric, others = batch.numeric(self.rule.field, self.actual)
+        compare = _OPERATORS[self._vector_op]
+        if self._vector_base is None:
+            checked = numeric
+            passed = compare(values, self._vector_constant)
+            rest = others
+        else:
+            bases, base_numeric, _ = batch.numeric(self._vector_base_field, self._vector_base)
+            limit = _EXACT_FLOAT / max(1.0, abs(self._multiplier))
+            checked = numeric & base_numeric & (np.abs(bases) <= limit)
+            passed = compare(values, bases * self._multiplier)
+            rest = sorted(others + np.flatnonzero(numeric & ~checked).tolist())
+
+        failing = np.flatnonzero(checked & ~passed).tolist()
+        if rest:
+            failing = sorted(failing + rest)
+
+        # Violations are built by the scalar plan so they match evaluate()
+        failures = ((i, self.evaluate(records[i])) for i in failing)
+        return [(i, v) for i, v in failures if v is not None]
+
+
+class BatchColumns:
+    """
+    Field values of a record batch, gathered once per field path.
+
+    Rules reading the same field share the column; numeric views hold
+    exact numbers as float64 (NaN elsewhere) with a mask of which entries
+    are numeric.
+    """
+
+    def __init__(self, records: List[Dict[str, Any]]):
+        self.records = records
+        self._values: Dict[str, List[Any]] = {}
+        self._numeric: Dict[str, tuple] = {}
+
+    def values(self, path: str, getter: Callable[[Dict[str, Any]], Any]) -> List[Any]:
+        column = self._values.get(path)
+        if column is None:
+            column = self._values[path] = [getter(data) for data in self.records]
+        return column
+
+    def numeric(self, path: str, getter: Callable[[Dict[str, Any]], Any]) -> tuple:
+        """(float64 values, numeric mask, indices of present non-numeric values)."""
+        view = self._numeric.get(path)
+        if view is None:
+            column = self.values(path, getter)
+            mask = [_is_exact_number(v) for v in column]
+            values = np.array([v if m else np.nan for v, m in zip(column, mask)], dtype=float)
+            others = [i for i, (v, m) in enumerate(zip(column, mask)) if not m and v is not None]
+            view = self._numeric[path] = (values, np.array(mask, dtype=bool), others)
+        return view
+
+
 class RulesEngine:
     """
     Configurable validation rules engine.
@@ -153,6 +434,8 @@ class RulesEngine:
         self._rules: Dict[str, ValidationRule] = {}
         self._rules_by_standard: Dict[str, List[ValidationRule]] = {}
         self._rules_by_tag: Dict[str, List[ValidationRule]] = {}
+        self._plans: Dict[str, CompiledRule] = {}
+        self._selections: Dict[tuple, List[CompiledRule]] = {}
 
         # Load built-in rules
         self._load_builtin_rules()
@@ -330,8 +613,13 @@ class RulesEngine:
             print(f"Error loading rules file {filepath}: {e}")
 
     def add_rule(self, rule: ValidationRule):
-        """Add a rule to the engine."""
+        """Add (or replace) a rule and compile its evaluation plan."""
+        previous = self._rules.get(rule.id)
+        if previous is not None:
+            self._unindex(previous)
         self._rules[rule.id] = rule
+        self._plans[rule.id] = CompiledRule(rule)
+        self._selections.clear()
 
         # Index by standard
         if rule.standard not in self._rules_by_standard:
@@ -344,6 +632,16 @@ class RulesEngine:
                 self._rules_by_tag[tag] = []
             self._rules_by_tag[tag].append(rule)
 
+    def _unindex(self, rule: ValidationRule):
+        """Drop a replaced rule from the standard and tag indexes."""
+        for index, keys in ((self._rules_by_standard, [rule.standard]), (self._rules_by_tag, rule.tags)):
+            for key in keys:
+                remaining = [r for r in index.get(key, []) if r is not rule]
+                if remaining:
+                    index[key] = remaining
+                else:
+                    index.pop(key, None)
+
     def get_rule(self, rule_id: str) -> Optional[ValidationRule]:
         """Get a rule by ID."""
         return self._rules.get(rule_id)
@@ -388,163 +686,77 @@ class RulesEngine:
         """
         violations: List[RuleViolation] = []
 
-        # Determine which rules to evaluate
-        if rules:
-            rules_to_check = rules
-        elif standard:
-            rules_to_check = self.get_rules_by_standard(standard)
-        elif tags:
-            rules_to_check = []
-            for tag in tags:
-                rules_to_check.extend(self.get_rules_by_tag(tag))
-            rules_to_check = list(set(rules_to_check))  # Remove duplicates
-        else:
-            rules_to_check = list(self._rules.values())
-
         # Evaluate each rule
-        for rule in rules_to_check:
-            if not rule.enabled:
+        for plan in self._select_plans(rules, standard, tags):
+            if not plan.rule.enabled:
                 continue
 
-            violation = self._evaluate_rule(rule, data)
+            violation = plan.evaluate(data)
             if violation:
                 violations.append(violation)
 
         return violations
 
-    def _evaluate_rule(self, rule: ValidationRule, data: Dict[str, Any]) -> Optional[RuleViolation]:
-        """Evaluate a single rule against data."""
-        # Get the field value
-        field_value = self._get_field_value(rule.field, data)
-        if field_value is None:
-            return None  # Field not present, skip rule
+    def evaluate_batch(self, records: List[Dict[str, Any]],
+                       rules: Optional[List[ValidationRule]] = None,
+                       standard: Optional[str] = None,
+                       tags: Optional[List[str]] = None) -> List[List[RuleViolation]]:
+        """
+        Evaluate a rule set over many records.
 
-        # Get the comparison value
-        expected = self._resolve_value(rule.value, data)
-
-        # Evaluate the operator
-        passed = self._evaluate_operator(rule.operator, field_value, expected)
-
-        if not passed:
-            return RuleViolation(
-                rule_id=rule.id,
-                rule_name=rule.name,
-                severity=rule.severity,
-                message=rule.message,
-                suggestion=rule.suggestion,
-                field=rule.field,
-                actual_value=field_value,
-                expected_value=expected,
-                standard_reference=f"{rule.standard} {rule.section}" if rule.section else rule.standard
-            )
-
-        return None
-
-    def _get_field_value(self, field: str, data: Dict[str, Any]) -> Any:
-        """Get a field value from data, supporting nested paths."""
-        if "." in field:
-            parts = field.split(".")
-            value = data
-            for part in parts:
-                if isinstance(value, dict):
-                    value = value.get(part)
-                else:
-                    return None
-            return value
-        return data.get(field)
-
-    def _resolve_value(self, value: Any, data: Dict[str, Any]) -> Any:
-        """Resolve a rule value, handling dynamic references."""
-        if isinstance(value, dict):
-            # Multiplier-based value
-            if "multiplier" in value and "base_field" in value:
-                base_value = self._get_field_value(value["base_field"], data)
-                if base_value is not None:
-                    return value["multiplier"] * base_value
-            # Lookup table
-            if "lookup" in value:
-                return self._lookup_value(value["lookup"], data)
-            # Formula
-            if "formula" in value:
-                return self._calculate_formula(value["formula"], data)
+        Rules are selected once, each field is read once per batch, and
+        each rule runs over the whole batch; numeric comparisons against
+        constants or field multiples are vectorized when NumPy is available.
 
-        return value
+        Args:
+            records: Dictionaries of field values, one per part
+            rules: Specific rules to evaluate (optional)
+            standard: Filter by standard (optional)
+            tags: Filter by tags (optional)
 
-    def _lookup_value(self, table_name: str, data: Dict[str, Any]) -> Any:
-        """Look up a value from a reference table."""
-        # Edge distance table
-        if table_name == "edge_distance_table":
-            bolt_size = data.get("bolt_diameter", 0.75)
-            edge_type = data.get("edge_type", "rolled")
-            # AISC Table J3.4 values
-            edge_distances = {
-                0.5: {"rolled": 0.75, "sheared": 0.875},
-                0.625: {"rolled": 0.875, "sheared": 1.125},
-                0.75: {"rolled": 1.0, "sheared": 1.25},
-                0.875: {"rolled": 1.125, "sheared": 1.5},
-                1.0: {"rolled": 1.25, "sheared": 1.75},
-            }
-            return edge_distances.get(bolt_size, {}).get(edge_type, 1.0)
-
-        # Fillet weld table (AWS D1.1 Table 5.8)
-        if table_name == "fillet_weld_table":
-            thickness = data.get("base_metal_thickness", 0.5)
-            if thickness <= 0.25:
-                return 0.125  # 1/8"
-            elif thickness <= 0.5:
-                return 0.1875  # 3/16"
-            elif thickness <= 0.75:
-                return 0.25  # 1/4"
+        Returns:
+            Violations per record, in record order; each list is what
+            evaluate() returns for that record
+        """
+        results: List[List[RuleViolation]] = [[] for _ in records]
+        batch = BatchColumns(records)
+        for plan in self._select_plans(rules, standard, tags):
+            if not plan.rule.enabled:
+                continue
+            for index, violation in plan.evaluate_many(batch):
+                results[index].append(violation)
+        return results
+
+    def _select_plans(self, rules: Optional[List[ValidationRule]],
+                      standard: Optional[str],
+                      tags: Optional[List[str]]) -> List[CompiledRule]:
+        """Compiled plans for the rules an evaluate call asks for."""
+        if rules:
+            return [self._plan_for(rule) for rule in rules]
+
+        key = ("standard", standard) if standard else ("tags", tuple(tags)) if tags else ("all",)
+        plans = self._selections.get(key)
+        if plans is None:
+            if standard:
+                selected = self.get_rules_by_standard(standard)
+            elif tags:
+                # Union of the tag lists, first occurrence wins
+                unique = {}
+                for tag in tags:
+                    for rule in self.get_rules_by_tag(tag):
+                        unique.setdefault(rule.id, rule)
+                selected = list(unique.values())
             else:
-                return 0.3125  # 5/16"
+                selected = list(self._rules.values())
+            plans = self._selections[key] = [self._plan_for(rule) for rule in selected]
+        return plans
 
-        return None
-
-    def _calculate_formula(self, formula_name: str, data: Dict[str, Any]) -> Any:
-        """Calculate a formula-based value."""
-        if formula_name == "pressure_wall_thickness":
-            # ASME B31.3 Equation 3a
-            P = data.get("design_pressure", 150)
-            D = data.get("pipe_od", 4.5)
-            S = data.get("allowable_stress", 20000)
-            E = data.get("joint_factor", 1.0)
-            W = data.get("weld_factor", 1.0)
-            Y = data.get("y_coefficient", 0.4)
-            c = data.get("corrosion_allowance", 0.0625)
-
-            t = (P * D) / (2 * (S * E * W + P * Y)) + c
-            return t
-
-        return None
-
-    def _evaluate_operator(self, operator: RuleOperator, actual: Any, expected: Any) -> bool:
-        """Evaluate a comparison operator."""
-        try:
-            if operator == RuleOperator.EQUALS:
-                return actual == expected
-            elif operator == RuleOperator.NOT_EQUALS:
-                return actual != expected
-            elif operator == RuleOperator.GREATER_THAN:
-                return actual > expected
-            elif operator == RuleOperator.GREATER_THAN_OR_EQUAL:
-                return actual >= expected
-            elif operator == RuleOperator.LESS_THAN:
-                return actual < expected
-            elif operator == RuleOperator.LESS_THAN_OR_EQUAL:
-                return actual <= expected
-            elif operator == RuleOperator.IN:
-                return actual in expected
-            elif operator == RuleOperator.NOT_IN:
-                return actual not in expected
-            elif operator == RuleOperator.BETWEEN:
-                return expected[0] <= actual <= expected[1]
-            elif operator == RuleOperator.MATCHES:
-                return bool(re.match(expected, str(actual)))
-            elif operator == RuleOperator.EXISTS:
-                return actual is not None
-        except (TypeError, ValueError):
-            return False
-        return False
+    def _plan_for(self, rule: ValidationRule) -> CompiledRule:
+        """Stored plan for a registered rule; ad-hoc rules are compiled on the spot."""
+        plan = self._plans.get(rule.id)
+        if plan is not None and plan.rule is rule:
+            return plan
+        return CompiledRule(rule)
 
     # ==================== EXPORT / SERIALIZATION ====================
 
@@ -578,3 +790,15 @@ class RulesEngine:
             },
             "tags": list(self._rules_by_tag.keys()),
         }
+
+
+# Singleton instance
+_rules_engine: Optional[RulesEngine] = None
+
+
+def get_rules_engine() -> RulesEngine:
+    """Get or create singleton RulesEngine instance."""
+    global _rules_engine
+    if _rules_engine is None:
+        _rules_engine = RulesEngine()
+    return _rules_engine
@@ -0,0 +1,245 @@
+"""
+Search Index
+============
+Precomputed lookup structures behind StandardsHub and ComponentLookup search.
+
+Documents are added once with their names (designation, key), a flattened
+property text and their numeric properties. Queries then read indexes
+instead of scanning every item:
+
+- Exact names map straight to documents
+- Gram postings (1-3 characters for names, trigrams for property text)
+  narrow substring queries; candidates are verified with the original
+  substring test, so results match a full scan
+- Name bigram counts and lengths bound each document's Levenshtein
+  similarity, so typo-tolerant lookups compare the most promising names
+  first and stop once the top results are settled
+- Sorted per-property value lists answer numeric ranges ("Zx >= 100")
+
+Document ids are assigned in insertion order and queries break ties in
+that order, so callers keep their original tie-breaking.
+"""
+
+from bisect import bisect_left, bisect_right
+from collections import Counter, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+# Longest gram indexed for substring queries
+GRAM = 3
+
+
+def _grams(text: str, shortest: int = 1) -> Set[str]:
+    """Distinct substrings of length shortest..GRAM."""
+    return {text[i:i + n] for n in range(shortest, GRAM + 1) for i in range(len(text) - n + 1)}
+
+
+def _bigrams(text: str) -> Counter:
+    return Counter(text[i:i + 2] for i in range(len(text) - 1))
+
+
+def _match_masks(pattern: str) -> Dict[str, int]:
+    """Bit mask of the positions of each character in the pattern."""
+    masks: Dict[str, int] = {}
+    for i, char in enumerate(pattern):
+        masks[char] = masks.get(char, 0) | (1 << i)
+    return masks
+
+
+def _levenshtein(pattern: str, masks: Dict[str, int], text: str) -> int:
+    """Edit distance by the bit-parallel Myers/Hyyro algorithm (one pass over text)."""
+    m = len(pattern)
+    if m == 0:
+        return len(text)
+    full = (1 << m) - 1
+    top = 1 << (m - 1)
+    pv, mv, score = full, 0, m
+    for char in text:
+        eq = masks.get(char, 0)
+        xv = eq | mv
+        xh = (((eq & pv) + pv) ^ pv) | eq
+        ph = mv | (~(xh | pv) & full)
+        mh = pv & xh
+        if ph & top:
+            score += 1
+        elif mh & top:
+            score -= 1
+        ph = ((ph << 1) | 1) & full
+        mh = (mh << 1) & full
+        pv = mh | (~(xv | ph) & full)
+        mv = ph & xv
+    return score
+
+
+class SearchIndex:
+    """
+    Name, text and numeric indexes over a fixed set of documents.
+
+    Callers normalize case and spacing before adding and querying; the index
+    compares strings as given.
+    """
+
+    def __init__(self):
+        self._names: List[Tuple[str, ...]] = []
+        self._texts: List[str] = []
+        self._exact: Dict[str, List[int]] = defaultdict(list)
+        self._name_grams: Dict[str, List[int]] = defaultdict(list)
+        self._text_grams: Dict[str, List[int]] = defaultdict(list)
+        self._bigrams: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self._by_length: Dict[int, List[int]] = defaultdict(list)
+        self._lengths: List[int] = []
+        self._numbers: Dict[str, List[Tuple[float, int]]] = defaultdict(list)
+        self._sorted: Set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def add(self, names: Iterable[str], text: str = "",
+            numbers: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Index a document.
+
+        Args:
+            names: Designations the document answers to; the first one is
+                used for typo-tolerant lookups
+            text: Flattened property text for substring queries
+            numbers: Numeric properties for range queries
+
+        Returns:
+            Document id (insertion order)
+        """
+        doc = len(self._names)
+        names = tuple(dict.fromkeys(names))
+        self._names.append(names)
+        self._texts.append(text)
+
+        for name in names:
+            self._exact[name].append(doc)
+        for gram in set().union(*(_grams(name) for name in names)):
+            self._name_grams[gram].append(doc)
+        for gram in _grams(text, shortest=GRAM):
+            self._text_grams[gram].append(doc)
+
+        primary = names[0] if names else ""
+        for gram, count in _bigrams(primary).items():
+            self._bigrams[gram].append((doc, count))
+        self._by_length[len(primary)].append(doc)
+        self._lengths.append(len(primary))
+
+        for key, value in (numbers or {}).items():
+            if isinstance(value, (int, float)) and not isinstance(value, bool):
+                self._numbers[key].append((float(value), doc))
+                self._sorted.discard(key)
+        return doc
+
+    # ==================== QUERIES ====================
+
+    def exact(self, query: str) -> List[int]:
+        """Documents with a name equal to the query."""
+        return list(self._exact.get(query, ()))
+
+    def _substring(self, query: str, postings: Dict[str, List[int]], texts) -> List[int]:
+        if not query:
+            return list(range(len(self._names)))
+        # Only documents holding every gram of the query can contain it
+        grams = {query[i:i + GRAM] for i in range(max(1, len(query) - GRAM + 1))}
+        lists = sorted((postings.get(gram, ()) for gram in grams), key=len)
+        candidates = set(lists[0]).intersection(*lists[1:])
+        return [doc for doc in sorted(candidates) if texts(doc, query)]
+
+    def name_contains(self, query: str) -> List[int]:
+        """Documents with a name containing the query."""
+        return self._substring(query, self._name_grams, lambda doc, q: any(q in n for n in self._names[doc]))
+
+    def text_contains(self, query: str) -> List[int]:
+        """Documents whose property text contains the query."""
+        if len(query) < GRAM:
+            # Property text is only indexed by full-length grams
+            return [doc for doc, text in enumerate(self._texts) if query in text]
+        return self._substring(query, self._text_grams, lambda doc, q: q in self._texts[doc])
+
+    def similar(self, query: str, threshold: float, limit: Optional[int] = None) -> List[Tuple[float, int]]:
+        """
+        Documents whose first name has Levenshtein similarity >= threshold.
+
+        Similarity is 1 - distance / longer length. Within k edits a name
+        differs in length by at most k and shares at least
+        longer - 1 - 2k bigrams with the query, which gives each document an
+        upper bound on its similarity from the bigram postings alone.
+        Documents are compared best bound first, and with a limit the search
+        stops once no remaining bound can reach the current top results.
+        Names sharing no bigram are grouped by length and only expanded if
+        their common bound is reached.
+
+        Returns:
+            (similarity, doc) pairs, most similar first, ties in document order
+        """
+        def bound(length: int, common: int) -> float:
+            longest = max(len(query), length)
+            if longest == 0:
+                return 1.0
+            edits = max(abs(len(query) - length), -(-(longest - 1 - common) // 2))
+            return 1.0 - edits / longest
+
+        masks = _match_masks(query)
+        shared: Counter = Counter()
+        for gram, count in _bigrams(query).items():
+            for doc, doc_count in self._bigrams.get(gram, ()):
+                shared[doc] += min(count, doc_count)
+
+        # bound -> documents, or lengths whose unshared documents share it
+        by_bound: Dict[float, List[int]] = defaultdict(list)
+        unshared: Dict[float, List[int]] = defaultdict(list)
+        for doc, common in shared.items():
+            by_bound[bound(self._lengths[doc], common)].append(doc)
+        for length in self._by_length:
+            unshared[bound(length, 0)].append(length)
+
+        results: List[Tuple[float, int]] = []
+        floor = threshold
+        for upper in sorted(set(by_bound) | set(unshared), reverse=True):
+            if upper < floor:
+                break
+            docs = list(by_bound.get(upper, ()))
+            for length in unshared.get(upper, ()):
+                docs.extend(doc for doc in self._by_length[length] if doc not in shared)
+
+            for doc in docs:
+                name = self._names[doc][0] if self._names[doc] else ""
+                longest = max(len(query), len(name))
+                if name == query:
+                    similarity = 1.0
+                elif not name or not query:
+                    similarity = 0.0
+                else:
+                    similarity = 1.0 - _levenshtein(query, masks, name) / longest
+                if similarity >= threshold:
+                    results.append((similarity, doc))
+
+            if limit is not None and len(results) >= limit:
+                results.sort(key=lambda item: (-item[0], item[1]))
+                del results[limit:]
+                # Later bounds are lower; only ties with the last kept result could still enter
+                floor = max(floor, results[-1][0])
+
+        results.sort(key=lambda item: (-item[0], item[1]))
+        return results if limit is None else results[:limit]
+
+    def in_range(self, key: str, min_value: Optional[float] = None,
+                 max_value: Optional[float] = None) -> List[int]:
+        """Documents with numeric property ``key`` within [min_value, max_value], by value."""
+        values = self._numbers.get(key)
+        if not values:
+            return []
+        if key not in self._sorted:
+            values.sort()
+            self._sorted.add(key)
+        lo = 0 if min_value is None else bisect_left(values, (float(min_value), -1))
+        hi = len(values) if max_value is None else bisect_right(values, (float(max_value), len(self._names)))
+        return [doc for _, doc in values[lo:hi]]
+
+    def numeric_keys(self) -> List[str]:
+        """Property names available to in_range."""
+        return sorted(self._numbers)
+
+
+__all__ = ["SearchIndex"]
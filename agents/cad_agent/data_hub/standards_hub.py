@@ -8,6 +8,7 @@ Features:
 - Fuzzy matching for component lookups
 - Standards cross-referencing
 - Cached queries for performance
+- Indexed search (see search_index.SearchIndex) and numeric range filters
 """
 
 import json
@@ -17,6 +18,8 @@ from typing import Dict, List, Any, Optional, Union
 from functools import lru_cache
 from enum import Enum
 
+from .search_index import SearchIndex
+
 
 class StandardType(str, Enum):
     """Engineering standards supported."""
@@ -165,6 +168,20 @@ class StandardsHub:
                     reference="ASTM Standards"
                 ))
 
+        # Precompute lookup structures; doc ids follow index order
+        self._search = SearchIndex()
+        self._documents: List[tuple] = []
+        self._doc_categories: Dict[str, List[int]] = {}
+        for cat, items in self._index.items():
+            for item in items:
+                doc = self._search.add(
+                    [item.designation.lower()],
+                    text=str(item.properties).lower(),
+                    numbers=item.properties,
+                )
+                self._documents.append((cat, item))
+                self._doc_categories.setdefault(item.category.lower(), []).append(doc)
+
     # ==================== SEARCH METHODS ====================
 
     def search(self, query: str, standard: Optional[str] = None,
@@ -182,49 +199,66 @@ class StandardsHub:
             List of matching StandardsSearchResult objects
         """
         query_lower = query.lower()
-        results: List[StandardsSearchResult] = []
-
-        # Search all categories or specific one
-        categories = [category] if category else list(self._index.keys())
+        categories = {category} if category else set(self._index)
+
+        def allowed(doc: int) -> bool:
+            cat, item = self._documents[doc]
+            if cat not in categories:
+                return False
+            # Filter by standard if specified
+            return not standard or item.standard.lower() == standard.lower()
+
+        def category_docs(q: str) -> List[int]:
+            return sorted(doc for name, docs in self._doc_categories.items() if q in name for doc in docs)
+
+        # Relevance tiers, best first; within a tier items keep index order.
+        # Lower tiers are only looked up while the limit is not yet reached.
+        tiers = [
+            (1.0, self._search.exact),          # Exact match on designation
+            (0.7, self._search.name_contains),  # Partial match
+            (0.3, category_docs),               # Match in category
+            (0.2, self._search.text_contains),  # Match in properties
+        ]
 
-        for cat in categories:
-            if cat not in self._index:
-                continue
-            for item in self._index[cat]:
-                # Filter by standard if specified
-                if standard and item.standard.lower() != standard.lower():
+        results: List[StandardsSearchResult] = []
+        seen = set()
+        for score, lookup in tiers:
+            for doc in lookup(query_lower):
+                if doc in seen or not allowed(doc):
                     continue
+                if len(results) >= limit:
+                    return results
+                seen.add(doc)
+                item = self._documents[doc][1]
+                item.relevance_score = score
+                results.append(item)
+        return results
+
+    def filter_by_property(self, prop: str, min_value: Optional[float] = None,
+                           max_value: Optional[float] = None, category: Optional[str] = None,
+                           limit: Optional[int] = None) -> List[StandardsSearchResult]:
+        """
+        Find items by numeric property range (e.g. beams with Zx >= 100).
 
-                # Score relevance
-                score = self._calculate_relevance(query_lower, item)
-                if score > 0:
-                    item.relevance_score = score
-                    results.append(item)
-
-        # Sort by relevance and limit
-        results.sort(key=lambda x: x.relevance_score, reverse=True)
-        return results[:limit]
-
-    def _calculate_relevance(self, query: str, item: StandardsSearchResult) -> float:
-        """Calculate relevance score for search result."""
-        score = 0.0
-
-        # Exact match on designation
-        if query == item.designation.lower():
-            score += 1.0
-        # Partial match
-        elif query in item.designation.lower():
-            score += 0.7
-        # Match in category
-        elif query in item.category.lower():
-            score += 0.3
-        # Match in properties
-        else:
-            props_str = str(item.properties).lower()
-            if query in props_str:
-                score += 0.2
+        Args:
+            prop: Property name as stored (e.g. "Zx", "weight_per_ft")
+            min_value: Inclusive lower bound
+            max_value: Inclusive upper bound
+            category: Filter by category (beams, bolts, materials)
+            limit: Maximum results to return
 
-        return score
+        Returns:
+            Matching items in ascending property order
+        """
+        results: List[StandardsSearchResult] = []
+        for doc in self._search.in_range(prop, min_value, max_value):
+            cat, item = self._documents[doc]
+            if category and cat != category:
+                continue
+            results.append(item)
+            if limit is not None and len(results) >= limit:
+                break
+        return results
 
     # ==================== COMPONENT LOOKUPS ====================
 
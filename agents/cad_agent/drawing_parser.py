@@ -18,6 +18,8 @@ from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 
+from .extraction_cache import ExtractionCache, get_extraction_cache
+
 logger = logging.getLogger("vulcan.cad.drawing_parser")
 
 
@@ -176,10 +178,16 @@ class DrawingParser:
     - DWG files (requires conversion to DXF first)
     """
 
-    def __init__(self):
+    def __init__(self, cache: Optional[ExtractionCache] = None):
+        """
+        Args:
+            cache: PDF extraction cache (default: the shared one). Pass
+                ExtractionCache(cache_dir=None) to parse without caching.
+        """
         self.supported_formats = [".pdf", ".dwg", ".dxf"]
         self._pypdf_available = self._check_pypdf()
         self._ezdxf_available = self._check_ezdxf()
+        self.cache = get_extraction_cache() if cache is None else cache
 
     def _check_pypdf(self) -> bool:
         """Check if pypdf is available."""
@@ -239,31 +247,24 @@ class DrawingParser:
             return data
 
         try:
-            import pypdf
-
-            with open(path, "rb") as f:
-                reader = pypdf.PdfReader(f)
-
-                # Extract text from all pages
-                all_text = []
-                for page in reader.pages:
-                    text = page.extract_text() or ""
-                    all_text.append(text)
+            record = self.cache.get_record(path)
+            if record is None:
+                data.errors.append("PDF parse error: could not read PDF")
+                return data
 
-                data.raw_text = "\n".join(all_text)
+            data.raw_text = record.text
 
-                # Extract metadata from PDF properties
-                if reader.metadata:
-                    data.metadata.title = reader.metadata.get("/Title", "") or ""
-                    data.metadata.author = reader.metadata.get("/Author", "") or ""
+            # Extract metadata from PDF properties
+            data.metadata.title = record.metadata.get("/Title", "") or ""
+            data.metadata.author = record.metadata.get("/Author", "") or ""
 
-                # Parse the extracted text
-                self._extract_title_block(data)
-                self._extract_dimensions(data)
-                self._extract_notes(data)
-                self._extract_bom(data)
+            # Parse the extracted text
+            self._extract_title_block(data)
+            self._extract_dimensions(data)
+            self._extract_notes(data)
+            self._extract_bom(data)
 
-                logger.info(f"PDF parsed: {len(data.dimensions)} dimensions, {len(data.notes)} notes")
+            logger.info(f"PDF parsed: {len(data.dimensions)} dimensions, {len(data.notes)} notes")
 
         except Exception as e:
             logger.error(f"Error parsing PDF: {e}")
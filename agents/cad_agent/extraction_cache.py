@@ -0,0 +1,350 @@
+"""
+Extraction Cache
+================
+On-disk cache of PDF extraction results shared by every drawing parser.
+
+Entries are keyed by the SHA-256 of the file content plus EXTRACTOR_VERSION,
+so renaming or copying a drawing still hits the cache while any edit to the
+file (or a bump of the extractor version) misses it. Each entry stores the
+per-page text layer, per-page OCR output (by DPI) and page metadata.
+
+The cache directory is size-bounded; least recently used entries are evicted
+first. Writes are atomic so several worker processes can share one directory.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger("vulcan.cad.extraction_cache")
+
+# Bump whenever text/OCR extraction changes in a way that alters output
+EXTRACTOR_VERSION = "1"
+
+try:
+    import pypdf as _pdf_lib
+except ImportError:
+    try:
+        import PyPDF2 as _pdf_lib
+    except ImportError:
+        _pdf_lib = None
+
+
+@dataclass
+class PageRecord:
+    """Cached extraction output for one page."""
+    number: int  # 1-based
+    text: str = ""  # Text layer
+    width: float = 0.0  # Points
+    height: float = 0.0
+    rotation: int = 0
+    ocr: Dict[str, str] = field(default_factory=dict)  # DPI -> OCR text
+
+
+@dataclass
+class ExtractionRecord:
+    """Cached extraction output for one PDF."""
+    content_hash: str
+    extractor_version: str = EXTRACTOR_VERSION
+    page_count: int = 0
+    pages: List[PageRecord] = field(default_factory=list)
+    metadata: Dict[str, Any] = field(default_factory=dict)  # /Title, /Author, ...
+    created_at: float = field(default_factory=time.time)
+
+    @property
+    def page_texts(self) -> List[str]:
+        return [p.text for p in self.pages]
+
+    @property
+    def text(self) -> str:
+        """Text layer of all pages joined with newlines."""
+        return "\n".join(self.page_texts)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ExtractionRecord":
+        pages = [PageRecord(**p) for p in data.get("pages", [])]
+        return cls(**{**data, "pages": pages})
+
+
+class ExtractionCache:
+    """
+    Content-addressed, size-bounded LRU cache of PDF extraction results.
+
+    Usage:
+        cache = get_extraction_cache()
+        record = cache.get_record("drawing.pdf")      # text layer, cached
+        ocr = cache.get_ocr("drawing.pdf", [2, 3], 300, run_ocr)
+
+    With an empty ``cache_dir`` (None or "") nothing is read from or written
+    to disk and every call extracts afresh. Pass such an instance to a
+    parser to opt it out of the shared cache, or set
+    VULCAN_EXTRACTION_CACHE_DIR="" to turn the shared cache off.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Optional[str] = "storage/extraction_cache",
+        max_bytes: int = 256 * 1024 * 1024,
+        version: str = EXTRACTOR_VERSION,
+    ):
+        self.enabled = bool(cache_dir)
+        self.cache_dir = Path(cache_dir or "")
+        self.max_bytes = max_bytes
+        self.version = version
+        self._lock = threading.Lock()
+        self._index: Optional[Dict[str, Tuple[int, float]]] = None  # name -> (size, last access)
+        self._hashes: Dict[Tuple[str, int, int], str] = {}  # (path, size, mtime_ns) -> sha256
+        self._stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+
+    # -------------------------------------------------------------------------
+    # Keys
+    # -------------------------------------------------------------------------
+
+    def file_hash(self, file_path: str) -> str:
+        """SHA-256 of the file content, memoized by path, size and mtime."""
+        st = os.stat(file_path)
+        key = (os.path.abspath(file_path), st.st_size, st.st_mtime_ns)
+        digest = self._hashes.get(key)
+        if digest is None:
+            h = hashlib.sha256()
+            with open(file_path, "rb") as f:
+                for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            if len(self._hashes) > 4096:
+                self._hashes.clear()
+            self._hashes[key] = digest
+        return digest
+
+    def _entry_name(self, content_hash: str) -> str:
+        return f"{content_hash}_v{self.version}.json"
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _load_index(self) -> Dict[str, Tuple[int, float]]:
+        if self._index is None:
+            self._index = {}
+            if self.enabled and self.cache_dir.exists():
+                for entry in os.scandir(self.cache_dir):
+                    if entry.name.endswith(".json"):
+                        st = entry.stat()
+                        self._index[entry.name] = (st.st_size, st.st_mtime)
+        return self._index
+
+    def load(self, content_hash: str) -> Optional[ExtractionRecord]:
+        """Load a record by content hash, or None on miss."""
+        if not self.enabled:
+            return None
+        name = self._entry_name(content_hash)
+        path = self.cache_dir / name
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                record = ExtractionRecord.from_dict(json.load(f))
+        except FileNotFoundError:
+            return None
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Discarding corrupt cache entry {name}: {e}")
+            self._remove(name)
+            return None
+
+        now = time.time()
+        try:
+            os.utime(path, (now, now))  # mtime doubles as LRU timestamp
+        except OSError:
+            pass
+        with self._lock:
+            index = self._load_index()
+            size = index[name][0] if name in index else path.stat().st_size
+            index[name] = (size, now)
+        return record
+
+    def store(self, record: ExtractionRecord) -> None:
+        """Atomically write a record and evict LRU entries over budget."""
+        if not self.enabled:
+            return
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        name = self._entry_name(record.content_hash)
+        payload = json.dumps(record.to_dict(), separators=(",", ":")).encode("utf-8")
+
+        fd, tmp = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(payload)
+            os.replace(tmp, self.cache_dir / name)
+        except OSError as e:
+            logger.warning(f"Extraction cache write failed: {e}")
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            return
+
+        with self._lock:
+            self._stats["writes"] += 1
+            self._load_index()[name] = (len(payload), time.time())
+            self._evict()
+
+    def _evict(self) -> None:
+        index = self._index
+        total = sum(size for size, _ in index.values())
+        if total <= self.max_bytes:
+            return
+        for name, (size, _) in sorted(index.items(), key=lambda kv: kv[1][1]):
+            if total <= self.max_bytes:
+                break
+            self._remove(name)
+            total -= size
+            self._stats["evictions"] += 1
+
+    def _remove(self, name: str) -> None:
+        try:
+            os.unlink(self.cache_dir / name)
+        except OSError:
+            pass
+        if self._index is not None:
+            self._index.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove every cache entry."""
+        with self._lock:
+            for name in list(self._load_index()):
+                self._remove(name)
+
+    # -------------------------------------------------------------------------
+    # Extraction
+    # -------------------------------------------------------------------------
+
+    def get_record(self, file_path: str) -> Optional[ExtractionRecord]:
+        """
+        Get the text layer and page metadata for a PDF.
+
+        Reads the PDF only on a cache miss. Returns None when no PDF library
+        is installed or the file cannot be parsed.
+        """
+        content_hash = self.file_hash(file_path)
+        record = self.load(content_hash)
+        if record is not None:
+            self._stats["hits"] += 1
+            return record
+
+        self._stats["misses"] += 1
+        if _pdf_lib is None:
+            return None
+
+        try:
+            reader = _pdf_lib.PdfReader(file_path)
+            pages = []
+            for i, page in enumerate(reader.pages, start=1):
+                box = page.mediabox
+                pages.append(PageRecord(
+                    number=i,
+                    text=page.extract_text() or "",
+                    width=float(box.width),
+                    height=float(box.height),
+                    rotation=int(page.get("/Rotate", 0) or 0),
+                ))
+            metadata = {
+                str(k): str(v) for k, v in (reader.metadata or {}).items()
+            }
+        except Exception as e:
+            logger.error(f"PDF text extraction failed for {file_path}: {e}")
+            return None
+
+        record = ExtractionRecord(
+            content_hash=content_hash,
+            extractor_version=self.version,
+            page_count=len(pages),
+            pages=pages,
+            metadata=metadata,
+        )
+        self.store(record)
+        return record
+
+    def get_ocr(
+        self,
+        file_path: str,
+        pages: Iterable[int],
+        dpi: int,
+        run_ocr: Callable[[List[int]], Dict[int, str]],
+    ) -> Dict[int, str]:
+        """
+        Get OCR text for the given pages, running OCR only for pages that
+        have no cached result at this DPI.
+
+        Args:
+            file_path: Path to PDF file
+            pages: 1-based page numbers
+            dpi: Rasterization resolution used for OCR
+            run_ocr: Called with the missing page numbers; returns page -> text
+
+        Returns:
+            Page number -> OCR text for every page that produced output
+        """
+        pages = list(pages)
+        record = self.get_record(file_path)
+        if record is None:
+            # No text layer library; cache OCR under a bare record
+            content_hash = self.file_hash(file_path)
+            record = self.load(content_hash) or ExtractionRecord(content_hash=content_hash)
+
+        by_number = {p.number: p for p in record.pages}
+        key = str(dpi)
+        results = {
+            n: by_number[n].ocr[key]
+            for n in pages
+            if n in by_number and key in by_number[n].ocr
+        }
+        missing = [n for n in pages if n not in results]
+        if not missing:
+            return results
+
+        computed = run_ocr(missing)
+        for n, text in computed.items():
+            page = by_number.get(n)
+            if page is None:
+                page = by_number[n] = PageRecord(number=n)
+                record.pages.append(page)
+            page.ocr[key] = text
+            results[n] = text
+
+        record.pages.sort(key=lambda p: p.number)
+        record.page_count = max(record.page_count, len(record.pages))
+        self.store(record)
+        return results
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss counts and current size."""
+        with self._lock:
+            index = self._load_index()
+            return {
+                **self._stats,
+                "entries": len(index),
+                "bytes": sum(size for size, _ in index.values()),
+                "max_bytes": self.max_bytes,
+            }
+
+
+_cache: Optional[ExtractionCache] = None
+
+
+def get_extraction_cache() -> ExtractionCache:
+    """Get or create the shared extraction cache."""
+    global _cache
+    if _cache is None:
+        _cache = ExtractionCache(
+            cache_dir=os.getenv("VULCAN_EXTRACTION_CACHE_DIR", "storage/extraction_cache"),
+            max_bytes=int(os.getenv("VULCAN_EXTRACTION_CACHE_MB", "256")) * 1024 * 1024,
+        )
+    return _cache
@@ -1,27 +1,32 @@
-import pypdf
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
 
-logger = logging.getLogger("vulcan.cad.pdf_parser")
+from .extraction_cache import ExtractionCache, get_extraction_cache
 
+logger = logging.getLogger("vulcan.cad.pdf_parser")
 
-def extract_pdf_metadata(file_path: str) -> Dict[str, Any]:
-    """Extract metadata and text from a PDF drawing."""
-    try:
-        reader = pypdf.PdfReader(file_path)
-        meta = reader.metadata
-        text_content = []
 
-        for page in reader.pages:
-            text_content.append(page.extract_text())
+def extract_pdf_metadata(
+    file_path: str, cache: Optional[ExtractionCache] = None
+) -> Dict[str, Any]:
+    """
+    Extract metadata and text from a PDF drawing.
 
-        full_text = "\n".join(text_content)
+    Uses the shared extraction cache unless ``cache`` is given; pass
+    ExtractionCache(cache_dir=None) to read the PDF without caching.
+    """
+    if cache is None:
+        cache = get_extraction_cache()
+    try:
+        record = cache.get_record(file_path)
+        if record is None:
+            raise ValueError("could not read PDF")
 
         return {
-            "title": meta.title if meta else None,
-            "author": meta.author if meta else None,
-            "page_count": len(reader.pages),
-            "raw_text": full_text,
+            "title": record.metadata.get("/Title"),
+            "author": record.metadata.get("/Author"),
+            "page_count": record.page_count,
+            "raw_text": record.text,
         }
     except Exception as e:
         logger.error(f"Failed to parse PDF {file_path}: {e}")
@@ -8,6 +8,13 @@ Phase 25 - Added PDF Drawing Validation support.
 """
 
 from .orchestrator import ValidationOrchestrator
+from .check_scheduler import CheckScheduler, CheckSpec, CheckOutcome
+from .extraction_service import (
+    ExtractionService,
+    ExtractionBusyError,
+    ExtractionTimeoutError,
+    get_extraction_service,
+)
 from .drawing_analyzer import DrawingAnalyzer
 from .validation_models import (
     ValidationRequest,
@@ -129,6 +136,13 @@ from .gdt_validator import (
 __all__ = [
     # Core validators
     "ValidationOrchestrator",
+    "CheckScheduler",
+    "CheckSpec",
+    "CheckOutcome",
+    "ExtractionService",
+    "ExtractionBusyError",
+    "ExtractionTimeoutError",
+    "get_extraction_service",
     "DrawingAnalyzer",
     # Validation models
     "ValidationRequest",
@@ -0,0 +1,194 @@
+"""
+Check Scheduler
+
+Runs validation checks as a dependency graph instead of one after another.
+Checks whose dependencies are satisfied are launched together; async checks
+run on the event loop, blocking (CPU-bound) checks run on a worker pool.
+"""
+
+import asyncio
+import logging
+import time
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class CheckSpec:
+    """A single schedulable validation check."""
+
+    name: str
+    run: Callable[[], Awaitable[Any]]
+    depends_on: Tuple[str, ...] = ()
+    blocking: bool = True  # True = CPU-bound body, run on the worker pool
+    label: str = ""
+    message: str = ""
+
+
+@dataclass
+class CheckOutcome:
+    """Result and timing of one executed check."""
+
+    name: str
+    result: Any = None
+    duration_ms: float = 0.0
+    started_at: float = 0.0
+    finished_at: float = 0.0
+
+
+def _run_blocking(run: Callable[[], Awaitable[Any]]) -> Tuple[Any, float, float]:
+    """Drive a check coroutine to completion on a worker thread."""
+    started = time.perf_counter()
+    result = asyncio.run(run())
+    return result, started, time.perf_counter()
+
+
+class CheckScheduler:
+    """
+    Dependency-aware concurrent runner for validation checks.
+
+    Example:
+        >>> scheduler = CheckScheduler(max_workers=4)
+        >>> outcomes = await scheduler.run([
+        ...     CheckSpec("gdt", run_gdt),
+        ...     CheckSpec("report", run_report, depends_on=("gdt",)),
+        ... ])
+        >>> outcomes["gdt"].duration_ms
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ):
+        self.max_workers = max_workers
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def executor(self) -> Executor:
+        """Worker pool for blocking checks (created on first use)."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="vulcan-check"
+            )
+        return self._executor
+
+    def shutdown(self) -> None:
+        """Release the worker pool if this scheduler created it."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    @staticmethod
+    def order(specs: Sequence[CheckSpec]) -> List[List[str]]:
+        """
+        Group checks into dependency levels.
+
+        Dependencies on checks that are not scheduled are ignored (the
+        validator is unavailable or was not requested).
+
+        Raises:
+            ValueError: If the dependency graph contains a cycle
+        """
+        names = {spec.name for spec in specs}
+        remaining = {
+            spec.name: {d for d in spec.depends_on if d in names} for spec in specs
+        }
+        levels: List[List[str]] = []
+
+        while remaining:
+            ready = [name for name, deps in remaining.items() if not deps]
+            if not ready:
+                raise ValueError(
+                    f"Check dependency cycle among: {sorted(remaining)}"
+                )
+            levels.append(ready)
+            for name in ready:
+                del remaining[name]
+            for deps in remaining.values():
+                deps.difference_update(ready)
+
+        return levels
+
+    async def run(
+        self,
+        specs: Sequence[CheckSpec],
+        on_start: Optional[Callable[[CheckSpec, int], None]] = None,
+        on_complete: Optional[Callable[[CheckSpec, CheckOutcome, int], None]] = None,
+    ) -> Dict[str, CheckOutcome]:
+        """
+        Run all checks, launching each as soon as its dependencies finish.
+
+        Callbacks are invoked on the event loop thread with the number of
+        checks completed so far, so progress reported from them is monotonic.
+
+        Returns:
+            Outcomes keyed by check name, in the order the specs were given
+
+        Raises:
+            ValueError: On a dependency cycle
+            Exception: The first exception raised by a check; remaining
+                checks are cancelled
+        """
+        self.order(specs)  # validate the graph before launching anything
+
+        by_name = {spec.name: spec for spec in specs}
+        pending_deps = {
+            spec.name: {d for d in spec.depends_on if d in by_name} for spec in specs
+        }
+        outcomes: Dict[str, CheckOutcome] = {}
+        running: Dict[asyncio.Future, CheckSpec] = {}
+        loop = asyncio.get_running_loop()
+
+        def launch_ready() -> None:
+            for name in [n for n, deps in pending_deps.items() if not deps]:
+                del pending_deps[name]
+                spec = by_name[name]
+                if on_start:
+                    on_start(spec, len(outcomes))
+                if spec.blocking:
+                    future = loop.run_in_executor(self.executor, _run_blocking, spec.run)
+                else:
+                    future = asyncio.ensure_future(self._run_async(spec.run))
+                running[future] = spec
+
+        launch_ready()
+        try:
+            while running:
+                done, _ = await asyncio.wait(
+                    list(running), return_when=asyncio.FIRST_COMPLETED
+                )
+                for future in done:
+                    spec = running.pop(future)
+                    result, started, finished = future.result()
+                    outcome = CheckOutcome(
+                        name=spec.name,
+                        result=result,
+                        duration_ms=(finished - started) * 1000,
+                        started_at=started,
+                        finished_at=finished,
+                    )
+                    outcomes[spec.name] = outcome
+                    logger.debug(f"Check {spec.name} finished in {outcome.duration_ms:.1f}ms")
+
+                    for deps in pending_deps.values():
+                        deps.discard(spec.name)
+                    if on_complete:
+                        on_complete(spec, outcome, len(outcomes))
+                launch_ready()
+        except BaseException:
+            for future in running:
+                future.cancel()
+            raise
+
+        return {spec.name: outcomes[spec.name] for spec in specs}
+
+    @staticmethod
+    async def _run_async(run: Callable[[], Awaitable[Any]]) -> Tuple[Any, float, float]:
+        started = time.perf_counter()
+        result = await run()
+        return result, started, time.perf_counter()
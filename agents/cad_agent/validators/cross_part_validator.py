@@ -13,6 +13,12 @@ from enum import Enum
 
 from .validation_models import ValidationIssue, ValidationSeverity
 
+try:
+    from ..adapters.hole_matcher import match_points, register_points
+    HOLE_MATCHER_AVAILABLE = True
+except ImportError:
+    HOLE_MATCHER_AVAILABLE = False
+
 logger = logging.getLogger("vulcan.validator.cross_part")
 
 
@@ -134,8 +140,14 @@ class CrossPartValidator:
     8. Assembly sequence feasibility
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, register_hole_patterns: bool = False):
+        """
+        Args:
+            register_hole_patterns: Hole coordinates are in each part's own
+                frame; find the rotation/offset between patterns before
+                checking alignment
+        """
+        self.register_hole_patterns = register_hole_patterns
 
     def validate_interface_pair(
         self,
@@ -299,24 +311,29 @@ class CrossPartValidator:
             ))
             return
 
-        # Match holes by position
+        # Match holes by position (each axis within tolerance, one-to-one)
         tolerance = max(interface_a.position_tolerance, interface_b.position_tolerance)
-        matched = []
-        unmatched_a = list(range(len(holes_a)))
-        unmatched_b = list(range(len(holes_b)))
-
-        for i, h_a in enumerate(holes_a):
-            for j in unmatched_b:
-                h_b = holes_b[j]
-
-                dx = abs(h_a.get("x", 0) - h_b.get("x", 0))
-                dy = abs(h_a.get("y", 0) - h_b.get("y", 0))
-
-                if dx <= tolerance and dy <= tolerance:
-                    matched.append((i, j))
-                    unmatched_a.remove(i)
-                    unmatched_b.remove(j)
-                    break
+        if HOLE_MATCHER_AVAILABLE:
+            points_a = [(h.get("x", 0), h.get("y", 0)) for h in holes_a]
+            points_b = [(h.get("x", 0), h.get("y", 0)) for h in holes_b]
+            if self.register_hole_patterns:
+                points_b = register_points(points_a, points_b, tolerance).apply(points_b)
+            pairing = match_points(points_a, points_b, tolerance, metric="chebyshev")
+            unmatched_a, unmatched_b = pairing.unmatched_a, pairing.unmatched_b
+        else:
+            unmatched_a = list(range(len(holes_a)))
+            unmatched_b = list(range(len(holes_b)))
+            for i, h_a in enumerate(holes_a):
+                for j in unmatched_b:
+                    h_b = holes_b[j]
+
+                    dx = abs(h_a.get("x", 0) - h_b.get("x", 0))
+                    dy = abs(h_a.get("y", 0) - h_b.get("y", 0))
+
+                    if dx <= tolerance and dy <= tolerance:
+                        unmatched_a.remove(i)
+                        unmatched_b.remove(j)
+                        break
 
         if unmatched_a or unmatched_b:
             result.failed += 1
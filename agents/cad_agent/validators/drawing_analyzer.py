@@ -9,13 +9,13 @@ import logging
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 # Optional imports with graceful fallback
 try:
-    from pdf2image import convert_from_path
+    from pdf2image import convert_from_path, pdfinfo_from_path
 
     PDF2IMAGE_AVAILABLE = True
 except ImportError:
@@ -39,6 +39,12 @@ except ImportError:
     logger.warning("PyPDF2 not available - PDF text extraction disabled")
     PYPDF2_AVAILABLE = False
 
+try:
+    from ..extraction_cache import ExtractionCache, get_extraction_cache
+except ImportError:
+    ExtractionCache = None
+    get_extraction_cache = None
+
 
 @dataclass
 class DrawingAnalysis:
@@ -57,6 +63,7 @@ class DrawingAnalysis:
     drawing_number: Optional[str] = None
     revision: Optional[str] = None
     sheet_count: int = 0
+    page_count: int = 0
 
     # Engineering data
     datums: List[str] = field(default_factory=list)
@@ -65,12 +72,14 @@ class DrawingAnalysis:
     dimensions: List[str] = field(default_factory=list)
     notes: List[str] = field(default_factory=list)
 
-    # Images
-    page_images: List[Any] = field(default_factory=list)  # PIL Images
+    # Images - no longer retained; pages are rasterized one at a time and
+    # released after OCR (see DrawingAnalyzer.iter_page_images)
+    page_images: List[Any] = field(default_factory=list)
 
     # Analysis metadata
     analysis_duration_ms: int = 0
     ocr_used: bool = False
+    ocr_pages: List[int] = field(default_factory=list)  # 1-based
     errors: List[str] = field(default_factory=list)
 
 
@@ -87,14 +96,35 @@ class DrawingAnalyzer:
         >>> print(f"Extracted {len(analysis.extracted_text)} characters")
     """
 
-    def __init__(self, enable_ocr: bool = True):
+    def __init__(
+        self,
+        enable_ocr: bool = True,
+        dpi: int = 300,
+        min_page_text_chars: int = 100,
+        cache: Optional["ExtractionCache"] = None,
+        use_cache: bool = True,
+    ):
         """
         Initialize analyzer.
 
         Args:
             enable_ocr: Whether to use OCR for scanned PDFs
+            dpi: Rasterization resolution for OCR
+            min_page_text_chars: Pages whose text layer has fewer characters
+                than this are rasterized and OCR'd
+            cache: Extraction cache (defaults to the shared cache)
+            use_cache: Set False to always re-read the PDF, even if a
+                cache is given
         """
         self.enable_ocr = enable_ocr and PYTESSERACT_AVAILABLE
+        self.dpi = dpi
+        self.min_page_text_chars = min_page_text_chars
+        self.cache = None
+        if use_cache:
+            if cache is not None:
+                self.cache = cache
+            elif get_extraction_cache is not None:
+                self.cache = get_extraction_cache()
 
         logger.info("DrawingAnalyzer initialized")
         logger.info(f"  PDF text extraction: {'✓' if PYPDF2_AVAILABLE else '✗'}")
@@ -127,23 +157,47 @@ class DrawingAnalyzer:
         )
 
         try:
-            # Extract text directly from PDF
+            # Extract text directly from PDF, page by page
+            page_texts: List[str] = []
             if PYPDF2_AVAILABLE:
-                analysis.raw_text = self._extract_pdf_text(file_path)
+                page_texts = self._extract_page_texts(file_path)
+                analysis.raw_text = "\n".join(t for t in page_texts if t)
                 analysis.extracted_text = analysis.raw_text
                 logger.info(f"  Extracted {len(analysis.raw_text)} chars from PDF")
 
-            # Convert to images for OCR if needed
+            analysis.page_count = len(page_texts) or self._count_pages(file_path)
+
+            # OCR only the pages without a usable text layer, rasterizing
+            # one page at a time
             if self.enable_ocr and PDF2IMAGE_AVAILABLE:
-                analysis.page_images = self._convert_pdf_to_images(file_path)
-                logger.info(f"  Converted to {len(analysis.page_images)} images")
+                sparse_pages = [
+                    n
+                    for n in range(1, analysis.page_count + 1)
+                    if n > len(page_texts)
+                    or len(page_texts[n - 1].strip()) < self.min_page_text_chars
+                ]
+
+                if sparse_pages:
+                    ocr_results = self._ocr_pages(file_path, sparse_pages)
+                    analysis.ocr_pages = sorted(ocr_results)
+                    analysis.ocr_text = "\n".join(
+                        ocr_results[n] for n in analysis.ocr_pages if ocr_results[n]
+                    )
 
-                # Run OCR if text extraction yielded little content
-                if len(analysis.raw_text) < 100:
-                    analysis.ocr_text = self._run_ocr(analysis.page_images)
-                    analysis.extracted_text = analysis.ocr_text
-                    analysis.ocr_used = True
-                    logger.info(f"  OCR extracted {len(analysis.ocr_text)} chars")
+                    # Merge: text layer where good, OCR where the page was sparse
+                    merged = []
+                    for n in range(1, analysis.page_count + 1):
+                        text = ocr_results.get(n)
+                        if text is None and n <= len(page_texts):
+                            text = page_texts[n - 1]
+                        if text:
+                            merged.append(text)
+                    analysis.extracted_text = "\n".join(merged)
+                    analysis.ocr_used = bool(analysis.ocr_pages)
+                    logger.info(
+                        f"  OCR extracted {len(analysis.ocr_text)} chars "
+                        f"from {len(analysis.ocr_pages)} page(s)"
+                    )
 
             # Parse engineering data
             self._parse_engineering_data(analysis)
@@ -166,58 +220,98 @@ class DrawingAnalyzer:
 
         return analysis
 
-    def _extract_pdf_text(self, file_path: str) -> str:
-        """Extract text directly from PDF."""
+    def _extract_page_texts(self, file_path: str) -> List[str]:
+        """Extract the text layer of each page directly from the PDF."""
+        if self.cache is not None:
+            record = self.cache.get_record(file_path)
+            if record is not None:
+                return record.page_texts
+
         if not PYPDF2_AVAILABLE:
-            return ""
+            return []
 
         try:
             reader = PdfReader(file_path)
-            text_parts = []
-
-            for page in reader.pages:
-                text = page.extract_text()
-                if text:
-                    text_parts.append(text)
-
-            return "\n".join(text_parts)
+            return [page.extract_text() or "" for page in reader.pages]
 
         except Exception as e:
             logger.error(f"PDF text extraction failed: {e}")
-            return ""
+            return []
+
+    def _count_pages(self, file_path: str) -> int:
+        """Get the page count when no text layer could be read."""
+        if self.cache is not None:
+            record = self.cache.get_record(file_path)
+            if record is not None and record.page_count:
+                return record.page_count
 
-    def _convert_pdf_to_images(self, file_path: str) -> List[Any]:
-        """Convert PDF pages to images."""
         if not PDF2IMAGE_AVAILABLE:
-            return []
+            return 0
 
         try:
-            images = convert_from_path(file_path, dpi=300)
-            return images
+            return int(pdfinfo_from_path(file_path).get("Pages", 0))
 
         except Exception as e:
-            logger.error(f"PDF to image conversion failed: {e}")
-            return []
+            logger.error(f"PDF page count failed: {e}")
+            return 0
 
-    def _run_ocr(self, images: List[Any]) -> str:
-        """Run OCR on images."""
-        if not PYTESSERACT_AVAILABLE or not images:
-            return ""
+    def iter_page_images(
+        self, file_path: str, pages: Iterable[int]
+    ) -> Iterator[Tuple[int, Any]]:
+        """
+        Rasterize pages lazily, one at a time.
 
-        try:
-            text_parts = []
+        Only one page image is alive at a time as long as the caller drops
+        each image before advancing the generator.
 
-            for i, image in enumerate(images):
-                logger.debug(f"  Running OCR on page {i + 1}...")
-                text = pytesseract.image_to_string(image)
-                if text:
-                    text_parts.append(text)
+        Args:
+            file_path: Path to PDF file
+            pages: 1-based page numbers to rasterize
 
-            return "\n".join(text_parts)
+        Yields:
+            (page_number, PIL image) tuples
+        """
+        if not PDF2IMAGE_AVAILABLE:
+            return
 
-        except Exception as e:
-            logger.error(f"OCR failed: {e}")
-            return ""
+        for page_number in pages:
+            try:
+                images = convert_from_path(
+                    file_path, dpi=self.dpi, first_page=page_number, last_page=page_number
+                )
+            except Exception as e:
+                logger.error(f"PDF to image conversion failed on page {page_number}: {e}")
+                continue
+
+            if images:
+                # pop so the generator frame holds no reference while suspended
+                yield page_number, images.pop(0)
+
+    def _ocr_pages(self, file_path: str, pages: List[int]) -> Dict[int, str]:
+        """Get OCR text for pages, from the cache or by running OCR."""
+        if not PYTESSERACT_AVAILABLE or not pages:
+            return {}
+
+        if self.cache is not None:
+            return self.cache.get_ocr(
+                file_path, pages, self.dpi, lambda missing: self._run_ocr(file_path, missing)
+            )
+        return self._run_ocr(file_path, pages)
+
+    def _run_ocr(self, file_path: str, pages: List[int]) -> Dict[int, str]:
+        """Run OCR on the given pages, releasing each image when done."""
+        results: Dict[int, str] = {}
+        for page_number, image in self.iter_page_images(file_path, pages):
+            try:
+                logger.debug(f"  Running OCR on page {page_number}...")
+                results[page_number] = pytesseract.image_to_string(image) or ""
+            except Exception as e:
+                logger.error(f"OCR failed on page {page_number}: {e}")
+            finally:
+                image.close()
+                del image
+
+        return results
 
     def _parse_engineering_data(self, analysis: DrawingAnalysis) -> None:
         """Parse engineering data from extracted text."""
@@ -322,9 +416,7 @@ class DrawingAnalyzer:
         if sheet_match:
             analysis.sheet_count = int(sheet_match.group(1))
         else:
-            analysis.sheet_count = (
-                len(analysis.page_images) if analysis.page_images else 1
-            )
+            analysis.sheet_count = analysis.page_count or 1
 
     def analyze_dxf(self, file_path: str) -> DrawingAnalysis:
         """
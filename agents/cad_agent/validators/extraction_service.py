@@ -0,0 +1,241 @@
+"""
+Extraction Service
+
+Runs blocking PDF work (pypdf text extraction, pdf2image rasterization,
+pytesseract OCR) on a process pool so it never stalls the event loop.
+
+Provides bounded concurrency, backpressure when too many jobs are waiting,
+cancellation of queued jobs and per-job timeouts.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from .drawing_analyzer import DrawingAnalysis, DrawingAnalyzer
+
+logger = logging.getLogger(__name__)
+
+
+class ExtractionBusyError(RuntimeError):
+    """Raised when the wait queue is full and a new job is rejected."""
+
+
+class ExtractionTimeoutError(TimeoutError):
+    """Raised when an extraction job exceeds its timeout."""
+
+
+# Per-process analyzer, created lazily inside each worker
+_worker_analyzers: Dict[bool, DrawingAnalyzer] = {}
+
+
+def analyze_pdf_job(file_path: str, enable_ocr: bool = True) -> DrawingAnalysis:
+    """Worker entry point: analyze a PDF drawing inside a pool process."""
+    analyzer = _worker_analyzers.get(enable_ocr)
+    if analyzer is None:
+        analyzer = _worker_analyzers[enable_ocr] = DrawingAnalyzer(enable_ocr=enable_ocr)
+
+    return analyzer.analyze_pdf(file_path)
+
+
+class ExtractionService:
+    """
+    Async front end to a process pool for PDF extraction jobs.
+
+    At most ``max_workers`` jobs run at once and at most ``max_pending``
+    more may wait for a slot; beyond that ``submit`` raises
+    ExtractionBusyError so callers can shed load (HTTP 503).
+
+    Example:
+        >>> service = get_extraction_service()
+        >>> analysis = await service.analyze_pdf("drawing.pdf", timeout=120)
+        >>> result = await service.submit(validate_pdf, "drawing.pdf")
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_pending: int = 16,
+        default_timeout: Optional[float] = 300.0,
+        executor: Optional[Executor] = None,
+    ):
+        """
+        Initialize service.
+
+        Args:
+            max_workers: Concurrent jobs (default: min(4, CPU count))
+            max_pending: Jobs allowed to wait for a free slot
+            default_timeout: Per-job timeout in seconds (None = no limit)
+            executor: Custom executor (default: ProcessPoolExecutor)
+        """
+        self.max_workers = max_workers or min(4, os.cpu_count() or 1)
+        self.max_pending = max_pending
+        self.default_timeout = default_timeout
+        self._executor = executor
+        self._owns_executor = executor is None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._pending = 0
+        self._running = 0
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "rejected": 0,
+            "timed_out": 0,
+            "cancelled": 0,
+            "total_job_ms": 0.0,
+        }
+
+    @property
+    def executor(self) -> Executor:
+        """Process pool (created on first use)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _bind_loop(self) -> asyncio.Semaphore:
+        """Return the slot semaphore for the running loop."""
+        loop = asyncio.get_running_loop()
+        if loop is not self._loop:
+            self._loop = loop
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._running = 0
+        return self._slots
+
+    async def submit(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """
+        Run ``fn(*args)`` on the pool and await its result.
+
+        ``fn`` and its arguments must be picklable (module-level functions).
+
+        Args:
+            fn: Job function
+            *args: Job arguments
+            timeout: Seconds before giving up (default: service default)
+
+        Raises:
+            ExtractionBusyError: If the wait queue is full
+            ExtractionTimeoutError: If the job exceeds its timeout
+        """
+        slots = self._bind_loop()
+        timeout = self.default_timeout if timeout is None else timeout
+
+        if self._pending >= self.max_pending:
+            self._stats["rejected"] += 1
+            raise ExtractionBusyError(
+                f"Extraction queue full ({self._pending} jobs waiting)"
+            )
+
+        self._stats["submitted"] += 1
+        deadline = time.monotonic() + timeout if timeout else None
+
+        # Wait for a free slot; cancelling here drops the job before it runs
+        self._pending += 1
+        try:
+            if deadline is None:
+                await slots.acquire()
+            else:
+                await asyncio.wait_for(slots.acquire(), deadline - time.monotonic())
+        except asyncio.TimeoutError:
+            self._stats["timed_out"] += 1
+            raise ExtractionTimeoutError(f"{fn.__name__} timed out waiting for a worker")
+        except asyncio.CancelledError:
+            self._stats["cancelled"] += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        self._running += 1
+        started = time.perf_counter()
+        try:
+            job = self.executor.submit(fn, *args)
+        except BaseException:
+            self._running -= 1
+            slots.release()
+            raise
+
+        # The slot is held until the worker actually finishes, even when the
+        # caller stops waiting, so the concurrency bound stays truthful.
+        loop = self._loop
+
+        def release(done: Future) -> None:
+            try:
+                loop.call_soon_threadsafe(self._job_finished, slots, started)
+            except RuntimeError:
+                pass  # loop already closed
+
+        job.add_done_callback(release)
+
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            result = await asyncio.wait_for(asyncio.wrap_future(job), remaining)
+        except asyncio.TimeoutError:
+            job.cancel()
+            self._stats["timed_out"] += 1
+            raise ExtractionTimeoutError(f"{fn.__name__} timed out after {timeout}s")
+        except asyncio.CancelledError:
+            job.cancel()
+            self._stats["cancelled"] += 1
+            raise
+        except Exception:
+            self._stats["failed"] += 1
+            raise
+
+        self._stats["completed"] += 1
+        return result
+
+    def _job_finished(self, slots: asyncio.Semaphore, started: float) -> None:
+        if slots is not self._slots:
+            return  # belongs to a previous event loop
+        self._running -= 1
+        self._stats["total_job_ms"] += (time.perf_counter() - started) * 1000
+        slots.release()
+
+    async def analyze_pdf(
+        self,
+        file_path: str,
+        enable_ocr: bool = True,
+        timeout: Optional[float] = None,
+    ) -> DrawingAnalysis:
+        """Analyze a PDF drawing on the pool (see DrawingAnalyzer.analyze_pdf)."""
+        return await self.submit(analyze_pdf_job, file_path, enable_ocr, timeout=timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue and job statistics."""
+        finished = self._stats["completed"] + self._stats["failed"]
+        return {
+            **self._stats,
+            "total_job_ms": round(self._stats["total_job_ms"], 1),
+            "avg_job_ms": round(self._stats["total_job_ms"] / finished, 1) if finished else 0.0,
+            "running": self._running,
+            "pending": self._pending,
+            "max_workers": self.max_workers,
+            "max_pending": self.max_pending,
+        }
+
+    def shutdown(self, wait: bool = False) -> None:
+        """Stop the pool if this service created it."""
+        if self._executor is not None and self._owns_executor:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_service: Optional[ExtractionService] = None
+
+
+def get_extraction_service() -> ExtractionService:
+    """Get or create extraction service singleton."""
+    global _service
+    if _service is None:
+        _service = ExtractionService()
+    return _service
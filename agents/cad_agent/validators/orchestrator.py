@@ -8,8 +8,10 @@ import logging
 import time
 import uuid
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
+from .check_scheduler import CheckOutcome, CheckScheduler, CheckSpec
+from .extraction_service import ExtractionService, get_extraction_service
 from .validation_models import (
     ACHEValidationResult,
     GDTValidationResult,
@@ -199,8 +201,50 @@ class ValidationOrchestrator:
         >>> print(f"Pass rate: {report.pass_rate:.1f}%")
     """
 
-    def __init__(self):
-        """Initialize orchestrator with all validators."""
+    # Progress step label and message for each check
+    _CHECK_STEPS: Dict[str, Tuple[str, str]] = {
+        "gdt": ("GD&T validation", "Parsing geometric tolerances..."),
+        "welding": ("Welding validation", "Validating weld symbols and callouts..."),
+        "material": ("Material validation", "Checking material specifications..."),
+        "ache": ("ACHE validation", "Running 130-point comprehensive checklist..."),
+        "drawing": ("Drawing validation", "Validating title block, dimensions, and notes..."),
+        "holes": ("AISC Hole validation", "Checking hole edge distances and spacing..."),
+        "structural": ("Structural capacity validation", "Checking bolt and weld capacities..."),
+        "shaft": ("Shaft/machining validation", "Checking tolerances and keyways..."),
+        "handling": ("Handling validation", "Checking lifting lugs and CG..."),
+        "bom": ("BOM validation", "Validating bill of materials..."),
+        "dimensions": ("Dimension validation", "Checking dimension callouts..."),
+        "osha": ("OSHA safety validation", "Checking safety requirements..."),
+    }
+
+    # Report attribute for checks with a dedicated result model; all other
+    # checks are stored in phase25_results
+    _REPORT_FIELDS: Dict[str, str] = {
+        "gdt": "gdt_results",
+        "welding": "welding_results",
+        "material": "material_results",
+        "ache": "ache_results",
+        "drawing": "drawing_results",
+    }
+
+    # Checks that must wait for other checks to finish. Every current check
+    # only reads the shared DrawingAnalysis, so they all run concurrently.
+    CHECK_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {}
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        extraction_service: Optional[ExtractionService] = None,
+    ):
+        """
+        Initialize orchestrator with all validators.
+
+        Args:
+            max_workers: Size of the worker pool used to run checks
+                concurrently (defaults to the executor's own default)
+            extraction_service: Process pool for PDF analysis
+                (defaults to the shared service)
+        """
         self.gdt_parser = GDTParser() if GDTParser else None
         self.welding_validator = WeldingValidator() if WeldingValidator else None
         self.material_validator = MaterialValidator() if MaterialValidator else None
@@ -232,6 +276,9 @@ class ValidationOrchestrator:
         self.hpc_walkway_validator = HPCWalkwayValidator() if HPCWalkwayValidator else None
         self.hpc_header_validator = HPCHeaderValidator() if HPCHeaderValidator else None
 
+        self.scheduler = CheckScheduler(max_workers=max_workers)
+        self.extraction_service = extraction_service or get_extraction_service()
+
         # Progress callbacks
         self._progress_callbacks: List[Callable[[ValidationProgress], None]] = []
 
@@ -321,142 +368,47 @@ class ValidationOrchestrator:
                 "Extracting text and metadata from PDF...",
             )
 
-            analysis = self.drawing_analyzer.analyze_pdf(file_path)
+            analysis = await self.extraction_service.analyze_pdf(
+                file_path, enable_ocr=self.drawing_analyzer.enable_ocr
+            )
 
             # Step 2: Run requested checks
             checks_to_run = self._determine_checks(request.checks)
             total_checks = len(checks_to_run)
 
-            for i, check in enumerate(checks_to_run):
-                progress = 10 + int((i + 1) / total_checks * 80)
+            specs = self._build_check_specs(checks_to_run, analysis, file_path)
 
-                if check == "gdt":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "GD&T validation",
-                        progress,
-                        "Parsing geometric tolerances...",
-                    )
-                    report.gdt_results = await self._validate_gdt(analysis)
-
-                elif check == "welding":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Welding validation",
-                        progress,
-                        "Validating weld symbols and callouts...",
-                    )
-                    report.welding_results = await self._validate_welding(analysis)
-
-                elif check == "material":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Material validation",
-                        progress,
-                        "Checking material specifications...",
-                    )
-                    report.material_results = await self._validate_material(analysis)
-
-                elif check == "ache":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "ACHE validation",
-                        progress,
-                        "Running 130-point comprehensive checklist...",
-                    )
-                    report.ache_results = await self._validate_ache(analysis, file_path)
-
-                elif check == "drawing":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Drawing validation",
-                        progress,
-                        "Validating title block, dimensions, and notes...",
-                    )
-                    report.drawing_results = await self._validate_drawing(file_path)
-
-                # Phase 25 - New validators
-                elif check == "holes":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "AISC Hole validation",
-                        progress,
-                        "Checking hole edge distances and spacing...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["holes"] = await self._validate_holes(analysis)
-
-                elif check == "structural":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Structural capacity validation",
-                        progress,
-                        "Checking bolt and weld capacities...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["structural"] = await self._validate_structural(analysis)
-
-                elif check == "shaft":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Shaft/machining validation",
-                        progress,
-                        "Checking tolerances and keyways...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["shaft"] = await self._validate_shaft(analysis)
-
-                elif check == "handling":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Handling validation",
-                        progress,
-                        "Checking lifting lugs and CG...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["handling"] = await self._validate_handling(analysis)
-
-                elif check == "bom":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "BOM validation",
-                        progress,
-                        "Validating bill of materials...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["bom"] = await self._validate_bom(analysis)
-
-                elif check == "dimensions":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "Dimension validation",
-                        progress,
-                        "Checking dimension callouts...",
-                    )
-                    report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["dimensions"] = await self._validate_dimensions(analysis)
-
-                elif check == "osha":
-                    self._report_progress(
-                        request_id,
-                        ValidationStatus.RUNNING,
-                        "OSHA safety validation",
-                        progress,
-                        "Checking safety requirements...",
-                    )
+            def on_start(spec: CheckSpec, completed: int) -> None:
+                self._report_progress(
+                    request_id,
+                    ValidationStatus.RUNNING,
+                    spec.label,
+                    10 + int(completed / total_checks * 80),
+                    spec.message,
+                )
+
+            def on_complete(spec: CheckSpec, outcome: CheckOutcome, completed: int) -> None:
+                self._report_progress(
+                    request_id,
+                    ValidationStatus.RUNNING,
+                    spec.label,
+                    10 + int(completed / total_checks * 80),
+                    f"{spec.label} finished in {outcome.duration_ms:.0f}ms",
+                )
+
+            outcomes = await self.scheduler.run(
+                specs, on_start=on_start, on_complete=on_complete
+            )
+
+            # Apply results in request order so the report is deterministic
+            for check, outcome in outcomes.items():
+                field_name = self._REPORT_FIELDS.get(check)
+                if field_name:
+                    setattr(report, field_name, outcome.result)
+                else:
                     report.phase25_results = report.phase25_results or {}
-                    report.phase25_results["osha"] = await self._validate_osha(analysis)
+                    report.phase25_results[check] = outcome.result
+                report.check_timings[check] = round(outcome.duration_ms, 2)
 
             # Step 3: Calculate summary (95%)
             self._report_progress(
@@ -505,6 +457,39 @@ class ValidationOrchestrator:
 
             raise
 
+    def _build_check_specs(
+        self, checks: List[str], analysis: Any, file_path: str
+    ) -> List[CheckSpec]:
+        """Build schedulable specs for the requested checks."""
+        runners: Dict[str, Callable[[], Any]] = {
+            "gdt": lambda: self._validate_gdt(analysis),
+            "welding": lambda: self._validate_welding(analysis),
+            "material": lambda: self._validate_material(analysis),
+            "ache": lambda: self._validate_ache(analysis, file_path),
+            "drawing": lambda: self._validate_drawing(file_path),
+            "holes": lambda: self._validate_holes(analysis),
+            "structural": lambda: self._validate_structural(analysis),
+            "shaft": lambda: self._validate_shaft(analysis),
+            "handling": lambda: self._validate_handling(analysis),
+            "bom": lambda: self._validate_bom(analysis),
+            "dimensions": lambda: self._validate_dimensions(analysis),
+            "osha": lambda: self._validate_osha(analysis),
+        }
+
+        specs = []
+        for check in checks:
+            label, message = self._CHECK_STEPS[check]
+            specs.append(
+                CheckSpec(
+                    name=check,
+                    run=runners[check],
+                    depends_on=self.CHECK_DEPENDENCIES.get(check, ()),
+                    label=label,
+                    message=message,
+                )
+            )
+        return specs
+
     def _determine_checks(self, requested: List[str]) -> List[str]:
         """Determine which checks to run based on request."""
         if "all" in requested:
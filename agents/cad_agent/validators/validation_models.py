@@ -140,6 +140,9 @@ class ValidationReport(BaseModel):
     critical_failures: int = 0
     pass_rate: float = 0.0
 
+    # Per-check wall-clock time in milliseconds, keyed by check name
+    check_timings: Dict[str, float] = Field(default_factory=dict)
+
     # All issues combined
     all_issues: List[ValidationIssue] = Field(default_factory=list)
 
@@ -10,6 +10,9 @@ Contains shared functionality used by all agents, including:
 from . import memory
 from .logging import BlackBoxLogger, get_logger
 from .redis_adapter import RedisCacheAdapter, get_cache
+from .llm_cache import ResponseCache, get_response_cache, request_key
+from .llm_coalesce import MicroBatcher, SingleFlight, get_single_flight
+from .llm_semantic_cache import SemanticCache, get_semantic_cache
 from .model_router import ModelRouter, ModelTier, RoutingDecision, get_model_router
 from .token_optimizer_v2 import TokenOptimizerV2, get_token_optimizer_v2
 from .orchestrator_adapter import (
@@ -60,6 +63,14 @@ __all__ = [
     # Cost Optimization Stack
     "RedisCacheAdapter",
     "get_cache",
+    "ResponseCache",
+    "get_response_cache",
+    "request_key",
+    "SingleFlight",
+    "MicroBatcher",
+    "get_single_flight",
+    "SemanticCache",
+    "get_semantic_cache",
     "ModelRouter",
     "ModelTier",
     "RoutingDecision",
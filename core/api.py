@@ -13,6 +13,7 @@ from collections import defaultdict
 from typing import List, Dict, Any, Optional
 from fastapi import FastAPI, HTTPException, Security, Depends, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from fastapi.security import APIKeyHeader
 
@@ -26,6 +27,7 @@ from core.orchestrator_adapter import get_orchestrator, TaskRequest, AgentType
 from core.database_adapter import get_db_adapter
 from core.metrics.strategy_scoring import get_strategy_scorer
 from core.audit_logger import get_audit_logger
+from core.llm_semantic_cache import prompt_version
 
 # Initialize logging
 from core.logging_config import setup_logging
@@ -391,6 +393,14 @@ async def startup_event():
     logger.info("Orchestrator ready with agents: Trading, CAD, Sketch, Work")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Close pooled LLM connections."""
+    from core.llm_async import get_llm
+
+    await get_llm().aclose()
+
+
 @app.get("/health")
 async def health():
     """Health check with desktop connectivity."""
@@ -410,9 +420,14 @@ async def health():
     }
 
 
-@app.post("/chat")
-async def chat(request: ChatRequest, api_key: str = Depends(get_api_key)):
-    """Process chat via OrchestratorAdapter."""
+async def _prepare_chat(request: ChatRequest):
+    """
+    Pick the agent and build its system prompt (desktop + RAG context) and messages.
+
+    Also returns the system prompt version for the semantic cache: the base
+    prompt plus desktop context. Retrieved RAG context follows the question,
+    so it is left out and paraphrases can share an answer.
+    """
     if not request.messages:
         raise HTTPException(status_code=400, detail="No messages provided")
 
@@ -462,6 +477,8 @@ async def chat(request: ChatRequest, api_key: str = Depends(get_api_key)):
         except Exception as e:
             logger.warning(f"Failed to fetch desktop context: {e}")
 
+    system_version = prompt_version(system_prompt + desktop_context)
+
     # Augment with RAG if available
     try:
         from core.memory.rag_engine import RAGEngine
@@ -476,14 +493,26 @@ async def chat(request: ChatRequest, api_key: str = Depends(get_api_key)):
     if desktop_context:
         system_prompt += desktop_context
 
-    # Generate response
+    messages = [{"role": m.role, "content": m.content} for m in request.messages]
+    return agent_type, system_prompt, system_version, messages
+
+
+@app.post("/chat")
+async def chat(request: ChatRequest, api_key: str = Depends(get_api_key)):
+    """Process chat via OrchestratorAdapter."""
+    agent_type, system_prompt, system_version, messages = await _prepare_chat(request)
+
+    # Generate response (async client: the event loop keeps serving meanwhile)
     try:
-        from core.llm import llm
+        from core.llm_async import get_llm
 
-        messages = [{"role": m.role, "content": m.content} for m in request.messages]
-        response = llm.generate(
-            messages=messages, system=system_prompt, agent_type=agent_type.value
+        result = await get_llm().chat(
+            messages=messages,
+            system_prompt=system_prompt,
+            agent_type=agent_type.value,
+            system_version=system_version,
         )
+        response = result.content
 
         # Handle Actions in response
         if "[ACTION:" in response:
@@ -519,6 +548,32 @@ async def chat(request: ChatRequest, api_key: str = Depends(get_api_key)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/chat/stream")
+async def chat_stream(request: ChatRequest, api_key: str = Depends(get_api_key)):
+    """Process chat and stream the response text as it is generated."""
+    agent_type, system_prompt, system_version, messages = await _prepare_chat(request)
+    from core.llm_async import get_llm
+
+    async def body():
+        try:
+            async for text in get_llm().stream(
+                messages=messages,
+                system_prompt=system_prompt,
+                agent_type=agent_type.value,
+                system_version=system_version,
+            ):
+                yield text
+        except Exception as e:
+            logger.error(f"Chat stream failed: {e}")
+            yield f"\n\n[System: generation failed: {e}]"
+
+    return StreamingResponse(
+        body(),
+        media_type="text/plain; charset=utf-8",
+        headers={"X-Agent": agent_type.value},
+    )
+
+
 @app.post("/desktop/command")
 async def desktop_command(cmd: DesktopCommand, api_key: str = Depends(get_api_key)):
     """Bridge to the local desktop server."""
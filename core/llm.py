@@ -6,8 +6,9 @@ Features:
 1. Anthropic Native Prompt Caching (90% savings on system prompts)
 2. Model Router (Haiku for simple, Sonnet for complex)
 3. Token Optimizer (history trimming, prompt compression)
-4. Redis Response Caching (avoid duplicate API calls)
-5. Batch API support (50% savings for non-urgent)
+4. Response Caching keyed by the full request (avoid duplicate API calls)
+5. Request coalescing (concurrent identical calls share one API call)
+6. Batch API support (50% savings for non-urgent), with micro-batching
 """
 
 import os
@@ -44,6 +45,8 @@ class LLMClient:
         self._router = None
         self._optimizer = None
         self._cache = None
+        self._inflight = None
+        self._batcher = None
 
     @property
     def router(self):
@@ -72,13 +75,29 @@ class LLMClient:
     def cache(self):
         if self._cache is None:
             try:
-                from .redis_adapter import get_cache
+                from .llm_cache import get_response_cache
 
-                self._cache = get_cache()
+                self._cache = get_response_cache()
             except ImportError:
                 pass
         return self._cache
 
+    @property
+    def inflight(self):
+        if self._inflight is None:
+            from .llm_coalesce import get_single_flight
+
+            self._inflight = get_single_flight()
+        return self._inflight
+
+    @property
+    def batcher(self):
+        if self._batcher is None:
+            from .llm_coalesce import MicroBatcher
+
+            self._batcher = MicroBatcher(send=self.generate_batch)
+        return self._batcher
+
     def generate(
         self,
         messages: List[Dict[str, str]],
@@ -89,6 +108,7 @@ class LLMClient:
         auto_route: bool = True,
         optimize_tokens: bool = True,
         use_cache: bool = True,
+        coalesce: bool = True,
         use_prompt_cache: bool = True,  # NEW: Anthropic native caching
         agent_type: str = "general",
     ) -> str:
@@ -96,10 +116,11 @@ class LLMClient:
         Generate with MAXIMUM cost optimization.
 
         Cost-saving features:
-        1. Redis cache check (avoid duplicate calls entirely)
-        2. Model routing (Haiku is 12x cheaper than Sonnet)
-        3. Token optimization (reduce input/output tokens)
-        4. Anthropic prompt caching (90% cheaper on system prompts)
+        1. Model routing (Haiku is 12x cheaper than Sonnet)
+        2. Token optimization (reduce input/output tokens)
+        3. Response cache check on the final request (avoid duplicate calls entirely)
+        4. Coalescing with identical in-flight requests (one call for all)
+        5. Anthropic prompt caching (90% cheaper on system prompts)
 
         Args:
             messages: Conversation history
@@ -109,7 +130,8 @@ class LLMClient:
             temperature: Response temperature
             auto_route: Use model router
             optimize_tokens: Use token optimizer
-            use_cache: Check Redis cache first
+            use_cache: Check the response cache before calling the API
+            coalesce: Share the API call with identical concurrent requests
             use_prompt_cache: Use Anthropic's native prompt caching
             agent_type: Agent type for routing
         """
@@ -118,16 +140,7 @@ class LLMClient:
 
         last_message = messages[-1]["content"] if messages else ""
 
-        # 1. Check Redis cache first (completely free if hit!)
-        cache_key = None
-        if use_cache and self.cache:
-            cache_key = f"llm:{hash(last_message + system + agent_type)}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                logger.info("⚡ Redis cache HIT - FREE response!")
-                return cached
-
-        # 2. Route to appropriate model
+        # 1. Route to appropriate model
         if auto_route and model is None and self.router:
             decision = self.router.route(last_message, agent_type)
             model = decision.model
@@ -139,7 +152,7 @@ class LLMClient:
             max_tokens = max_tokens or 4096
             temperature = temperature or 0.7
 
-        # 3. Optimize tokens with V2 (includes Anthropic prompt caching)
+        # 2. Optimize tokens with V2 (includes Anthropic prompt caching)
         system_payload = system  # Default: plain string
 
         if optimize_tokens and self.optimizer:
@@ -170,7 +183,17 @@ class LLMClient:
                         "🔥 Anthropic prompt caching ENABLED (90% savings on system prompt)"
                     )
 
-        try:
+        # 3. Check response cache on the exact request (completely free if hit!)
+        from .llm_cache import request_key
+
+        cache_key = request_key(model, messages, system_payload, max_tokens, temperature)
+        if use_cache and self.cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info("⚡ Response cache HIT - FREE response!")
+                return cached["content"]
+
+        def call() -> str:
             response = self.client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
@@ -193,10 +216,19 @@ class LLMClient:
                         f"📝 Prompt cache CREATED: {cache_create} tokens (next call = 90% off)"
                     )
 
-            # 4. Store in Redis cache for future
-            if use_cache and self.cache and cache_key:
-                self.cache.set(cache_key, result, ttl=3600)
+            # Store in response cache for future
+            if use_cache and self.cache:
+                self.cache.set(cache_key, {"content": result, "model": model}, agent_type=agent_type)
+
+            return result
 
+        # 4. Identical requests already in flight share that call
+        try:
+            if not coalesce:
+                return call()
+            result, shared = self.inflight.do(cache_key, call)
+            if shared:
+                logger.info("🔗 Coalesced with an identical in-flight request - FREE response!")
             return result
 
         except Exception as e:
@@ -216,36 +248,39 @@ class LLMClient:
         )
 
     def generate_batch(
-        self, requests: List[Dict[str, Any]], wait_for_completion: bool = True
+        self,
+        requests: List[Dict[str, Any]],
+        wait_for_completion: bool = True,
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
     ) -> List[str]:
         """
         Batch API for non-urgent tasks (50% cheaper!).
 
+        Blocks the calling thread while polling; async code should use
+        core.llm_async.LLMClient.generate_batch instead.
+
         Args:
-            requests: List of {"messages": [...], "system": "..."}
+            requests: List of {"messages": [...], "system": "..."}, optionally
+                with "model", "max_tokens" and "temperature"
             wait_for_completion: Wait for all results
+            poll_interval: First wait between status checks (doubles each time)
+            max_poll_interval: Longest wait between status checks
 
         Returns:
-            List of responses
+            List of responses, in request order
         """
         if not self.client:
             return ["Error: LLM not initialized"] * len(requests)
 
         try:
+            from .llm_async import batch_params
+
             # Prepare batch
-            batch_requests = []
-            for i, req in enumerate(requests):
-                batch_requests.append(
-                    {
-                        "custom_id": f"req_{i}",
-                        "params": {
-                            "model": "claude-sonnet-4-20250514",
-                            "max_tokens": 1024,
-                            "messages": req.get("messages", []),
-                            "system": req.get("system", ""),
-                        },
-                    }
-                )
+            batch_requests = [
+                {"custom_id": f"req_{i}", "params": batch_params(req)}
+                for i, req in enumerate(requests)
+            ]
 
             # Submit batch
             batch = self.client.messages.batches.create(requests=batch_requests)
@@ -253,20 +288,23 @@ class LLMClient:
             if not wait_for_completion:
                 return [f"Batch submitted: {batch.id}"]
 
-            # Poll for completion
+            # Poll for completion, backing off exponentially
             import time
 
-            while batch.processing_status == "in_progress":
-                time.sleep(5)
+            delay = poll_interval
+            while batch.processing_status != "ended":
+                time.sleep(delay)
+                delay = min(delay * 2, max_poll_interval)
                 batch = self.client.messages.batches.retrieve(batch.id)
 
-            # Collect results
-            results = []
+            # Collect results (the API doesn't guarantee request order)
+            by_id = {}
             for result in self.client.messages.batches.results(batch.id):
                 if result.result.type == "succeeded":
-                    results.append(result.result.message.content[0].text)
+                    by_id[result.custom_id] = result.result.message.content[0].text
                 else:
-                    results.append(f"Error: {result.result.error}")
+                    by_id[result.custom_id] = f"Error: {result.result.error}"
+            results = [by_id.get(f"req_{i}", "Error: missing batch result") for i in range(len(requests))]
 
             logger.info(f"📦 Batch complete: {len(results)} results at 50% off!")
             return results
@@ -275,6 +313,34 @@ class LLMClient:
             logger.error(f"Batch error: {e}")
             return [f"Batch error: {e}"] * len(requests)
 
+    def submit_batched(
+        self,
+        messages: List[Dict[str, str]],
+        system: str = "",
+        model: str = None,
+        max_tokens: int = None,
+    ):
+        """
+        Queue a small non-urgent prompt for the next micro-batch.
+
+        Prompts submitted within the batcher's window go out together
+        through generate_batch (50% cheaper); identical prompts in a window
+        are sent once.
+
+        Returns:
+            Future resolving to the response text
+        """
+        return self.batcher.submit(
+            {"messages": messages, "system": system, "model": model, "max_tokens": max_tokens}
+        )
+
+    def coalescing_stats(self) -> Dict[str, Any]:
+        """Calls coalesced in flight and sent in micro-batches."""
+        return {
+            "in_flight": self.inflight.stats(),
+            "micro_batches": self._batcher.stats() if self._batcher else None,
+        }
+
 
 # Global instance
 llm = LLMClient()
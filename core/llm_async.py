@@ -1,22 +1,36 @@
 """
 LLM Client Adapter
-Unified interface for Claude API with auto-routing and caching.
+Unified async interface for Claude API with auto-routing and caching.
 
 Integrates:
 - Model Router: Haiku for simple, Sonnet for complex
-- Redis Cache: Skip API calls for cached responses
+- Response Cache: Skip API calls for requests already answered
+- Single-flight: Concurrent identical requests share one API call
+- Semantic Cache (opt-in, ENABLE_SEMANTIC_CACHE=true): Paraphrased
+  questions reuse an earlier answer
 - Token Optimizer: Reduce input/output tokens
 
-Packages Used: anthropic (pip install anthropic)
+Every call goes through the SDK's async client, so the event loop keeps
+serving while a request is in flight:
+- One pooled HTTP connection set per event loop, reused by all calls
+- Per-model concurrency caps (asyncio semaphores)
+- Token streaming straight from the API
+- Batch API polling with exponential backoff
+
+Packages Used: anthropic (pip install anthropic), httpx
 """
 
+import asyncio
 import os
 import logging
-from typing import List, Dict, Optional, AsyncGenerator
-from dataclasses import dataclass
-
-from .model_router import get_model_router, RoutingDecision
-from .redis_adapter import get_cache
+import weakref
+from typing import Any, List, Dict, Optional, AsyncGenerator, Tuple
+from dataclasses import dataclass, field, replace
+
+from .llm_cache import get_response_cache, request_key
+from .llm_coalesce import get_single_flight
+from .llm_semantic_cache import SemanticCache, get_semantic_cache, prompt_version, semantic_query
+from .model_router import get_model_router, ModelProvider, RoutingDecision
 from .token_optimizer_v2 import get_token_optimizer_v2
 
 logger = logging.getLogger("core.llm")
@@ -32,11 +46,34 @@ class LLMResponse:
     input_tokens: int
     output_tokens: int
     cost_estimate: float  # USD
+    coalesced: bool = False  # Served by another caller's identical in-flight request
+    semantic: bool = False  # Served by the semantic cache for a similar question
+
+
+@dataclass
+class _LoopState:
+    """Async client and concurrency limits bound to one event loop."""
+
+    client: Any
+    limits: Dict[str, asyncio.Semaphore] = field(default_factory=dict)
+
+
+def batch_params(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Batch API params for a {"messages", "system", "model"?, "max_tokens"?, "temperature"?} request."""
+    params = {
+        "model": request.get("model") or "claude-sonnet-4-20250514",
+        "max_tokens": request.get("max_tokens") or 1024,
+        "messages": request.get("messages", []),
+        "system": request.get("system", ""),
+    }
+    if request.get("temperature") is not None:
+        params["temperature"] = request["temperature"]
+    return params
 
 
 class LLMClient:
     """
-    Cost-optimized Claude client.
+    Cost-optimized async Claude client.
 
     Usage:
         client = LLMClient()
@@ -45,6 +82,9 @@ class LLMClient:
             agent_type="trading"
         )
         # Uses Haiku (12x cheaper) + caches response
+
+        async for text in client.stream(messages, system_prompt=prompt):
+            ...
     """
 
     # Cost per 1M tokens (USD)
@@ -53,40 +93,104 @@ class LLMClient:
         "claude-sonnet-4-20250514": {"input": 3.0, "output": 15.0},
     }
 
-    def __init__(self, api_key: str = None):
+    # Concurrent requests per model (rate limits are per model)
+    MODEL_CONCURRENCY = {
+        "claude-3-haiku-20240307": 16,
+        "default": 8,
+    }
+
+    def __init__(
+        self,
+        api_key: str = None,
+        base_url: Optional[str] = None,
+        client: Any = None,
+        max_connections: int = 32,
+        model_concurrency: Optional[Dict[str, int]] = None,
+        timeout: float = 120.0,
+        semantic_cache: Optional[SemanticCache] = None,
+    ):
+        """
+        Args:
+            api_key: Anthropic API key (defaults to ANTHROPIC_API_KEY)
+            base_url: API base URL (defaults to ANTHROPIC_BASE_URL or the SDK's)
+            client: Preconfigured AsyncAnthropic-compatible client, used as is
+            max_connections: HTTP connection pool size per event loop
+            model_concurrency: Overrides merged over MODEL_CONCURRENCY
+            timeout: Request timeout in seconds
+            semantic_cache: Similarity-matched cache tier; defaults to the
+                shared one if ENABLE_SEMANTIC_CACHE is "true", else off
+        """
         self.api_key = api_key or os.getenv("ANTHROPIC_API_KEY")
-        self._client = None
+        self.base_url = base_url or os.getenv("ANTHROPIC_BASE_URL")
+        self.max_connections = max_connections
+        self.model_concurrency = {**self.MODEL_CONCURRENCY, **(model_concurrency or {})}
+        self.timeout = timeout
+        self._client = client
+        self._loops: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, _LoopState]" = (
+            weakref.WeakKeyDictionary()
+        )
         self.router = get_model_router()
-        self.cache = get_cache()
-        self.optimizer = get_token_optimizer()
+        self.cache = get_response_cache()
+        self.inflight = get_single_flight()
+        if semantic_cache is None and os.getenv("ENABLE_SEMANTIC_CACHE") == "true":
+            semantic_cache = get_semantic_cache()
+        self.semantic_cache = semantic_cache
+        self.optimizer = get_token_optimizer_v2()
+
+    # ==================== CONNECTIONS ====================
+
+    def _state(self) -> _LoopState:
+        """Client and limits for the running loop (httpx pools can't cross loops)."""
+        loop = asyncio.get_running_loop()
+        state = self._loops.get(loop)
+        if state is None:
+            client = self._client
+            if client is None:
+                import anthropic
+                import httpx
+
+                http_client = anthropic.DefaultAsyncHttpxClient(
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                    timeout=self.timeout,
+                )
+                client = anthropic.AsyncAnthropic(
+                    api_key=self.api_key, base_url=self.base_url, http_client=http_client
+                )
+            state = self._loops[loop] = _LoopState(client=client)
+        return state
 
     @property
     def client(self):
-        """Lazy load Anthropic client."""
-        if self._client is None:
-            import anthropic
+        """Async Anthropic client for the running event loop."""
+        return self._state().client
+
+    def _limit(self, model: str) -> asyncio.Semaphore:
+        limits = self._state().limits
+        if model not in limits:
+            limits[model] = asyncio.Semaphore(
+                self.model_concurrency.get(model, self.model_concurrency["default"])
+            )
+        return limits[model]
 
-            self._client = anthropic.Anthropic(api_key=self.api_key)
-        return self._client
+    async def aclose(self):
+        """Close the running loop's HTTP connections (e.g. on app shutdown)."""
+        state = self._loops.pop(asyncio.get_running_loop(), None)
+        if state is not None and state.client is not self._client:
+            await state.client.close()
 
-    async def chat(
+    # ==================== REQUESTS ====================
+
+    def _prepare(
         self,
         messages: List[Dict[str, str]],
-        system_prompt: str = "",
-        agent_type: str = "general",
-        use_cache: bool = True,
-        force_model: str = None,
-    ) -> LLMResponse:
-        """
-        Send chat request with auto-routing and caching.
-
-        Args:
-            messages: Conversation history
-            system_prompt: System instructions
-            agent_type: Agent type for routing decisions
-            use_cache: Whether to use cache (default True)
-            force_model: Override auto-routing
-        """
+        system_prompt: str,
+        agent_type: str,
+        force_model: Optional[str],
+    ) -> Dict[str, Any]:
+        """Route and optimize into a Messages API request."""
         # Get last user message for routing
         user_message = ""
         for msg in reversed(messages):
@@ -94,24 +198,10 @@ class LLMClient:
                 user_message = msg.get("content", "")
                 break
 
-        # Check cache first
-        if use_cache:
-            cache_key = f"llm:{agent_type}:{user_message[:100]}"
-            cached = self.cache.get(cache_key)
-            if cached:
-                logger.info(f"💾 Cache hit - saved API call")
-                return LLMResponse(
-                    content=cached["content"],
-                    model=cached.get("model", "cached"),
-                    cached=True,
-                    input_tokens=0,
-                    output_tokens=0,
-                    cost_estimate=0.0,
-                )
-
         # Route to model
         if force_model:
             routing = RoutingDecision(
+                provider=ModelProvider.ANTHROPIC,
                 model=force_model,
                 max_tokens=4096,
                 temperature=0.7,
@@ -130,47 +220,134 @@ class LLMClient:
             system_prompt=system_prompt,
             task_type=task_type,
             complexity=routing.complexity,
+            model=routing.model,
         )
 
         # Build API request
-        api_messages = optimized.messages
-        if optimized.system_prompt:
-            api_messages = [
-                {"role": "system", "content": optimized.system_prompt}
-            ] + api_messages
+        request = {
+            "model": routing.model,
+            "max_tokens": min(routing.max_tokens, optimized.max_tokens),
+            "temperature": routing.temperature,
+            "messages": optimized.messages,
+        }
+        if optimized.system:
+            request["system"] = optimized.system
+        return request
 
-        # Call API
-        try:
-            response = self.client.messages.create(
-                model=routing.model,
-                max_tokens=min(routing.max_tokens, optimized.max_tokens),
-                temperature=routing.temperature,
-                messages=api_messages,
+    async def chat(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str = "",
+        agent_type: str = "general",
+        use_cache: bool = True,
+        force_model: str = None,
+        coalesce: bool = True,
+        system_version: Optional[str] = None,
+    ) -> LLMResponse:
+        """
+        Send chat request with auto-routing and caching.
+
+        Args:
+            messages: Conversation history
+            system_prompt: System instructions
+            agent_type: Agent type for routing decisions
+            use_cache: Whether to use cache (default True)
+            force_model: Override auto-routing
+            coalesce: Share the API call with identical concurrent requests
+            system_version: Semantic cache scope for the system prompt (e.g.
+                the base prompt's version when per-request context is
+                appended); defaults to a digest of system_prompt
+        """
+        request = self._prepare(messages, system_prompt, agent_type, force_model)
+
+        # Check cache on the exact request
+        cache_key = request_key(**request)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                logger.info(f"💾 Cache hit - saved API call")
+                return LLMResponse(
+                    content=cached["content"],
+                    model=cached.get("model", "cached"),
+                    cached=True,
+                    input_tokens=0,
+                    output_tokens=0,
+                    cost_estimate=0.0,
+                )
+
+        # Then a paraphrase of a question answered before (opt-in tier)
+        semantic, query, version = self._semantic_scope(messages, system_prompt, system_version, use_cache)
+        if semantic is not None:
+            hit = await asyncio.to_thread(semantic.get, query, agent_type, version)
+            if hit is not None:
+                logger.info(f"🧠 Semantic cache hit ({hit['similarity']:.2f}) - saved API call")
+                return LLMResponse(
+                    content=hit["content"],
+                    model=hit.get("model", "cached"),
+                    cached=True,
+                    input_tokens=0,
+                    output_tokens=0,
+                    cost_estimate=0.0,
+                    semantic=True,
+                )
+
+        # Call API, sharing the call with identical requests already in flight
+        if not coalesce:
+            response = await self._call(request, cache_key if use_cache else None, agent_type)
+        else:
+            response, shared = await self.inflight.do_async(
+                cache_key, lambda: self._call(request, cache_key if use_cache else None, agent_type)
             )
+            if shared:
+                logger.info("🔗 Coalesced with an identical in-flight request")
+                return replace(response, input_tokens=0, output_tokens=0, cost_estimate=0.0, coalesced=True)
+
+        if semantic is not None:
+            semantic.set(query, {"content": response.content, "model": response.model}, agent_type, version)
+        return response
+
+    def _semantic_scope(
+        self,
+        messages: List[Dict[str, str]],
+        system_prompt: str,
+        system_version: Optional[str],
+        use_cache: bool,
+    ) -> Tuple[Optional[SemanticCache], str, str]:
+        """(cache, query, version) for the semantic tier; cache is None when it doesn't apply."""
+        cache = self.semantic_cache
+        query = semantic_query(messages) if cache is not None and use_cache else None
+        if cache is None or query is None:
+            return None, "", ""
+        return cache, query, system_version or prompt_version(system_prompt)
+
+    def _cost(self, model: str, input_tokens: int, output_tokens: int) -> float:
+        costs = self.COSTS.get(model, self.COSTS["claude-3-haiku-20240307"])
+        return (input_tokens * costs["input"] + output_tokens * costs["output"]) / 1_000_000
+
+    async def _call(self, request: Dict, cache_key: Optional[str], agent_type: str) -> LLMResponse:
+        """One API call, within the model's concurrency cap."""
+        model = request["model"]
+        try:
+            async with self._limit(model):
+                response = await self.client.messages.create(**request)
 
             content = response.content[0].text
             input_tokens = response.usage.input_tokens
             output_tokens = response.usage.output_tokens
 
-            # Calculate cost
-            costs = self.COSTS.get(routing.model, self.COSTS["claude-3-haiku-20240307"])
-            cost = (
-                input_tokens * costs["input"] + output_tokens * costs["output"]
-            ) / 1_000_000
-
-            # Cache response
-            if use_cache and len(content) < 10000:
+            # Cache response (large ones are stored compressed)
+            if cache_key:
                 self.cache.set(
-                    cache_key, {"content": content, "model": routing.model}, ttl=3600
+                    cache_key, {"content": content, "model": model}, agent_type=agent_type
                 )
 
             return LLMResponse(
                 content=content,
-                model=routing.model,
+                model=model,
                 cached=False,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
-                cost_estimate=cost,
+                cost_estimate=self._cost(model, input_tokens, output_tokens),
             )
 
         except Exception as e:
@@ -182,28 +359,89 @@ class LLMClient:
         messages: List[Dict[str, str]],
         system_prompt: str = "",
         agent_type: str = "general",
+        use_cache: bool = True,
+        force_model: Optional[str] = None,
+        system_version: Optional[str] = None,
     ) -> AsyncGenerator[str, None]:
-        """Stream response for real-time display."""
-        user_message = ""
-        for msg in reversed(messages):
-            if msg.get("role") == "user":
-                user_message = msg.get("content", "")
-                break
+        """
+        Stream response text for real-time display.
 
-        routing = self.router.route(user_message, agent_type)
+        A cached response (exact or semantic) is yielded in one piece; a
+        completed stream is cached for later chat() or stream() calls.
+        """
+        request = self._prepare(messages, system_prompt, agent_type, force_model)
+        cache_key = request_key(**request)
+        if use_cache:
+            cached = self.cache.get(cache_key)
+            if cached is not None:
+                yield cached["content"]
+                return
+        semantic, query, version = self._semantic_scope(messages, system_prompt, system_version, use_cache)
+        if semantic is not None:
+            hit = await asyncio.to_thread(semantic.get, query, agent_type, version)
+            if hit is not None:
+                yield hit["content"]
+                return
+
+        parts: List[str] = []
+        async with self._limit(request["model"]):
+            async with self.client.messages.stream(**request) as stream:
+                async for text in stream.text_stream:
+                    parts.append(text)
+                    yield text
 
-        api_messages = messages
-        if system_prompt:
-            api_messages = [{"role": "system", "content": system_prompt}] + messages
+        if use_cache:
+            entry = {"content": "".join(parts), "model": request["model"]}
+            self.cache.set(cache_key, entry, agent_type=agent_type)
+            if semantic is not None:
+                semantic.set(query, entry, agent_type, version)
 
-        with self.client.messages.stream(
-            model=routing.model,
-            max_tokens=routing.max_tokens,
-            temperature=routing.temperature,
-            messages=api_messages,
-        ) as stream:
-            for text in stream.text_stream:
-                yield text
+    # ==================== BATCH API ====================
+
+    async def generate_batch(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval: float = 1.0,
+        max_poll_interval: float = 60.0,
+        timeout: Optional[float] = None,
+    ) -> List[str]:
+        """
+        Batch API for non-urgent tasks (50% cheaper), polled without blocking.
+
+        Args:
+            requests: List of {"messages": [...], "system": "..."}, optionally
+                with "model", "max_tokens" and "temperature"
+            poll_interval: First wait between status checks (doubles each time)
+            max_poll_interval: Longest wait between status checks
+            timeout: Give up (raise asyncio.TimeoutError) after this many seconds
+
+        Returns:
+            List of responses, in request order
+        """
+        batch = await self.client.messages.batches.create(
+            requests=[{"custom_id": f"req_{i}", "params": batch_params(req)} for i, req in enumerate(requests)]
+        )
+        batch = await asyncio.wait_for(
+            self._wait_for_batch(batch, poll_interval, max_poll_interval), timeout
+        )
+
+        # Results are matched by custom_id; the API doesn't guarantee request order
+        by_id: Dict[str, str] = {}
+        async for result in await self.client.messages.batches.results(batch.id):
+            if result.result.type == "succeeded":
+                by_id[result.custom_id] = result.result.message.content[0].text
+            else:
+                by_id[result.custom_id] = f"Error: {getattr(result.result, 'error', result.result.type)}"
+        logger.info(f"📦 Batch complete: {len(by_id)} results at 50% off!")
+        return [by_id.get(f"req_{i}", "Error: missing batch result") for i in range(len(requests))]
+
+    async def _wait_for_batch(self, batch, poll_interval: float, max_poll_interval: float):
+        delay = poll_interval
+        while batch.processing_status != "ended":
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, max_poll_interval)
+            batch = await self.client.messages.batches.retrieve(batch.id)
+        return batch
 
 
 # Singleton
@@ -0,0 +1,229 @@
+"""
+LLM Response Cache
+Content-addressed response cache shared by core.llm and core.llm_async.
+
+Entries are keyed by a SHA-256 digest of the normalized request (model,
+system, messages, max_tokens, temperature, tools), so:
+- Identical requests hit across workers and restarts (no hash() salting)
+- Requests that differ anywhere, including earlier turns, never collide
+- Anthropic cache_control markers and single text blocks vs plain strings
+  don't change the key, since they don't change the response
+
+Large responses are stored zlib-compressed. Entries are plain strings, so
+Redis and the InMemoryCache fallback store and return exactly the same
+thing.
+
+Packages Used: None (stores through redis_adapter)
+"""
+
+import base64
+import hashlib
+import json
+import logging
+import threading
+import zlib
+from dataclasses import asdict, dataclass
+from typing import Any, Dict, List, Optional
+
+logger = logging.getLogger("core.llm-cache")
+
+# Bump when the key or entry format changes so old entries are ignored
+KEY_PREFIX = "llm:v1:"
+
+
+def _strip_cache_control(value: Any) -> Any:
+    """Drop cache_control markers and collapse a lone text block to its text."""
+    if isinstance(value, dict):
+        return {k: _strip_cache_control(v) for k, v in value.items() if k != "cache_control"}
+    if isinstance(value, list):
+        blocks = [_strip_cache_control(v) for v in value]
+        if len(blocks) == 1 and isinstance(blocks[0], dict) and set(blocks[0]) == {"type", "text"} \
+                and blocks[0]["type"] == "text":
+            return blocks[0]["text"]
+        return blocks
+    return value
+
+
+def normalize_request(
+    model: str,
+    messages: List[Dict[str, Any]],
+    system: Any = "",
+    max_tokens: Optional[int] = None,
+    temperature: Optional[float] = None,
+    tools: Optional[List[Dict[str, Any]]] = None,
+) -> Dict[str, Any]:
+    """Canonical form of a Messages API request, as used for the cache key."""
+    return {
+        "model": model,
+        "system": _strip_cache_control(system) or "",
+        "messages": [_strip_cache_control(message) for message in messages],
+        "max_tokens": int(max_tokens) if max_tokens is not None else None,
+        "temperature": float(temperature) if temperature is not None else None,
+        "tools": _strip_cache_control(tools) or None,
+    }
+
+
+def request_key(model: str, messages: List[Dict[str, Any]], system: Any = "",
+                max_tokens: Optional[int] = None, temperature: Optional[float] = None,
+                tools: Optional[List[Dict[str, Any]]] = None) -> str:
+    """Stable cache key for a request."""
+    canonical = json.dumps(
+        normalize_request(model, messages, system, max_tokens, temperature, tools),
+        sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str,
+    )
+    return KEY_PREFIX + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _size(stored: Any) -> int:
+    return len(stored) if isinstance(stored, bytes) else len(stored.encode("utf-8"))
+
+
+@dataclass
+class CacheStats:
+    """Response cache counters since startup."""
+
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    skipped: int = 0  # TTL of 0 or entry too large
+    errors: int = 0
+    bytes_read: int = 0  # Stored (possibly compressed) bytes
+    bytes_written: int = 0
+    bytes_uncompressed: int = 0  # What bytes_written would have been without compression
+
+    def to_dict(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        data = asdict(self)
+        data["hit_rate"] = round(self.hits / lookups, 4) if lookups else 0.0
+        return data
+
+
+class ResponseCache:
+    """
+    Response cache over a Redis-style backend (get/setex).
+
+    Usage:
+        cache = get_response_cache()
+        key = request_key(model, messages, system, max_tokens, temperature)
+        entry = cache.get(key)
+        if entry is None:
+            entry = {"content": call_api(), "model": model}
+            cache.set(key, entry, agent_type="cad")
+    """
+
+    # Seconds to keep responses per agent type; 0 disables caching
+    TTL_POLICIES = {
+        "default": 3600,
+        "general": 3600,
+        "cad": 86400,  # Standards and CAD answers don't go stale
+        "cad_agent": 86400,
+        "trading": 300,  # Market context changes within minutes
+        "trading_agent": 300,
+    }
+
+    def __init__(self, backend: Any = None, ttl_policies: Optional[Dict[str, int]] = None,
+                 compress_min_bytes: int = 1024, max_entry_bytes: int = 1_000_000):
+        """
+        Args:
+            backend: Object with get(key) and setex(key, ttl, value); defaults
+                to the shared Redis connection (or its in-memory fallback)
+            ttl_policies: Overrides merged over TTL_POLICIES
+            compress_min_bytes: Entries at least this large are compressed
+            max_entry_bytes: Larger entries (after compression) aren't stored
+        """
+        self._backend = backend
+        self.ttl_policies = {**self.TTL_POLICIES, **(ttl_policies or {})}
+        self.compress_min_bytes = compress_min_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self._stats = CacheStats()
+        self._lock = threading.Lock()
+
+    @property
+    def backend(self):
+        """Lazy connection."""
+        if self._backend is None:
+            from .redis_adapter import get_cache
+
+            self._backend = get_cache().client
+        return self._backend
+
+    def ttl_for(self, agent_type: str) -> int:
+        return self.ttl_policies.get(agent_type, self.ttl_policies["default"])
+
+    def _count(self, **deltas: int):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+    # ==================== ENCODING ====================
+
+    def _encode(self, entry: Dict[str, Any]) -> tuple:
+        """(stored string, uncompressed size); 'j' prefix is JSON, 'z' is zlib+base64."""
+        raw = json.dumps(entry, separators=(",", ":"), ensure_ascii=False)
+        raw_bytes = raw.encode("utf-8")
+        if len(raw_bytes) >= self.compress_min_bytes:
+            packed = "z" + base64.b64encode(zlib.compress(raw_bytes, 6)).decode("ascii")
+            if len(packed) < len(raw_bytes):
+                return packed, len(raw_bytes)
+        return "j" + raw, len(raw_bytes)
+
+    @staticmethod
+    def _decode(stored: Any) -> Dict[str, Any]:
+        if isinstance(stored, bytes):
+            stored = stored.decode("utf-8")
+        if stored[0] == "z":
+            return json.loads(zlib.decompress(base64.b64decode(stored[1:])).decode("utf-8"))
+        if stored[0] == "j":
+            return json.loads(stored[1:])
+        raise ValueError(f"Unknown cache entry format {stored[:1]!r}")
+
+    # ==================== GET / SET ====================
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Cached entry for a request key, or None."""
+        try:
+            stored = self.backend.get(key)
+            if stored is None:
+                self._count(misses=1)
+                return None
+            entry = self._decode(stored)
+        except Exception as e:
+            logger.warning(f"Response cache get error: {e}")
+            self._count(errors=1, misses=1)
+            return None
+        self._count(hits=1, bytes_read=_size(stored))
+        logger.debug(f"✅ Response cache HIT: {key[len(KEY_PREFIX):][:12]}")
+        return entry
+
+    def set(self, key: str, entry: Dict[str, Any], agent_type: str = "general") -> bool:
+        """Store an entry (e.g. {"content": ..., "model": ...}) under the agent's TTL."""
+        ttl = self.ttl_for(agent_type)
+        try:
+            stored, raw_size = self._encode(entry)
+            size = _size(stored)
+            if ttl <= 0 or size > self.max_entry_bytes:
+                self._count(skipped=1)
+                return False
+            self.backend.setex(key, ttl, stored)
+        except Exception as e:
+            logger.warning(f"Response cache set error: {e}")
+            self._count(errors=1)
+            return False
+        self._count(stores=1, bytes_written=size, bytes_uncompressed=raw_size)
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counts and bytes moved."""
+        with self._lock:
+            return self._stats.to_dict()
+
+
+# Singleton
+_response_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    global _response_cache
+    if _response_cache is None:
+        _response_cache = ResponseCache()
+    return _response_cache
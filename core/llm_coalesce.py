@@ -0,0 +1,262 @@
+"""
+LLM Request Coalescing
+Share upstream calls between callers asking the same thing.
+
+- SingleFlight: concurrent identical requests (same request_key digest)
+  wait on one in-flight call and all receive its result or its error
+- MicroBatcher: small independent non-urgent prompts arriving close
+  together are sent as one batch call (e.g. the Batch API at 50% off),
+  with identical prompts in a batch sent once
+
+Both keep counters so the savings are visible in stats().
+
+Packages Used: None (threading / asyncio)
+"""
+
+import asyncio
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import asdict, dataclass
+from typing import Any, Callable, Coroutine, Dict, List, Optional, Tuple
+
+from .llm_cache import request_key
+
+logger = logging.getLogger("core.llm-coalesce")
+
+
+@dataclass
+class CoalesceStats:
+    """Counters for calls made vs calls shared."""
+
+    calls: int = 0  # Requests seen
+    upstream: int = 0  # Requests that went upstream
+    coalesced: int = 0  # Requests served by another caller's in-flight call
+    failures: int = 0  # Upstream calls that raised (shared with their waiters)
+    batches: int = 0
+    batched: int = 0  # Requests sent inside batches
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["coalesce_rate"] = round(self.coalesced / self.calls, 4) if self.calls else 0.0
+        data["avg_batch_size"] = round(self.batched / self.batches, 2) if self.batches else 0.0
+        return data
+
+
+class _Counted:
+    """Thread-safe CoalesceStats holder."""
+
+    def __init__(self):
+        self._stats = CoalesceStats()
+        self._lock = threading.Lock()
+
+    def _count(self, **deltas: int):
+        with self._lock:
+            for name, delta in deltas.items():
+                setattr(self._stats, name, getattr(self._stats, name) + delta)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return self._stats.to_dict()
+
+
+class SingleFlight(_Counted):
+    """
+    In-flight request registry keyed by request digest.
+
+    Usage:
+        flight = get_single_flight()
+        result, shared = flight.do(key, lambda: client.messages.create(**request))
+
+        # In async code
+        result, shared = await flight.do_async(key, lambda: call_api(request))
+
+    The first caller for a key runs the call; callers arriving while it
+    runs wait for it instead of making their own. Nothing is kept once the
+    call finishes; the response cache covers later repeats.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._calls: Dict[str, Future] = {}
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def in_flight(self) -> int:
+        with self._lock:
+            return len(self._calls) + len(self._tasks)
+
+    def do(self, key: str, fn: Callable[[], Any]) -> Tuple[Any, bool]:
+        """
+        Run fn once for all concurrent callers with this key.
+
+        Returns:
+            (result, shared) where shared is True for callers that waited on
+            another caller's call. Errors raised by fn are raised to every
+            caller.
+        """
+        with self._lock:
+            self._stats.calls += 1
+            waiting_on = self._calls.get(key)
+            if waiting_on is None:
+                future: Future = Future()
+                self._calls[key] = future
+                self._stats.upstream += 1
+            else:
+                self._stats.coalesced += 1
+
+        if waiting_on is not None:
+            logger.debug(f"🔗 Coalesced onto in-flight call {key[-12:]}")
+            return waiting_on.result(), True
+
+        try:
+            result = fn()
+        except BaseException as e:
+            self._count(failures=1)
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result, False
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+
+    async def do_async(self, key: str, factory: Callable[[], Coroutine[Any, Any, Any]]) -> Tuple[Any, bool]:
+        """
+        Async form of do(): one task per key on the running event loop.
+
+        A waiter being cancelled doesn't cancel the shared call.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            self._stats.calls += 1
+            running = self._tasks.get(key)
+            if running is not None and running.get_loop() is loop and not running.done():
+                task, shared = running, True
+                self._stats.coalesced += 1
+            else:
+                task, shared = loop.create_task(factory()), False
+                self._tasks[key] = task
+                self._stats.upstream += 1
+                task.add_done_callback(lambda done: self._finished(key, done))
+        return await asyncio.shield(task), shared
+
+    def _finished(self, key: str, task: asyncio.Task):
+        with self._lock:
+            if self._tasks.get(key) is task:
+                del self._tasks[key]
+        # Retrieve the exception so an unawaited failure isn't logged as lost
+        if not task.cancelled() and task.exception() is not None:
+            self._count(failures=1)
+
+
+class MicroBatcher(_Counted):
+    """
+    Groups small independent requests into batch calls.
+
+    Usage:
+        batcher = MicroBatcher(send=llm.generate_batch, max_batch=32, max_wait=0.25)
+        future = batcher.submit({"messages": [...], "system": "..."})
+        text = future.result()
+
+    A batch goes out when max_batch requests are waiting or max_wait
+    seconds after its first request arrived. send receives the distinct
+    requests of a batch and returns one result per request, in order.
+    """
+
+    def __init__(self, send: Callable[[List[Dict[str, Any]]], List[Any]],
+                 max_batch: int = 32, max_wait: float = 0.25):
+        super().__init__()
+        self.send = send
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue: "queue.Queue[Optional[Tuple[Dict[str, Any], Future]]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._closed = False
+
+    def submit(self, request: Dict[str, Any]) -> Future:
+        """Queue a request; the future resolves to its result."""
+        if self._closed:
+            raise RuntimeError("MicroBatcher is closed")
+        future: Future = Future()
+        with self._lock:
+            self._stats.calls += 1
+            if self._worker is None:
+                self._worker = threading.Thread(target=self._run, name="llm-microbatch", daemon=True)
+                self._worker.start()
+        self._queue.put((request, future))
+        return future
+
+    def close(self, timeout: float = 5.0):
+        """Send what is queued and stop the worker."""
+        self._closed = True
+        if self._worker is not None:
+            self._queue.put(None)
+            self._worker.join(timeout)
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            batch = [item]
+            deadline = time.monotonic() + self.max_wait
+            stop = False
+            while len(batch) < self.max_batch:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if item is None:
+                    stop = True
+                    break
+                batch.append(item)
+            self._send(batch)
+            if stop:
+                return
+
+    def _send(self, batch: List[Tuple[Dict[str, Any], Future]]):
+        # Identical requests in a batch are sent once
+        slots: Dict[str, int] = {}
+        unique: List[Dict[str, Any]] = []
+        positions = []
+        for request, _ in batch:
+            key = request_key(
+                request.get("model", ""), request.get("messages", []), request.get("system", ""),
+                request.get("max_tokens"), request.get("temperature"), request.get("tools"),
+            )
+            if key not in slots:
+                slots[key] = len(unique)
+                unique.append(request)
+            positions.append(slots[key])
+        self._count(batches=1, batched=len(unique), upstream=len(unique),
+                    coalesced=len(batch) - len(unique))
+
+        try:
+            results = self.send(unique)
+            if len(results) != len(unique):
+                raise RuntimeError(f"Batch returned {len(results)} results for {len(unique)} requests")
+        except Exception as e:
+            logger.error(f"Micro-batch error: {e}")
+            self._count(failures=1)
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), position in zip(batch, positions):
+            future.set_result(results[position])
+
+
+# Singleton
+_single_flight: Optional[SingleFlight] = None
+
+
+def get_single_flight() -> SingleFlight:
+    global _single_flight
+    if _single_flight is None:
+        _single_flight = SingleFlight()
+    return _single_flight
@@ -0,0 +1,421 @@
+"""
+Semantic LLM Response Cache
+Opt-in cache tier that answers paraphrased questions from earlier responses.
+
+The exact-request cache (llm_cache) misses 'min edge distance for 3/4" bolt'
+after "edge distance 0.75in bolt AISC" was answered. This tier embeds the
+normalized question (memory.embeddings model) and reuses a stored answer
+when the cosine similarity clears a threshold:
+- Scoped by agent type and system-prompt version, so a prompt change or a
+  different agent never serves another's answers
+- Scoped by the numbers in the question as well (with their units and
+  designations like A325): embeddings barely tell "3/4 in bolt" from "1 in
+  bolt", so only questions stating exactly the same quantities can match
+- Only single-question conversations are cached (earlier turns change the
+  meaning of a follow-up)
+- LRU eviction over a global entry budget, per-agent TTLs
+- Cleared when the rules or standards data files change
+- Hit-rate and similarity metrics
+
+Packages Used: sentence-transformers (via memory.embeddings), numpy (optional)
+"""
+
+import hashlib
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, cast
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+logger = logging.getLogger("core.llm-semantic-cache")
+
+# Texts -> one vector per text
+Embedder = Callable[[List[str]], Sequence[Sequence[float]]]
+
+_ROOT = Path(__file__).parent.parent
+
+# Rules and standards data; answers derived from them go stale when they change
+DEFAULT_WATCH_PATHS = (
+    _ROOT / "data" / "standards",
+    _ROOT / "agents" / "cad_agent" / "data_hub" / "rules",
+    _ROOT / "RULES.md",
+)
+
+_FRACTION = re.compile(r"(?<![\d.])(\d+)\s*/\s*(\d+)(?![\d.])")
+_INCH = re.compile(r'(?<=\d)\s*(?:"|\'\'|inches\b|inch\b|in\b)')
+_PUNCTUATION = re.compile(r"[^\w\s.]|(?<!\d)\.|\.(?!\d)")
+_QUANTITY = re.compile(r"(\d+(?:\.\d+)?)([a-z]*)")
+_UNITS = frozenset({
+    "in", "ft", "mm", "cm", "m", "deg", "degrees", "psi", "ksi", "mpa", "kpa", "bar",
+    "lb", "lbs", "kip", "kips", "n", "kn", "kg", "rpm", "hz", "gpm", "cfm",
+})
+
+
+def normalize_query(text: str) -> str:
+    """
+    Canonical form of a question for embedding.
+
+    Lowercases, writes simple fractions as decimals (3/4 -> 0.75) and inch
+    marks as "in", and drops punctuation, so notation differences don't
+    cost similarity.
+    """
+    text = text.lower()
+    text = _FRACTION.sub(
+        lambda m: f"{int(m.group(1)) / int(m.group(2)):g}" if int(m.group(2)) else m.group(0), text
+    )
+    text = _INCH.sub(" in", text)
+    text = _PUNCTUATION.sub(" ", text)
+    return " ".join(text.split())
+
+
+def _canonical_number(value: str) -> str:
+    """Decimal string without leading/trailing zeros (0.750 -> 0.75, 02 -> 2)."""
+    whole, _, fraction = value.partition(".")
+    whole = whole.lstrip("0") or "0"
+    fraction = fraction.rstrip("0")
+    return f"{whole}.{fraction}" if fraction else whole
+
+
+def query_numbers(query: str) -> Tuple[str, ...]:
+    """
+    The quantities a normalized question states, for exact matching.
+
+    Numbers keep a unit written after them ("0.75 in", "20mm"); tokens that
+    mix letters and digits (A325, M20, J3.4) are kept as they are. Sorted,
+    so word order doesn't matter.
+    """
+    tokens = query.split()
+    numbers = []
+    for i, token in enumerate(tokens):
+        if not any(c.isdigit() for c in token):
+            continue
+        match = _QUANTITY.fullmatch(token)
+        if match is None:
+            numbers.append(token)
+            continue
+        value, unit = match.groups()
+        if not unit and i + 1 < len(tokens) and tokens[i + 1] in _UNITS:
+            unit = tokens[i + 1]
+        numbers.append(f"{_canonical_number(value)} {unit}".strip())
+    return tuple(sorted(numbers))
+
+
+def semantic_query(messages: List[Dict[str, Any]]) -> Optional[str]:
+    """The question to cache on, or None unless the conversation is one user message."""
+    users = [m for m in messages if m.get("role") == "user"]
+    if len(users) != 1 or len(messages) != 1 or not isinstance(users[0].get("content"), str):
+        return None
+    query = normalize_query(users[0]["content"])
+    return query or None
+
+
+def prompt_version(system_prompt: Any) -> str:
+    """Short digest identifying a system prompt."""
+    return hashlib.sha256(str(system_prompt).encode("utf-8")).hexdigest()[:12]
+
+
+def data_fingerprint(paths: Sequence[Path]) -> str:
+    """Digest of (path, size, mtime) for every file under paths."""
+    digest = hashlib.sha256()
+    for root in paths:
+        root = Path(root)
+        files = sorted(p for p in root.rglob("*") if p.is_file()) if root.is_dir() else [root]
+        for path in files:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            digest.update(f"{path}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _unit(vector: Sequence[float]) -> List[float]:
+    norm = sum(x * x for x in vector) ** 0.5
+    return [x / norm for x in vector] if norm else list(vector)
+
+
+@dataclass
+class SemanticStats:
+    """Semantic cache counters since startup."""
+
+    lookups: int = 0
+    hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    skipped: int = 0  # TTL of 0 or not a cacheable question
+    evictions: int = 0  # Dropped for the entry budget
+    expirations: int = 0
+    invalidations: int = 0  # Entries cleared by invalidate() or a data change
+    errors: int = 0
+    similarity_total: float = 0.0  # Summed over hits
+    embed_seconds: float = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        del data["similarity_total"]
+        data["hit_rate"] = round(self.hits / self.lookups, 4) if self.lookups else 0.0
+        data["avg_hit_similarity"] = round(self.similarity_total / self.hits, 4) if self.hits else 0.0
+        data["embed_seconds"] = round(self.embed_seconds, 4)
+        return data
+
+
+# (agent type, prompt version, query_numbers)
+ScopeKey = Tuple[str, str, Tuple[str, ...]]
+
+
+@dataclass
+class _Entry:
+    scope: ScopeKey
+    query: str
+    vector: List[float]
+    value: Dict[str, Any]
+    expires: float
+
+
+@dataclass
+class _Scope:
+    """Entries for one scope key, with a lazily built matrix."""
+
+    entries: List[_Entry] = field(default_factory=list)
+    matrix: Any = None
+    expires: Any = None
+
+    def _build(self):
+        if self.matrix is None:
+            self.matrix = np.array([e.vector for e in self.entries], dtype=np.float32)
+            self.expires = np.array([e.expires for e in self.entries], dtype=np.float64)
+
+    def expired(self, now: float) -> List[_Entry]:
+        if NUMPY_AVAILABLE and self.entries:
+            self._build()
+            return [self.entries[i] for i in np.flatnonzero(self.expires <= now)]
+        return [e for e in self.entries if e.expires <= now]
+
+    def best(self, vector: List[float]) -> Tuple[Optional[_Entry], float]:
+        if not self.entries:
+            return None, 0.0
+        if NUMPY_AVAILABLE:
+            self._build()
+            scores = self.matrix @ np.asarray(vector, dtype=np.float32)
+            i = int(scores.argmax())
+            return self.entries[i], float(scores[i])
+        scores = [sum(a * b for a, b in zip(e.vector, vector)) for e in self.entries]
+        i = max(range(len(scores)), key=scores.__getitem__)
+        return self.entries[i], scores[i]
+
+    def remove(self, entry: _Entry):
+        self.entries.remove(entry)
+        self.matrix = None
+
+
+class SemanticCache:
+    """
+    Similarity-matched response cache, in process.
+
+    Usage:
+        cache = SemanticCache(threshold=0.9)
+        query = semantic_query(messages)
+        version = prompt_version(system_prompt)
+        hit = cache.get(query, agent_type="cad", version=version)
+        if hit is None:
+            entry = {"content": call_api(), "model": model}
+            cache.set(query, entry, agent_type="cad", version=version)
+    """
+
+    # Seconds to keep answers per agent type; 0 disables the tier for that agent
+    TTL_POLICIES = {
+        "default": 0,
+        "general": 3600,
+        "cad": 86400,
+        "cad_agent": 86400,
+        "inspector": 86400,
+        "trading": 0,  # Same words, different market
+        "trading_agent": 0,
+    }
+
+    def __init__(
+        self,
+        embed: Optional[Embedder] = None,
+        threshold: float = 0.9,
+        max_entries: int = 5000,
+        ttl_policies: Optional[Dict[str, int]] = None,
+        watch_paths: Optional[Sequence[Path]] = DEFAULT_WATCH_PATHS,
+        check_interval: float = 30.0,
+    ):
+        """
+        Args:
+            embed: Texts -> vectors; defaults to memory.embeddings' model
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Entry budget across all scopes (least recently used go first)
+            ttl_policies: Overrides merged over TTL_POLICIES
+            watch_paths: Files/directories whose changes clear the cache (None: don't watch)
+            check_interval: Seconds between checks of watch_paths
+        """
+        self._embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_policies = {**self.TTL_POLICIES, **(ttl_policies or {})}
+        self.watch_paths = list(watch_paths or [])
+        self.check_interval = check_interval
+        self._scopes: Dict[ScopeKey, _Scope] = {}
+        self._lru: "OrderedDict[int, _Entry]" = OrderedDict()
+        self._vectors: "OrderedDict[str, List[float]]" = OrderedDict()  # Recent query embeddings
+        self._fingerprint = data_fingerprint(self.watch_paths) if self.watch_paths else None
+        self._checked = time.monotonic()
+        self._stats = SemanticStats()
+        self._lock = threading.RLock()
+
+    @property
+    def embed(self) -> Embedder:
+        """Lazy model load."""
+        if self._embed is None:
+            from .memory.embeddings import get_embedding_function
+
+            self._embed = cast(Embedder, get_embedding_function())
+        return self._embed
+
+    def ttl_for(self, agent_type: str) -> int:
+        return self.ttl_policies.get(agent_type, self.ttl_policies["default"])
+
+    def _vector(self, query: str) -> List[float]:
+        """Unit embedding, reused between get() and the set() that follows a miss."""
+        with self._lock:
+            vector = self._vectors.get(query)
+        if vector is None:
+            start = time.perf_counter()
+            vector = _unit([float(x) for x in self.embed([query])[0]])
+            with self._lock:
+                self._stats.embed_seconds += time.perf_counter() - start
+                self._vectors[query] = vector
+                while len(self._vectors) > 256:
+                    self._vectors.popitem(last=False)
+        return vector
+
+    # ==================== INVALIDATION ====================
+
+    def _check_data(self):
+        """Clear everything if the watched data changed (at most every check_interval)."""
+        if not self.watch_paths or time.monotonic() - self._checked < self.check_interval:
+            return
+        self._checked = time.monotonic()
+        fingerprint = data_fingerprint(self.watch_paths)
+        if fingerprint != self._fingerprint:
+            self._fingerprint = fingerprint
+            dropped = self.invalidate()
+            logger.info(f"♻️ Rules/standards data changed - dropped {dropped} semantic cache entries")
+
+    def invalidate(self, agent_type: Optional[str] = None) -> int:
+        """Drop all entries, or one agent type's; returns how many."""
+        with self._lock:
+            doomed = [e for e in self._lru.values() if agent_type is None or e.scope[0] == agent_type]
+            for entry in doomed:
+                self._drop(entry)
+            self._stats.invalidations += len(doomed)
+            return len(doomed)
+
+    def _drop(self, entry: _Entry):
+        self._lru.pop(id(entry), None)
+        scope = self._scopes.get(entry.scope)
+        if scope is not None:
+            scope.remove(entry)
+            if not scope.entries:
+                del self._scopes[entry.scope]
+
+    # ==================== GET / SET ====================
+
+    def get(self, query: Optional[str], agent_type: str = "general", version: str = "") -> Optional[Dict[str, Any]]:
+        """Stored entry for a similar question (with its "similarity"), or None."""
+        if not query or self.ttl_for(agent_type) <= 0:
+            return None
+        try:
+            self._check_data()
+            vector = self._vector(query)
+        except Exception as e:
+            logger.warning(f"Semantic cache get error: {e}")
+            with self._lock:
+                self._stats.errors += 1
+            return None
+
+        with self._lock:
+            self._stats.lookups += 1
+            key = (agent_type, version, query_numbers(query))
+            scope = self._scopes.get(key)
+            if scope is not None:
+                # Expired entries must not win the argmax over a live match
+                for expired in scope.expired(time.monotonic()):
+                    self._drop(expired)
+                    self._stats.expirations += 1
+                scope = self._scopes.get(key)
+            entry, similarity = scope.best(vector) if scope else (None, 0.0)
+            if entry is None or similarity < self.threshold:
+                self._stats.misses += 1
+                return None
+            self._lru.move_to_end(id(entry))
+            self._stats.hits += 1
+            self._stats.similarity_total += similarity
+        logger.debug(f"✅ Semantic cache HIT ({similarity:.3f}): {query[:40]!r} ~ {entry.query[:40]!r}")
+        return {**entry.value, "similarity": similarity, "matched_query": entry.query}
+
+    def set(self, query: Optional[str], value: Dict[str, Any], agent_type: str = "general", version: str = "") -> bool:
+        """Store an entry (e.g. {"content": ..., "model": ...}) under the agent's TTL."""
+        ttl = self.ttl_for(agent_type)
+        if not query or ttl <= 0:
+            with self._lock:
+                self._stats.skipped += 1
+            return False
+        try:
+            vector = self._vector(query)
+        except Exception as e:
+            logger.warning(f"Semantic cache set error: {e}")
+            with self._lock:
+                self._stats.errors += 1
+            return False
+
+        with self._lock:
+            key = (agent_type, version, query_numbers(query))
+            scope = self._scopes.setdefault(key, _Scope())
+            for old in scope.entries:
+                if old.query == query:
+                    self._drop(old)
+                    scope = self._scopes.setdefault(key, _Scope())
+                    break
+            entry = _Entry(key, query, vector, dict(value), time.monotonic() + ttl)
+            scope.entries.append(entry)
+            scope.matrix = None
+            self._lru[id(entry)] = entry
+            self._stats.stores += 1
+            while len(self._lru) > self.max_entries:
+                self._drop(next(iter(self._lru.values())))
+                self._stats.evictions += 1
+        return True
+
+    def __len__(self) -> int:
+        return len(self._lru)
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit rate, similarity of hits, evictions and invalidations."""
+        with self._lock:
+            data = self._stats.to_dict()
+            data["entries"] = len(self._lru)
+            data["threshold"] = self.threshold
+            return data
+
+
+# Singleton
+_semantic_cache: Optional[SemanticCache] = None
+
+
+def get_semantic_cache() -> SemanticCache:
+    global _semantic_cache
+    if _semantic_cache is None:
+        _semantic_cache = SemanticCache()
+    return _semantic_cache
@@ -6,12 +6,14 @@ Uses Chroma for local vector storage (no API costs, data stays local).
 """
 
 from .chroma_store import VulcanMemory
+from .batch_ingest import IngestPipeline
 from .rag_engine import RAGEngine
 from .embeddings import get_embedding_function
 from .ingest import TradeIngestor, LessonIngestor, AnalysisIngestor, CADIngestor
 
 __all__ = [
     "VulcanMemory",
+    "IngestPipeline",
     "RAGEngine",
     "get_embedding_function",
     "TradeIngestor",
@@ -0,0 +1,235 @@
+"""
+Batched Ingestion Pipeline
+
+Background queue that coalesces documents into large embedding batches
+and writes them to Chroma in bulk. Back-fills (a year of journal entries,
+thousands of CAD job logs) fill whole batches immediately; a lone
+interactive add is written once its flush deadline passes.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .chroma_store import VulcanMemory
+
+logger = logging.getLogger("core.memory.batch_ingest")
+
+
+@dataclass
+class IngestItem:
+    """A document waiting to be written."""
+    collection: str
+    doc_id: str
+    content: str
+    metadata: Dict[str, Any]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.monotonic)
+
+
+class _Flush:
+    """Queue marker: write what is pending, then signal."""
+
+    def __init__(self):
+        self.done = threading.Event()
+
+
+_STOP = object()
+
+
+class IngestPipeline:
+    """
+    Background batched writer for VulcanMemory.
+
+    Usage:
+        pipeline = IngestPipeline(memory)
+        future = pipeline.submit("trades", "trade_1", content, metadata)
+        pipeline.submit_many("cad_jobs", records)   # back-fill
+        pipeline.flush()                            # wait until written
+        print(pipeline.get_stats()["docs_per_sec"])
+    """
+
+    def __init__(
+        self,
+        memory: "VulcanMemory",
+        batch_size: int = 128,
+        flush_interval: float = 0.25,
+        max_queue: int = 10000,
+    ):
+        """
+        Args:
+            memory: VulcanMemory to write to
+            batch_size: Documents per embedding batch / Chroma write
+            flush_interval: Max seconds a document waits for its batch to fill
+            max_queue: Max queued documents before submit blocks
+        """
+        self.memory = memory
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_queue)
+        self._lock = threading.Lock()
+        self._submit_lock = threading.Lock()  # Orders submit/flush against close
+        self._stats = {
+            "submitted": 0,
+            "written": 0,
+            "duplicates": 0,
+            "failed": 0,
+            "batches": 0,
+            "write_seconds": 0.0,
+        }
+        self._closed = False
+        self._worker = threading.Thread(
+            target=self._run, name="vulcan-ingest", daemon=True
+        )
+        self._worker.start()
+
+    def submit(
+        self,
+        collection: str,
+        doc_id: str,
+        content: str,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> Future:
+        """
+        Queue one document.
+
+        Returns:
+            Future resolving to the stored ID (the existing ID if the
+            content is already in the collection)
+
+        Raises:
+            RuntimeError: If the pipeline is closed
+        """
+        if collection not in self.memory.COLLECTIONS:
+            raise ValueError(f"Unknown collection: {collection}")
+
+        item = IngestItem(collection, doc_id, content, dict(metadata or {}))
+        with self._submit_lock:
+            if self._closed:
+                raise RuntimeError("Ingest pipeline is closed")
+            self._queue.put(item)
+        with self._lock:
+            self._stats["submitted"] += 1
+        return item.future
+
+    def submit_many(
+        self,
+        collection: str,
+        records: Iterable[Tuple[str, str, Optional[Dict[str, Any]]]],
+    ) -> List[Future]:
+        """Queue (doc_id, content, metadata) records for bulk ingestion."""
+        return [self.submit(collection, *record) for record in records]
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is written.
+
+        Returns:
+            False if the timeout expired first
+        """
+        marker = _Flush()
+        with self._submit_lock:
+            closed = self._closed
+            if not closed:
+                self._queue.put(marker)
+        if not closed:
+            return marker.done.wait(timeout)
+        # Closed: the worker writes everything queued before it stops
+        self._worker.join(timeout)
+        return not self._worker.is_alive()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Write pending documents and stop the worker.
+
+        Later submits raise RuntimeError; documents queued before close are
+        still written.
+        """
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(_STOP)
+        self._worker.join(timeout)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get ingestion counts and throughput."""
+        with self._lock:
+            stats = dict(self._stats)
+        seconds = stats["write_seconds"]
+        stats["write_seconds"] = round(seconds, 3)
+        stats["docs_per_sec"] = round(stats["written"] / seconds, 1) if seconds else 0.0
+        stats["avg_batch"] = round(stats["written"] / stats["batches"], 1) if stats["batches"] else 0.0
+        stats["queued"] = self._queue.qsize()
+        return stats
+
+    # -------------------------------------------------------------------------
+    # Worker
+    # -------------------------------------------------------------------------
+
+    def _run(self) -> None:
+        batch: List[IngestItem] = []
+        while True:
+            if batch:
+                timeout = max(0.0, batch[0].enqueued_at + self.flush_interval - time.monotonic())
+                try:
+                    entry = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    entry = None  # deadline reached
+            else:
+                entry = self._queue.get()
+
+            if isinstance(entry, IngestItem):
+                batch.append(entry)
+                if len(batch) < self.batch_size:
+                    continue
+
+            if batch:
+                self._write(batch)
+                batch = []
+
+            if isinstance(entry, _Flush):
+                entry.done.set()
+            elif entry is _STOP:
+                return
+
+    def _write(self, batch: List[IngestItem]) -> None:
+        by_collection: "OrderedDict[str, List[IngestItem]]" = OrderedDict()
+        for item in batch:
+            by_collection.setdefault(item.collection, []).append(item)
+
+        for collection, items in by_collection.items():
+            started = time.perf_counter()
+            try:
+                stored = self.memory.add_documents(
+                    collection,
+                    [item.doc_id for item in items],
+                    [item.content for item in items],
+                    [item.metadata for item in items],
+                    dedupe_existing=True,
+                )
+            except Exception as e:
+                logger.error(f"Batch write to {collection} failed ({len(items)} docs): {e}")
+                with self._lock:
+                    self._stats["failed"] += len(items)
+                for item in items:
+                    item.future.set_exception(e)
+                continue
+
+            elapsed = time.perf_counter() - started
+            duplicates = sum(1 for item in items if stored[item.doc_id] != item.doc_id)
+            with self._lock:
+                self._stats["batches"] += 1
+                self._stats["written"] += len(items) - duplicates
+                self._stats["duplicates"] += duplicates
+                self._stats["write_seconds"] += elapsed
+            logger.debug(
+                f"Wrote {len(items)} docs to {collection} in {elapsed * 1000:.0f}ms "
+                f"({duplicates} duplicates)"
+            )
+            for item in items:
+                item.future.set_result(stored[item.doc_id])
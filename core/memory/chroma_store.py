@@ -5,8 +5,12 @@ Local vector database for semantic search over trades, lessons, and analyses.
 Data stays on your machine - no API costs, full privacy.
 """
 
+import hashlib
 import os
-from typing import List, Dict, Any, Optional
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Sequence
 from datetime import datetime
 
 try:
@@ -29,15 +33,25 @@ class VulcanMemory:
         - lessons: Extracted lessons learned from trading
         - analyses: Daily/weekly market analyses
         - cad_jobs: CAD work logs with commands, parameters, outcomes
+
+    Queries are embedded once and cached (LRU), so searching several
+    collections for the same text costs a single model call.
     """
 
-    def __init__(self, persist_dir: str = "./storage/chroma"):
+    COLLECTIONS = ("trades", "lessons", "analyses", "cad_jobs")
+
+    def __init__(self, persist_dir: str = "./storage/chroma", query_cache_size: int = 256):
         """Initialize the memory store.
 
         Args:
             persist_dir: Directory to persist the vector database.
+            query_cache_size: Number of recent query embeddings to keep.
         """
         os.makedirs(persist_dir, exist_ok=True)
+        self.query_cache_size = query_cache_size
+        self._query_cache: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._query_cache_lock = threading.Lock()
+        self._query_pool: Optional[ThreadPoolExecutor] = None
 
         self.client = chromadb.PersistentClient(
             path=persist_dir,
@@ -75,12 +89,7 @@ class VulcanMemory:
             content: Full trade description (setup, rationale, result, lesson)
             metadata: Structured data (pair, setup_type, result, day, session, r_multiple)
         """
-        metadata["timestamp"] = datetime.now().isoformat()
-        self.trades.add(
-            ids=[trade_id],
-            documents=[content],
-            metadatas=[metadata]
-        )
+        self.add_documents("trades", [trade_id], [content], [metadata])
 
     def search_trades(self, query: str, n_results: int = 5,
                       where: Optional[Dict] = None) -> Dict[str, Any]:
@@ -94,11 +103,7 @@ class VulcanMemory:
         Returns:
             Dict with ids, documents, metadatas, distances
         """
-        return self.trades.query(
-            query_texts=[query],
-            n_results=n_results,
-            where=where
-        )
+        return self._query(self.trades, query, n_results, where)
 
     def add_lesson(self, lesson_id: str, content: str, metadata: Dict[str, Any]) -> None:
         """Add a lesson learned.
@@ -108,50 +113,166 @@ class VulcanMemory:
             content: The lesson text
             metadata: Context (source_trade, category, severity)
         """
-        metadata["timestamp"] = datetime.now().isoformat()
-        self.lessons.add(
-            ids=[lesson_id],
-            documents=[content],
-            metadatas=[metadata]
-        )
+        self.add_documents("lessons", [lesson_id], [content], [metadata])
 
     def search_lessons(self, query: str, n_results: int = 5) -> Dict[str, Any]:
         """Find relevant lessons."""
-        return self.lessons.query(
-            query_texts=[query],
-            n_results=n_results
-        )
+        return self._query(self.lessons, query, n_results)
 
     def add_analysis(self, analysis_id: str, content: str, metadata: Dict[str, Any]) -> None:
         """Add a market analysis."""
-        metadata["timestamp"] = datetime.now().isoformat()
-        self.analyses.add(
-            ids=[analysis_id],
-            documents=[content],
-            metadatas=[metadata]
-        )
+        self.add_documents("analyses", [analysis_id], [content], [metadata])
 
     def search_analyses(self, query: str, n_results: int = 5) -> Dict[str, Any]:
         """Search market analyses."""
-        return self.analyses.query(
-            query_texts=[query],
-            n_results=n_results
-        )
+        return self._query(self.analyses, query, n_results)
 
     def add_cad_job(self, job_id: str, content: str, metadata: Dict[str, Any]) -> None:
         """Add a CAD job log."""
-        metadata["timestamp"] = datetime.now().isoformat()
-        self.cad_jobs.add(
-            ids=[job_id],
-            documents=[content],
-            metadatas=[metadata]
-        )
+        self.add_documents("cad_jobs", [job_id], [content], [metadata])
 
     def search_cad_jobs(self, query: str, n_results: int = 5) -> Dict[str, Any]:
         """Search CAD job history."""
-        return self.cad_jobs.query(
-            query_texts=[query],
-            n_results=n_results
+        return self._query(self.cad_jobs, query, n_results)
+
+    def add_documents(
+        self,
+        collection: str,
+        ids: Sequence[str],
+        documents: Sequence[str],
+        metadatas: Optional[Sequence[Dict[str, Any]]] = None,
+        dedupe_existing: bool = False,
+    ) -> Dict[str, str]:
+        """Add many documents with one embedding call and one write.
+
+        Documents are deduplicated by content hash within the batch. Checking
+        against what the collection already holds costs an extra read, so it
+        is opt-in; IngestPipeline does it once per batch it flushes.
+
+        Args:
+            collection: Collection name (see COLLECTIONS)
+            ids: Document IDs
+            documents: Document texts
+            metadatas: Metadata per document (None values dropped; timestamp
+                and content_hash added)
+            dedupe_existing: Also skip content the collection already holds
+
+        Returns:
+            Dict of requested ID -> stored ID (the existing ID for duplicates)
+        """
+        if collection not in self.COLLECTIONS:
+            raise ValueError(f"Unknown collection: {collection}")
+        metadatas = metadatas or [{} for _ in ids]
+        if not len(ids) == len(documents) == len(metadatas):
+            raise ValueError("ids, documents and metadatas must have the same length")
+
+        target = getattr(self, collection)
+        hashes = [hashlib.sha256(doc.encode("utf-8")).hexdigest() for doc in documents]
+
+        stored: Dict[str, str] = {}
+        if dedupe_existing and hashes:
+            existing = target.get(
+                where={"content_hash": {"$in": sorted(set(hashes))}},
+                include=["metadatas"]
+            )
+            stored = {
+                meta["content_hash"]: doc_id
+                for doc_id, meta in zip(existing["ids"], existing["metadatas"])
+            }
+
+        new_ids, new_docs, new_metas = [], [], []
+        timestamp = datetime.now().isoformat()
+        result = {}
+        for doc_id, doc, meta, content_hash in zip(ids, documents, metadatas, hashes):
+            if content_hash not in stored:
+                stored[content_hash] = doc_id
+                meta = {k: v for k, v in meta.items() if v is not None}  # Chroma rejects None
+                meta["timestamp"] = timestamp
+                meta["content_hash"] = content_hash
+                new_ids.append(doc_id)
+                new_docs.append(doc)
+                new_metas.append(meta)
+            result[doc_id] = stored[content_hash]
+
+        if new_ids:
+            target.add(
+                ids=new_ids,
+                embeddings=self.embedding_fn(new_docs),
+                documents=new_docs,
+                metadatas=new_metas
+            )
+        return result
+
+    def search_many(
+        self,
+        query: str,
+        collections: Sequence[str] = ("trades", "lessons", "analyses"),
+        n_results: int = 5,
+        where: Optional[Dict[str, Dict]] = None,
+    ) -> Dict[str, Dict[str, Any]]:
+        """Search several collections with one embedding of the query.
+
+        The query is embedded once, then every collection is queried
+        concurrently with the same vector.
+
+        Args:
+            query: Natural language query
+            collections: Collection names (see COLLECTIONS)
+            n_results: Number of results per collection
+            where: Optional metadata filter per collection name
+
+        Returns:
+            Dict of collection name -> query results (ids, documents, metadatas, distances)
+        """
+        unknown = [name for name in collections if name not in self.COLLECTIONS]
+        if unknown:
+            raise ValueError(f"Unknown collections: {unknown}")
+        if not collections:
+            return {}
+
+        embedding = self.embed_query(query)
+        where = where or {}
+
+        def run(name: str) -> Dict[str, Any]:
+            return getattr(self, name).query(
+                query_embeddings=[embedding],
+                n_results=n_results,
+                where=where.get(name)
+            )
+
+        if len(collections) < 2:
+            return {name: run(name) for name in collections}
+
+        if self._query_pool is None:
+            self._query_pool = ThreadPoolExecutor(
+                max_workers=len(self.COLLECTIONS), thread_name_prefix="vulcan-memory"
+            )
+        futures = {name: self._query_pool.submit(run, name) for name in collections}
+        return {name: future.result() for name, future in futures.items()}
+
+    def embed_query(self, query: str) -> List[float]:
+        """Embed a query, reusing the vector for recently seen queries."""
+        with self._query_cache_lock:
+            embedding = self._query_cache.get(query)
+            if embedding is not None:
+                self._query_cache.move_to_end(query)
+                return embedding
+
+        embedding = [float(x) for x in self.embedding_fn([query])[0]]
+
+        with self._query_cache_lock:
+            self._query_cache[query] = embedding
+            self._query_cache.move_to_end(query)
+            while len(self._query_cache) > self.query_cache_size:
+                self._query_cache.popitem(last=False)
+        return embedding
+
+    def _query(self, collection, query: str, n_results: int,
+               where: Optional[Dict] = None) -> Dict[str, Any]:
+        return collection.query(
+            query_embeddings=[self.embed_query(query)],
+            n_results=n_results,
+            where=where
         )
 
     def get_trade_count(self) -> int:
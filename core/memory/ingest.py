@@ -3,6 +3,9 @@ Data Ingestion Module
 
 Handles ingesting trades, lessons, and analyses into memory.
 Parses markdown journal entries and extracts structured data.
+
+Each ingestor writes synchronously by default; pass an IngestPipeline to
+queue documents for batched background writes instead.
 """
 
 import re
@@ -11,14 +14,31 @@ from typing import Dict, Any, Optional, List
 from datetime import datetime
 from pathlib import Path
 
+from .batch_ingest import IngestPipeline
 from .chroma_store import VulcanMemory
 
 
+def _store(
+    memory: VulcanMemory,
+    pipeline: Optional[IngestPipeline],
+    collection: str,
+    doc_id: str,
+    content: str,
+    metadata: Dict[str, Any],
+) -> None:
+    """Write through the pipeline when one is configured."""
+    if pipeline is not None:
+        pipeline.submit(collection, doc_id, content, metadata)
+    else:
+        memory.add_documents(collection, [doc_id], [content], [metadata])
+
+
 class TradeIngestor:
     """Ingests trade journal entries into memory."""
 
-    def __init__(self, memory: VulcanMemory):
+    def __init__(self, memory: VulcanMemory, pipeline: Optional[IngestPipeline] = None):
         self.memory = memory
+        self.pipeline = pipeline
 
     def ingest_trade(
         self,
@@ -62,7 +82,7 @@ class TradeIngestor:
             "session": session or "unknown"
         }
 
-        self.memory.add_trade(trade_id, content, metadata)
+        _store(self.memory, self.pipeline, "trades", trade_id, content, metadata)
         return trade_id
 
     def ingest_from_journal_entry(self, markdown_content: str) -> Optional[str]:
@@ -99,8 +119,9 @@ class TradeIngestor:
 class LessonIngestor:
     """Ingests lessons learned into memory."""
 
-    def __init__(self, memory: VulcanMemory):
+    def __init__(self, memory: VulcanMemory, pipeline: Optional[IngestPipeline] = None):
         self.memory = memory
+        self.pipeline = pipeline
 
     def ingest_lesson(
         self,
@@ -128,15 +149,16 @@ class LessonIngestor:
             "source_trade": source_trade
         }
 
-        self.memory.add_lesson(lesson_id, content, metadata)
+        _store(self.memory, self.pipeline, "lessons", lesson_id, content, metadata)
         return lesson_id
 
 
 class AnalysisIngestor:
     """Ingests market analyses into memory."""
 
-    def __init__(self, memory: VulcanMemory):
+    def __init__(self, memory: VulcanMemory, pipeline: Optional[IngestPipeline] = None):
         self.memory = memory
+        self.pipeline = pipeline
 
     def ingest_analysis(
         self,
@@ -167,15 +189,16 @@ class AnalysisIngestor:
             "date": date or datetime.now().strftime("%Y-%m-%d")
         }
 
-        self.memory.add_analysis(analysis_id, content, metadata)
+        _store(self.memory, self.pipeline, "analyses", analysis_id, content, metadata)
         return analysis_id
 
 
 class CADIngestor:
     """Ingests CAD job logs into memory."""
 
-    def __init__(self, memory: VulcanMemory):
+    def __init__(self, memory: VulcanMemory, pipeline: Optional[IngestPipeline] = None):
         self.memory = memory
+        self.pipeline = pipeline
 
     def ingest_cad_job(
         self,
@@ -207,5 +230,5 @@ class CADIngestor:
             "success": "success" in outcome.lower()
         }
 
-        self.memory.add_cad_job(job_id, content, metadata)
+        _store(self.memory, self.pipeline, "cad_jobs", job_id, content, metadata)
         return job_id
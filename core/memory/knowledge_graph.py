@@ -3,14 +3,27 @@ Knowledge Graph - Deep Memory Consolidation
 
 Implements long-term memory with relationship graphs.
 Consolidates short-term RAG data into persistent knowledge structures.
+
+Nodes are indexed by type and by label/property trigrams, and edges by
+(source, target, relation) with forward and reverse adjacency, so adds
+and lookups do not scan the whole graph.
+
+Persistence is a JSON snapshot plus an append-only operation log. Each
+change appends the new state of the touched nodes/edges to the log; once
+the log grows past a threshold it is compacted into a fresh snapshot
+(written atomically). Loading replays snapshot + log.
 """
 
 import json
 import logging
-from typing import Dict, Any, List, Optional, Set, Tuple
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import Dict, Any, Iterator, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 from pathlib import Path
-from collections import defaultdict
+from collections import defaultdict, deque
+from itertools import islice
 
 logger = logging.getLogger("core.memory.knowledge_graph")
 
@@ -115,47 +128,242 @@ class KnowledgeGraph:
     - Material specifications
     """
 
-    def __init__(self, graph_file: str = "knowledge_graph.json"):
+    def __init__(
+        self,
+        graph_file: str = "knowledge_graph.json",
+        compact_every: int = 1000,
+    ):
+        """
+        Args:
+            graph_file: Snapshot file name inside the knowledge directory
+            compact_every: Logged operations before the log is compacted
+        """
         self.graph_file = KNOWLEDGE_DIR / graph_file
+        self.log_file = self.graph_file.with_suffix(".log.jsonl")
+        self.compact_every = compact_every
         self.nodes: Dict[str, Node] = {}
         self.edges: List[Edge] = []
-        self._adjacency: Dict[str, List[Tuple[str, str, float]]] = defaultdict(list)
+        self._edge_index: Dict[Tuple[str, str, str], Edge] = {}
+        self._adjacency: Dict[str, List[Edge]] = defaultdict(list)  # outgoing
+        self._incoming: Dict[str, List[Edge]] = defaultdict(list)
+        self._by_type: Dict[str, Dict[str, None]] = defaultdict(dict)  # ids, least recently accessed first
+        self._grams: Dict[str, Set[str]] = defaultdict(set)  # trigram -> node ids
+        self._node_grams: Dict[str, Set[str]] = {}
+        self._seq: Dict[str, int] = {}  # node id -> insertion order
+        self._next_seq = 0
+        self._dirty_nodes: Set[str] = set()
+        self._dirty_edges: Set[Tuple[str, str, str]] = set()
+        self._batch_depth = 0
+        self._log_ops = 0
         self._load()
 
     def _load(self):
-        """Load graph from disk."""
+        """Load graph from snapshot, then replay the operation log."""
         if self.graph_file.exists():
             try:
                 with open(self.graph_file) as f:
                     data = json.load(f)
 
                 for node_data in data.get("nodes", []):
-                    node = Node.from_dict(node_data)
-                    self.nodes[node.id] = node
+                    self._put_node(Node.from_dict(node_data))
 
                 for edge_data in data.get("edges", []):
-                    edge = Edge.from_dict(edge_data)
-                    self.edges.append(edge)
-                    self._adjacency[edge.source].append((edge.target, edge.relation, edge.weight))
-
-                logger.info(f"Loaded knowledge graph: {len(self.nodes)} nodes, {len(self.edges)} edges")
+                    self._put_edge(Edge.from_dict(edge_data))
             except Exception as e:
                 logger.error(f"Failed to load knowledge graph: {e}")
 
+        if self.log_file.exists():
+            replayed = 0
+            end = 0  # Offset just past the last complete line
+            tail = b""  # Unterminated last line, if any
+            tail_ok = False
+            with open(self.log_file, "rb") as f:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        end += len(line)
+                    else:
+                        tail = line
+                    try:
+                        op = json.loads(line)
+                        if op["op"] == "node":
+                            self._put_node(Node.from_dict(op["data"]))
+                        elif op["op"] == "edge":
+                            self._put_edge(Edge.from_dict(op["data"]))
+                    except (ValueError, KeyError) as e:
+                        # A torn final line from a crash mid-append
+                        logger.warning(f"Skipping unreadable knowledge log entry: {e}")
+                        continue
+                    replayed += 1
+                    tail_ok = line is tail
+            self._log_ops = replayed
+            if tail:
+                self._repair_log_tail(end, keep=tail_ok)
+
+        # Order each type by last access so get_related reads the tail
+        for node_type, ids in self._by_type.items():
+            self._by_type[node_type] = dict.fromkeys(sorted(
+                ids, key=lambda nid: (self.nodes[nid].last_accessed, -self._seq[nid])
+            ))
+
+        logger.info(
+            f"Loaded knowledge graph: {len(self.nodes)} nodes, {len(self.edges)} edges"
+            f" ({self._log_ops} log entries)"
+        )
+
+    def _repair_log_tail(self, end: int, keep: bool):
+        """
+        Make the log end in a newline so the next append starts a new line.
+
+        A readable last line only lost its newline and is terminated; a
+        torn one is cut off at ``end``, the end of the last complete line.
+        """
+        try:
+            with open(self.log_file, "r+b") as f:
+                if keep:
+                    f.seek(0, os.SEEK_END)
+                    f.write(b"\n")
+                else:
+                    f.truncate(end)
+        except OSError as e:
+            logger.error(f"Failed to repair knowledge graph log: {e}")
+
+    # -------------------------------------------------------------------------
+    # Indexes
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _trigrams(node: Node) -> Set[str]:
+        """Trigrams of the lowercased label and property values."""
+        grams: Set[str] = set()
+        for text in [node.label, *node.properties.values()]:
+            text = str(text).lower()
+            grams.update(text[i:i + 3] for i in range(len(text) - 2))
+        return grams
+
+    def _index_text(self, node: Node):
+        for gram in self._node_grams.pop(node.id, ()):
+            ids = self._grams[gram]
+            ids.discard(node.id)
+            if not ids:
+                del self._grams[gram]
+        grams = self._trigrams(node)
+        self._node_grams[node.id] = grams
+        for gram in grams:
+            self._grams[gram].add(node.id)
+
+    def _put_node(self, node: Node):
+        """Insert or replace a node and index it."""
+        old = self.nodes.get(node.id)
+        if old is not None:
+            self._by_type[old.type].pop(node.id, None)
+        else:
+            self._seq[node.id] = self._next_seq
+            self._next_seq += 1
+        self.nodes[node.id] = node
+        self._by_type[node.type][node.id] = None
+        self._index_text(node)
+
+    def _touch(self, node: Node):
+        """Mark a node as just accessed."""
+        node.last_accessed = datetime.utcnow()
+        ids = self._by_type[node.type]
+        ids.pop(node.id, None)
+        ids[node.id] = None
+
+    def _remove_node(self, node_id: str):
+        node = self.nodes.pop(node_id)
+        self._by_type[node.type].pop(node_id, None)
+        self._seq.pop(node_id, None)
+        for gram in self._node_grams.pop(node_id, ()):
+            ids = self._grams[gram]
+            ids.discard(node_id)
+            if not ids:
+                del self._grams[gram]
+
+    def _put_edge(self, edge: Edge):
+        """Insert an edge, or overwrite the stored one with the same key."""
+        key = (edge.source, edge.target, edge.relation)
+        existing = self._edge_index.get(key)
+        if existing is None:
+            self.edges.append(edge)
+            self._adjacency[edge.source].append(edge)
+            self._incoming[edge.target].append(edge)
+            self._edge_index[key] = edge
+        else:
+            existing.weight = edge.weight
+            existing.properties = edge.properties
+            existing.created_at = edge.created_at
+
+    @contextmanager
+    def batch(self) -> Iterator["KnowledgeGraph"]:
+        """
+        Group changes so they are persisted once, at the end.
+
+        Usage:
+            with graph.batch():
+                graph.add_node(...)
+                graph.add_edge(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._save()
+
     def _save(self):
-        """Save graph to disk."""
+        """Append pending changes to the log (deferred inside batch())."""
+        if self._batch_depth or not (self._dirty_nodes or self._dirty_edges):
+            return
+
+        lines = [
+            json.dumps({"op": "node", "data": self.nodes[nid].to_dict()})
+            for nid in self._dirty_nodes if nid in self.nodes
+        ]
+        lines += [
+            json.dumps({"op": "edge", "data": self._edge_index[key].to_dict()})
+            for key in self._dirty_edges if key in self._edge_index
+        ]
+
         try:
-            data = {
-                "nodes": [n.to_dict() for n in self.nodes.values()],
-                "edges": [e.to_dict() for e in self.edges],
-                "metadata": {
-                    "saved_at": datetime.utcnow().isoformat(),
-                    "node_count": len(self.nodes),
-                    "edge_count": len(self.edges)
-                }
+            with open(self.log_file, "a") as f:
+                f.write("\n".join(lines) + "\n")
+        except Exception as e:
+            # Changes stay dirty and are retried on the next save
+            logger.error(f"Failed to append knowledge graph log: {e}")
+            return
+        self._dirty_nodes.clear()
+        self._dirty_edges.clear()
+        self._log_ops += len(lines)
+
+        if self._log_ops >= self.compact_every:
+            self.compact()
+
+    def compact(self):
+        """Write an atomic snapshot of the whole graph and truncate the log."""
+        data = {
+            "nodes": [n.to_dict() for n in self.nodes.values()],
+            "edges": [e.to_dict() for e in self.edges],
+            "metadata": {
+                "saved_at": datetime.utcnow().isoformat(),
+                "node_count": len(self.nodes),
+                "edge_count": len(self.edges)
             }
-            with open(self.graph_file, "w") as f:
-                json.dump(data, f, indent=2)
+        }
+        try:
+            fd, tmp = tempfile.mkstemp(dir=self.graph_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w") as f:
+                    f.write(json.dumps(data, separators=(",", ":")))
+                os.replace(tmp, self.graph_file)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+            # Replaying the log over the new snapshot is idempotent, so a
+            # crash before this truncate loses nothing
+            open(self.log_file, "w").close()
+            self._log_ops = 0
         except Exception as e:
             logger.error(f"Failed to save knowledge graph: {e}")
 
@@ -170,11 +378,14 @@ class KnowledgeGraph:
         if id in self.nodes:
             node = self.nodes[id]
             node.properties.update(properties or {})
-            node.last_accessed = datetime.utcnow()
+            self._touch(node)
+            if properties:
+                self._index_text(node)
         else:
             node = Node(id, type, label, properties)
-            self.nodes[id] = node
+            self._put_node(node)
 
+        self._dirty_nodes.add(id)
         self._save()
         return node
 
@@ -187,16 +398,15 @@ class KnowledgeGraph:
         properties: Dict = None
     ) -> Edge:
         """Add a relationship edge."""
-        # Check if edge already exists
-        for edge in self.edges:
-            if edge.source == source and edge.target == target and edge.relation == relation:
-                edge.weight = max(edge.weight, weight)  # Strengthen connection
-                self._save()
-                return edge
+        key = (source, target, relation)
+        edge = self._edge_index.get(key)
+        if edge is not None:
+            edge.weight = max(edge.weight, weight)  # Strengthen connection
+        else:
+            edge = Edge(source, target, relation, weight, properties)
+            self._put_edge(edge)
 
-        edge = Edge(source, target, relation, weight, properties)
-        self.edges.append(edge)
-        self._adjacency[source].append((target, relation, weight))
+        self._dirty_edges.add(key)
         self._save()
         return edge
 
@@ -204,7 +414,7 @@ class KnowledgeGraph:
         """Get a node by ID."""
         node = self.nodes.get(id)
         if node:
-            node.last_accessed = datetime.utcnow()
+            self._touch(node)
         return node
 
     def get_neighbors(
@@ -222,38 +432,53 @@ class KnowledgeGraph:
                 return
             visited.add(nid)
 
-            for target, rel, weight in self._adjacency.get(nid, []):
-                if relation is None or rel == relation:
-                    node = self.nodes.get(target)
+            for edge in self._adjacency.get(nid, []):
+                if relation is None or edge.relation == relation:
+                    node = self.nodes.get(edge.target)
                     if node:
                         result.append({
                             "node": node.to_dict(),
-                            "relation": rel,
-                            "weight": weight,
+                            "relation": edge.relation,
+                            "weight": edge.weight,
                             "depth": current_depth
                         })
-                        traverse(target, current_depth + 1)
+                        traverse(edge.target, current_depth + 1)
 
         traverse(node_id, 1)
         return result
 
+    def get_incoming(self, node_id: str, relation: str = None) -> List[Dict]:
+        """Get nodes with an edge pointing at this node."""
+        result = []
+        for edge in self._incoming.get(node_id, []):
+            if relation is None or edge.relation == relation:
+                node = self.nodes.get(edge.source)
+                if node:
+                    result.append({
+                        "node": node.to_dict(),
+                        "relation": edge.relation,
+                        "weight": edge.weight
+                    })
+        return result
+
     def find_path(self, source: str, target: str, max_depth: int = 5) -> Optional[List[str]]:
         """Find path between two nodes using BFS."""
         if source not in self.nodes or target not in self.nodes:
             return None
 
         visited = {source}
-        queue = [(source, [source])]
+        queue = deque([(source, [source])])
 
         while queue:
-            current, path = queue.pop(0)
+            current, path = queue.popleft()
             if current == target:
                 return path
 
             if len(path) >= max_depth:
                 continue
 
-            for neighbor, _, _ in self._adjacency.get(current, []):
+            for edge in self._adjacency.get(current, []):
+                neighbor = edge.target
                 if neighbor not in visited:
                     visited.add(neighbor)
                     queue.append((neighbor, path + [neighbor]))
@@ -265,17 +490,35 @@ class KnowledgeGraph:
         node_type: str,
         limit: int = 10
     ) -> List[Node]:
-        """Get all nodes of a specific type."""
-        nodes = [n for n in self.nodes.values() if n.type == node_type]
-        nodes.sort(key=lambda x: x.last_accessed, reverse=True)
-        return nodes[:limit]
+        """Get the most recently accessed nodes of a specific type."""
+        ids = self._by_type.get(node_type, {})
+        return [self.nodes[nid] for nid in islice(reversed(ids), limit)]
 
     def search(self, query: str, node_type: str = None) -> List[Node]:
-        """Search nodes by label or properties."""
+        """
+        Search nodes by label or properties (case-insensitive substring).
+
+        Property changes are indexed when made through add_node.
+        """
         query_lower = query.lower()
         results = []
 
-        for node in self.nodes.values():
+        if len(query_lower) >= 3:
+            # Only nodes holding every trigram of the query can contain it
+            postings = sorted(
+                (self._grams.get(query_lower[i:i + 3], set()) for i in range(len(query_lower) - 2)),
+                key=len
+            )
+            candidates = set(postings[0]).intersection(*postings[1:])
+            if node_type:
+                candidates &= self._by_type.get(node_type, {}).keys()
+            nodes = [self.nodes[nid] for nid in sorted(candidates, key=self._seq.__getitem__)]
+        elif node_type:
+            nodes = [self.nodes[nid] for nid in sorted(self._by_type.get(node_type, ()), key=self._seq.__getitem__)]
+        else:
+            nodes = list(self.nodes.values())
+
+        for node in nodes:
             if node_type and node.type != node_type:
                 continue
 
@@ -291,18 +534,19 @@ class KnowledgeGraph:
         Consolidate RAG search results into knowledge graph.
         Called periodically to build long-term memory.
         """
-        for result in rag_results:
-            doc_id = result.get("id", result.get("metadata", {}).get("id"))
-            doc_type = result.get("type", result.get("metadata", {}).get("type", "document"))
-            content = result.get("content", result.get("document", ""))
-
-            if doc_id:
-                self.add_node(
-                    id=f"doc_{doc_id}",
-                    type=doc_type,
-                    label=content[:100] if content else doc_id,
-                    properties=result.get("metadata", {})
-                )
+        with self.batch():
+            for result in rag_results:
+                doc_id = result.get("id", result.get("metadata", {}).get("id"))
+                doc_type = result.get("type", result.get("metadata", {}).get("type", "document"))
+                content = result.get("content", result.get("document", ""))
+
+                if doc_id:
+                    self.add_node(
+                        id=f"doc_{doc_id}",
+                        type=doc_type,
+                        label=content[:100] if content else doc_id,
+                        properties=result.get("metadata", {})
+                    )
 
         logger.info(f"Consolidated {len(rag_results)} RAG results into knowledge graph")
 
@@ -310,41 +554,42 @@ class KnowledgeGraph:
         """Add strategy and its relationships to the graph."""
         strategy_id = f"strategy_{strategy.get('id', strategy.get('name'))}"
 
-        # Add strategy node
-        self.add_node(
-            id=strategy_id,
-            type="strategy",
-            label=strategy.get("name", "Unknown"),
-            properties={
-                "product_type": strategy.get("product_type"),
-                "performance_score": strategy.get("performance_score"),
-                "version": strategy.get("version")
-            }
-        )
-
-        # Add material relationship
-        material = strategy.get("material", {})
-        if material:
-            material_id = f"material_{material.get('name', 'unknown')}"
+        with self.batch():
+            # Add strategy node
             self.add_node(
-                id=material_id,
-                type="material",
-                label=material.get("name", "Unknown Material"),
-                properties=material
+                id=strategy_id,
+                type="strategy",
+                label=strategy.get("name", "Unknown"),
+                properties={
+                    "product_type": strategy.get("product_type"),
+                    "performance_score": strategy.get("performance_score"),
+                    "version": strategy.get("version")
+                }
             )
-            self.add_edge(strategy_id, material_id, "uses_material")
 
-        # Add constraint relationships
-        for constraint in strategy.get("constraints", []):
-            if constraint.get("standard"):
-                std_id = f"standard_{constraint['standard']}"
+            # Add material relationship
+            material = strategy.get("material", {})
+            if material:
+                material_id = f"material_{material.get('name', 'unknown')}"
                 self.add_node(
-                    id=std_id,
-                    type="standard",
-                    label=constraint["standard"],
-                    properties={}
+                    id=material_id,
+                    type="material",
+                    label=material.get("name", "Unknown Material"),
+                    properties=material
                 )
-                self.add_edge(strategy_id, std_id, "follows_standard")
+                self.add_edge(strategy_id, material_id, "uses_material")
+
+            # Add constraint relationships
+            for constraint in strategy.get("constraints", []):
+                if constraint.get("standard"):
+                    std_id = f"standard_{constraint['standard']}"
+                    self.add_node(
+                        id=std_id,
+                        type="standard",
+                        label=constraint["standard"],
+                        properties={}
+                    )
+                    self.add_edge(strategy_id, std_id, "follows_standard")
 
     def add_error_pattern(
         self,
@@ -355,25 +600,24 @@ class KnowledgeGraph:
         """Record error patterns for learning."""
         error_id = f"error_{error_type}"
 
-        self.add_node(
-            id=error_id,
-            type="error",
-            label=error_type,
-            properties={"count": error_details.get("count", 1)}
-        )
+        with self.batch():
+            self.add_node(
+                id=error_id,
+                type="error",
+                label=error_type,
+                properties={"count": error_details.get("count", 1)}
+            )
 
-        self.add_edge(
-            f"strategy_{strategy_id}",
-            error_id,
-            "failed_with",
-            weight=error_details.get("frequency", 1.0)
-        )
+            self.add_edge(
+                f"strategy_{strategy_id}",
+                error_id,
+                "failed_with",
+                weight=error_details.get("frequency", 1.0)
+            )
 
     def get_stats(self) -> Dict[str, Any]:
         """Get graph statistics."""
-        type_counts = defaultdict(int)
-        for node in self.nodes.values():
-            type_counts[node.type] += 1
+        type_counts = {t: len(ids) for t, ids in self._by_type.items() if ids}
 
         relation_counts = defaultdict(int)
         for edge in self.edges:
@@ -395,18 +639,23 @@ class KnowledgeGraph:
         ]
 
         for nid in old_nodes:
-            del self.nodes[nid]
-            self.edges = [e for e in self.edges if e.source != nid and e.target != nid]
+            self._remove_node(nid)
 
-        self._rebuild_adjacency()
-        self._save()
+        if old_nodes:
+            removed = set(old_nodes)
+            self.edges = [e for e in self.edges if e.source not in removed and e.target not in removed]
+            self._rebuild_adjacency()
+        self.compact()  # deletions are not logged; snapshot instead
         logger.info(f"Pruned {len(old_nodes)} old nodes from knowledge graph")
 
     def _rebuild_adjacency(self):
-        """Rebuild adjacency list from edges."""
+        """Rebuild adjacency lists and edge index from edges."""
         self._adjacency.clear()
+        self._incoming.clear()
+        self._edge_index = {(e.source, e.target, e.relation): e for e in self.edges}
         for edge in self.edges:
-            self._adjacency[edge.source].append((edge.target, edge.relation, edge.weight))
+            self._adjacency[edge.source].append(edge)
+            self._incoming[edge.target].append(edge)
 
 
 # Singleton
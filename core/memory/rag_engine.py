@@ -12,6 +12,15 @@ from .chroma_store import VulcanMemory
 
 ContextType = Literal["all", "trades", "lessons", "analyses", "cad"]
 
+# Collections searched for each context type
+CONTEXT_COLLECTIONS = {
+    "all": ("trades", "lessons", "analyses"),
+    "trades": ("trades",),
+    "lessons": ("lessons",),
+    "analyses": ("analyses",),
+    "cad": ("cad_jobs",),
+}
+
 
 class RAGEngine:
     """Retrieval-Augmented Generation for Vulcan.
@@ -49,27 +58,23 @@ class RAGEngine:
         Returns:
             Augmented prompt with retrieved context
         """
-        context_parts = []
-
-        if context_type in ["all", "trades"]:
-            trades_context = self._get_trades_context(user_query, include_metadata)
-            if trades_context:
-                context_parts.append(trades_context)
-
-        if context_type in ["all", "lessons"]:
-            lessons_context = self._get_lessons_context(user_query, include_metadata)
-            if lessons_context:
-                context_parts.append(lessons_context)
+        results = self.memory.search_many(
+            user_query,
+            CONTEXT_COLLECTIONS.get(context_type, ()),
+            n_results=self.context_window
+        )
+        formatters = {
+            "trades": self._format_trades_context,
+            "lessons": self._format_lessons_context,
+            "analyses": self._format_analyses_context,
+            "cad_jobs": self._format_cad_context,
+        }
 
-        if context_type in ["all", "analyses"]:
-            analyses_context = self._get_analyses_context(user_query, include_metadata)
-            if analyses_context:
-                context_parts.append(analyses_context)
-
-        if context_type in ["cad"]:
-            cad_context = self._get_cad_context(user_query, include_metadata)
-            if cad_context:
-                context_parts.append(cad_context)
+        context_parts = []
+        for name, result in results.items():
+            context = formatters[name](result, include_metadata)
+            if context:
+                context_parts.append(context)
 
         if context_parts:
             return f"""## Retrieved Context
@@ -83,10 +88,8 @@ class RAGEngine:
 
         return user_query
 
-    def _get_trades_context(self, query: str, include_metadata: bool) -> Optional[str]:
-        """Retrieve relevant trades."""
-        results = self.memory.search_trades(query, n_results=self.context_window)
-
+    def _format_trades_context(self, results: Dict[str, Any], include_metadata: bool) -> Optional[str]:
+        """Format relevant trades."""
         if not results["documents"][0]:
             return None
 
@@ -102,10 +105,8 @@ class RAGEngine:
 
         return "\n".join(lines)
 
-    def _get_lessons_context(self, query: str, include_metadata: bool) -> Optional[str]:
-        """Retrieve relevant lessons."""
-        results = self.memory.search_lessons(query, n_results=self.context_window)
-
+    def _format_lessons_context(self, results: Dict[str, Any], include_metadata: bool) -> Optional[str]:
+        """Format relevant lessons."""
         if not results["documents"][0]:
             return None
 
@@ -121,10 +122,8 @@ class RAGEngine:
 
         return "\n".join(lines)
 
-    def _get_analyses_context(self, query: str, include_metadata: bool) -> Optional[str]:
-        """Retrieve relevant market analyses."""
-        results = self.memory.search_analyses(query, n_results=self.context_window)
-
+    def _format_analyses_context(self, results: Dict[str, Any], include_metadata: bool) -> Optional[str]:
+        """Format relevant market analyses."""
         if not results["documents"][0]:
             return None
 
@@ -140,10 +139,8 @@ class RAGEngine:
 
         return "\n".join(lines)
 
-    def _get_cad_context(self, query: str, include_metadata: bool) -> Optional[str]:
-        """Retrieve relevant CAD job logs."""
-        results = self.memory.search_cad_jobs(query, n_results=self.context_window)
-
+    def _format_cad_context(self, results: Dict[str, Any], include_metadata: bool) -> Optional[str]:
+        """Format relevant CAD job logs."""
         if not results["documents"][0]:
             return None
 
@@ -171,22 +168,18 @@ class RAGEngine:
         Returns:
             Dict with context by type
         """
-        context = {}
+        collections = [
+            name for name in CONTEXT_COLLECTIONS.get(context_type, ())
+            if name in ("trades", "lessons")
+        ]
+        results = self.memory.search_many(query, collections, n_results=self.context_window)
 
-        if context_type in ["all", "trades"]:
-            results = self.memory.search_trades(query, n_results=self.context_window)
-            if results["documents"][0]:
-                context["trades"] = [
-                    {"content": doc, "metadata": meta}
-                    for doc, meta in zip(results["documents"][0], results["metadatas"][0])
-                ]
-
-        if context_type in ["all", "lessons"]:
-            results = self.memory.search_lessons(query, n_results=self.context_window)
-            if results["documents"][0]:
-                context["lessons"] = [
+        context = {}
+        for name, result in results.items():
+            if result["documents"][0]:
+                context[name] = [
                     {"content": doc, "metadata": meta}
-                    for doc, meta in zip(results["documents"][0], results["metadatas"][0])
+                    for doc, meta in zip(result["documents"][0], result["metadatas"][0])
                 ]
 
         return context
@@ -6,8 +6,10 @@ Provides observability for AI operations.
 
 import os
 import json
+import atexit
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field, asdict
 from pathlib import Path
@@ -16,7 +18,6 @@ from collections import defaultdict
 logger = logging.getLogger("core.metrics.telemetry")
 
 TELEMETRY_DIR = Path(__file__).parent.parent.parent / "data" / "telemetry"
-TELEMETRY_DIR.mkdir(parents=True, exist_ok=True)
 
 
 @dataclass
@@ -54,6 +55,42 @@ class APICall:
         return input_cost + output_cost
 
 
+@dataclass
+class ModelAggregate:
+    """Running totals for one model within one hour."""
+    calls: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    latency_ms: float = 0.0
+    errors: int = 0
+
+    @property
+    def tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def add(self, call: APICall):
+        self.calls += 1
+        self.input_tokens += call.input_tokens
+        self.output_tokens += call.output_tokens
+        self.cost += call.cost
+        self.latency_ms += call.latency_ms
+        if not call.success:
+            self.errors += 1
+
+    def merge(self, other: "ModelAggregate"):
+        self.calls += other.calls
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        self.cost += other.cost
+        self.latency_ms += other.latency_ms
+        self.errors += other.errors
+
+
+# hour (naive UTC, truncated) -> model -> totals
+HourlyBuckets = Dict[datetime, Dict[str, ModelAggregate]]
+
+
 class Telemetry:
     """
     Telemetry collector for AI operations.
@@ -63,45 +100,198 @@ class Telemetry:
     - API latency
     - Cost estimation
     - Error rates
-    """
 
-    def __init__(self):
-        self._calls: List[APICall] = []
-        self._daily_file: Optional[Path] = None
-        self._load_today()
+    Calls are appended to ``telemetry_YYYYMMDD.jsonl`` by a background
+    flusher, so ``record`` never touches the disk. Statistics come from
+    hourly per-model aggregates covering the last ``window_days`` days;
+    individual calls are not kept in memory. After each flush a small
+    ``telemetry_YYYYMMDD.agg.json`` summary is rewritten so startup only
+    replays log lines written after the last summary.
+    """
 
-    def _get_daily_file(self) -> Path:
-        """Get today's telemetry file."""
-        today = datetime.utcnow().strftime("%Y%m%d")
-        return TELEMETRY_DIR / f"telemetry_{today}.json"
+    def __init__(
+        self,
+        telemetry_dir: Optional[Path] = None,
+        flush_interval: float = 1.0,
+        flush_batch: int = 256,
+        window_days: int = 7,
+    ):
+        """
+        Args:
+            telemetry_dir: Directory for daily logs (default $VULCAN_TELEMETRY_DIR,
+                then data/telemetry)
+            flush_interval: Max seconds a recorded call waits before being written
+            flush_batch: Pending calls that trigger an early flush
+            window_days: Days of aggregates kept in memory
+        """
+        self.telemetry_dir = Path(telemetry_dir or os.getenv("VULCAN_TELEMETRY_DIR") or TELEMETRY_DIR)
+        self.telemetry_dir.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.flush_batch = flush_batch
+        self.window_days = window_days
+
+        self._lock = threading.Lock()
+        self._io_lock = threading.Lock()
+        self._hours: HourlyBuckets = {}
+        self._pending: List[Tuple[APICall, str]] = []
+        self._persisted: Dict[str, Tuple[int, HourlyBuckets]] = {}
+        self._wake = threading.Event()
+        self._closed = False
+
+        self._load_window()
+
+        self._worker = threading.Thread(
+            target=self._run, name="vulcan-telemetry", daemon=True
+        )
+        self._worker.start()
+        atexit.register(self.close)
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def _day_files(self, day: str) -> Tuple[Path, Path]:
+        """Get the (log, aggregate) files for a YYYYMMDD day."""
+        return (
+            self.telemetry_dir / f"telemetry_{day}.jsonl",
+            self.telemetry_dir / f"telemetry_{day}.agg.json",
+        )
 
-    def _load_today(self):
-        """Load today's telemetry data."""
-        self._daily_file = self._get_daily_file()
-        if self._daily_file.exists():
+    def _load_window(self):
+        """Load aggregates for the in-memory window from disk."""
+        today = datetime.utcnow().date()
+        for offset in range(self.window_days, -1, -1):
+            day = today - timedelta(days=offset)
+            self._hours.update(self._load_day(day.strftime("%Y%m%d")))
+        self._evict()
+
+    def _load_day(self, day: str, include_legacy: bool = True) -> HourlyBuckets:
+        """Rebuild one day's hourly aggregates from its summary and log tail."""
+        log_file, agg_file = self._day_files(day)
+        hours: HourlyBuckets = {}
+        offset = 0
+
+        if agg_file.exists():
             try:
-                with open(self._daily_file) as f:
+                with open(agg_file) as f:
                     data = json.load(f)
-                    for call_data in data.get("calls", []):
-                        call_data["timestamp"] = datetime.fromisoformat(call_data["timestamp"])
-                        self._calls.append(APICall(**call_data))
+                for hour, models in data["hours"].items():
+                    hours[datetime.fromisoformat(hour)] = {
+                        model: ModelAggregate(**totals) for model, totals in models.items()
+                    }
+                offset = data["offset"]
+            except Exception as e:
+                logger.error(f"Failed to load telemetry summary {agg_file.name}: {e}")
+                hours, offset = {}, 0
+
+        if log_file.exists():
+            with open(log_file, "rb") as f:
+                f.seek(offset)
+                for line in f:
+                    try:
+                        self._add_to(hours, self._decode(json.loads(line)))
+                    except Exception:
+                        continue  # torn or corrupt line
+
+        # Pre-JSONL format: one JSON document per day
+        legacy = self.telemetry_dir / f"telemetry_{day}.json"
+        if include_legacy and legacy.exists():
+            try:
+                with open(legacy) as f:
+                    for call_data in json.load(f).get("calls", []):
+                        self._add_to(hours, self._decode(call_data))
             except Exception as e:
                 logger.error(f"Failed to load telemetry: {e}")
 
-    def _save(self):
-        """Save telemetry to disk."""
-        try:
-            data = {
-                "date": datetime.utcnow().strftime("%Y-%m-%d"),
-                "calls": [
-                    {**asdict(c), "timestamp": c.timestamp.isoformat()}
-                    for c in self._calls
-                ]
-            }
-            with open(self._get_daily_file(), "w") as f:
-                json.dump(data, f, indent=2)
-        except Exception as e:
-            logger.error(f"Failed to save telemetry: {e}")
+        return hours
+
+    @staticmethod
+    def _decode(data: Dict[str, Any]) -> APICall:
+        data["timestamp"] = datetime.fromisoformat(data["timestamp"])
+        return APICall(**data)
+
+    @staticmethod
+    def _add_to(hours: HourlyBuckets, call: APICall):
+        hour = call.timestamp.replace(minute=0, second=0, microsecond=0)
+        models = hours.setdefault(hour, {})
+        models.setdefault(call.model, ModelAggregate()).add(call)
+
+    def _evict(self):
+        """Drop hourly buckets that have left the window."""
+        cutoff = datetime.utcnow() - timedelta(days=self.window_days + 1)
+        for hour in [h for h in self._hours if h < cutoff]:
+            del self._hours[hour]
+
+    def _run(self):
+        while not self._closed:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Write pending calls to disk and refresh the daily summaries."""
+        with self._io_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                self._evict()
+            if not pending:
+                return
+
+            by_day: Dict[str, List[Tuple[APICall, str]]] = defaultdict(list)
+            for call, line in pending:
+                by_day[call.timestamp.strftime("%Y%m%d")].append((call, line))
+
+            for day, entries in by_day.items():
+                try:
+                    self._append_day(day, entries)
+                except Exception as e:
+                    logger.error(f"Failed to save telemetry: {e}")
+
+            # Only the current and previous day still receive appends
+            keep = {(datetime.utcnow() - timedelta(days=d)).strftime("%Y%m%d") for d in (0, 1)}
+            for day in [d for d in self._persisted if d not in keep]:
+                del self._persisted[day]
+
+    def _append_day(self, day: str, entries: List[Tuple[APICall, str]]):
+        """Append calls to a day's log and rewrite its summary to match."""
+        log_file, agg_file = self._day_files(day)
+        size = log_file.stat().st_size if log_file.exists() else 0
+        offset, hours = self._persisted.get(day, (-1, {}))
+        if offset != size:
+            # First write of the day, or another writer appended since
+            hours = self._load_day(day, include_legacy=False)
+
+        with open(log_file, "a") as f:
+            f.write("".join(line for _, line in entries))
+            offset = f.tell()
+        for call, _ in entries:
+            self._add_to(hours, call)
+        self._persisted[day] = (offset, hours)
+
+        summary = {
+            "offset": offset,
+            "hours": {
+                hour.isoformat(): {model: asdict(totals) for model, totals in models.items()}
+                for hour, models in hours.items()
+            },
+        }
+        tmp_file = agg_file.with_suffix(".tmp")
+        with open(tmp_file, "w") as f:
+            json.dump(summary, f)
+        os.replace(tmp_file, agg_file)
+
+    def close(self):
+        """Flush pending calls and stop the background writer."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._worker.join(timeout=5)
+        self.flush()
+
+    # -------------------------------------------------------------------------
+    # Recording
+    # -------------------------------------------------------------------------
 
     def record(
         self,
@@ -127,8 +317,13 @@ class Telemetry:
             metadata=metadata or {}
         )
 
-        self._calls.append(call)
-        self._save()
+        line = json.dumps({**asdict(call), "timestamp": call.timestamp.isoformat()}, default=str) + "\n"
+        with self._lock:
+            self._add_to(self._hours, call)
+            self._pending.append((call, line))
+            backlog = len(self._pending)
+        if backlog >= self.flush_batch:
+            self._wake.set()
 
         # Log high-cost calls
         if call.cost > 0.10:
@@ -136,71 +331,77 @@ class Telemetry:
 
         return call
 
+    # -------------------------------------------------------------------------
+    # Statistics
+    # -------------------------------------------------------------------------
+
+    def _totals_by_model(self, hours: HourlyBuckets, since: Optional[datetime] = None,
+                         until: Optional[datetime] = None) -> Dict[str, ModelAggregate]:
+        totals: Dict[str, ModelAggregate] = defaultdict(ModelAggregate)
+        with self._lock:
+            for hour, models in hours.items():
+                if (since and hour < since) or (until and hour >= until):
+                    continue
+                for model, agg in models.items():
+                    totals[model].merge(agg)
+        return totals
+
     def get_daily_stats(self, date: datetime = None) -> Dict[str, Any]:
         """Get statistics for a specific day."""
         target_date = (date or datetime.utcnow()).date()
-        day_calls = [
-            c for c in self._calls
-            if c.timestamp.date() == target_date
-        ]
-
-        if not day_calls:
+        start = datetime.combine(target_date, datetime.min.time())
+        hours = self._hours
+        if start < datetime.utcnow() - timedelta(days=self.window_days):
+            self.flush()
+            hours = self._load_day(target_date.strftime("%Y%m%d"))
+        by_model = self._totals_by_model(hours, start, start + timedelta(days=1))
+
+        calls = sum(m.calls for m in by_model.values())
+        if not calls:
             return {"date": str(target_date), "calls": 0}
 
-        total_tokens = sum(c.total_tokens for c in day_calls)
-        total_cost = sum(c.cost for c in day_calls)
-        avg_latency = sum(c.latency_ms for c in day_calls) / len(day_calls)
-        errors = sum(1 for c in day_calls if not c.success)
-
-        by_model = defaultdict(lambda: {"calls": 0, "tokens": 0, "cost": 0})
-        for c in day_calls:
-            by_model[c.model]["calls"] += 1
-            by_model[c.model]["tokens"] += c.total_tokens
-            by_model[c.model]["cost"] += c.cost
-
+        errors = sum(m.errors for m in by_model.values())
         return {
             "date": str(target_date),
-            "calls": len(day_calls),
-            "total_tokens": total_tokens,
-            "total_cost": round(total_cost, 4),
-            "avg_latency_ms": round(avg_latency, 2),
+            "calls": calls,
+            "total_tokens": sum(m.tokens for m in by_model.values()),
+            "total_cost": round(sum(m.cost for m in by_model.values()), 4),
+            "avg_latency_ms": round(sum(m.latency_ms for m in by_model.values()) / calls, 2),
             "errors": errors,
-            "error_rate": round(errors / len(day_calls) * 100, 2) if day_calls else 0,
-            "by_model": dict(by_model)
+            "error_rate": round(errors / calls * 100, 2),
+            "by_model": {
+                model: {"calls": m.calls, "tokens": m.tokens, "cost": m.cost}
+                for model, m in by_model.items()
+            }
         }
 
     def get_weekly_stats(self) -> Dict[str, Any]:
-        """Get statistics for the past 7 days."""
-        cutoff = datetime.utcnow() - timedelta(days=7)
-        week_calls = [c for c in self._calls if c.timestamp >= cutoff]
+        """Get statistics for the past 7 days (to hour granularity)."""
+        cutoff = (datetime.utcnow() - timedelta(days=7)).replace(minute=0, second=0, microsecond=0)
+        by_model = self._totals_by_model(self._hours, since=cutoff)
 
-        if not week_calls:
+        calls = sum(m.calls for m in by_model.values())
+        if not calls:
             return {"period": "7 days", "calls": 0}
 
-        total_cost = sum(c.cost for c in week_calls)
-        total_tokens = sum(c.total_tokens for c in week_calls)
+        total_cost = sum(m.cost for m in by_model.values())
+        total_tokens = sum(m.tokens for m in by_model.values())
 
         return {
             "period": "7 days",
-            "calls": len(week_calls),
+            "calls": calls,
             "total_tokens": total_tokens,
             "total_cost": round(total_cost, 4),
             "avg_daily_cost": round(total_cost / 7, 4),
-            "avg_tokens_per_call": round(total_tokens / len(week_calls), 0) if week_calls else 0
+            "avg_tokens_per_call": round(total_tokens / calls, 0)
         }
 
     def get_model_breakdown(self) -> Dict[str, Dict]:
-        """Get usage breakdown by model."""
-        breakdown = defaultdict(lambda: {"calls": 0, "tokens": 0, "cost": 0, "errors": 0})
-
-        for call in self._calls:
-            breakdown[call.model]["calls"] += 1
-            breakdown[call.model]["tokens"] += call.total_tokens
-            breakdown[call.model]["cost"] += call.cost
-            if not call.success:
-                breakdown[call.model]["errors"] += 1
-
-        return dict(breakdown)
+        """Get usage breakdown by model over the in-memory window."""
+        return {
+            model: {"calls": m.calls, "tokens": m.tokens, "cost": m.cost, "errors": m.errors}
+            for model, m in self._totals_by_model(self._hours).items()
+        }
 
     def estimate_monthly_cost(self) -> float:
         """Estimate monthly cost based on current usage."""
@@ -7,9 +7,15 @@ Packages Used: redis (pip install redis)
 
 import json
 import hashlib
+import heapq
 import logging
 import os
-from typing import Any, Optional
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, List, Optional
 from functools import wraps
 
 logger = logging.getLogger("core.redis-cache")
@@ -157,52 +163,194 @@ class RedisCacheAdapter:
                 return {
                     "status": "healthy",
                     "type": "in-memory-fallback",
-                    "note": "Redis unavailable, using local cache"
+                    "note": "Redis unavailable, using local cache",
+                    "used_memory": self.client.info("memory")["used_memory_human"],
                 }
         except Exception as e:
             return {"status": "unhealthy", "error": str(e)}
 
 
+# Per-entry bookkeeping: OrderedDict node, _Item and a heap tuple
+_ITEM_OVERHEAD = 200
+
+
+class _Item:
+    __slots__ = ("value", "expires", "size")
+
+    def __init__(self, value: Any, expires: Optional[float], size: int):
+        self.value = value
+        self.expires = expires
+        self.size = size
+
+
+def _sizeof(key: str, value: Any) -> int:
+    """Approximate bytes held for one entry (key, value and bookkeeping)."""
+    return sys.getsizeof(key) + sys.getsizeof(value) + _ITEM_OVERHEAD
+
+
 class InMemoryCache:
-    """Fallback in-memory cache when Redis unavailable."""
-    
-    def __init__(self, max_size: int = 1000):
-        self._cache = {}
-        self._expiry = {}
+    """
+    Fallback in-memory cache when Redis unavailable.
+
+    Drop-in for the Redis client calls RedisCacheAdapter and ResponseCache
+    make (get/set/setex/delete/ping/info), with Redis-like behavior:
+    - O(1) LRU eviction once max_size items or max_memory bytes are held
+    - TTLs on a min-heap, so expired entries are found without a scan
+    - Expired entries are removed on read, on write and by a background
+      sweep every sweep_interval seconds (0 disables the thread)
+    - Hit/miss/eviction/expiry counts and memory use in stats() / info()
+    """
+
+    def __init__(self, max_size: int = 1000, max_memory: int = 64 * 1024 * 1024,
+                 sweep_interval: float = 1.0):
+        self._cache: "OrderedDict[str, _Item]" = OrderedDict()  # Least recently used first
+        self._heap: List[tuple] = []  # (expires, key); stale when the item's expires differs
         self._max_size = max_size
-        
+        self._max_memory = max_memory
+        self._used_memory = 0
+        self._stats = {"hits": 0, "misses": 0, "sets": 0, "evictions": 0, "expirations": 0, "rejected": 0}
+        self._lock = threading.RLock()
+        self._stop = threading.Event()
+        if sweep_interval > 0:
+            # The thread holds a weak reference so an unused cache can still be collected
+            threading.Thread(
+                target=InMemoryCache._sweeper, args=(weakref.ref(self), self._stop, sweep_interval),
+                name="inmemory-cache-expiry", daemon=True,
+            ).start()
+
+    # ==================== EXPIRY ====================
+
+    @staticmethod
+    def _sweeper(ref, stop: threading.Event, interval: float):
+        while not stop.wait(interval):
+            cache = ref()
+            if cache is None:
+                return
+            cache.expire()
+            del cache
+
+    def expire(self, limit: Optional[int] = None) -> int:
+        """Remove expired entries (at most limit); returns how many."""
+        now = time.monotonic()
+        removed = 0
+        with self._lock:
+            heap = self._heap
+            while heap and heap[0][0] <= now and (limit is None or removed < limit):
+                expires, key = heapq.heappop(heap)
+                item = self._cache.get(key)
+                if item is not None and item.expires == expires:
+                    self._remove(key)
+                    self._stats["expirations"] += 1
+                    removed += 1
+            # Overwritten keys leave stale heap entries; rebuild when they dominate
+            if len(heap) > 2 * len(self._cache) + 64:
+                self._heap = [(item.expires, k) for k, item in self._cache.items() if item.expires is not None]
+                heapq.heapify(self._heap)
+        return removed
+
+    def _remove(self, key: str) -> Optional[_Item]:
+        item = self._cache.pop(key, None)
+        if item is not None:
+            self._used_memory -= item.size
+        return item
+
+    def close(self):
+        """Stop the background sweep."""
+        self._stop.set()
+
+    # ==================== REDIS COMMANDS ====================
+
     def get(self, key: str) -> Optional[str]:
-        import time
-        if key in self._cache:
-            if self._expiry.get(key, float('inf')) > time.time():
-                return self._cache[key]
-            else:
-                del self._cache[key]
-                del self._expiry[key]
-        return None
-        
-    def set(self, key: str, value: str, ttl: int = 3600):
-        import time
-        # Evict oldest if at capacity
-        if len(self._cache) >= self._max_size:
-            oldest = min(self._expiry, key=self._expiry.get)
-            del self._cache[oldest]
-            del self._expiry[oldest]
-        self._cache[key] = value
-        self._expiry[key] = time.time() + ttl
-        
+        with self._lock:
+            item = self._cache.get(key)
+            if item is not None and item.expires is not None and item.expires <= time.monotonic():
+                self._remove(key)
+                self._stats["expirations"] += 1
+                item = None
+            if item is None:
+                self._stats["misses"] += 1
+                return None
+            self._cache.move_to_end(key)
+            self._stats["hits"] += 1
+            return item.value
+
+    def set(self, key: str, value: str, ttl: Optional[float] = 3600):
+        """Store value; ttl in seconds, None for no expiry."""
+        size = _sizeof(key, value)
+        with self._lock:
+            self._remove(key)
+            if size > self._max_memory:
+                self._stats["rejected"] += 1
+                logger.warning(f"In-memory cache entry too large ({size} bytes) - not stored")
+                return False
+            self.expire(limit=8)  # Amortized cleanup before evicting live entries
+            while self._cache and (len(self._cache) >= self._max_size
+                                   or self._used_memory + size > self._max_memory):
+                _, item = self._cache.popitem(last=False)
+                self._used_memory -= item.size
+                self._stats["evictions"] += 1
+            expires = time.monotonic() + ttl if ttl is not None else None
+            self._cache[key] = _Item(value, expires, size)
+            self._used_memory += size
+            if expires is not None:
+                heapq.heappush(self._heap, (expires, key))
+            self._stats["sets"] += 1
+            return True
+
     def setex(self, key: str, ttl: int, value: str):
-        self.set(key, value, ttl)
-        
-    def delete(self, key: str):
-        self._cache.pop(key, None)
-        self._expiry.pop(key, None)
-        
+        return self.set(key, value, ttl)
+
+    def delete(self, key: str) -> int:
+        with self._lock:
+            return 1 if self._remove(key) is not None else 0
+
+    def ttl(self, key: str) -> int:
+        """Seconds left like Redis TTL: -1 without expiry, -2 if missing."""
+        with self._lock:
+            item = self._cache.get(key)
+            if item is None:
+                return -2
+            if item.expires is None:
+                return -1
+            return max(0, int(round(item.expires - time.monotonic())))
+
+    def flushdb(self):
+        with self._lock:
+            self._cache.clear()
+            self._heap.clear()
+            self._used_memory = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
     def ping(self):
         return True
-        
+
+    def stats(self) -> dict:
+        """Hit rate, evictions, expirations and memory use."""
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                "keys": len(self._cache),
+                "used_memory": self._used_memory,
+                "max_memory": self._max_memory,
+                "max_size": self._max_size,
+            }
+
     def info(self, section: str = None):
-        return {"used_memory_human": f"{len(self._cache)} items"}
+        stats = self.stats()
+        return {
+            "used_memory": stats["used_memory"],
+            "used_memory_human": f"{stats['used_memory'] / 1024 / 1024:.2f}M ({stats['keys']} items)",
+            "maxmemory": stats["max_memory"],
+            "maxmemory_policy": "allkeys-lru",
+            "keyspace_hits": stats["hits"],
+            "keyspace_misses": stats["misses"],
+            "evicted_keys": stats["evictions"],
+            "expired_keys": stats["expirations"],
+        }
 
 
 # Singleton
@@ -3,17 +3,19 @@ SolidWorks Event Listener for ACHE Model Detection
 Phase 24.1.1 - Event listener for model open
 
 Listens for SolidWorks model open/close/activate events
-and triggers ACHE detection when relevant.
+and triggers ACHE detection when relevant. Events come from the shared
+SolidWorks state hub rather than a polling thread of its own.
 """
 
 import logging
-import threading
-import time
+import os
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Callable, Dict, List, Optional, Any
 from enum import Enum
 
+from watchers.state_hub import SolidWorksStateHub, StateChange, StateEvent, get_state_hub
+
 logger = logging.getLogger("vulcan.ache.event_listener")
 
 
@@ -49,21 +51,21 @@ class ACHEEventListener:
         listener.start()
     """
 
-    def __init__(self, poll_interval: float = 1.0):
+    def __init__(self, poll_interval: float = 1.0, hub: Optional[SolidWorksStateHub] = None):
         """
         Initialize the event listener.
 
         Args:
-            poll_interval: Seconds between polls (default 1.0)
+            poll_interval: Kept for compatibility; the state hub sets the cadence
+            hub: State hub to subscribe to (default: the shared hub)
         """
         self._poll_interval = poll_interval
+        self._hub = hub or get_state_hub()
         self._running = False
-        self._thread: Optional[threading.Thread] = None
         self._callbacks: Dict[ModelEventType, List[Callable]] = {
             event_type: [] for event_type in ModelEventType
         }
         self._last_model_path: Optional[str] = None
-        self._sw_app = None
 
     def on_model_open(self, callback: Callable[[ModelOpenEvent], None]) -> None:
         """Register callback for model open events."""
@@ -82,6 +84,9 @@ class ACHEEventListener:
         """
         Start the event listener.
 
+        Subscribes to the state hub, so models opened after SolidWorks
+        starts are picked up even if it is not running yet.
+
         Returns:
             True if started successfully, False otherwise
         """
@@ -90,14 +95,10 @@ class ACHEEventListener:
             return True
 
         try:
-            # Connect to SolidWorks
-            if not self._connect_solidworks():
-                logger.error("Cannot start listener - SolidWorks not connected")
-                return False
-
+            self._last_model_path = self._hub.state.document_path
+            self._hub.subscribe(self._on_state_change)
+            self._hub.start()
             self._running = True
-            self._thread = threading.Thread(target=self._poll_loop, daemon=True)
-            self._thread.start()
             logger.info("ACHE Event Listener started")
             return True
 
@@ -108,77 +109,42 @@ class ACHEEventListener:
     def stop(self) -> None:
         """Stop the event listener."""
         self._running = False
-        if self._thread:
-            self._thread.join(timeout=2.0)
+        self._hub.unsubscribe(self._on_state_change)
         logger.info("ACHE Event Listener stopped")
 
-    def _connect_solidworks(self) -> bool:
-        """Connect to running SolidWorks instance."""
-        try:
-            import win32com.client
-            self._sw_app = win32com.client.GetActiveObject("SldWorks.Application")
-            logger.info("Connected to SolidWorks")
-            return True
-        except Exception as e:
-            logger.warning(f"SolidWorks not running or not accessible: {e}")
-            return False
-
-    def _poll_loop(self) -> None:
-        """Main polling loop to detect model changes."""
-        while self._running:
-            try:
-                self._check_active_model()
-            except Exception as e:
-                logger.error(f"Error in poll loop: {e}")
-            time.sleep(self._poll_interval)
-
-    def _check_active_model(self) -> None:
-        """Check if active model has changed."""
-        if not self._sw_app:
+    def _on_state_change(self, change: StateChange) -> None:
+        """Translate hub changes into model open/activate/close events."""
+        current_path = change.state.document_path
+        if current_path == self._last_model_path:
+            if change.event == StateEvent.SAVED and current_path:
+                event = self._create_model_event(change.document, current_path, change)
+                self._trigger_event(ModelEventType.SAVED, event)
             return
 
-        try:
-            active_doc = self._sw_app.ActiveDoc
-            if active_doc is None:
-                if self._last_model_path:
-                    # Model was closed
-                    self._trigger_close(self._last_model_path)
-                    self._last_model_path = None
-                return
-
-            current_path = active_doc.GetPathName()
-
-            if current_path != self._last_model_path:
-                if self._last_model_path:
-                    # Different model activated
-                    event = self._create_model_event(active_doc, current_path)
-                    self._trigger_event(ModelEventType.ACTIVATED, event)
-                else:
-                    # New model opened
-                    event = self._create_model_event(active_doc, current_path)
-                    self._trigger_event(ModelEventType.OPENED, event)
-
-                self._last_model_path = current_path
-
-        except Exception as e:
-            logger.error(f"Error checking active model: {e}")
-
-    def _create_model_event(self, doc, filepath: str) -> ModelOpenEvent:
-        """Create a ModelOpenEvent from SolidWorks document."""
-        import os
-
-        # Determine model type
-        doc_type = doc.GetType()
-        type_map = {1: "part", 2: "assembly", 3: "drawing"}
-        model_type = type_map.get(doc_type, "unknown")
-
+        if current_path is None:
+            # Model was closed
+            if self._last_model_path:
+                self._trigger_close(self._last_model_path)
+        else:
+            event = self._create_model_event(change.document, current_path, change)
+            if self._last_model_path:
+                # Different model activated
+                self._trigger_event(ModelEventType.ACTIVATED, event)
+            else:
+                # New model opened
+                self._trigger_event(ModelEventType.OPENED, event)
+
+        self._last_model_path = current_path
+
+    def _create_model_event(self, doc, filepath: str, change: StateChange) -> ModelOpenEvent:
+        """Create a ModelOpenEvent from a hub change and its live document."""
         # Get custom properties for ACHE detection
-        custom_props = self._get_custom_properties(doc)
+        custom_props = self._get_custom_properties(doc) if doc is not None else {}
 
         return ModelOpenEvent(
             filepath=filepath,
             filename=os.path.basename(filepath),
-            model_type=model_type,
+            model_type=change.state.document_type.value,
             custom_properties=custom_props,
         )
 
@@ -235,9 +201,10 @@ class ACHEEventListener:
         """Get listener status."""
         return {
             "running": self._running,
-            "solidworks_connected": self._sw_app is not None,
+            "solidworks_connected": self._hub.state.is_running,
             "last_model": self._last_model_path,
             "poll_interval": self._poll_interval,
+            "state_hub": self._hub.get_stats(),
             "callbacks_registered": {
                 event_type.value: len(callbacks)
                 for event_type, callbacks in self._callbacks.items()
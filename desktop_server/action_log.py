@@ -0,0 +1,210 @@
+"""
+Action Log
+==========
+Bounded in-memory record of requests and queued command executions.
+
+The log is a ring buffer with a fixed entry count, and large payloads are
+truncated, so memory stays flat however long the server runs. Entries can
+optionally be spilled to a rotating JSONL file for a permanent record.
+Queries filter by type, path prefix and time without copying the whole
+buffer:
+- a per-type index answers type filters in O(matches)
+- time filters scan newest-first and stop at the first older entry
+
+Usage:
+    log = ActionLog(max_entries=5000, spill_file=Path("logs/actions.jsonl"))
+    log.record("request", method="POST", path="/mouse/move", client="100.1.2.3")
+    log.query(type="queue_execution", since=time.time() - 3600, limit=50)
+"""
+
+import json
+import logging
+import logging.handlers
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Union
+
+logger = logging.getLogger("vulcan.action_log")
+
+
+@dataclass(slots=True)
+class ActionEntry:
+    """One logged action."""
+    seq: int
+    ts: float
+    type: str
+    method: Optional[str] = None
+    path: Optional[str] = None
+    client: Optional[str] = None
+    data: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry = {"timestamp": datetime.fromtimestamp(self.ts).isoformat(), "type": self.type}
+        if self.method is not None:
+            entry["method"] = self.method
+        if self.path is not None:
+            entry["path"] = self.path
+        if self.client is not None:
+            entry["client"] = self.client
+        entry.update(self.data)
+        return entry
+
+
+def _bounded(value: Any, max_chars: int) -> Any:
+    """Keep small payloads as-is; replace large ones with a truncated JSON string."""
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    if isinstance(value, str):
+        return value if len(value) <= max_chars else value[:max_chars] + "...[truncated]"
+    try:
+        text = json.dumps(value, default=str)
+    except (TypeError, ValueError):
+        text = str(value)
+    if len(text) <= max_chars:
+        return value
+    return text[:max_chars] + "...[truncated]"
+
+
+class ActionLog:
+    """Thread-safe ring buffer of ActionEntry with type index and optional JSONL spill."""
+
+    def __init__(
+        self,
+        max_entries: int = 5000,
+        max_payload_chars: int = 2000,
+        spill_file: Optional[Path] = None,
+        spill_max_bytes: int = 10 * 1024 * 1024,
+        spill_backups: int = 5,
+    ):
+        """
+        Args:
+            max_entries: Entries kept in memory (oldest evicted first)
+            max_payload_chars: Longest serialized payload value kept in memory
+            spill_file: Also append every entry to this JSONL file (None = memory only)
+            spill_max_bytes: Rotate the spill file at this size
+            spill_backups: Rotated spill files kept
+        """
+        self.max_entries = max_entries
+        self.max_payload_chars = max_payload_chars
+        self._entries: Deque[ActionEntry] = deque()
+        self._by_type: Dict[str, Deque[ActionEntry]] = {}
+        self._lock = threading.Lock()
+        self._seq = 0
+        self._spill: Optional[logging.Logger] = None
+        if spill_file:
+            self._spill = self._open_spill(Path(spill_file), spill_max_bytes, spill_backups)
+
+    def _open_spill(self, spill_file: Path, max_bytes: int, backups: int) -> logging.Logger:
+        spill_file.parent.mkdir(parents=True, exist_ok=True)
+        handler = logging.handlers.RotatingFileHandler(
+            spill_file, maxBytes=max_bytes, backupCount=backups, encoding="utf-8"
+        )
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        spill = logging.getLogger(f"vulcan.action_log.spill.{id(self)}")
+        spill.handlers = [handler]
+        spill.setLevel(logging.INFO)
+        spill.propagate = False
+        return spill
+
+    def record(
+        self,
+        type: str,
+        method: Optional[str] = None,
+        path: Optional[str] = None,
+        client: Optional[str] = None,
+        **data: Any,
+    ) -> ActionEntry:
+        """
+        Append an action.
+
+        Args:
+            type: Action kind, e.g. "request" or "queue_execution"
+            method, path, client: Request details, when the action is a request
+            **data: Extra payload (large values are truncated in memory)
+
+        Returns:
+            The stored entry
+        """
+        if self._spill is not None:
+            full = {"timestamp": datetime.now().isoformat(), "type": type, "method": method,
+                    "path": path, "client": client, **data}
+            self._spill.info(json.dumps(full, default=str))
+        if data:
+            data = {key: _bounded(value, self.max_payload_chars) for key, value in data.items()}
+
+        with self._lock:
+            self._seq += 1
+            entry = ActionEntry(self._seq, time.time(), type, method, path, client, data)
+            if len(self._entries) >= self.max_entries:
+                evicted = self._entries.popleft()
+                # Entries are appended in seq order, so the evicted one heads its type index
+                by_type = self._by_type[evicted.type]
+                by_type.popleft()
+                if not by_type:
+                    del self._by_type[evicted.type]
+            self._entries.append(entry)
+            self._by_type.setdefault(type, deque()).append(entry)
+        return entry
+
+    def query(
+        self,
+        limit: int = 100,
+        type: Optional[str] = None,
+        path: Optional[str] = None,
+        since: Optional[Union[float, datetime]] = None,
+        until: Optional[Union[float, datetime]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Most recent matching entries, oldest first (like slicing the old list).
+
+        Args:
+            limit: Max entries returned
+            type: Only this action type
+            path: Only request paths starting with this prefix
+            since: Only entries at or after this time (epoch seconds or datetime)
+            until: Only entries at or before this time
+        """
+        since_ts = since.timestamp() if isinstance(since, datetime) else since
+        until_ts = until.timestamp() if isinstance(until, datetime) else until
+
+        with self._lock:
+            source = self._by_type.get(type, ()) if type is not None else self._entries
+            matches: List[ActionEntry] = []
+            for entry in reversed(source):
+                if since_ts is not None and entry.ts < since_ts:
+                    break
+                if until_ts is not None and entry.ts > until_ts:
+                    continue
+                if path is not None and not (entry.path or "").startswith(path):
+                    continue
+                matches.append(entry)
+                if len(matches) >= limit:
+                    break
+        return [entry.to_dict() for entry in reversed(matches)]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._by_type.clear()
+
+    @property
+    def total_recorded(self) -> int:
+        """Entries recorded since start, including evicted ones."""
+        return self._seq
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "total_recorded": self._seq,
+                "by_type": {kind: len(entries) for kind, entries in self._by_type.items()},
+                "spill": self._spill is not None,
+            }
@@ -7,11 +7,50 @@ Phase 24.10 Implementation
 """
 
 import logging
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 
 logger = logging.getLogger("vulcan.analyzer.interference")
 
+Box = Tuple[float, float, float, float, float, float]
+
+
+def nearby_pairs(boxes: Sequence[Optional[Box]], reach: float) -> List[Tuple[int, int]]:
+    """
+    Index pairs whose boxes come within ``reach`` of each other on every axis.
+
+    Boxes further apart than ``reach`` on any axis cannot have a minimum
+    distance below it, so the exact (expensive) measurement can be skipped.
+    A None box is unknown and pairs with everything.
+
+    Args:
+        boxes: (xmin, ymin, zmin, xmax, ymax, zmax) per item, or None
+        reach: Clearance being checked, in the boxes' units
+
+    Returns:
+        Sorted (i, j) pairs with i < j
+    """
+    known = sorted((box[0], i) for i, box in enumerate(boxes) if box is not None)
+    unknown = [i for i, box in enumerate(boxes) if box is None]
+    pairs = set()
+
+    # Sweep along x: each box pairs with later-starting boxes that begin within reach
+    active: List[int] = []
+    for x_min, i in known:
+        active = [j for j in active if boxes[j][3] + reach > x_min]
+        a = boxes[i]
+        for j in active:
+            b = boxes[j]
+            if all(min(a[k + 3], b[k + 3]) - max(a[k], b[k]) > -reach for k in (1, 2)):
+                pairs.add((min(i, j), max(i, j)))
+        active.append(i)
+
+    for i in unknown:
+        for j in range(len(boxes)):
+            if j != i:
+                pairs.add((min(i, j), max(i, j)))
+    return sorted(pairs)
+
 
 @dataclass
 class InterferenceResult:
@@ -126,7 +165,12 @@ class InterferenceAnalyzer:
         return result
 
     def check_clearances(self, min_clearance_m: float = 0.001) -> List[ClearanceResult]:
-        """Check minimum clearances between components."""
+        """
+        Check minimum clearances between components.
+
+        Component bounding boxes are read first and only pairs whose boxes
+        come within min_clearance_m get a GetMinimumDistance call.
+        """
         clearances = []
 
         if not self._connect():
@@ -139,32 +183,48 @@ class InterferenceAnalyzer:
             if not components or len(components) < 2:
                 return clearances
 
-            # Check clearance between each pair
-            for i, comp1 in enumerate(components):
-                for comp2 in components[i + 1:]:
-                    try:
-                        # Use minimum distance measure
-                        result = self._doc.Extension.GetMinimumDistance(
-                            comp1, comp2, None, None, None, None
-                        )
-
-                        if result and len(result) >= 1:
-                            distance = result[0]
-                            if distance < min_clearance_m:
-                                clearances.append(ClearanceResult(
-                                    component1_name=comp1.Name2,
-                                    component2_name=comp2.Name2,
-                                    clearance_m=distance,
-                                    clearance_in=distance * 39.3701,
-                                ))
-                    except Exception:
-                        pass
+            components = list(components)
+            pairs = nearby_pairs([self._component_box(c) for c in components], min_clearance_m)
+            logger.debug(f"Clearance broad phase: {len(pairs)} of "
+                         f"{len(components) * (len(components) - 1) // 2} pairs measured")
+
+            # Check clearance between each candidate pair
+            for i, j in pairs:
+                comp1, comp2 = components[i], components[j]
+                try:
+                    # Use minimum distance measure
+                    result = self._doc.Extension.GetMinimumDistance(
+                        comp1, comp2, None, None, None, None
+                    )
+
+                    if result and len(result) >= 1:
+                        distance = result[0]
+                        if distance < min_clearance_m:
+                            clearances.append(ClearanceResult(
+                                component1_name=comp1.Name2,
+                                component2_name=comp2.Name2,
+                                clearance_m=distance,
+                                clearance_in=distance * 39.3701,
+                            ))
+                except Exception:
+                    pass
 
         except Exception as e:
             logger.error(f"Clearance check failed: {e}")
 
         return clearances
 
+    @staticmethod
+    def _component_box(component) -> Optional[Box]:
+        """Component bounding box in assembly space (metres), or None if unavailable."""
+        try:
+            box = component.GetBox(False, False)
+            if box and len(box) >= 6:
+                return tuple(float(v) for v in box[:6])
+        except Exception as e:
+            logger.debug(f"GetBox failed for {getattr(component, 'Name2', '?')}: {e}")
+        return None
+
     def to_dict(self) -> Dict[str, Any]:
         """Run analysis and return results as dictionary."""
         result = self.run_interference_check()
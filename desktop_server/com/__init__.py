@@ -3,6 +3,8 @@ COM Adapters for CAD Applications.
 Provides FastAPI routers for SolidWorks and Inventor automation.
 """
 
+from .com_executor import ComExecutor, com_route, get_com_executor, get_com_stats
+
 try:
     from .solidworks_com import router as solidworks_router
     SOLIDWORKS_AVAILABLE = True
@@ -263,6 +265,10 @@ except ImportError:
     SOLIDWORKS_DRAWINGS_ADVANCED_AVAILABLE = False
 
 __all__ = [
+    "ComExecutor",
+    "com_route",
+    "get_com_executor",
+    "get_com_stats",
     "solidworks_router",
     "solidworks_advanced_router",
     "solidworks_assembly_router",
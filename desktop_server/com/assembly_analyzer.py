@@ -11,13 +11,17 @@ import os
 import json
 import logging
 import re
+import heapq
+from bisect import bisect_left
+from collections import defaultdict
 from datetime import datetime
 from typing import Dict, List, Any, Optional
 from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
-import win32com.client
-import pythoncom
+
+from .com_executor import ComConnectionError, ComUnavailableError, get_com_executor
+from .component_walker import ComponentWalker, DocumentCache, com_value
 
 router = APIRouter(prefix="/com/solidworks/analysis", tags=["assembly-analysis"])
 logger = logging.getLogger(__name__)
@@ -26,6 +30,9 @@ logger = logging.getLogger(__name__)
 KNOWLEDGE_BASE_PATH = Path(__file__).parent.parent.parent / "data" / "design_knowledge"
 KNOWLEDGE_BASE_PATH.mkdir(parents=True, exist_ok=True)
 
+# Per-document data survives across analysis runs until the file changes
+_document_cache = DocumentCache(KNOWLEDGE_BASE_PATH / "component_cache.json")
+
 # Part type patterns for classification
 PART_TYPE_PATTERNS = {
     "structural_frame": [
@@ -354,28 +361,91 @@ def get_recommendations_for_part(part_type: str, part_name: str, context: Dict =
     return recommendations, issues
 
 
-def find_related_parts(part_name: str, all_parts: List[Dict]) -> List[str]:
-    """Find parts that are likely related based on naming patterns."""
-    related = []
+class RelatedPartsIndex:
+    """
+    Finds parts related by naming in O(log n) per lookup.
+
+    Two parts are related when one's base name (instance suffix such as -1
+    or _2 removed) is a prefix of the other's name, or when their base
+    names share a first-5-character prefix (for bases longer than 5).
+    """
+
+    def __init__(self, part_numbers: List[str]):
+        self._order = {}
+        for name in part_numbers:
+            self._order.setdefault(name, len(self._order))
+        self._sorted = sorted(self._order)
+        self._by_base: Dict[str, List[str]] = defaultdict(list)
+        self._by_prefix: Dict[str, List[str]] = defaultdict(list)
+        for name in self._order:
+            base = self._base(name)
+            self._by_base[base].append(name)
+            self._by_prefix[base[:5]].append(name)
+
+    @staticmethod
+    def _base(name: str) -> str:
+        return re.sub(r'[-_]\d+$', '', name)
+
+    def related(self, part_name: str, limit: int = 5) -> List[str]:
+        base = self._base(part_name)
+        candidates = []
+
+        # Names that start with this part's base
+        i = bisect_left(self._sorted, base)
+        while i < len(self._sorted) and self._sorted[i].startswith(base):
+            candidates.append(self._sorted[i])
+            i += 1
+
+        # Groups are in input order, so their first limit + 1 entries suffice
+        for end in range(1, len(part_name) + 1):
+            candidates.extend(self._by_base.get(part_name[:end], ())[:limit + 1])
+        if len(base) > 5:
+            candidates.extend(self._by_prefix.get(base[:5], ())[:limit + 1])
+
+        found = set(candidates)
+        found.discard(part_name)
+        return heapq.nsmallest(limit, found, key=lambda n: self._order.get(n, len(self._order)))
 
-    # Extract base name (remove suffixes like -1, -2, etc.)
-    base_pattern = re.sub(r'[-_]\d+$', '', part_name)
 
-    for part in all_parts:
-        other_name = part.get("part_number", "")
-        if other_name != part_name:
-            other_base = re.sub(r'[-_]\d+$', '', other_name)
+def find_related_parts(part_name: str, all_parts: List[Dict]) -> List[str]:
+    """Find parts that are likely related based on naming patterns."""
+    index = RelatedPartsIndex([part.get("part_number", "") for part in all_parts])
+    return index.related(part_name)
 
-            # Check for similar base names
-            if base_pattern in other_name or other_base in part_name:
-                related.append(other_name)
 
-            # Check for common prefixes
-            if len(base_pattern) > 5 and base_pattern[:5] == other_base[:5]:
-                if other_name not in related:
-                    related.append(other_name)
+def get_custom_properties(ref_model) -> Dict[str, str]:
+    """Read all custom properties, in one call where the API allows it."""
+    properties = {}
+    try:
+        cpm = ref_model.Extension.CustomPropertyManager("")
+        if not cpm:
+            return properties
 
-    return related[:5]  # Limit to top 5 related parts
+        # GetAll3 returns (count, names, types, values, resolved, links)
+        try:
+            result = cpm.GetAll3()
+            names, values, resolved = result[1], result[3], result[4]
+            for name, value, resolved_value in zip(names or (), values or (), resolved or ()):
+                value = value or resolved_value
+                if value:
+                    properties[name] = str(value)
+            return properties
+        except Exception:
+            pass
+
+        prop_names = com_value(cpm, "GetNames")
+        for name in prop_names or ():
+            try:
+                result = cpm.Get3(name, False)
+                if result:
+                    val = result[0] if result[0] else result[1]
+                    if val:
+                        properties[name] = str(val)
+            except Exception:
+                continue
+    except Exception as e:
+        logger.debug(f"Could not get custom properties: {e}")
+    return properties
 
 
 def get_mass_properties(ref_model) -> Dict:
@@ -527,6 +597,16 @@ def get_mates_info(comp) -> List[Dict]:
         if not comp:
             return mates
 
+        # One call for all mates where available
+        all_mates = com_value(comp, "GetMates")
+        if all_mates is not None:
+            for i, mate in enumerate(all_mates):
+                mates.append({
+                    "type": getattr(mate, "Type", "Unknown"),
+                    "name": getattr(mate, "Name", f"Mate{i}")
+                })
+            return mates
+
         # Get mates from component
         mate_count = comp.GetMateCount()
         if mate_count and mate_count > 0:
@@ -577,188 +657,113 @@ def load_learned_patterns() -> List[Dict]:
     return []
 
 
-def _analyze_assembly_sync():
-    """Synchronous assembly analysis - runs in COM thread context."""
-    pythoncom.CoInitialize()
+def fetch_document_data(ref_model) -> Dict[str, Any]:
+    """Read everything the analysis needs from one document in a single pass."""
+    geometry = get_mass_properties(ref_model)
+    bbox = get_bounding_box(ref_model)
+    if bbox:
+        geometry["bounding_box"] = bbox
+    return {
+        "file_path": str(com_value(ref_model, "GetPathName", "") or ""),
+        "properties": get_custom_properties(ref_model),
+        "geometry": geometry,
+        "material": get_material_info(ref_model),
+        "features": get_feature_summary(ref_model),
+    }
+
+
+def _analyze_assembly_sync(app, max_depth: Optional[int] = None, cache: Optional[DocumentCache] = None):
+    """Synchronous assembly analysis - runs on the SolidWorks COM executor thread."""
     try:
-        app = win32com.client.Dispatch("SldWorks.Application")
         model = app.ActiveDoc
 
         if not model:
             return {"error": "No active document", "status_code": 400}
 
         doc_type = model.GetType
+        if callable(doc_type):
+            doc_type = doc_type()
         if doc_type != 2:  # swDocASSEMBLY = 2
             return {"error": "Active document is not an assembly", "status_code": 400}
 
         # Get assembly name
-        assembly_name = model.GetTitle if hasattr(model, 'GetTitle') else "Unknown"
-        if callable(assembly_name):
-            assembly_name = assembly_name()
+        assembly_name = com_value(model, "GetTitle", "Unknown")
 
-        # Get all components
+        # Walk the full component tree once, one fetch per referenced document
         config_mgr = model.ConfigurationManager
         active_config = config_mgr.ActiveConfiguration
         root_component = active_config.GetRootComponent3(True)
 
-        parts_data = []
-        analyses = []
-
-        if root_component:
-            children = root_component.GetChildren
-            if callable(children):
-                children = children()
+        walker = ComponentWalker(fetch_document_data, cache=_document_cache if cache is None else cache)
+        walk = walker.walk(root_component, max_depth=max_depth)
+        related_index = RelatedPartsIndex([doc.part_number for doc in walk.documents])
 
-            if children:
-                # First pass: collect all part info with models
-                seen_parts = {}
-                for comp in children:
-                    try:
-                        comp_name = None
-                        for attr in ['Name2', 'Name', 'GetName']:
-                            try:
-                                val = getattr(comp, attr, None)
-                                if val is not None:
-                                    comp_name = val() if callable(val) else val
-                                    if comp_name:
-                                        break
-                            except:
-                                continue
-
-                        if not comp_name:
-                            continue
-
-                        # Remove instance suffix
-                        part_number = comp_name
-                        if "<" in str(part_number):
-                            part_number = str(part_number).split("<")[0]
-
-                        if part_number not in seen_parts:
-                            # Get file path and ref_model
-                            file_path = ""
-                            ref_model = None
-                            custom_props = {}
-
-                            try:
-                                ref_model = comp.GetModelDoc2()
-                                if ref_model:
-                                    path_name = getattr(ref_model, 'GetPathName', None)
-                                    if path_name:
-                                        file_path = path_name() if callable(path_name) else path_name
-
-                                    # Get custom properties
-                                    try:
-                                        ext = ref_model.Extension
-                                        if ext:
-                                            cpm = ext.CustomPropertyManager("")
-                                            if cpm:
-                                                prop_names = cpm.GetNames
-                                                if callable(prop_names):
-                                                    prop_names = prop_names()
-                                                if prop_names:
-                                                    for name in prop_names:
-                                                        try:
-                                                            result = cpm.Get3(name, False)
-                                                            if result:
-                                                                val = result[0] if result[0] else result[1]
-                                                                if val:
-                                                                    custom_props[name] = str(val)
-                                                        except:
-                                                            continue
-                                    except:
-                                        pass
-                            except:
-                                pass
-
-                            seen_parts[part_number] = {
-                                "part_number": part_number,
-                                "file_path": file_path,
-                                "ref_model": ref_model,
-                                "component": comp,
-                                "properties": custom_props
-                            }
-                    except Exception as e:
-                        logger.warning(f"Error processing component: {e}")
-                        continue
-
-                parts_data = list(seen_parts.values())
-
-                # Second pass: analyze each part with ALL data
-                for part in parts_data:
-                    part_number = part["part_number"]
-                    file_path = part.get("file_path", "")
-                    ref_model = part.get("ref_model")
-                    comp = part.get("component")
-
-                    # Get geometry data
-                    geometry = get_mass_properties(ref_model)
-                    bbox = get_bounding_box(ref_model)
-                    if bbox:
-                        geometry["bounding_box"] = bbox
-
-                    # Get material info
-                    material = get_material_info(ref_model)
-
-                    # Get feature summary
-                    features = get_feature_summary(ref_model)
-
-                    # Get custom properties
-                    custom_props = part.get("properties", {})
-
-                    # Get mate info
-                    mates = get_mates_info(comp)
-
-                    # Classify part type using ALL data
-                    part_type, confidence = classify_part_type(
-                        part_number, file_path, custom_props, geometry
-                    )
-
-                    # Generate purpose description
-                    purpose = generate_part_purpose(part_number, part_type)
-
-                    # Get recommendations
-                    recommendations, issues = get_recommendations_for_part(part_type, part_number)
-
-                    # Add geometry-specific recommendations
-                    if features.get("holes") and len(features["holes"]) > 5:
-                        recommendations.append("Consider using hole patterns for consistent spacing")
-                    if not features.get("fillets") and features.get("cuts"):
-                        issues.append("Sharp edges on cut features - consider adding fillets for handling")
-
-                    # Find related parts
-                    related = find_related_parts(part_number, parts_data)
-
-                    # Generate suggested name
-                    suggested_name = generate_suggested_name(
-                        part_number, part_type, geometry, material, custom_props
-                    )
-
-                    analyses.append({
-                        "part_number": part_number,
-                        "suggested_name": suggested_name,
-                        "part_type": part_type,
-                        "purpose": purpose,
-                        "recommendations": recommendations[:5],  # Top 5
-                        "potential_issues": issues[:3],  # Top 3
-                        "related_parts": related,
-                        "confidence": confidence,
-                        "geometry": {
-                            "mass_kg": round(geometry.get("mass", 0), 3),
-                            "volume_m3": round(geometry.get("volume", 0), 6),
-                            "surface_area_m2": round(geometry.get("surface_area", 0), 4),
-                            "bounding_box": bbox
-                        },
-                        "material": material,
-                        "features": {
-                            "total": features.get("total_features", 0),
-                            "holes": len(features.get("holes", [])),
-                            "fillets": len(features.get("fillets", [])),
-                            "chamfers": len(features.get("chamfers", [])),
-                            "patterns": len(features.get("patterns", [])),
-                            "hole_details": features.get("holes", [])[:5]  # First 5 holes
-                        },
-                        "mates": mates[:5]  # First 5 mates
-                    })
+        analyses = []
+        for doc in walk.documents:
+            part_number = doc.part_number
+            file_path = doc.data.get("file_path") or doc.path
+            custom_props = doc.data.get("properties", {})
+            geometry = doc.data.get("geometry", {})
+            bbox = geometry.get("bounding_box", {})
+            material = doc.data.get("material", {})
+            features = doc.data.get("features", {})
+
+            # Mates belong to the instance, not the document
+            mates = get_mates_info(doc.instances[0].component)
+
+            # Classify part type using ALL data
+            part_type, confidence = classify_part_type(
+                part_number, file_path, custom_props, geometry
+            )
+
+            # Generate purpose description
+            purpose = generate_part_purpose(part_number, part_type)
+
+            # Get recommendations (copies: the best-practice lists are shared)
+            recommendations, issues = get_recommendations_for_part(part_type, part_number)
+            recommendations, issues = list(recommendations), list(issues)
+
+            # Add geometry-specific recommendations
+            if features.get("holes") and len(features["holes"]) > 5:
+                recommendations.append("Consider using hole patterns for consistent spacing")
+            if not features.get("fillets") and features.get("cuts"):
+                issues.append("Sharp edges on cut features - consider adding fillets for handling")
+
+            # Find related parts
+            related = related_index.related(part_number)
+
+            # Generate suggested name
+            suggested_name = generate_suggested_name(
+                part_number, part_type, geometry, material, custom_props
+            )
+
+            analyses.append({
+                "part_number": part_number,
+                "suggested_name": suggested_name,
+                "part_type": part_type,
+                "purpose": purpose,
+                "quantity": len(doc.instances),
+                "recommendations": recommendations[:5],  # Top 5
+                "potential_issues": issues[:3],  # Top 3
+                "related_parts": related,
+                "confidence": confidence,
+                "geometry": {
+                    "mass_kg": round(geometry.get("mass", 0), 3),
+                    "volume_m3": round(geometry.get("volume", 0), 6),
+                    "surface_area_m2": round(geometry.get("surface_area", 0), 4),
+                    "bounding_box": bbox
+                },
+                "material": material,
+                "features": {
+                    "total": features.get("total_features", 0),
+                    "holes": len(features.get("holes", [])),
+                    "fillets": len(features.get("fillets", [])),
+                    "chamfers": len(features.get("chamfers", [])),
+                    "patterns": len(features.get("patterns", [])),
+                    "hole_details": features.get("holes", [])[:5]  # First 5 holes
+                },
+                "mates": mates[:5]  # First 5 mates
+            })
 
         # Generate assembly-level insights
         assembly_insights = generate_assembly_insights(analyses, assembly_name)
@@ -770,6 +775,8 @@ def _analyze_assembly_sync():
             "status": "ok",
             "assembly_name": assembly_name,
             "total_parts_analyzed": len(analyses),
+            "total_components": walk.component_count,
+            "walk": walk.get_stats(),
             "part_analyses": analyses,
             "assembly_insights": assembly_insights,
             "timestamp": datetime.now().isoformat()
@@ -778,8 +785,6 @@ def _analyze_assembly_sync():
     except Exception as e:
         logger.error(f"Error analyzing assembly: {e}")
         return {"error": f"Failed to analyze assembly: {e}", "status_code": 500}
-    finally:
-        pythoncom.CoUninitialize()
 
 
 def generate_assembly_insights(analyses: List[Dict], assembly_name: str) -> Dict:
@@ -939,16 +944,20 @@ def learn_from_assembly(assembly_name: str, analyses: List[Dict], insights: Dict
 
 
 @router.get("/analyze")
-async def analyze_assembly():
-    """Analyze the current assembly and provide design insights."""
-    import asyncio
-    import concurrent.futures
+async def analyze_assembly(max_depth: Optional[int] = None):
+    """Analyze the current assembly and provide design insights.
 
+    Args:
+        max_depth: Sub-assembly levels to walk (default: the full tree)
+    """
     logger.info("Starting assembly analysis")
 
-    loop = asyncio.get_event_loop()
-    with concurrent.futures.ThreadPoolExecutor() as pool:
-        result = await loop.run_in_executor(pool, _analyze_assembly_sync)
+    try:
+        result = await get_com_executor("solidworks").run(_analyze_assembly_sync, max_depth)
+    except ComUnavailableError:
+        raise HTTPException(status_code=501, detail="COM not available")
+    except ComConnectionError as e:
+        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
 
     if "error" in result:
         raise HTTPException(status_code=result.get("status_code", 500), detail=result["error"])
@@ -0,0 +1,384 @@
+"""
+COM Apartment Executor
+======================
+Runs all COM work for a CAD application on one dedicated
+single-threaded-apartment (STA) thread that owns a long-lived,
+health-checked application session.
+
+Routers used to call CoInitialize() and GetActiveObject() on every request,
+directly on the event loop. With this module they await the executor
+instead. The loop stays free while SolidWorks works, every call reuses
+the same session, and a dead session is reconnected automatically.
+
+Usage:
+    from .com_executor import com_route, get_solidworks
+
+    @router.get("/thing")
+    @com_route()
+    async def read_thing():
+        sw = get_solidworks()          # session owned by the STA thread
+        return {"title": sw.ActiveDoc.GetTitle()}
+
+    # Or submit a callable directly
+    title = await get_com_executor("solidworks").run(lambda sw: sw.ActiveDoc.GetTitle())
+"""
+
+import asyncio
+import functools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from fastapi import HTTPException
+
+logger = logging.getLogger(__name__)
+
+try:
+    import win32com.client
+    import pythoncom
+    COM_AVAILABLE = True
+except ImportError:
+    COM_AVAILABLE = False
+
+
+PROG_IDS = {
+    "solidworks": "SldWorks.Application",
+    "inventor": "Inventor.Application",
+}
+
+# HRESULTs meaning the application process went away
+DISCONNECTED_HRESULTS = {
+    -2147417848,  # RPC_E_DISCONNECTED
+    -2147023174,  # RPC_S_SERVER_UNAVAILABLE
+    -2147023170,  # RPC_S_CALL_FAILED
+}
+
+
+class ComUnavailableError(RuntimeError):
+    """pywin32 is not installed (non-Windows host)."""
+
+
+class ComConnectionError(RuntimeError):
+    """The CAD application could not be reached."""
+
+
+def is_disconnect_error(error: BaseException) -> bool:
+    """Check whether a COM error means the session is dead."""
+    hresult = getattr(error, "hresult", None)
+    if hresult is None and error.args and isinstance(error.args[0], int):
+        hresult = error.args[0]  # pywintypes.com_error
+    return hresult in DISCONNECTED_HRESULTS
+
+
+def _drive(coro):
+    """Run a coroutine that never suspends to completion on this thread."""
+    try:
+        yielded = coro.send(None)
+    except StopIteration as stop:
+        return stop.value
+    coro.close()
+    raise RuntimeError(f"COM handler suspended on {yielded!r}; COM routes must not await I/O")
+
+
+@dataclass
+class _Job:
+    fn: Callable[[], Any]
+    future: Future = field(default_factory=Future)
+    enqueued_at: float = field(default_factory=time.perf_counter)
+
+
+_STOP = object()
+
+
+class ComExecutor:
+    """
+    Single STA thread owning one CAD application session.
+
+    Jobs run one at a time in submission order, which is also what the
+    application itself requires.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        connect: Callable[[], Any],
+        health_check: Optional[Callable[[Any], Any]] = None,
+        health_interval: float = 5.0,
+        latency_window: int = 500,
+    ):
+        """
+        Args:
+            name: Application name, used for the thread name and stats
+            connect: Returns a new application object; called on the STA thread
+            health_check: Raises if the session is dead (default: read app.Visible)
+            health_interval: Seconds between health checks of an idle session
+            latency_window: Number of recent calls kept for latency percentiles
+        """
+        self.name = name
+        self._connect = connect
+        self._health_check = health_check or (lambda app: app.Visible)
+        self.health_interval = health_interval
+
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._app = None
+        self._checked_at = 0.0
+        self._latencies: deque = deque(maxlen=latency_window)
+        self._waits: deque = deque(maxlen=latency_window)
+        self._stats = {
+            "submitted": 0,
+            "completed": 0,
+            "failed": 0,
+            "connects": 0,
+            "reconnects": 0,
+            "health_failures": 0,
+        }
+
+    # -------------------------------------------------------------------------
+    # Submitting work
+    # -------------------------------------------------------------------------
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """
+        Queue fn(app, *args, **kwargs) on the STA thread.
+
+        Returns:
+            Future resolving to fn's return value
+        """
+        return self._submit(lambda: fn(self.app, *args, **kwargs))
+
+    def _submit(self, fn: Callable[[], Any]) -> Future:
+        self._ensure_thread()
+        job = _Job(fn)
+        with self._stats_lock:
+            self._stats["submitted"] += 1
+        self._queue.put(job)
+        return job.future
+
+    async def run(self, fn: Callable, *args, timeout: Optional[float] = None, **kwargs) -> Any:
+        """Await fn(app, *args, **kwargs) without blocking the event loop."""
+        if self.is_com_thread():
+            return fn(self.app, *args, **kwargs)
+        return await self._await(self.submit(fn, *args, **kwargs), timeout)
+
+    @staticmethod
+    async def _await(future: Future, timeout: Optional[float]) -> Any:
+        wrapped = asyncio.wrap_future(future)
+        if timeout is None:
+            return await wrapped
+        return await asyncio.wait_for(wrapped, timeout)
+
+    async def run_handler(self, handler: Callable, *args, **kwargs) -> Any:
+        """Run an async route handler whose body is synchronous COM code."""
+        if self.is_com_thread():
+            return await handler(*args, **kwargs)  # nested call from another COM route
+        # The handler fetches the session itself (get_solidworks()), so a
+        # connection failure surfaces as the handler's own HTTP error.
+        return await self._await(self._submit(lambda: _drive(handler(*args, **kwargs))), None)
+
+    def is_com_thread(self) -> bool:
+        return threading.current_thread() is self._thread
+
+    @property
+    def app(self) -> Any:
+        """The live application object. Only valid on the STA thread."""
+        if not self.is_com_thread():
+            raise RuntimeError(f"{self.name} COM session used outside its executor thread")
+        now = time.monotonic()
+        if self._app is not None and now - self._checked_at >= self.health_interval:
+            try:
+                self._health_check(self._app)
+                self._checked_at = now
+            except Exception as e:
+                logger.warning(f"{self.name} session failed health check, reconnecting: {e}")
+                with self._stats_lock:
+                    self._stats["health_failures"] += 1
+                self._drop_session()
+        if self._app is None:
+            self._app = self._connect()
+            self._checked_at = now
+            with self._stats_lock:
+                if self._stats["connects"]:
+                    self._stats["reconnects"] += 1
+                self._stats["connects"] += 1
+            logger.info(f"Connected to {self.name}")
+        return self._app
+
+    def _drop_session(self):
+        self._app = None
+
+    # -------------------------------------------------------------------------
+    # STA thread
+    # -------------------------------------------------------------------------
+
+    def _ensure_thread(self):
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                thread = threading.Thread(
+                    target=self._run, name=f"vulcan-com-{self.name}", daemon=True
+                )
+                self._thread = thread
+                thread.start()
+
+    def _run(self):
+        if COM_AVAILABLE:
+            pythoncom.CoInitialize()
+        try:
+            while True:
+                job = self._queue.get()
+                if job is _STOP:
+                    return
+                self._execute(job)
+        finally:
+            self._app = None
+            if COM_AVAILABLE:
+                pythoncom.CoUninitialize()
+
+    def _execute(self, job: _Job):
+        if not job.future.set_running_or_notify_cancel():
+            return
+        started = time.perf_counter()
+        try:
+            result = job.fn()
+        except BaseException as e:
+            if is_disconnect_error(e):
+                logger.warning(f"{self.name} disconnected, will reconnect on next call: {e}")
+                self._drop_session()
+            self._record(job, started, failed=True)
+            job.future.set_exception(e)
+        else:
+            self._record(job, started, failed=False)
+            job.future.set_result(result)
+
+    def _record(self, job: _Job, started: float, failed: bool):
+        finished = time.perf_counter()
+        with self._stats_lock:
+            self._stats["failed" if failed else "completed"] += 1
+            self._waits.append(started - job.enqueued_at)
+            self._latencies.append(finished - started)
+
+    def shutdown(self, timeout: Optional[float] = None):
+        """Finish queued jobs, release the session and stop the thread."""
+        thread = self._thread
+        if thread is None:
+            return
+        self._queue.put(_STOP)
+        thread.join(timeout)
+        with self._start_lock:
+            self._thread = None
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue depth, call counts and latency for this executor."""
+        with self._stats_lock:
+            stats = dict(self._stats)
+            latencies = sorted(self._latencies)
+            waits = list(self._waits)
+        stats.update({
+            "name": self.name,
+            "connected": self._app is not None,
+            "queue_depth": self._queue.qsize(),
+            "avg_latency_ms": round(sum(latencies) / len(latencies) * 1000, 2) if latencies else 0.0,
+            "p95_latency_ms": round(latencies[int(len(latencies) * 0.95)] * 1000, 2) if latencies else 0.0,
+            "avg_wait_ms": round(sum(waits) / len(waits) * 1000, 2) if waits else 0.0,
+        })
+        return stats
+
+
+# =============================================================================
+# Shared executors
+# =============================================================================
+
+def _connect_active(prog_id: str) -> Callable[[], Any]:
+    def connect():
+        if not COM_AVAILABLE:
+            raise ComUnavailableError("COM not available")
+        try:
+            return win32com.client.GetActiveObject(prog_id)
+        except Exception as e:
+            raise ComConnectionError(str(e)) from e
+    return connect
+
+
+def _connect_dispatch(prog_id: str) -> Callable[[], Any]:
+    def connect():
+        if not COM_AVAILABLE:
+            raise ComUnavailableError("COM not available")
+        try:
+            return win32com.client.Dispatch(prog_id)
+        except Exception as e:
+            raise ComConnectionError(str(e)) from e
+    return connect
+
+
+_CONNECTORS = {
+    "solidworks": _connect_active(PROG_IDS["solidworks"]),  # attach, never launch
+    "inventor": _connect_dispatch(PROG_IDS["inventor"]),
+}
+
+_executors: Dict[str, ComExecutor] = {}
+_executors_lock = threading.Lock()
+
+
+def get_com_executor(app_name: str = "solidworks") -> ComExecutor:
+    """Get or create the executor for a CAD application."""
+    executor = _executors.get(app_name)
+    if executor is None:
+        with _executors_lock:
+            executor = _executors.get(app_name)
+            if executor is None:
+                if app_name not in _CONNECTORS:
+                    raise ValueError(f"Unknown COM application: {app_name}")
+                executor = ComExecutor(app_name, _CONNECTORS[app_name])
+                _executors[app_name] = executor
+    return executor
+
+
+def set_com_executor(app_name: str, executor: ComExecutor) -> Optional[ComExecutor]:
+    """Install an executor (e.g. one backed by a fake application); returns the old one."""
+    with _executors_lock:
+        previous = _executors.get(app_name)
+        _executors[app_name] = executor
+    return previous
+
+
+def get_com_stats() -> Dict[str, Dict[str, Any]]:
+    """Get stats for every executor that has been created."""
+    return {name: executor.get_stats() for name, executor in list(_executors.items())}
+
+
+def com_route(app_name: str = "solidworks"):
+    """Decorator running an async COM route handler on the application's STA thread."""
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(*args, **kwargs):
+            return await get_com_executor(app_name).run_handler(handler, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def _session(app_name: str, label: str) -> Any:
+    try:
+        return get_com_executor(app_name).app
+    except ComUnavailableError:
+        raise HTTPException(status_code=501, detail="COM not available")
+    except ComConnectionError as e:
+        raise HTTPException(status_code=500, detail=f"{label} not running: {e}")
+
+
+def get_solidworks():
+    """Get the SolidWorks session owned by the COM executor thread."""
+    return _session("solidworks", "SolidWorks")
+
+
+def get_inventor():
+    """Get the Inventor session owned by the COM executor thread."""
+    return _session("inventor", "Inventor")
@@ -0,0 +1,262 @@
+"""
+Component Walker
+================
+Single-pass traversal of a SolidWorks assembly tree.
+
+Every COM property read is a cross-process round-trip, so the walker:
+- visits each component once, reading only its name, path and children
+- groups instances by referenced document, so a bolt used 400 times is
+  opened and read once
+- fetches each document's data in one pass through a caller-supplied
+  function
+- caches fetched data by document path and file modification time, so an
+  unchanged part is not re-read on the next analysis run
+
+Usage:
+    walker = ComponentWalker(fetch_document, cache=DocumentCache(cache_file))
+    result = walker.walk(root_component)
+    for doc in result.documents:
+        print(doc.part_number, len(doc.instances), doc.data["properties"])
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_INSTANCE_SUFFIX = re.compile(r"[-_]\d+$")
+
+
+def com_value(obj: Any, name: str, default: Any = None) -> Any:
+    """Read a late-bound COM member that may be exposed as a property or a method."""
+    try:
+        value = getattr(obj, name, None)
+        if value is None:
+            return default
+        return value() if callable(value) else value
+    except Exception:
+        return default
+
+
+def component_name(comp: Any) -> Optional[str]:
+    """Get a component's display name, trying the APIs SolidWorks versions expose."""
+    for attr in ("Name2", "Name", "GetName"):
+        name = com_value(comp, attr)
+        if name:
+            return str(name)
+    return None
+
+
+def part_number_for(name: str, path: str) -> str:
+    """Part number for a document: its file stem, else the instance name without suffixes."""
+    if path:
+        return Path(path.replace("\\", "/")).stem
+    name = name.split("<")[0].rsplit("/", 1)[-1]
+    return _INSTANCE_SUFFIX.sub("", name)
+
+
+@dataclass
+class ComponentInstance:
+    """One occurrence of a document in the assembly tree."""
+    name: str
+    path: str
+    depth: int
+    component: Any = field(repr=False, compare=False)
+
+
+@dataclass
+class WalkedDocument:
+    """A referenced document with all of its instances and fetched data."""
+    key: str
+    path: str
+    part_number: str
+    instances: List[ComponentInstance]
+    data: Dict[str, Any]
+    from_cache: bool = False
+
+
+@dataclass
+class WalkResult:
+    """Documents found by a walk, in first-seen order."""
+    documents: List[WalkedDocument]
+    component_count: int
+    cache_hits: int
+    fetched: int
+    elapsed_ms: float
+
+    def get_stats(self) -> Dict[str, Any]:
+        return {
+            "components": self.component_count,
+            "documents": len(self.documents),
+            "cache_hits": self.cache_hits,
+            "fetched": self.fetched,
+            "elapsed_ms": round(self.elapsed_ms, 1),
+        }
+
+
+class DocumentCache:
+    """
+    Per-document data keyed by path, valid while the file's mtime is unchanged.
+
+    Bounded LRU; optionally persisted to a JSON file so results survive
+    server restarts.
+    """
+
+    def __init__(self, cache_file: Optional[Path] = None, max_entries: int = 20000):
+        """
+        Args:
+            cache_file: JSON file to load from and save to (None = memory only)
+            max_entries: Max documents kept
+        """
+        self.cache_file = Path(cache_file) if cache_file else None
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._load()
+
+    def _load(self):
+        if not self.cache_file or not self.cache_file.exists():
+            return
+        try:
+            with open(self.cache_file) as f:
+                for path, (mtime, data) in json.load(f).items():
+                    self._entries[path] = (mtime, data)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable component cache {self.cache_file}: {e}")
+            self._entries.clear()
+
+    def get(self, path: str, mtime: float) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[0] != mtime:
+                return None
+            self._entries.move_to_end(path)
+            return entry[1]
+
+    def put(self, path: str, mtime: float, data: Dict[str, Any]):
+        with self._lock:
+            self._entries[path] = (mtime, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._dirty = True
+
+    def save(self):
+        """Write the cache file if anything changed."""
+        if not self.cache_file or not self._dirty:
+            return
+        with self._lock:
+            snapshot = dict(self._entries)
+            self._dirty = False
+        try:
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(tmp_file, self.cache_file)
+        except Exception as e:
+            logger.warning(f"Could not save component cache: {e}")
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.path.getmtime(path) if path else None
+    except OSError:
+        return None
+
+
+class ComponentWalker:
+    """Walks a component tree once and fetches each referenced document once."""
+
+    def __init__(
+        self,
+        fetch_document: Callable[[Any], Dict[str, Any]],
+        cache: Optional[DocumentCache] = None,
+        mtime: Callable[[str], Optional[float]] = _file_mtime,
+    ):
+        """
+        Args:
+            fetch_document: Reads everything needed from a ModelDoc2 in one pass
+            cache: Cross-run cache of fetched data (None = no caching)
+            mtime: Returns a document's modification time, or None if unknown
+        """
+        self.fetch_document = fetch_document
+        self.cache = cache
+        self.mtime = mtime
+
+    def walk(self, root_component: Any, max_depth: Optional[int] = None) -> WalkResult:
+        """
+        Traverse the tree under root_component.
+
+        Args:
+            root_component: Root Component2 of the active configuration
+            max_depth: Levels below the root to visit (None = full tree)
+        """
+        started = time.perf_counter()
+        documents: "OrderedDict[str, WalkedDocument]" = OrderedDict()
+        component_count = 0
+
+        stack = [(child, 1) for child in reversed(self._children(root_component))]
+        while stack:
+            comp, depth = stack.pop()
+            name = component_name(comp)
+            if not name:
+                continue
+            component_count += 1
+            path = str(com_value(comp, "GetPathName", "") or "")
+            key = path.lower() or part_number_for(name, "")
+
+            doc = documents.get(key)
+            if doc is None:
+                doc = WalkedDocument(key, path, part_number_for(name, path), [], {})
+                documents[key] = doc
+            doc.instances.append(ComponentInstance(name, path, depth, comp))
+
+            if max_depth is None or depth < max_depth:
+                stack.extend((child, depth + 1) for child in reversed(self._children(comp)))
+
+        cache_hits = fetched = 0
+        for doc in documents.values():
+            mtime = self.mtime(doc.path) if self.cache is not None else None
+            if mtime is not None:
+                cached = self.cache.get(doc.key, mtime)
+                if cached is not None:
+                    doc.data, doc.from_cache = cached, True
+                    cache_hits += 1
+                    continue
+
+            ref_model = com_value(doc.instances[0].component, "GetModelDoc2")
+            if ref_model is None:
+                continue  # suppressed or lightweight; nothing to read
+            doc.data = self.fetch_document(ref_model)
+            fetched += 1
+            if mtime is not None:
+                self.cache.put(doc.key, mtime, doc.data)
+
+        if self.cache is not None:
+            self.cache.save()
+
+        return WalkResult(
+            documents=list(documents.values()),
+            component_count=component_count,
+            cache_hits=cache_hits,
+            fetched=fetched,
+            elapsed_ms=(time.perf_counter() - started) * 1000,
+        )
+
+    @staticmethod
+    def _children(comp: Any) -> List[Any]:
+        if comp is None:
+            return []
+        return list(com_value(comp, "GetChildren", None) or [])
@@ -1,7 +1,10 @@
-import win32com.client
 import logging
 from typing import Optional, Dict, Any
-import pythoncom
+
+try:
+    import win32com.client
+except ImportError:  # The sinks are plain classes; only EventManager needs COM
+    win32com = None
 
 logger = logging.getLogger("com.events")
 
@@ -9,7 +12,26 @@ logger = logging.getLogger("com.events")
 _event_listener = None
 
 
-class SolidWorksAppEvents:
+class _NotifyingSink:
+    """
+    Base for sinks that forward to a notify(event, path=None) callable.
+
+    WithEvents constructs the sink itself, so the owner assigns ``notify``
+    on the returned object (see watchers.state_hub).
+    """
+
+    notify = None
+
+    def _forward(self, event: str, path: Optional[str] = None) -> int:
+        if self.notify:
+            try:
+                self.notify(event, path)
+            except Exception as e:
+                logger.error(f"Event handler failed for {event}: {e}")
+        return 0
+
+
+class SolidWorksAppEvents(_NotifyingSink):
     """Events for the main SolidWorks Application."""
 
     def __init__(self):
@@ -17,14 +39,25 @@ class SolidWorksAppEvents:
 
     def OnActiveModelDocChangeNotify(self) -> int:
         """Fired when the active document changes."""
-        logger.info("Active document changed - re-hooking document events")
-        # In a real implementation, we would re-attach document-level listeners here
-        return 0
+        logger.info("Active document changed")
+        return self._forward("activated")
 
     def OnFileOpenNotify(self, filename: str) -> int:
+        # The document is not loaded yet; subscribers hear about it from the post-notify
         logger.info(f"File opened: {filename}")
         return 0
 
+    def OnFileOpenPostNotify(self, filename: str) -> int:
+        return self._forward("opened", filename)
+
+    def OnFileCloseNotify(self, filename: str, reason: int) -> int:
+        return self._forward("closed", filename)
+
+    def OnDestroyNotify(self) -> int:
+        """Fired when SolidWorks is shutting down."""
+        logger.info("SolidWorks is exiting")
+        return self._forward("exited")
+
     def OnUserSelectionPreNotify(self, sel_type, item) -> int:
         # Note: This often fires *before* the item is fully selected in the tree
         # logger.info(f"Pre-selection: Type={sel_type}")
@@ -59,6 +92,16 @@ class AssemblyDocEvents:
         return 0
 
 
+class DocumentEvents(_NotifyingSink):
+    """Save and close events for the active document (part, assembly or drawing)."""
+
+    def OnFileSavePostNotify(self, save_type: int, filename: str) -> int:
+        return self._forward("saved", filename)
+
+    def OnDestroyNotify2(self, destroy_type: int) -> int:
+        return self._forward("closed")
+
+
 class EventManager:
     """Manages COM event listeners."""
 
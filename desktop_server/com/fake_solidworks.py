@@ -0,0 +1,264 @@
+"""
+Fake SolidWorks COM Objects
+===========================
+Minimal stand-ins for SldWorks.Application, ModelDoc2 and Component2 so
+COM code paths can be exercised and benchmarked without Windows.
+
+Every member read counts as one COM round-trip in ``FakeSolidWorks.calls``,
+and an optional per-call latency simulates the cross-process cost.
+
+Usage:
+    app = build_fake_assembly(components=5000, unique_parts=500)
+    executor = ComExecutor("solidworks", lambda: app)
+"""
+
+import time
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+class _CallMeter:
+    def __init__(self, latency_s: float = 0.0):
+        self.latency_s = latency_s
+        self.calls: Counter = Counter()
+
+    def tick(self, member: str):
+        self.calls[member] += 1
+        if self.latency_s:
+            time.sleep(self.latency_s)
+
+    @property
+    def total(self) -> int:
+        return sum(self.calls.values())
+
+
+class FakeFeature:
+    def __init__(self, meter, name, type_name, next_feature=None):
+        self._meter = meter
+        self._name = name
+        self._type = type_name
+        self._next = next_feature
+
+    @property
+    def Name(self):
+        self._meter.tick("Feature.Name")
+        return self._name
+
+    def GetTypeName2(self):
+        self._meter.tick("Feature.GetTypeName2")
+        return self._type
+
+    def GetNextFeature(self):
+        self._meter.tick("Feature.GetNextFeature")
+        return self._next
+
+    def GetDefinition(self):
+        self._meter.tick("Feature.GetDefinition")
+        return None
+
+
+class FakeCustomPropertyManager:
+    def __init__(self, meter, properties: Dict[str, str]):
+        self._meter = meter
+        self._properties = properties
+
+    def GetNames(self):
+        self._meter.tick("CustomPropertyManager.GetNames")
+        return list(self._properties)
+
+    def Get3(self, name, use_cached):
+        self._meter.tick("CustomPropertyManager.Get3")
+        value = self._properties[name]
+        return (value, value)
+
+    def GetAll3(self):
+        self._meter.tick("CustomPropertyManager.GetAll3")
+        names = list(self._properties)
+        values = [self._properties[n] for n in names]
+        return (len(names), names, [30] * len(names), values, values, [False] * len(names))
+
+
+class FakeExtension:
+    def __init__(self, model):
+        self._model = model
+
+    def CustomPropertyManager(self, config):
+        self._model._meter.tick("Extension.CustomPropertyManager")
+        return FakeCustomPropertyManager(self._model._meter, self._model.properties)
+
+    def GetMassProperties2(self, options, status):
+        self._model._meter.tick("Extension.GetMassProperties2")
+        return (self._model.mass, self._model.mass / 7850, 0.5, 0.0, 0.0, 0.0)
+
+
+class FakeModelDoc:
+    """A part or assembly document (ModelDoc2)."""
+
+    def __init__(self, meter, path, properties=None, mass=1.0, material="AISI 1020",
+                 features=None, doc_type=1):
+        self._meter = meter
+        self.path = path
+        self.properties = dict(properties or {})
+        self.mass = mass
+        self.material = material
+        self.doc_type = doc_type
+        self.root_component = None
+        self._first_feature = None
+        for name, type_name in reversed(features or []):
+            self._first_feature = FakeFeature(meter, name, type_name, self._first_feature)
+
+    @property
+    def Extension(self):
+        self._meter.tick("ModelDoc2.Extension")
+        return FakeExtension(self)
+
+    def GetPathName(self):
+        self._meter.tick("ModelDoc2.GetPathName")
+        return self.path
+
+    def GetTitle(self):
+        self._meter.tick("ModelDoc2.GetTitle")
+        return self.path.replace("\\", "/").rsplit("/", 1)[-1]
+
+    def GetType(self):
+        self._meter.tick("ModelDoc2.GetType")
+        return self.doc_type
+
+    def GetPartBox(self):
+        self._meter.tick("ModelDoc2.GetPartBox")
+        return (0.0, 0.0, 0.0, 0.2, 0.1, 0.01)
+
+    @property
+    def MaterialIdName(self):
+        self._meter.tick("ModelDoc2.MaterialIdName")
+        return self.material
+
+    @property
+    def FirstFeature(self):
+        self._meter.tick("ModelDoc2.FirstFeature")
+        return self._first_feature
+
+    @property
+    def ConfigurationManager(self):
+        self._meter.tick("ModelDoc2.ConfigurationManager")
+        return _FakeConfigurationManager(self)
+
+
+class _FakeConfigurationManager:
+    def __init__(self, model):
+        self.ActiveConfiguration = self
+        self._model = model
+
+    def GetRootComponent3(self, resolve):
+        self._model._meter.tick("Configuration.GetRootComponent3")
+        return self._model.root_component
+
+
+class FakeComponent:
+    """A component instance (Component2)."""
+
+    def __init__(self, meter, name, model: Optional[FakeModelDoc], children=None, mates=0):
+        self._meter = meter
+        self._name = name
+        self._model = model
+        self.children: List["FakeComponent"] = list(children or [])
+        self._mates = [type("Mate", (), {"Type": 0, "Name": f"Coincident{i}"})() for i in range(mates)]
+
+    @property
+    def Name2(self):
+        self._meter.tick("Component2.Name2")
+        return self._name
+
+    def GetPathName(self):
+        self._meter.tick("Component2.GetPathName")
+        return self._model.path if self._model else ""
+
+    def GetChildren(self):
+        self._meter.tick("Component2.GetChildren")
+        return self.children
+
+    def GetModelDoc2(self):
+        self._meter.tick("Component2.GetModelDoc2")
+        return self._model
+
+    def GetMates(self):
+        self._meter.tick("Component2.GetMates")
+        return self._mates
+
+
+class FakeSolidWorks:
+    """Stands in for SldWorks.Application."""
+
+    def __init__(self, active_doc: Optional[FakeModelDoc] = None, latency_s: float = 0.0,
+                 meter: Optional[_CallMeter] = None):
+        self._meter = meter or _CallMeter(latency_s)
+        self.ActiveDoc = active_doc
+        self.Visible = True
+
+    @property
+    def calls(self) -> Counter:
+        return self._meter.calls
+
+    @property
+    def call_count(self) -> int:
+        return self._meter.total
+
+    def reset_calls(self):
+        self._meter.calls.clear()
+
+
+PART_FEATURES = [
+    ("Sketch1", "ProfileFeature"),
+    ("Boss-Extrude1", "Extrusion"),
+    ("Cut-Extrude1", "Cut-Extrude"),
+    ("Hole1", "HoleWzd"),
+    ("Fillet1", "Fillet"),
+]
+
+PART_NAMES = ["FRAME-RAIL", "SIDE-PANEL", "LIFT-LUG", "HEX-BOLT", "AIR-SEAL",
+              "MOTOR-BRACKET", "FAN-RING", "TUBE-SUPPORT", "PLENUM-DUCT", "GUSSET"]
+
+
+def build_fake_assembly(
+    components: int = 5000,
+    unique_parts: int = 500,
+    subassemblies: int = 50,
+    properties_per_part: int = 8,
+    latency_s: float = 0.0,
+) -> FakeSolidWorks:
+    """
+    Build an application whose active document is a two-level assembly.
+
+    The top level holds `subassemblies` sub-assemblies; together they contain
+    `components` part instances that reference `unique_parts` documents.
+    """
+    meter = _CallMeter(latency_s)
+    parts = []
+    for i in range(unique_parts):
+        stem = f"{PART_NAMES[i % len(PART_NAMES)]}-{i:04d}"
+        parts.append(FakeModelDoc(
+            meter, f"C:\\Vault\\Parts\\{stem}.SLDPRT",
+            properties={f"Prop{k}": f"value {i}.{k}" for k in range(properties_per_part - 2)}
+            | {"Description": stem.replace("-", " ").title(), "Material": "Steel"},
+            mass=0.05 + (i % 40) * 0.5,
+            features=PART_FEATURES,
+        ))
+
+    per_sub = max(1, components // subassemblies)
+    subs = []
+    made = 0
+    for s in range(subassemblies):
+        sub_doc = FakeModelDoc(meter, f"C:\\Vault\\Assemblies\\SUB-{s:03d}.SLDASM", doc_type=2)
+        children = []
+        count = per_sub if s < subassemblies - 1 else components - made
+        for _ in range(count):
+            part = parts[made % unique_parts]
+            children.append(FakeComponent(meter, f"{part.GetTitle()[:-7]}-{made + 1}", part, mates=3))
+            made += 1
+        subs.append(FakeComponent(meter, f"SUB-{s:03d}-1", sub_doc, children, mates=2))
+
+    top = FakeModelDoc(meter, "C:\\Vault\\TOP-ASSEMBLY.SLDASM", doc_type=2)
+    top.root_component = FakeComponent(meter, "TOP-ASSEMBLY", top, subs)
+    app = FakeSolidWorks(top, meter=meter)
+    app.reset_calls()
+    return app
@@ -22,12 +22,7 @@ import copy
 import json
 import os
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+from .com_executor import com_route, get_solidworks
 
 router = APIRouter(prefix="/com/solidworks/batch", tags=["solidworks", "batch"])
 logger = logging.getLogger(__name__)
@@ -152,17 +147,6 @@ class CreateAssemblyRequest(BaseModel):
 # Helper Functions
 # =============================================================================
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def evaluate_condition(condition: str, variables: Dict[str, Any]) -> bool:
     """Safely evaluate a condition string."""
     try:
@@ -623,6 +607,7 @@ async def execute_operation(sw, model, operation: str, params: Dict[str, Any], v
 # =============================================================================
 
 @router.post("/execute")
+@com_route()
 async def execute_batch_operations(req: BatchOperationsRequest):
     """
     Execute multiple operations with deferred rebuild - MACRO SPEED.
@@ -653,8 +638,7 @@ async def execute_batch_operations(req: BatchOperationsRequest):
     global _batch_mode_active, _variables
 
     try:
-        pythoncom.CoInitialize()
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
+        sw = get_solidworks()
         model = sw.ActiveDoc
 
         if not model:
@@ -746,14 +730,10 @@ async def execute_batch_operations(req: BatchOperationsRequest):
         _batch_mode_active = False
         logger.error(f"Batch operations failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
 
 
 @router.post("/workflow")
+@com_route()
 async def execute_workflow(req: WorkflowRequest):
     """
     Execute a complete workflow with conditionals, loops, and variables.
@@ -789,8 +769,7 @@ async def execute_workflow(req: WorkflowRequest):
     global _variables
 
     try:
-        pythoncom.CoInitialize()
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
+        sw = get_solidworks()
         model = sw.ActiveDoc
 
         if not model:
@@ -837,11 +816,6 @@ async def execute_workflow(req: WorkflowRequest):
     except Exception as e:
         logger.error(f"Workflow failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
 
 
 async def execute_workflow_step(sw, model, step: WorkflowStep, variables: Dict) -> Dict:
@@ -1155,11 +1129,11 @@ async def create_hole_pattern(
 # =============================================================================
 
 @router.post("/properties")
+@com_route()
 async def batch_update_properties(req: BatchPropertiesRequest):
     """Update multiple custom properties in one call."""
     try:
-        pythoncom.CoInitialize()
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
+        sw = get_solidworks()
         model = sw.ActiveDoc
 
         if not model:
@@ -1190,19 +1164,14 @@ async def batch_update_properties(req: BatchPropertiesRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
 
 
 @router.post("/dimensions")
+@com_route()
 async def batch_update_dimensions(req: BatchDimensionsRequest):
     """Update multiple dimensions in one call."""
     try:
-        pythoncom.CoInitialize()
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
+        sw = get_solidworks()
         model = sw.ActiveDoc
 
         if not model:
@@ -1234,11 +1203,6 @@ async def batch_update_dimensions(req: BatchDimensionsRequest):
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        try:
-            pythoncom.CoUninitialize()
-        except:
-            pass
 
 
 @router.get("/status")
@@ -13,14 +13,9 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models
@@ -54,22 +49,12 @@ class RenameBodyRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-bodies", tags=["solidworks-bodies"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Body Management
 # =============================================================================
 
 @router.get("/list")
+@com_route()
 async def list_bodies():
     """
     List all bodies in the active part.
@@ -122,11 +107,10 @@ async def list_bodies():
     except Exception as e:
         logger.error(f"List bodies failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/body/{body_name}")
+@com_route()
 async def get_body_info(body_name: str):
     """
     Get detailed information about a specific body.
@@ -162,11 +146,10 @@ async def get_body_info(body_name: str):
     except Exception as e:
         logger.error(f"Get body info failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/rename")
+@com_route()
 async def rename_body(request: RenameBodyRequest):
     """
     Rename a body.
@@ -194,11 +177,10 @@ async def rename_body(request: RenameBodyRequest):
     except Exception as e:
         logger.error(f"Rename body failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/hide/{body_name}")
+@com_route()
 async def hide_body(body_name: str):
     """
     Hide a body.
@@ -218,11 +200,10 @@ async def hide_body(body_name: str):
     except Exception as e:
         logger.error(f"Hide body failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/show/{body_name}")
+@com_route()
 async def show_body(body_name: str):
     """
     Show a hidden body.
@@ -242,8 +223,6 @@ async def show_body(body_name: str):
     except Exception as e:
         logger.error(f"Show body failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -251,6 +230,7 @@ async def show_body(body_name: str):
 # =============================================================================
 
 @router.post("/combine")
+@com_route()
 async def combine_bodies(request: CombineBodiesRequest):
     """
     Combine multiple bodies using boolean operations.
@@ -292,11 +272,10 @@ async def combine_bodies(request: CombineBodiesRequest):
     except Exception as e:
         logger.error(f"Combine bodies failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/move")
+@com_route()
 async def move_body(request: MoveBodyRequest):
     """
     Move/copy a body by translation and/or rotation.
@@ -338,11 +317,10 @@ async def move_body(request: MoveBodyRequest):
     except Exception as e:
         logger.error(f"Move body failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/delete/{body_name}")
+@com_route()
 async def delete_body(body_name: str):
     """
     Delete a body from the part.
@@ -370,8 +348,6 @@ async def delete_body(body_name: str):
     except Exception as e:
         logger.error(f"Delete body failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -379,6 +355,7 @@ async def delete_body(body_name: str):
 # =============================================================================
 
 @router.get("/cut-list")
+@com_route()
 async def get_cut_list():
     """
     Get weldment cut list items.
@@ -432,11 +409,10 @@ async def get_cut_list():
     except Exception as e:
         logger.error(f"Get cut list failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/cut-list/update")
+@com_route()
 async def update_cut_list():
     """
     Force update of the cut list.
@@ -461,11 +437,10 @@ async def update_cut_list():
     except Exception as e:
         logger.error(f"Update cut list failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/cut-list/export")
+@com_route()
 async def export_cut_list(output_path: str):
     """
     Export cut list to Excel file.
@@ -494,8 +469,6 @@ async def export_cut_list(output_path: str):
     except Exception as e:
         logger.error(f"Export cut list failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -503,6 +476,7 @@ async def export_cut_list(output_path: str):
 # =============================================================================
 
 @router.get("/folders")
+@com_route()
 async def list_body_folders():
     """
     List all body folders in the feature tree.
@@ -535,8 +509,6 @@ async def list_body_folders():
     except Exception as e:
         logger.error(f"List folders failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -14,15 +14,9 @@ from dataclasses import dataclass, field
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class ConstraintType(IntEnum):
@@ -121,19 +115,6 @@ class DeleteConstraintRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-constraints", tags=["solidworks-constraints"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def get_active_sketch(sw):
     """Get currently active sketch."""
     doc = sw.ActiveDoc
@@ -152,6 +133,7 @@ def get_active_sketch(sw):
 # =============================================================================
 
 @router.post("/constraint/horizontal")
+@com_route()
 async def add_horizontal_constraint(request: AddConstraintRequest):
     """
     Add horizontal constraint to selected line(s).
@@ -183,11 +165,10 @@ async def add_horizontal_constraint(request: AddConstraintRequest):
     except Exception as e:
         logger.error(f"Horizontal constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/vertical")
+@com_route()
 async def add_vertical_constraint(request: AddConstraintRequest):
     """
     Add vertical constraint to selected line(s).
@@ -210,11 +191,10 @@ async def add_vertical_constraint(request: AddConstraintRequest):
     except Exception as e:
         logger.error(f"Vertical constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/parallel")
+@com_route()
 async def add_parallel_constraint():
     """
     Add parallel constraint between two selected lines.
@@ -241,11 +221,10 @@ async def add_parallel_constraint():
     except Exception as e:
         logger.error(f"Parallel constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/perpendicular")
+@com_route()
 async def add_perpendicular_constraint():
     """
     Add perpendicular constraint between two selected lines.
@@ -272,11 +251,10 @@ async def add_perpendicular_constraint():
     except Exception as e:
         logger.error(f"Perpendicular constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/tangent")
+@com_route()
 async def add_tangent_constraint(request: TangentConstraintRequest):
     """
     Add tangent constraint between two curves.
@@ -299,11 +277,10 @@ async def add_tangent_constraint(request: TangentConstraintRequest):
     except Exception as e:
         logger.error(f"Tangent constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/collinear")
+@com_route()
 async def add_collinear_constraint():
     """
     Add collinear constraint between two or more lines.
@@ -326,11 +303,10 @@ async def add_collinear_constraint():
     except Exception as e:
         logger.error(f"Collinear constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/concentric")
+@com_route()
 async def add_concentric_constraint():
     """
     Add concentric constraint between circles/arcs.
@@ -353,8 +329,6 @@ async def add_concentric_constraint():
     except Exception as e:
         logger.error(f"Concentric constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -362,6 +336,7 @@ async def add_concentric_constraint():
 # =============================================================================
 
 @router.post("/constraint/fix")
+@com_route()
 async def add_fix_constraint(request: FixEntityRequest):
     """
     Fix an entity in place (lock position).
@@ -391,11 +366,10 @@ async def add_fix_constraint(request: FixEntityRequest):
     except Exception as e:
         logger.error(f"Fix constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/equal")
+@com_route()
 async def add_equal_constraint(request: EqualConstraintRequest):
     """
     Add equal constraint between entities.
@@ -431,11 +405,10 @@ async def add_equal_constraint(request: EqualConstraintRequest):
     except Exception as e:
         logger.error(f"Equal constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/symmetric")
+@com_route()
 async def add_symmetric_constraint(request: SymmetricConstraintRequest):
     """
     Add symmetric constraint about a centerline.
@@ -467,11 +440,10 @@ async def add_symmetric_constraint(request: SymmetricConstraintRequest):
     except Exception as e:
         logger.error(f"Symmetric constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/coincident")
+@com_route()
 async def add_coincident_constraint(request: CoincidentConstraintRequest):
     """
     Add coincident constraint between point and entity.
@@ -498,11 +470,10 @@ async def add_coincident_constraint(request: CoincidentConstraintRequest):
     except Exception as e:
         logger.error(f"Coincident constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/midpoint")
+@com_route()
 async def add_midpoint_constraint():
     """
     Add midpoint constraint.
@@ -525,8 +496,6 @@ async def add_midpoint_constraint():
     except Exception as e:
         logger.error(f"Midpoint constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -534,6 +503,7 @@ async def add_midpoint_constraint():
 # =============================================================================
 
 @router.post("/dimension/add")
+@com_route()
 async def add_dimension(request: AddDimensionRequest):
     """
     Add a driving dimension to selected entities.
@@ -578,11 +548,10 @@ async def add_dimension(request: AddDimensionRequest):
     except Exception as e:
         logger.error(f"Add dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/driven")
+@com_route()
 async def make_dimension_driven():
     """
     Convert selected dimension from driving to driven (reference).
@@ -613,8 +582,6 @@ async def make_dimension_driven():
     except Exception as e:
         logger.error(f"Make driven failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -622,6 +589,7 @@ async def make_dimension_driven():
 # =============================================================================
 
 @router.get("/status")
+@com_route()
 async def get_sketch_status():
     """
     Get overall constraint status of active sketch.
@@ -664,11 +632,10 @@ async def get_sketch_status():
     except Exception as e:
         logger.error(f"Get status failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/constraints")
+@com_route()
 async def list_constraints():
     """
     List all constraints in active sketch.
@@ -708,11 +675,10 @@ async def list_constraints():
     except Exception as e:
         logger.error(f"List constraints failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/constraint/{index}")
+@com_route()
 async def delete_constraint(index: int):
     """
     Delete a constraint by index.
@@ -738,11 +704,10 @@ async def delete_constraint(index: int):
     except Exception as e:
         logger.error(f"Delete constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/auto-constrain")
+@com_route()
 async def auto_add_constraints():
     """
     Automatically add constraints to fully define sketch.
@@ -777,11 +742,10 @@ async def auto_add_constraints():
     except Exception as e:
         logger.error(f"Auto-constrain failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/construction-geometry")
+@com_route()
 async def toggle_construction_geometry():
     """
     Toggle selected entities as construction geometry.
@@ -803,8 +767,6 @@ async def toggle_construction_geometry():
     except Exception as e:
         logger.error(f"Toggle construction failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -812,6 +774,7 @@ async def toggle_construction_geometry():
 # =============================================================================
 
 @router.post("/constraint/pierce")
+@com_route()
 async def add_pierce_constraint():
     """
     Add pierce constraint.
@@ -834,11 +797,10 @@ async def add_pierce_constraint():
     except Exception as e:
         logger.error(f"Pierce constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/coradial")
+@com_route()
 async def add_coradial_constraint():
     """
     Add coradial constraint between arcs/circles.
@@ -861,11 +823,10 @@ async def add_coradial_constraint():
     except Exception as e:
         logger.error(f"Coradial constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/merge")
+@com_route()
 async def add_merge_constraint():
     """
     Merge two points into one.
@@ -888,8 +849,6 @@ async def add_merge_constraint():
     except Exception as e:
         logger.error(f"Merge constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
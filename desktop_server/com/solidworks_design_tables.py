@@ -19,14 +19,9 @@ from typing import Optional, Dict, Any, List, Union
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models
@@ -125,22 +120,12 @@ class SortConfigurationsRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-design-tables", tags=["solidworks-design-tables"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Design Table Management
 # =============================================================================
 
 @router.post("/create")
+@com_route()
 async def create_design_table(request: CreateDesignTableRequest):
     """
     Create a design table.
@@ -190,11 +175,10 @@ async def create_design_table(request: CreateDesignTableRequest):
     except Exception as e:
         logger.error(f"Create design table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/info")
+@com_route()
 async def get_design_table_info():
     """
     Get information about the design table.
@@ -242,11 +226,10 @@ async def get_design_table_info():
     except Exception as e:
         logger.error(f"Get design table info failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/data")
+@com_route()
 async def get_design_table_data():
     """
     Get all data from the design table.
@@ -290,11 +273,10 @@ async def get_design_table_data():
     except Exception as e:
         logger.error(f"Get design table data failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/add-configuration")
+@com_route()
 async def add_configuration_to_table(request: AddConfigurationRequest):
     """
     Add a new configuration (row) to the design table.
@@ -339,11 +321,10 @@ async def add_configuration_to_table(request: AddConfigurationRequest):
     except Exception as e:
         logger.error(f"Add configuration failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.put("/cell")
+@com_route()
 async def update_cell(request: UpdateCellRequest):
     """
     Update a specific cell in the design table.
@@ -377,8 +358,6 @@ async def update_cell(request: UpdateCellRequest):
     except Exception as e:
         logger.error(f"Update cell failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -386,6 +365,7 @@ async def update_cell(request: UpdateCellRequest):
 # =============================================================================
 
 @router.post("/edit")
+@com_route()
 async def edit_design_table():
     """
     Open design table for editing (in Excel).
@@ -412,11 +392,10 @@ async def edit_design_table():
     except Exception as e:
         logger.error(f"Edit design table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/update")
+@com_route()
 async def update_design_table():
     """
     Update design table and regenerate configurations.
@@ -443,11 +422,10 @@ async def update_design_table():
     except Exception as e:
         logger.error(f"Update design table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/delete")
+@com_route()
 async def delete_design_table():
     """
     Delete the design table from the document.
@@ -469,11 +447,10 @@ async def delete_design_table():
     except Exception as e:
         logger.error(f"Delete design table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/export")
+@com_route()
 async def export_design_table(output_path: str):
     """
     Export design table to Excel file.
@@ -500,8 +477,6 @@ async def export_design_table(output_path: str):
     except Exception as e:
         logger.error(f"Export design table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -509,6 +484,7 @@ async def export_design_table(output_path: str):
 # =============================================================================
 
 @router.get("/available-parameters")
+@com_route()
 async def list_available_parameters():
     """
     List all dimensions and features that can be added to design table.
@@ -551,8 +527,6 @@ async def list_available_parameters():
     except Exception as e:
         logger.error(f"List parameters failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -560,6 +534,7 @@ async def list_available_parameters():
 # =============================================================================
 
 @router.post("/add-column")
+@com_route()
 async def add_column(request: AddColumnRequest):
     """
     Add a new column (parameter) to the design table.
@@ -605,11 +580,10 @@ async def add_column(request: AddColumnRequest):
     except Exception as e:
         logger.error(f"Add column failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/column")
+@com_route()
 async def delete_column(request: DeleteColumnRequest):
     """Delete a column from the design table."""
     try:
@@ -640,8 +614,6 @@ async def delete_column(request: DeleteColumnRequest):
     except Exception as e:
         logger.error(f"Delete column failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -649,6 +621,7 @@ async def delete_column(request: DeleteColumnRequest):
 # =============================================================================
 
 @router.delete("/row")
+@com_route()
 async def delete_row(request: DeleteRowRequest):
     """Delete a row (configuration) from the design table."""
     try:
@@ -679,11 +652,10 @@ async def delete_row(request: DeleteRowRequest):
     except Exception as e:
         logger.error(f"Delete row failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/rename-configuration")
+@com_route()
 async def rename_configuration(request: RenameConfigurationRequest):
     """Rename a configuration in the design table."""
     try:
@@ -723,11 +695,10 @@ async def rename_configuration(request: RenameConfigurationRequest):
     except Exception as e:
         logger.error(f"Rename configuration failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/duplicate-configuration")
+@com_route()
 async def duplicate_configuration(request: DuplicateConfigurationRequest):
     """Duplicate a configuration with a new name."""
     try:
@@ -779,11 +750,10 @@ async def duplicate_configuration(request: DuplicateConfigurationRequest):
     except Exception as e:
         logger.error(f"Duplicate configuration failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/batch-create")
+@com_route()
 async def batch_create_configurations(request: BatchCreateConfigsRequest):
     """
     Create multiple configurations at once.
@@ -848,8 +818,6 @@ async def batch_create_configurations(request: BatchCreateConfigsRequest):
     except Exception as e:
         logger.error(f"Batch create failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -857,6 +825,7 @@ async def batch_create_configurations(request: BatchCreateConfigsRequest):
 # =============================================================================
 
 @router.post("/feature-suppression")
+@com_route()
 async def set_feature_suppression(request: FeatureSuppressionRequest):
     """
     Control feature suppression via design table.
@@ -914,11 +883,10 @@ async def set_feature_suppression(request: FeatureSuppressionRequest):
     except Exception as e:
         logger.error(f"Set feature suppression failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/custom-property")
+@com_route()
 async def set_custom_property(request: CustomPropertyRequest):
     """
     Control custom properties via design table.
@@ -977,11 +945,10 @@ async def set_custom_property(request: CustomPropertyRequest):
     except Exception as e:
         logger.error(f"Set custom property failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/component-visibility")
+@com_route()
 async def set_component_visibility(request: ComponentVisibilityRequest):
     """
     Control component visibility via design table (assemblies only).
@@ -1042,11 +1009,10 @@ async def set_component_visibility(request: ComponentVisibilityRequest):
     except Exception as e:
         logger.error(f"Set component visibility failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/color-control")
+@com_route()
 async def set_color(request: ColorControlRequest):
     """
     Control feature/face color via design table.
@@ -1107,8 +1073,6 @@ async def set_color(request: ColorControlRequest):
     except Exception as e:
         logger.error(f"Set color failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1116,6 +1080,7 @@ async def set_color(request: ColorControlRequest):
 # =============================================================================
 
 @router.post("/import-excel")
+@com_route()
 async def import_from_excel(request: ImportExcelRequest):
     """
     Import data from an Excel file into the design table.
@@ -1152,11 +1117,10 @@ async def import_from_excel(request: ImportExcelRequest):
     except Exception as e:
         logger.error(f"Import Excel failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/link")
+@com_route()
 async def link_to_excel(request: LinkTableRequest):
     """Link the design table to an external Excel file."""
     try:
@@ -1186,11 +1150,10 @@ async def link_to_excel(request: LinkTableRequest):
     except Exception as e:
         logger.error(f"Link to Excel failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/break-link")
+@com_route()
 async def break_excel_link():
     """Break the link to an external Excel file."""
     try:
@@ -1215,11 +1178,10 @@ async def break_excel_link():
     except Exception as e:
         logger.error(f"Break link failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/refresh-from-link")
+@com_route()
 async def refresh_from_linked_file():
     """Refresh the design table from the linked Excel file."""
     try:
@@ -1250,8 +1212,6 @@ async def refresh_from_linked_file():
     except Exception as e:
         logger.error(f"Refresh from link failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1259,6 +1219,7 @@ async def refresh_from_linked_file():
 # =============================================================================
 
 @router.post("/update-multiple-cells")
+@com_route()
 async def update_multiple_cells(request: UpdateMultipleCellsRequest):
     """Update multiple cells at once for better performance."""
     try:
@@ -1299,8 +1260,6 @@ async def update_multiple_cells(request: UpdateMultipleCellsRequest):
     except Exception as e:
         logger.error(f"Update multiple cells failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1363,6 +1322,7 @@ async def get_column_type_reference():
 
 
 @router.get("/features-for-suppression")
+@com_route()
 async def list_features_for_suppression():
     """List all features that can be controlled via $STATE@ columns."""
     try:
@@ -1395,11 +1355,10 @@ async def list_features_for_suppression():
     except Exception as e:
         logger.error(f"List features failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/components-for-visibility")
+@com_route()
 async def list_components_for_visibility():
     """List all components that can be controlled via $SHOW@ columns (assemblies)."""
     try:
@@ -1432,8 +1391,6 @@ async def list_components_for_visibility():
     except Exception as e:
         logger.error(f"List components failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -14,14 +14,9 @@ from enum import IntEnum
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class DisplayMode(IntEnum):
@@ -62,22 +57,12 @@ class DisplayModeRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-display", tags=["solidworks-display"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Display States
 # =============================================================================
 
 @router.post("/state/create")
+@com_route()
 async def create_display_state(request: CreateDisplayStateRequest):
     """
     Create a new display state.
@@ -105,11 +90,10 @@ async def create_display_state(request: CreateDisplayStateRequest):
     except Exception as e:
         logger.error(f"Create display state failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/states")
+@com_route()
 async def list_display_states():
     """
     List all display states in the document.
@@ -145,11 +129,10 @@ async def list_display_states():
     except Exception as e:
         logger.error(f"List display states failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/state/{name}/activate")
+@com_route()
 async def activate_display_state(name: str):
     """
     Activate a display state.
@@ -172,11 +155,10 @@ async def activate_display_state(name: str):
     except Exception as e:
         logger.error(f"Activate display state failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/state/{name}")
+@com_route()
 async def delete_display_state(name: str):
     """
     Delete a display state.
@@ -199,8 +181,6 @@ async def delete_display_state(name: str):
     except Exception as e:
         logger.error(f"Delete display state failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -208,6 +188,7 @@ async def delete_display_state(name: str):
 # =============================================================================
 
 @router.post("/color/set")
+@com_route()
 async def set_color(request: SetColorRequest):
     """
     Set color on body, face, or feature.
@@ -252,11 +233,10 @@ async def set_color(request: SetColorRequest):
     except Exception as e:
         logger.error(f"Set color failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/color")
+@com_route()
 async def get_color():
     """
     Get color of selected entity or document default.
@@ -284,11 +264,10 @@ async def get_color():
     except Exception as e:
         logger.error(f"Get color failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/transparency/set")
+@com_route()
 async def set_transparency(request: SetTransparencyRequest):
     """
     Set transparency on body or component.
@@ -317,8 +296,6 @@ async def set_transparency(request: SetTransparencyRequest):
     except Exception as e:
         logger.error(f"Set transparency failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -326,6 +303,7 @@ async def set_transparency(request: SetTransparencyRequest):
 # =============================================================================
 
 @router.post("/mode/set")
+@com_route()
 async def set_display_mode(request: DisplayModeRequest):
     """
     Set the display mode for the view.
@@ -360,11 +338,10 @@ async def set_display_mode(request: DisplayModeRequest):
     except Exception as e:
         logger.error(f"Set display mode failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/mode")
+@com_route()
 async def get_display_mode():
     """
     Get current display mode.
@@ -395,8 +372,6 @@ async def get_display_mode():
     except Exception as e:
         logger.error(f"Get display mode failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -404,6 +379,7 @@ async def get_display_mode():
 # =============================================================================
 
 @router.post("/component/visibility")
+@com_route()
 async def set_component_visibility(request: ComponentVisibilityRequest):
     """
     Show or hide a component in an assembly.
@@ -437,11 +413,10 @@ async def set_component_visibility(request: ComponentVisibilityRequest):
     except Exception as e:
         logger.error(f"Set component visibility failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/show-all")
+@com_route()
 async def show_all_components():
     """
     Show all hidden components in assembly.
@@ -465,8 +440,6 @@ async def show_all_components():
     except Exception as e:
         logger.error(f"Show all failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -474,6 +447,7 @@ async def show_all_components():
 # =============================================================================
 
 @router.post("/view/{orientation}")
+@com_route()
 async def set_view_orientation(orientation: str):
     """
     Set view to standard orientation.
@@ -507,11 +481,10 @@ async def set_view_orientation(orientation: str):
     except Exception as e:
         logger.error(f"Set view orientation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/zoom-fit")
+@com_route()
 async def zoom_to_fit():
     """
     Zoom to fit entire model in view.
@@ -529,11 +502,10 @@ async def zoom_to_fit():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/zoom/{factor}")
+@com_route()
 async def zoom(factor: float):
     """
     Zoom by factor (>1 = zoom in, <1 = zoom out).
@@ -551,8 +523,6 @@ async def zoom(factor: float):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
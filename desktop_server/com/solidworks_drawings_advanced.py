@@ -19,14 +19,9 @@ from enum import IntEnum
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -312,17 +307,6 @@ class BlockInsertRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-drawings-advanced", tags=["solidworks-drawings-advanced"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def get_drawing_doc(sw):
     """Get active drawing document."""
     doc = sw.ActiveDoc
@@ -350,6 +334,7 @@ def get_view(drawing, view_name: str):
 # =============================================================================
 
 @router.post("/view/section")
+@com_route()
 async def create_section_view(request: SectionViewRequest):
     """
     Create a section view from a parent view.
@@ -407,11 +392,10 @@ async def create_section_view(request: SectionViewRequest):
     except Exception as e:
         logger.error(f"Create section view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/detail")
+@com_route()
 async def create_detail_view(request: DetailViewRequest):
     """
     Create a detail view (magnified circular area).
@@ -479,11 +463,10 @@ async def create_detail_view(request: DetailViewRequest):
     except Exception as e:
         logger.error(f"Create detail view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/projected")
+@com_route()
 async def create_projected_view(request: ProjectedViewRequest):
     """
     Create an orthographic projected view from parent view.
@@ -548,11 +531,10 @@ async def create_projected_view(request: ProjectedViewRequest):
     except Exception as e:
         logger.error(f"Create projected view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/auxiliary")
+@com_route()
 async def create_auxiliary_view(request: AuxiliaryViewRequest):
     """Create an auxiliary view projected from an angled edge."""
     try:
@@ -588,11 +570,10 @@ async def create_auxiliary_view(request: AuxiliaryViewRequest):
     except Exception as e:
         logger.error(f"Create auxiliary view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/break")
+@com_route()
 async def create_break_view(request: BreakViewRequest):
     """Add break lines to a view to shorten long parts."""
     try:
@@ -630,8 +611,6 @@ async def create_break_view(request: BreakViewRequest):
     except Exception as e:
         logger.error(f"Create break view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -639,6 +618,7 @@ async def create_break_view(request: BreakViewRequest):
 # =============================================================================
 
 @router.post("/dimension/smart")
+@com_route()
 async def add_smart_dimension(request: SmartDimensionRequest):
     """
     Add a smart dimension between entities.
@@ -723,11 +703,10 @@ async def add_smart_dimension(request: SmartDimensionRequest):
     except Exception as e:
         logger.error(f"Add smart dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/ordinate")
+@com_route()
 async def add_ordinate_dimensions(request: OrdinateDimensionRequest):
     """
     Add ordinate dimensions from a datum origin.
@@ -792,11 +771,10 @@ async def add_ordinate_dimensions(request: OrdinateDimensionRequest):
     except Exception as e:
         logger.error(f"Add ordinate dimensions failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/baseline")
+@com_route()
 async def add_baseline_dimensions(request: BaselineDimensionRequest):
     """Add baseline (parallel) dimensions from a common baseline."""
     try:
@@ -849,11 +827,10 @@ async def add_baseline_dimensions(request: BaselineDimensionRequest):
     except Exception as e:
         logger.error(f"Add baseline dimensions failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/chain")
+@com_route()
 async def add_chain_dimensions(request: ChainDimensionRequest):
     """Add chain dimensions (sequential point-to-point)."""
     try:
@@ -907,8 +884,6 @@ async def add_chain_dimensions(request: ChainDimensionRequest):
     except Exception as e:
         logger.error(f"Add chain dimensions failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -916,6 +891,7 @@ async def add_chain_dimensions(request: ChainDimensionRequest):
 # =============================================================================
 
 @router.post("/annotation/gdt")
+@com_route()
 async def add_geometric_tolerance(request: GDTRequest):
     """
     Add a geometric tolerance (GD&T) symbol.
@@ -999,11 +975,10 @@ async def add_geometric_tolerance(request: GDTRequest):
     except Exception as e:
         logger.error(f"Add GD&T failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/datum-feature")
+@com_route()
 async def add_datum_feature(request: DatumFeatureRequest):
     """Add a datum feature symbol (datum identifier)."""
     try:
@@ -1039,11 +1014,10 @@ async def add_datum_feature(request: DatumFeatureRequest):
     except Exception as e:
         logger.error(f"Add datum feature failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/datum-target")
+@com_route()
 async def add_datum_target(request: DatumTargetRequest):
     """Add a datum target symbol."""
     try:
@@ -1089,11 +1063,10 @@ async def add_datum_target(request: DatumTargetRequest):
     except Exception as e:
         logger.error(f"Add datum target failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/hole-callout")
+@com_route()
 async def add_hole_callout(request: HoleCalloutRequest):
     """
     Add a hole callout annotation.
@@ -1144,11 +1117,10 @@ async def add_hole_callout(request: HoleCalloutRequest):
     except Exception as e:
         logger.error(f"Add hole callout failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/surface-finish")
+@com_route()
 async def add_surface_finish(request: SurfaceFinishRequest):
     """
     Add a surface finish symbol.
@@ -1207,11 +1179,10 @@ async def add_surface_finish(request: SurfaceFinishRequest):
     except Exception as e:
         logger.error(f"Add surface finish failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/weld-symbol")
+@com_route()
 async def add_weld_symbol(request: WeldSymbolRequest):
     """
     Add a weld symbol.
@@ -1286,8 +1257,6 @@ async def add_weld_symbol(request: WeldSymbolRequest):
     except Exception as e:
         logger.error(f"Add weld symbol failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1295,6 +1264,7 @@ async def add_weld_symbol(request: WeldSymbolRequest):
 # =============================================================================
 
 @router.post("/auto-dimension")
+@com_route()
 async def auto_dimension_view(request: AutoDimensionRequest):
     """
     Automatically add dimensions to a view.
@@ -1358,11 +1328,10 @@ async def auto_dimension_view(request: AutoDimensionRequest):
     except Exception as e:
         logger.error(f"Auto-dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/auto-balloon")
+@com_route()
 async def auto_balloon_view(request: AutoBalloonRequest):
     """
     Automatically add balloons to an assembly view.
@@ -1433,8 +1402,6 @@ async def auto_balloon_view(request: AutoBalloonRequest):
     except Exception as e:
         logger.error(f"Auto-balloon failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1442,6 +1409,7 @@ async def auto_balloon_view(request: AutoBalloonRequest):
 # =============================================================================
 
 @router.post("/centermark/pattern")
+@com_route()
 async def add_centermark_pattern(request: CenterMarkPatternRequest):
     """Add center marks to a hole pattern (circular or linear)."""
     try:
@@ -1495,8 +1463,6 @@ async def add_centermark_pattern(request: CenterMarkPatternRequest):
     except Exception as e:
         logger.error(f"Add centermark pattern failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1504,6 +1470,7 @@ async def add_centermark_pattern(request: CenterMarkPatternRequest):
 # =============================================================================
 
 @router.get("/views")
+@com_route()
 async def list_drawing_views():
     """List all views in the current drawing."""
     try:
@@ -1544,11 +1511,10 @@ async def list_drawing_views():
     except Exception as e:
         logger.error(f"List views failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/dimensions")
+@com_route()
 async def list_drawing_dimensions(view_name: Optional[str] = None):
     """List all dimensions in the drawing or specific view."""
     try:
@@ -1587,11 +1553,10 @@ async def list_drawing_dimensions(view_name: Optional[str] = None):
     except Exception as e:
         logger.error(f"List dimensions failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/modify")
+@com_route()
 async def modify_dimension(dimension_name: str, new_value: Optional[float] = None,
                           prefix: Optional[str] = None, suffix: Optional[str] = None,
                           tolerance_type: Optional[str] = None,
@@ -1652,11 +1617,10 @@ async def modify_dimension(dimension_name: str, new_value: Optional[float] = Non
     except Exception as e:
         logger.error(f"Modify dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/dimension/{dimension_name}")
+@com_route()
 async def delete_dimension(dimension_name: str):
     """Delete a dimension from the drawing."""
     try:
@@ -1679,8 +1643,6 @@ async def delete_dimension(dimension_name: str):
     except Exception as e:
         logger.error(f"Delete dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1705,6 +1667,7 @@ class AlternatePositionRequest(BaseModel):
 
 
 @router.post("/view/broken-out-section")
+@com_route()
 async def create_broken_out_section(request: BrokenOutSectionRequest):
     """
     Create a broken-out section in a view.
@@ -1746,11 +1709,10 @@ async def create_broken_out_section(request: BrokenOutSectionRequest):
     except Exception as e:
         logger.error(f"Create broken-out section failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/crop")
+@com_route()
 async def crop_view(request: CropViewRequest):
     """Crop a view to show only a specific region."""
     try:
@@ -1789,11 +1751,10 @@ async def crop_view(request: CropViewRequest):
     except Exception as e:
         logger.error(f"Crop view failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/view/alternate-position")
+@com_route()
 async def create_alternate_position_view(request: AlternatePositionRequest):
     """Create an alternate position view showing different configuration."""
     try:
@@ -1822,8 +1783,6 @@ async def create_alternate_position_view(request: AlternatePositionRequest):
     except Exception as e:
         logger.error(f"Create alternate position failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1853,6 +1812,7 @@ class ChamferDimensionRequest(BaseModel):
 
 
 @router.post("/dimension/angular")
+@com_route()
 async def add_angular_dimension(request: AngularDimensionRequest):
     """Add an angular dimension between two lines."""
     try:
@@ -1897,11 +1857,10 @@ async def add_angular_dimension(request: AngularDimensionRequest):
     except Exception as e:
         logger.error(f"Add angular dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/arc-length")
+@com_route()
 async def add_arc_length_dimension(request: ArcLengthDimensionRequest):
     """Add an arc length dimension."""
     try:
@@ -1938,11 +1897,10 @@ async def add_arc_length_dimension(request: ArcLengthDimensionRequest):
     except Exception as e:
         logger.error(f"Add arc length dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/chamfer")
+@com_route()
 async def add_chamfer_dimension(request: ChamferDimensionRequest):
     """Add a chamfer dimension."""
     try:
@@ -1987,8 +1945,6 @@ async def add_chamfer_dimension(request: ChamferDimensionRequest):
     except Exception as e:
         logger.error(f"Add chamfer dimension failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -2013,6 +1969,7 @@ class WeldmentCutListRequest(BaseModel):
 
 
 @router.post("/table/hole")
+@com_route()
 async def insert_hole_table(request: HoleTableRequest):
     """Insert a hole table showing hole positions from a datum."""
     try:
@@ -2051,11 +2008,10 @@ async def insert_hole_table(request: HoleTableRequest):
     except Exception as e:
         logger.error(f"Insert hole table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/table/bend")
+@com_route()
 async def insert_bend_table(request: BendTableRequest):
     """Insert a bend table for sheet metal parts."""
     try:
@@ -2091,11 +2047,10 @@ async def insert_bend_table(request: BendTableRequest):
     except Exception as e:
         logger.error(f"Insert bend table failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/table/weldment-cutlist")
+@com_route()
 async def insert_weldment_cutlist(request: WeldmentCutListRequest):
     """Insert a weldment cut list table."""
     try:
@@ -2131,8 +2086,6 @@ async def insert_weldment_cutlist(request: WeldmentCutListRequest):
     except Exception as e:
         logger.error(f"Insert weldment cut list failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -2160,6 +2113,7 @@ class MultiJogLeaderRequest(BaseModel):
 
 
 @router.post("/annotation/cosmetic-thread")
+@com_route()
 async def add_cosmetic_thread(request: CosmeticThreadRequest):
     """Add a cosmetic thread annotation to a hole."""
     try:
@@ -2196,11 +2150,10 @@ async def add_cosmetic_thread(request: CosmeticThreadRequest):
     except Exception as e:
         logger.error(f"Add cosmetic thread failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/dowel-pin")
+@com_route()
 async def add_dowel_pin_symbol(request: DowelPinSymbolRequest):
     """Add a dowel pin symbol."""
     try:
@@ -2230,11 +2183,10 @@ async def add_dowel_pin_symbol(request: DowelPinSymbolRequest):
     except Exception as e:
         logger.error(f"Add dowel pin symbol failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/annotation/multi-jog-leader")
+@com_route()
 async def add_multi_jog_leader(request: MultiJogLeaderRequest):
     """Add a leader line with multiple jogs/bends."""
     try:
@@ -2268,8 +2220,6 @@ async def add_multi_jog_leader(request: MultiJogLeaderRequest):
     except Exception as e:
         logger.error(f"Add multi-jog leader failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -2285,6 +2235,7 @@ class LayerRequest(BaseModel):
 
 
 @router.get("/layers")
+@com_route()
 async def list_layers():
     """List all layers in the drawing."""
     try:
@@ -2314,11 +2265,10 @@ async def list_layers():
     except Exception as e:
         logger.error(f"List layers failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/layer/create")
+@com_route()
 async def create_layer(request: LayerRequest):
     """Create a new layer."""
     try:
@@ -2346,11 +2296,10 @@ async def create_layer(request: LayerRequest):
     except Exception as e:
         logger.error(f"Create layer failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/layer/set-current")
+@com_route()
 async def set_current_layer(layer_name: str):
     """Set the current/active layer."""
     try:
@@ -2370,8 +2319,6 @@ async def set_current_layer(layer_name: str):
     except Exception as e:
         logger.error(f"Set current layer failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -2379,6 +2326,7 @@ async def set_current_layer(layer_name: str):
 # =============================================================================
 
 @router.get("/sheets")
+@com_route()
 async def list_sheets():
     """List all sheets in the drawing."""
     try:
@@ -2409,11 +2357,10 @@ async def list_sheets():
     except Exception as e:
         logger.error(f"List sheets failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/sheet/activate")
+@com_route()
 async def activate_sheet(sheet_name: str):
     """Activate a sheet by name."""
     try:
@@ -2432,11 +2379,10 @@ async def activate_sheet(sheet_name: str):
     except Exception as e:
         logger.error(f"Activate sheet failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/sheet/set-scale")
+@com_route()
 async def set_sheet_scale(sheet_name: str, scale_numerator: float, scale_denominator: float):
     """Set the scale of a sheet."""
     try:
@@ -2461,8 +2407,6 @@ async def set_sheet_scale(sheet_name: str, scale_numerator: float, scale_denomin
     except Exception as e:
         logger.error(f"Set sheet scale failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
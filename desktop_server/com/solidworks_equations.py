@@ -15,14 +15,9 @@ from enum import IntEnum
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class EquationType(IntEnum):
@@ -60,17 +55,6 @@ class SuppressionEquationRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-equations", tags=["solidworks-equations"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def get_equation_manager(doc):
     """Get equation manager from document."""
     eq_mgr = doc.GetEquationMgr()
@@ -84,6 +68,7 @@ def get_equation_manager(doc):
 # =============================================================================
 
 @router.post("/global-variable/add")
+@com_route()
 async def add_global_variable(request: AddGlobalVariableRequest):
     """
     Add a global variable to the model.
@@ -118,11 +103,10 @@ async def add_global_variable(request: AddGlobalVariableRequest):
     except Exception as e:
         logger.error(f"Add global variable failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/global-variables")
+@com_route()
 async def list_global_variables():
     """
     List all global variables in the model.
@@ -165,11 +149,10 @@ async def list_global_variables():
     except Exception as e:
         logger.error(f"List global variables failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.put("/global-variable/{name}")
+@com_route()
 async def update_global_variable(name: str, value: float):
     """
     Update a global variable value.
@@ -212,11 +195,10 @@ async def update_global_variable(name: str, value: float):
     except Exception as e:
         logger.error(f"Update global variable failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/global-variable/{name}")
+@com_route()
 async def delete_global_variable(name: str):
     """
     Delete a global variable.
@@ -244,8 +226,6 @@ async def delete_global_variable(name: str):
     except Exception as e:
         logger.error(f"Delete global variable failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -253,6 +233,7 @@ async def delete_global_variable(name: str):
 # =============================================================================
 
 @router.post("/equation/add")
+@com_route()
 async def add_equation(request: AddEquationRequest):
     """
     Add an equation to link dimensions.
@@ -285,11 +266,10 @@ async def add_equation(request: AddEquationRequest):
     except Exception as e:
         logger.error(f"Add equation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/equations")
+@com_route()
 async def list_equations():
     """
     List all equations in the model.
@@ -332,11 +312,10 @@ async def list_equations():
     except Exception as e:
         logger.error(f"List equations failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.put("/equation/{index}")
+@com_route()
 async def update_equation(index: int, equation: str):
     """
     Update an equation at specified index.
@@ -365,11 +344,10 @@ async def update_equation(index: int, equation: str):
     except Exception as e:
         logger.error(f"Update equation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/equation/{index}")
+@com_route()
 async def delete_equation(index: int):
     """
     Delete an equation at specified index.
@@ -394,8 +372,6 @@ async def delete_equation(index: int):
     except Exception as e:
         logger.error(f"Delete equation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -403,6 +379,7 @@ async def delete_equation(index: int):
 # =============================================================================
 
 @router.post("/link-dimensions")
+@com_route()
 async def link_dimensions(request: LinkDimensionsRequest):
     """
     Link two dimensions with optional multiplier and offset.
@@ -441,8 +418,6 @@ async def link_dimensions(request: LinkDimensionsRequest):
     except Exception as e:
         logger.error(f"Link dimensions failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -450,6 +425,7 @@ async def link_dimensions(request: LinkDimensionsRequest):
 # =============================================================================
 
 @router.post("/suppression-equation")
+@com_route()
 async def add_suppression_equation(request: SuppressionEquationRequest):
     """
     Add a conditional suppression equation for a feature.
@@ -485,8 +461,6 @@ async def add_suppression_equation(request: SuppressionEquationRequest):
     except Exception as e:
         logger.error(f"Add suppression equation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -494,6 +468,7 @@ async def add_suppression_equation(request: SuppressionEquationRequest):
 # =============================================================================
 
 @router.post("/evaluate")
+@com_route()
 async def evaluate_expression(expression: str):
     """
     Evaluate a mathematical expression using SolidWorks equation solver.
@@ -527,11 +502,10 @@ async def evaluate_expression(expression: str):
     except Exception as e:
         logger.error(f"Evaluate expression failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/import")
+@com_route()
 async def import_equations(equations: List[str]):
     """
     Import multiple equations at once.
@@ -572,11 +546,10 @@ async def import_equations(equations: List[str]):
     except Exception as e:
         logger.error(f"Import equations failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/export")
+@com_route()
 async def export_equations():
     """
     Export all equations as text.
@@ -609,11 +582,10 @@ async def export_equations():
     except Exception as e:
         logger.error(f"Export equations failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/rebuild")
+@com_route()
 async def rebuild_equations():
     """
     Force rebuild of all equations.
@@ -636,8 +608,6 @@ async def rebuild_equations():
     except Exception as e:
         logger.error(f"Rebuild equations failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
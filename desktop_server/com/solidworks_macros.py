@@ -24,14 +24,9 @@ from datetime import datetime
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # =============================================================================
@@ -110,17 +105,6 @@ os.makedirs(MACRO_LIBRARY_DIR, exist_ok=True)
 # Helper Functions
 # =============================================================================
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def create_temp_macro(code: str, module_name: str = "Module1", procedure_name: str = "Main") -> str:
     """Create a temporary .swp macro file from code."""
     # SWP file format is essentially a VBA project
@@ -182,6 +166,7 @@ def inject_parameters(code: str, parameters: Dict[str, Any]) -> str:
 # =============================================================================
 
 @router.post("/run")
+@com_route()
 async def run_macro(request: RunMacroRequest):
     """
     Run a SolidWorks macro (.swp file).
@@ -220,11 +205,10 @@ async def run_macro(request: RunMacroRequest):
     except Exception as e:
         logger.error(f"Run macro failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/run-inline")
+@com_route()
 async def run_inline_code(request: RunInlineCodeRequest):
     """
     Execute inline VBA code directly - NO FILE NEEDED.
@@ -277,10 +261,10 @@ async def run_inline_code(request: RunInlineCodeRequest):
                 shutil.rmtree(os.path.dirname(temp_path))
             except:
                 pass
-        pythoncom.CoUninitialize()
 
 
 @router.post("/run-parameterized")
+@com_route()
 async def run_parameterized_macro(request: ParameterizedMacroRequest):
     """
     Run a macro with injected parameters.
@@ -348,10 +332,10 @@ async def run_parameterized_macro(request: ParameterizedMacroRequest):
                 shutil.rmtree(os.path.dirname(temp_path))
             except:
                 pass
-        pythoncom.CoUninitialize()
 
 
 @router.post("/chain")
+@com_route()
 async def chain_macros(request: MacroChainRequest):
     """
     Chain multiple macros together for complex workflows.
@@ -431,11 +415,10 @@ async def chain_macros(request: MacroChainRequest):
     except Exception as e:
         logger.error(f"Chain macros failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/batch")
+@com_route()
 async def batch_run_macro(request: BatchMacroRequest):
     """
     Run a macro on multiple files - PRODUCTION AUTOMATION.
@@ -508,8 +491,6 @@ async def batch_run_macro(request: BatchMacroRequest):
     except Exception as e:
         logger.error(f"Batch macro failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -641,6 +622,7 @@ async def get_library_macro(name: str, category: Optional[str] = None):
 
 
 @router.post("/library/run/{name}")
+@com_route()
 async def run_library_macro(name: str, parameters: Optional[Dict[str, Any]] = None):
     """Run a macro from the library with optional parameters."""
     try:
@@ -682,8 +664,6 @@ async def run_library_macro(name: str, parameters: Optional[Dict[str, Any]] = No
     except Exception as e:
         logger.error(f"Run library macro failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/library/{name}")
@@ -873,6 +853,7 @@ async def generate_and_run_macro(request: GenerateMacroRequest):
 # =============================================================================
 
 @router.get("/recording/status")
+@com_route()
 async def get_recording_status():
     """Check if macro recording is active."""
     try:
@@ -884,11 +865,10 @@ async def get_recording_status():
     except Exception as e:
         logger.error(f"Get recording status failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/recording/start")
+@com_route()
 async def start_recording():
     """Start macro recording."""
     try:
@@ -903,11 +883,10 @@ async def start_recording():
     except Exception as e:
         logger.error(f"Start recording failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/recording/stop")
+@com_route()
 async def stop_recording(save_path: Optional[str] = None):
     """Stop macro recording and optionally save."""
     try:
@@ -926,8 +905,6 @@ async def stop_recording(save_path: Optional[str] = None):
     except Exception as e:
         logger.error(f"Stop recording failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -1085,6 +1062,7 @@ End Sub
 # =============================================================================
 
 @router.post("/command/{command_id}")
+@com_route()
 async def run_command(command_id: int):
     """
     Execute a SolidWorks command by ID.
@@ -1105,8 +1083,6 @@ async def run_command(command_id: int):
     except Exception as e:
         logger.error(f"Run command failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/commands")
@@ -13,14 +13,9 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Built-in material database for common materials
@@ -72,17 +67,6 @@ class CreateMaterialRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-materials", tags=["solidworks-materials"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Material Library
 # =============================================================================
@@ -173,6 +157,7 @@ async def get_material_properties(material_name: str):
 # =============================================================================
 
 @router.post("/assign")
+@com_route()
 async def assign_material(request: AssignMaterialRequest):
     """
     Assign a material to the active part or specific body.
@@ -223,11 +208,10 @@ async def assign_material(request: AssignMaterialRequest):
     except Exception as e:
         logger.error(f"Assign material failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/current")
+@com_route()
 async def get_current_material():
     """
     Get the currently assigned material.
@@ -263,11 +247,10 @@ async def get_current_material():
     except Exception as e:
         logger.error(f"Get current material failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/remove")
+@com_route()
 async def remove_material():
     """
     Remove material assignment from part.
@@ -287,8 +270,6 @@ async def remove_material():
     except Exception as e:
         logger.error(f"Remove material failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
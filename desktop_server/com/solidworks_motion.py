@@ -16,15 +16,9 @@ from dataclasses import dataclass
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class MotionStudyType(IntEnum):
@@ -138,19 +132,6 @@ class ExportAnimationRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-motion", tags=["solidworks-motion"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 def get_motion_manager(doc):
     """Get motion study manager from document."""
     ext = doc.Extension
@@ -169,6 +150,7 @@ def get_motion_manager(doc):
 # =============================================================================
 
 @router.post("/study/create")
+@com_route()
 async def create_motion_study(request: CreateMotionStudyRequest):
     """
     Create a new motion study.
@@ -210,11 +192,10 @@ async def create_motion_study(request: CreateMotionStudyRequest):
     except Exception as e:
         logger.error(f"Create motion study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/study/list")
+@com_route()
 async def list_motion_studies():
     """
     List all motion studies in active document.
@@ -248,11 +229,10 @@ async def list_motion_studies():
     except Exception as e:
         logger.error(f"List studies failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/study/{name}/activate")
+@com_route()
 async def activate_motion_study(name: str):
     """
     Activate a motion study by name.
@@ -281,11 +261,10 @@ async def activate_motion_study(name: str):
     except Exception as e:
         logger.error(f"Activate study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/study/{name}")
+@com_route()
 async def delete_motion_study(name: str):
     """
     Delete a motion study by name.
@@ -309,8 +288,6 @@ async def delete_motion_study(name: str):
     except Exception as e:
         logger.error(f"Delete study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -318,6 +295,7 @@ async def delete_motion_study(name: str):
 # =============================================================================
 
 @router.post("/motor/add")
+@com_route()
 async def add_motor(request: AddMotorRequest):
     """
     Add a motor to the active motion study.
@@ -372,8 +350,6 @@ async def add_motor(request: AddMotorRequest):
     except Exception as e:
         logger.error(f"Add motor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -381,6 +357,7 @@ async def add_motor(request: AddMotorRequest):
 # =============================================================================
 
 @router.post("/spring/add")
+@com_route()
 async def add_spring(request: AddSpringRequest):
     """
     Add a spring between two components.
@@ -420,11 +397,10 @@ async def add_spring(request: AddSpringRequest):
     except Exception as e:
         logger.error(f"Add spring failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/damper/add")
+@com_route()
 async def add_damper(request: AddDamperRequest):
     """
     Add a pure damper between two components.
@@ -461,8 +437,6 @@ async def add_damper(request: AddDamperRequest):
     except Exception as e:
         logger.error(f"Add damper failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -470,6 +444,7 @@ async def add_damper(request: AddDamperRequest):
 # =============================================================================
 
 @router.post("/gravity/add")
+@com_route()
 async def add_gravity(request: AddGravityRequest):
     """
     Add gravity to the motion study.
@@ -511,8 +486,6 @@ async def add_gravity(request: AddGravityRequest):
     except Exception as e:
         logger.error(f"Add gravity failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -520,6 +493,7 @@ async def add_gravity(request: AddGravityRequest):
 # =============================================================================
 
 @router.post("/contact/add")
+@com_route()
 async def add_contact(request: AddContactRequest):
     """
     Add contact/collision detection between components.
@@ -559,11 +533,10 @@ async def add_contact(request: AddContactRequest):
     except Exception as e:
         logger.error(f"Add contact failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/contact/all-solid-bodies")
+@com_route()
 async def enable_all_contact():
     """
     Enable contact between all solid bodies (global setting).
@@ -591,8 +564,6 @@ async def enable_all_contact():
     except Exception as e:
         logger.error(f"Enable contact failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -600,6 +571,7 @@ async def enable_all_contact():
 # =============================================================================
 
 @router.post("/sensor/add")
+@com_route()
 async def add_sensor(request: AddSensorRequest):
     """
     Add a sensor to track motion data.
@@ -644,8 +616,6 @@ async def add_sensor(request: AddSensorRequest):
     except Exception as e:
         logger.error(f"Add sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -653,6 +623,7 @@ async def add_sensor(request: AddSensorRequest):
 # =============================================================================
 
 @router.post("/run")
+@com_route()
 async def run_motion_study(request: RunMotionRequest):
     """
     Run the active motion study.
@@ -687,11 +658,10 @@ async def run_motion_study(request: RunMotionRequest):
     except Exception as e:
         logger.error(f"Run motion study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/results")
+@com_route()
 async def get_motion_results():
     """
     Get results from the last motion study run.
@@ -722,11 +692,10 @@ async def get_motion_results():
     except Exception as e:
         logger.error(f"Get results failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/export/animation")
+@com_route()
 async def export_animation(request: ExportAnimationRequest):
     """
     Export motion study as video animation.
@@ -763,11 +732,10 @@ async def export_animation(request: ExportAnimationRequest):
     except Exception as e:
         logger.error(f"Export animation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/export/csv")
+@com_route()
 async def export_results_csv(output_path: str):
     """
     Export motion results to CSV file.
@@ -795,8 +763,6 @@ async def export_results_csv(output_path: str):
     except Exception as e:
         logger.error(f"Export CSV failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -804,6 +770,7 @@ async def export_results_csv(output_path: str):
 # =============================================================================
 
 @router.post("/playback/play")
+@com_route()
 async def play_motion():
     """Start motion playback."""
     try:
@@ -824,11 +791,10 @@ async def play_motion():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/playback/stop")
+@com_route()
 async def stop_motion():
     """Stop motion playback."""
     try:
@@ -849,11 +815,10 @@ async def stop_motion():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/playback/goto/{time}")
+@com_route()
 async def goto_time(time: float):
     """
     Go to specific time in motion study.
@@ -877,8 +842,6 @@ async def goto_time(time: float):
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
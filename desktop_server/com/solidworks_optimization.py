@@ -17,15 +17,9 @@ from dataclasses import dataclass, field
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class StudyType(IntEnum):
@@ -142,24 +136,12 @@ class DOERequest(BaseModel):
 router = APIRouter(prefix="/solidworks-optimization", tags=["solidworks-optimization"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Design Study Management
 # =============================================================================
 
 @router.post("/study/create")
+@com_route()
 async def create_design_study(request: CreateDesignStudyRequest):
     """
     Create a new design study.
@@ -202,11 +184,10 @@ async def create_design_study(request: CreateDesignStudyRequest):
     except Exception as e:
         logger.error(f"Create design study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/study/list")
+@com_route()
 async def list_design_studies():
     """
     List all design studies in active document.
@@ -242,11 +223,10 @@ async def list_design_studies():
     except Exception as e:
         logger.error(f"List studies failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/study/{name}")
+@com_route()
 async def delete_design_study(name: str):
     """
     Delete a design study by name.
@@ -273,8 +253,6 @@ async def delete_design_study(name: str):
     except Exception as e:
         logger.error(f"Delete study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -282,6 +260,7 @@ async def delete_design_study(name: str):
 # =============================================================================
 
 @router.post("/variable/add")
+@com_route()
 async def add_design_variable(request: AddVariableRequest):
     """
     Add a design variable (dimension) to the active study.
@@ -320,11 +299,10 @@ async def add_design_variable(request: AddVariableRequest):
     except Exception as e:
         logger.error(f"Add variable failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/variables")
+@com_route()
 async def list_design_variables():
     """
     List all variables in active design study.
@@ -364,8 +342,6 @@ async def list_design_variables():
     except Exception as e:
         logger.error(f"List variables failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -373,6 +349,7 @@ async def list_design_variables():
 # =============================================================================
 
 @router.post("/sensor/add")
+@com_route()
 async def add_sensor(request: AddSensorRequest):
     """
     Add a sensor to monitor during optimization.
@@ -423,8 +400,6 @@ async def add_sensor(request: AddSensorRequest):
     except Exception as e:
         logger.error(f"Add sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -432,6 +407,7 @@ async def add_sensor(request: AddSensorRequest):
 # =============================================================================
 
 @router.post("/goal/set")
+@com_route()
 async def set_optimization_goal(request: SetGoalRequest):
     """
     Set the optimization goal (what to minimize/maximize).
@@ -475,11 +451,10 @@ async def set_optimization_goal(request: SetGoalRequest):
     except Exception as e:
         logger.error(f"Set goal failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/constraint/add")
+@com_route()
 async def add_design_constraint(request: AddConstraintRequest):
     """
     Add a constraint to the optimization.
@@ -525,8 +500,6 @@ async def add_design_constraint(request: AddConstraintRequest):
     except Exception as e:
         logger.error(f"Add constraint failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -534,6 +507,7 @@ async def add_design_constraint(request: AddConstraintRequest):
 # =============================================================================
 
 @router.post("/run")
+@com_route()
 async def run_design_study():
     """
     Run the active design study.
@@ -563,11 +537,10 @@ async def run_design_study():
     except Exception as e:
         logger.error(f"Run study failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/results")
+@com_route()
 async def get_study_results():
     """
     Get results from the last design study run.
@@ -606,8 +579,6 @@ async def get_study_results():
     except Exception as e:
         logger.error(f"Get results failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -615,6 +586,7 @@ async def get_study_results():
 # =============================================================================
 
 @router.post("/sweep")
+@com_route()
 async def parameter_sweep(request: ParameterSweepRequest):
     """
     Perform a parameter sweep on a single dimension.
@@ -673,11 +645,10 @@ async def parameter_sweep(request: ParameterSweepRequest):
     except Exception as e:
         logger.error(f"Parameter sweep failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/what-if")
+@com_route()
 async def what_if_scenario(request: WhatIfRequest):
     """
     Run a what-if scenario with specific parameter values.
@@ -727,8 +698,6 @@ async def what_if_scenario(request: WhatIfRequest):
     except Exception as e:
         logger.error(f"What-if failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -823,6 +792,7 @@ async def generate_doe_matrix(request: DOERequest):
 
 
 @router.post("/doe/run")
+@com_route()
 async def run_doe_study(samples: List[Dict[str, float]]):
     """
     Run DOE samples and collect results.
@@ -883,8 +853,6 @@ async def run_doe_study(samples: List[Dict[str, float]]):
     except Exception as e:
         logger.error(f"Run DOE failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -892,6 +860,7 @@ async def run_doe_study(samples: List[Dict[str, float]]):
 # =============================================================================
 
 @router.post("/sensitivity")
+@com_route()
 async def sensitivity_analysis(dimension_names: List[str], perturbation_percent: float = 5.0):
     """
     Perform sensitivity analysis on specified dimensions.
@@ -955,8 +924,6 @@ async def sensitivity_analysis(dimension_names: List[str], perturbation_percent:
     except Exception as e:
         logger.error(f"Sensitivity analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
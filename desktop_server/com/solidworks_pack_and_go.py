@@ -14,14 +14,9 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models
@@ -42,22 +37,12 @@ class AnalyzeReferencesRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-pack-and-go", tags=["solidworks-pack-and-go"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Pack and Go Operations
 # =============================================================================
 
 @router.post("/execute")
+@com_route()
 async def execute_pack_and_go(request: PackAndGoRequest):
     """
     Execute Pack and Go on the active document.
@@ -137,11 +122,10 @@ async def execute_pack_and_go(request: PackAndGoRequest):
     except Exception as e:
         logger.error(f"Pack and Go failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/preview")
+@com_route()
 async def preview_pack_and_go():
     """
     Preview what files will be included in Pack and Go.
@@ -191,8 +175,6 @@ async def preview_pack_and_go():
     except Exception as e:
         logger.error(f"Preview failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -200,6 +182,7 @@ async def preview_pack_and_go():
 # =============================================================================
 
 @router.get("/references")
+@com_route()
 async def analyze_references():
     """
     Analyze all references in the active document.
@@ -263,11 +246,10 @@ async def analyze_references():
     except Exception as e:
         logger.error(f"Analyze references failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/fix-missing")
+@com_route()
 async def fix_missing_references(search_folders: List[str]):
     """
     Attempt to fix missing references by searching in specified folders.
@@ -323,8 +305,6 @@ async def fix_missing_references(search_folders: List[str]):
     except Exception as e:
         logger.error(f"Fix references failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -332,6 +312,7 @@ async def fix_missing_references(search_folders: List[str]):
 # =============================================================================
 
 @router.post("/create-zip")
+@com_route()
 async def create_zip_archive(output_path: str, include_drawings: bool = True):
     """
     Create a ZIP archive of the document and all references.
@@ -380,8 +361,6 @@ async def create_zip_archive(output_path: str, include_drawings: bool = True):
     except Exception as e:
         logger.error(f"Create ZIP failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -389,6 +368,7 @@ async def create_zip_archive(output_path: str, include_drawings: bool = True):
 # =============================================================================
 
 @router.post("/copy-tree")
+@com_route()
 async def copy_tree(output_folder: str, preserve_folder_structure: bool = True):
     """
     Copy entire document tree maintaining folder structure.
@@ -428,8 +408,6 @@ async def copy_tree(output_folder: str, preserve_folder_structure: bool = True):
     except Exception as e:
         logger.error(f"Copy tree failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -15,14 +15,9 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models
@@ -65,22 +60,12 @@ class CoordinateSystemRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-reference", tags=["solidworks-reference"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Reference Planes
 # =============================================================================
 
 @router.post("/plane/offset")
+@com_route()
 async def create_offset_plane(request: PlaneOffsetRequest):
     """
     Create a plane offset from a reference plane.
@@ -117,11 +102,10 @@ async def create_offset_plane(request: PlaneOffsetRequest):
     except Exception as e:
         logger.error(f"Create offset plane failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/plane/angle")
+@com_route()
 async def create_angle_plane(request: PlaneAngleRequest):
     """
     Create a plane at an angle to a reference plane about an edge.
@@ -162,11 +146,10 @@ async def create_angle_plane(request: PlaneAngleRequest):
     except Exception as e:
         logger.error(f"Create angle plane failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/plane/three-points")
+@com_route()
 async def create_plane_from_points(request: Plane3PointsRequest):
     """
     Create a plane through three points.
@@ -206,11 +189,10 @@ async def create_plane_from_points(request: Plane3PointsRequest):
     except Exception as e:
         logger.error(f"Create 3-point plane failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/plane/midplane")
+@com_route()
 async def create_midplane(face1: str, face2: str):
     """
     Create a midplane between two parallel faces.
@@ -246,8 +228,6 @@ async def create_midplane(face1: str, face2: str):
     except Exception as e:
         logger.error(f"Create midplane failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -255,6 +235,7 @@ async def create_midplane(face1: str, face2: str):
 # =============================================================================
 
 @router.post("/axis/create")
+@com_route()
 async def create_axis(request: AxisRequest):
     """
     Create a reference axis.
@@ -305,8 +286,6 @@ async def create_axis(request: AxisRequest):
     except Exception as e:
         logger.error(f"Create axis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -314,6 +293,7 @@ async def create_axis(request: AxisRequest):
 # =============================================================================
 
 @router.post("/point/create")
+@com_route()
 async def create_point(request: PointRequest):
     """
     Create a reference point.
@@ -375,8 +355,6 @@ async def create_point(request: PointRequest):
     except Exception as e:
         logger.error(f"Create point failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -384,6 +362,7 @@ async def create_point(request: PointRequest):
 # =============================================================================
 
 @router.post("/coordinate-system/create")
+@com_route()
 async def create_coordinate_system(request: CoordinateSystemRequest):
     """
     Create a coordinate system at specified origin and orientation.
@@ -428,11 +407,10 @@ async def create_coordinate_system(request: CoordinateSystemRequest):
     except Exception as e:
         logger.error(f"Create coordinate system failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/coordinate-systems")
+@com_route()
 async def list_coordinate_systems():
     """
     List all coordinate systems in the document.
@@ -463,8 +441,6 @@ async def list_coordinate_systems():
     except Exception as e:
         logger.error(f"List coordinate systems failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -472,6 +448,7 @@ async def list_coordinate_systems():
 # =============================================================================
 
 @router.get("/planes")
+@com_route()
 async def list_planes():
     """
     List all planes in the document.
@@ -502,11 +479,10 @@ async def list_planes():
     except Exception as e:
         logger.error(f"List planes failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/axes")
+@com_route()
 async def list_axes():
     """
     List all reference axes in the document.
@@ -537,11 +513,10 @@ async def list_axes():
     except Exception as e:
         logger.error(f"List axes failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/points")
+@com_route()
 async def list_reference_points():
     """
     List all reference points in the document.
@@ -572,8 +547,6 @@ async def list_reference_points():
     except Exception as e:
         logger.error(f"List points failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -14,14 +14,9 @@ from typing import Optional, Dict, Any, List
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 # Pydantic models
@@ -70,22 +65,12 @@ class CameraRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-rendering", tags=["solidworks-rendering"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Lighting
 # =============================================================================
 
 @router.get("/lights")
+@com_route()
 async def list_lights():
     """
     List all lights in the scene.
@@ -128,11 +113,10 @@ async def list_lights():
     except Exception as e:
         logger.error(f"List lights failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/light/add")
+@com_route()
 async def add_light(request: AddLightRequest):
     """
     Add a light to the scene.
@@ -172,11 +156,10 @@ async def add_light(request: AddLightRequest):
     except Exception as e:
         logger.error(f"Add light failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/ambient")
+@com_route()
 async def set_ambient_light(intensity: float = 0.5, color_rgb: List[int] = [255, 255, 255]):
     """
     Set ambient light properties.
@@ -205,8 +188,6 @@ async def set_ambient_light(intensity: float = 0.5, color_rgb: List[int] = [255,
     except Exception as e:
         logger.error(f"Set ambient light failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -237,6 +218,7 @@ async def list_available_scenes():
 
 
 @router.post("/scene/set")
+@com_route()
 async def set_scene(request: SetSceneRequest):
     """
     Set the scene/environment for rendering.
@@ -262,8 +244,6 @@ async def set_scene(request: SetSceneRequest):
     except Exception as e:
         logger.error(f"Set scene failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -271,6 +251,7 @@ async def set_scene(request: SetSceneRequest):
 # =============================================================================
 
 @router.post("/camera/set")
+@com_route()
 async def set_camera(request: CameraRequest):
     """
     Set camera position and orientation.
@@ -304,11 +285,10 @@ async def set_camera(request: CameraRequest):
     except Exception as e:
         logger.error(f"Set camera failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/camera")
+@com_route()
 async def get_camera():
     """
     Get current camera/view settings.
@@ -337,8 +317,6 @@ async def get_camera():
     except Exception as e:
         logger.error(f"Get camera failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -346,6 +324,7 @@ async def get_camera():
 # =============================================================================
 
 @router.post("/capture")
+@com_route()
 async def capture_image(request: CaptureImageRequest):
     """
     Capture current view as image (screenshot).
@@ -382,11 +361,10 @@ async def capture_image(request: CaptureImageRequest):
     except Exception as e:
         logger.error(f"Capture image failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/render")
+@com_route()
 async def render_image(request: RenderRequest):
     """
     Render high-quality image using PhotoView 360.
@@ -424,8 +402,6 @@ async def render_image(request: RenderRequest):
     except Exception as e:
         logger.error(f"Render image failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -433,6 +409,7 @@ async def render_image(request: RenderRequest):
 # =============================================================================
 
 @router.post("/decal/add")
+@com_route()
 async def add_decal(request: AddDecalRequest):
     """
     Add a decal (image) to a face.
@@ -473,11 +450,10 @@ async def add_decal(request: AddDecalRequest):
     except Exception as e:
         logger.error(f"Add decal failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/decals")
+@com_route()
 async def list_decals():
     """
     List all decals in the document.
@@ -508,11 +484,10 @@ async def list_decals():
     except Exception as e:
         logger.error(f"List decals failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/decal/{decal_name}")
+@com_route()
 async def delete_decal(decal_name: str):
     """
     Delete a decal.
@@ -532,8 +507,6 @@ async def delete_decal(decal_name: str):
     except Exception as e:
         logger.error(f"Delete decal failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
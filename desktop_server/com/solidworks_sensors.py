@@ -15,14 +15,9 @@ from enum import IntEnum
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class SensorType(IntEnum):
@@ -73,22 +68,12 @@ class SetAlertRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-sensors", tags=["solidworks-sensors"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-    pythoncom.CoInitialize()
-    try:
-        return win32com.client.GetActiveObject("SldWorks.Application")
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Sensor Management
 # =============================================================================
 
 @router.get("/list")
+@com_route()
 async def list_sensors():
     """
     List all sensors in the active document.
@@ -128,11 +113,10 @@ async def list_sensors():
     except Exception as e:
         logger.error(f"List sensors failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/mass")
+@com_route()
 async def create_mass_sensor(request: CreateMassSensorRequest):
     """
     Create a mass property sensor.
@@ -188,11 +172,10 @@ async def create_mass_sensor(request: CreateMassSensorRequest):
     except Exception as e:
         logger.error(f"Create mass sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension")
+@com_route()
 async def create_dimension_sensor(request: CreateDimensionSensorRequest):
     """
     Create a dimension sensor to monitor a dimension value.
@@ -232,11 +215,10 @@ async def create_dimension_sensor(request: CreateDimensionSensorRequest):
     except Exception as e:
         logger.error(f"Create dimension sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/measurement")
+@com_route()
 async def create_measurement_sensor(request: CreateMeasurementSensorRequest):
     """
     Create a measurement sensor between entities.
@@ -296,11 +278,10 @@ async def create_measurement_sensor(request: CreateMeasurementSensorRequest):
     except Exception as e:
         logger.error(f"Create measurement sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/interference")
+@com_route()
 async def create_interference_sensor(name: str = "Interference Sensor"):
     """
     Create an interference detection sensor.
@@ -338,8 +319,6 @@ async def create_interference_sensor(name: str = "Interference Sensor"):
     except Exception as e:
         logger.error(f"Create interference sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -347,6 +326,7 @@ async def create_interference_sensor(name: str = "Interference Sensor"):
 # =============================================================================
 
 @router.get("/value/{sensor_name}")
+@com_route()
 async def get_sensor_value(sensor_name: str):
     """
     Get the current value of a sensor.
@@ -380,11 +360,10 @@ async def get_sensor_value(sensor_name: str):
     except Exception as e:
         logger.error(f"Get sensor value failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/values")
+@com_route()
 async def get_all_sensor_values():
     """
     Get values of all sensors.
@@ -423,8 +402,6 @@ async def get_all_sensor_values():
     except Exception as e:
         logger.error(f"Get all sensor values failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -432,6 +409,7 @@ async def get_all_sensor_values():
 # =============================================================================
 
 @router.post("/alert/set")
+@com_route()
 async def set_sensor_alert(request: SetAlertRequest):
     """
     Set an alert on a sensor.
@@ -487,11 +465,10 @@ async def set_sensor_alert(request: SetAlertRequest):
     except Exception as e:
         logger.error(f"Set sensor alert failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/alerts")
+@com_route()
 async def get_triggered_alerts():
     """
     Get all sensors with triggered alerts.
@@ -530,8 +507,6 @@ async def get_triggered_alerts():
     except Exception as e:
         logger.error(f"Get alerts failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -539,6 +514,7 @@ async def get_triggered_alerts():
 # =============================================================================
 
 @router.delete("/{sensor_name}")
+@com_route()
 async def delete_sensor(sensor_name: str):
     """
     Delete a sensor.
@@ -558,11 +534,10 @@ async def delete_sensor(sensor_name: str):
     except Exception as e:
         logger.error(f"Delete sensor failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/update-all")
+@com_route()
 async def update_all_sensors():
     """
     Force update of all sensor values.
@@ -581,8 +556,6 @@ async def update_all_sensors():
     except Exception as e:
         logger.error(f"Update sensors failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -17,15 +17,9 @@ from dataclasses import dataclass
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class CurvatureType(IntEnum):
@@ -110,24 +104,12 @@ class SurfaceQualityRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-surfaces", tags=["solidworks-surfaces"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Curvature Analysis
 # =============================================================================
 
 @router.post("/curvature/analyze")
+@com_route()
 async def analyze_curvature(request: CurvatureAnalysisRequest):
     """
     Perform curvature analysis on selected faces.
@@ -197,11 +179,10 @@ async def analyze_curvature(request: CurvatureAnalysisRequest):
     except Exception as e:
         logger.error(f"Curvature analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/curvature/clear")
+@com_route()
 async def clear_curvature_display():
     """
     Clear curvature analysis display.
@@ -220,8 +201,6 @@ async def clear_curvature_display():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -229,6 +208,7 @@ async def clear_curvature_display():
 # =============================================================================
 
 @router.post("/zebra/enable")
+@com_route()
 async def enable_zebra_stripes(request: ZebraAnalysisRequest):
     """
     Enable zebra stripe analysis for surface continuity checking.
@@ -282,11 +262,10 @@ async def enable_zebra_stripes(request: ZebraAnalysisRequest):
     except Exception as e:
         logger.error(f"Zebra analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/zebra/disable")
+@com_route()
 async def disable_zebra_stripes():
     """
     Disable zebra stripe display.
@@ -305,8 +284,6 @@ async def disable_zebra_stripes():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -314,6 +291,7 @@ async def disable_zebra_stripes():
 # =============================================================================
 
 @router.post("/draft/analyze")
+@com_route()
 async def analyze_draft(request: DraftAnalysisRequest):
     """
     Perform draft analysis for moldability.
@@ -372,11 +350,10 @@ async def analyze_draft(request: DraftAnalysisRequest):
     except Exception as e:
         logger.error(f"Draft analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/draft/clear")
+@com_route()
 async def clear_draft_analysis():
     """
     Clear draft analysis display.
@@ -395,8 +372,6 @@ async def clear_draft_analysis():
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -404,6 +379,7 @@ async def clear_draft_analysis():
 # =============================================================================
 
 @router.post("/undercut/analyze")
+@com_route()
 async def analyze_undercuts(request: UnderCutAnalysisRequest):
     """
     Analyze model for undercuts that prevent mold release.
@@ -452,8 +428,6 @@ async def analyze_undercuts(request: UnderCutAnalysisRequest):
     except Exception as e:
         logger.error(f"Undercut analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -461,6 +435,7 @@ async def analyze_undercuts(request: UnderCutAnalysisRequest):
 # =============================================================================
 
 @router.post("/deviation/analyze")
+@com_route()
 async def analyze_deviation(request: DeviationAnalysisRequest):
     """
     Compare two surfaces/bodies and show deviation.
@@ -507,8 +482,6 @@ async def analyze_deviation(request: DeviationAnalysisRequest):
     except Exception as e:
         logger.error(f"Deviation analysis failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -516,6 +489,7 @@ async def analyze_deviation(request: DeviationAnalysisRequest):
 # =============================================================================
 
 @router.get("/quality/check")
+@com_route()
 async def check_surface_quality():
     """
     Check overall surface quality of the model.
@@ -593,11 +567,10 @@ async def check_surface_quality():
     except Exception as e:
         logger.error(f"Quality check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/continuity/check")
+@com_route()
 async def check_edge_continuity():
     """
     Check continuity across surface edges.
@@ -655,8 +628,6 @@ async def check_edge_continuity():
     except Exception as e:
         logger.error(f"Continuity check failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -664,6 +635,7 @@ async def check_edge_continuity():
 # =============================================================================
 
 @router.get("/info")
+@com_route()
 async def get_surface_info():
     """
     Get summary information about all surfaces in the model.
@@ -731,8 +703,6 @@ async def get_surface_info():
     except Exception as e:
         logger.error(f"Surface info failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -15,15 +15,9 @@ from dataclasses import dataclass
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class ThreadStandard(IntEnum):
@@ -129,24 +123,12 @@ class ThreadCalloutRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-threads", tags=["solidworks-threads"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Cosmetic Threads
 # =============================================================================
 
 @router.post("/cosmetic/add")
+@com_route()
 async def add_cosmetic_thread(request: CosmeticThreadRequest):
     """
     Add cosmetic thread to a circular edge or face.
@@ -231,11 +213,10 @@ async def add_cosmetic_thread(request: CosmeticThreadRequest):
     except Exception as e:
         logger.error(f"Add cosmetic thread failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/cosmetic/list")
+@com_route()
 async def list_cosmetic_threads():
     """
     List all cosmetic threads in active document.
@@ -272,11 +253,10 @@ async def list_cosmetic_threads():
     except Exception as e:
         logger.error(f"List threads failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.delete("/cosmetic/{thread_name}")
+@com_route()
 async def delete_cosmetic_thread(thread_name: str):
     """
     Delete a cosmetic thread by name.
@@ -299,8 +279,6 @@ async def delete_cosmetic_thread(thread_name: str):
     except Exception as e:
         logger.error(f"Delete thread failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -308,6 +286,7 @@ async def delete_cosmetic_thread(thread_name: str):
 # =============================================================================
 
 @router.post("/helix/create")
+@com_route()
 async def create_helix(request: HelixRequest):
     """
     Create a helix/spiral curve.
@@ -374,11 +353,10 @@ async def create_helix(request: HelixRequest):
     except Exception as e:
         logger.error(f"Create helix failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/spiral/create")
+@com_route()
 async def create_spiral(request: SpiralRequest):
     """
     Create a flat or conical spiral.
@@ -429,8 +407,6 @@ async def create_spiral(request: SpiralRequest):
     except Exception as e:
         logger.error(f"Create spiral failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 # =============================================================================
@@ -16,15 +16,9 @@ from dataclasses import dataclass, field
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel
 
-logger = logging.getLogger(__name__)
+from .com_executor import com_route, get_solidworks
 
-# COM imports
-try:
-    import win32com.client
-    import pythoncom
-    COM_AVAILABLE = True
-except ImportError:
-    COM_AVAILABLE = False
+logger = logging.getLogger(__name__)
 
 
 class ToleranceType(IntEnum):
@@ -146,24 +140,12 @@ class HoleFitRequest(BaseModel):
 router = APIRouter(prefix="/solidworks-tolerances", tags=["solidworks-tolerances"])
 
 
-def get_solidworks():
-    """Get active SolidWorks application."""
-    if not COM_AVAILABLE:
-        raise HTTPException(status_code=501, detail="COM not available")
-
-    pythoncom.CoInitialize()
-    try:
-        sw = win32com.client.GetActiveObject("SldWorks.Application")
-        return sw
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"SolidWorks not running: {e}")
-
-
 # =============================================================================
 # Dimensional Tolerances
 # =============================================================================
 
 @router.post("/dimension/tolerance")
+@com_route()
 async def set_dimension_tolerance(request: SetToleranceRequest):
     """
     Set tolerance on a dimension.
@@ -224,11 +206,10 @@ async def set_dimension_tolerance(request: SetToleranceRequest):
     except Exception as e:
         logger.error(f"Set tolerance failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/dimension/{name}/tolerance")
+@com_route()
 async def get_dimension_tolerance(name: str):
     """
     Get current tolerance values for a dimension.
@@ -271,8 +252,6 @@ async def get_dimension_tolerance(name: str):
     except Exception as e:
         logger.error(f"Get tolerance failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/dimension/fit")
@@ -368,6 +347,7 @@ async def set_fit_tolerance(request: HoleFitRequest):
 # =============================================================================
 
 @router.post("/gdt/add")
+@com_route()
 async def add_geometric_tolerance(request: AddGDTRequest):
     """
     Add GD&T feature control frame to selected feature.
@@ -444,11 +424,10 @@ async def add_geometric_tolerance(request: AddGDTRequest):
     except Exception as e:
         logger.error(f"Add GDT failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.post("/datum/add")
+@com_route()
 async def add_datum_feature(request: AddDatumRequest):
     """
     Add datum feature symbol to selected geometry.
@@ -480,8 +459,6 @@ async def add_datum_feature(request: AddDatumRequest):
     except Exception as e:
         logger.error(f"Add datum failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 @router.get("/gdt/characteristics")
@@ -685,6 +662,7 @@ async def one_dimensional_chain_analysis(dimensions: List[Dict[str, Any]]):
 # =============================================================================
 
 @router.get("/report")
+@com_route()
 async def get_tolerance_report():
     """
     Generate tolerance report for active document.
@@ -732,8 +710,6 @@ async def get_tolerance_report():
     except Exception as e:
         logger.error(f"Tolerance report failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
-    finally:
-        pythoncom.CoUninitialize()
 
 
 __all__ = ["router"]
@@ -0,0 +1,427 @@
+"""
+Command Queue
+=============
+In-process dispatch and priority scheduling for queued commands.
+
+Commands posted to /queue/add used to be replayed as HTTP POSTs back to
+this server, paying JSON encoding, the middleware stack and a socket
+round-trip each. Here ``type/action`` resolves straight to the route's
+endpoint function, validated with the same pydantic models FastAPI uses.
+
+Scheduling:
+- lower ``priority`` runs first (0 = high, 1 = normal); FIFO within a level
+- UI-driving types (mouse, keyboard, SolidWorks/Inventor COM) share one
+  input lane: one batch at a time, strictly in queue order across types
+- per-type concurrency limits for everything else
+- consecutive input commands of one type are drained as a batch; the kill
+  switch is still checked before every command, and once it trips the
+  rest of the batch is skipped
+- wait/run latency is tracked for /queue/status
+
+Usage:
+    dispatcher = CommandDispatcher()
+    dispatcher.register_app_routes(app)
+    scheduler = CommandScheduler(dispatcher, should_skip=lambda: kill_switch.active)
+    await scheduler.put("mouse", "move", {"x": 10, "y": 20}, priority=0)
+    task = asyncio.create_task(scheduler.run())
+"""
+
+import asyncio
+import heapq
+import inspect
+import itertools
+import logging
+import time
+from collections import defaultdict, deque
+from copy import deepcopy
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional, Tuple
+
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger("vulcan.command_queue")
+
+CommandHandler = Callable[[Dict[str, Any]], Awaitable[Any]]
+
+# Types that drive the physical mouse/keyboard: consecutive ones are batched
+INPUT_TYPES = ("mouse", "keyboard")
+
+# Types that drive the UI: share one lane, one batch at a time, in queue order
+INPUT_LANE_TYPES = INPUT_TYPES + ("solidworks", "inventor")
+
+DEFAULT_CONCURRENCY = {
+    "screen": 2,
+    "window": 2,
+}
+
+
+class UnknownCommandError(LookupError):
+    """No handler is registered for a command's type/action."""
+
+
+@dataclass(order=True)
+class QueuedCommand:
+    """A command waiting in the scheduler (ordered by priority, then arrival)."""
+    priority: int
+    seq: int
+    type: str = field(compare=False)
+    action: str = field(compare=False)
+    params: Dict[str, Any] = field(compare=False, default_factory=dict)
+    enqueued_at: float = field(compare=False, default_factory=time.perf_counter)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"type": self.type, "action": self.action, "params": self.params, "priority": self.priority}
+
+
+class CommandDispatcher:
+    """Resolves ``type/action`` to a handler and calls it in-process."""
+
+    def __init__(self):
+        self._handlers: Dict[Tuple[str, str], CommandHandler] = {}
+
+    def register(self, command_type: str, action: str, handler: CommandHandler):
+        """Register an async handler taking the command's params dict."""
+        self._handlers[(command_type, action)] = handler
+
+    def register_app_routes(self, app) -> int:
+        """
+        Register every ``POST /{type}/{action}`` route of a FastAPI app.
+
+        Routes with dependencies are skipped; they need a real request.
+
+        Returns:
+            Number of routes registered
+        """
+        count = 0
+        for path, route in _iter_api_routes(app.routes):
+            if "POST" not in route.methods:
+                continue
+            parts = path.strip("/").split("/")
+            if len(parts) != 2 or "{" in path or route.dependant.dependencies:
+                continue
+            self.register(parts[0], parts[1], _route_handler(route))
+            count += 1
+        return count
+
+    def resolve(self, command_type: str, action: str) -> CommandHandler:
+        handler = self._handlers.get((command_type, action))
+        if handler is None:
+            raise UnknownCommandError(f"No command handler for {command_type}/{action}")
+        return handler
+
+    def has(self, command_type: str, action: str) -> bool:
+        return (command_type, action) in self._handlers
+
+    async def dispatch(self, command_type: str, action: str, params: Dict[str, Any]) -> Any:
+        """Run a command and return its result, raising on failure."""
+        return await self.resolve(command_type, action)(params)
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+
+def _iter_api_routes(routes, prefix: str = ""):
+    """Yield (full path, APIRoute), descending into lazily included routers."""
+    for route in routes:
+        if isinstance(route, APIRoute):
+            yield prefix + route.path, route
+            continue
+        included = getattr(route, "original_router", None)  # FastAPI >= 0.140
+        if included is None:
+            continue
+        context = getattr(route, "include_context", None)
+        if context is not None and getattr(context, "dependencies", None):
+            continue
+        yield from _iter_api_routes(included.routes, prefix + getattr(context, "prefix", ""))
+
+
+def _route_handler(route: APIRoute) -> CommandHandler:
+    """Build a handler that validates params like FastAPI would and calls the endpoint."""
+    dependant = route.dependant
+    body_fields = dependant.body_params
+    embed = len(body_fields) > 1 or any(getattr(f.field_info, "embed", False) for f in body_fields)
+    plain_fields = dependant.query_params + dependant.header_params + dependant.cookie_params
+    endpoint = dependant.call
+    is_async = inspect.iscoroutinefunction(endpoint)
+
+    def bind(params: Dict[str, Any]) -> Dict[str, Any]:
+        kwargs, errors = {}, []
+        for model_field in body_fields:
+            if embed:
+                value = params.get(model_field.alias, _MISSING)
+            else:
+                value = params
+            _bind_field(model_field, value, ("body",), kwargs, errors)
+        for model_field in plain_fields:
+            _bind_field(model_field, params.get(model_field.alias, _MISSING), ("query",), kwargs, errors)
+        if errors:
+            raise HTTPException(status_code=422, detail=errors)
+        return kwargs
+
+    async def handler(params: Dict[str, Any]) -> Any:
+        kwargs = bind(params or {})
+        if is_async:
+            return await endpoint(**kwargs)
+        return await run_in_threadpool(endpoint, **kwargs)
+
+    handler.__name__ = f"dispatch_{endpoint.__name__}"
+    return handler
+
+
+_MISSING = object()
+
+
+def _bind_field(model_field, value, loc, kwargs, errors):
+    if value is _MISSING:
+        if model_field.field_info.is_required():
+            errors.append({"loc": loc + (model_field.alias,), "msg": "Field required", "type": "missing"})
+        else:
+            kwargs[model_field.name] = deepcopy(model_field.default)
+        return
+    validated, field_errors = model_field.validate(value, {}, loc=loc + (model_field.alias,))
+    if field_errors:
+        errors.extend(field_errors if isinstance(field_errors, list) else [field_errors])
+    else:
+        kwargs[model_field.name] = validated
+
+
+class _LatencyWindow:
+    """Rolling window of durations in milliseconds."""
+
+    def __init__(self, size: int = 1000):
+        self._samples: Deque[float] = deque(maxlen=size)
+
+    def add(self, seconds: float):
+        self._samples.append(seconds * 1000)
+
+    def summary(self) -> Dict[str, float]:
+        if not self._samples:
+            return {"avg_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0}
+        ordered = sorted(self._samples)
+        return {
+            "avg_ms": round(sum(ordered) / len(ordered), 3),
+            "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+            "max_ms": round(ordered[-1], 3),
+        }
+
+
+class CommandScheduler:
+    """
+    Priority queue and worker for commands.
+
+    Must be used from a single event loop; ``run()`` is the worker.
+    """
+
+    def __init__(
+        self,
+        dispatcher: CommandDispatcher,
+        concurrency: Optional[Dict[str, int]] = None,
+        default_concurrency: int = 4,
+        max_in_flight: int = 8,
+        batch_max: int = 50,
+        should_skip: Callable[[], bool] = lambda: False,
+        on_complete: Optional[Callable[[QueuedCommand, Any], None]] = None,
+    ):
+        """
+        Args:
+            dispatcher: Resolves and runs commands
+            concurrency: Per-type limits on commands running at once
+                (INPUT_LANE_TYPES always run one batch at a time)
+            default_concurrency: Limit for types not in ``concurrency``
+            max_in_flight: Commands (or batches) running at once across all types
+            batch_max: Most input commands drained into one batch
+            should_skip: Checked before every command (kill switch); True skips
+                that command and the rest of its batch. Must be cheap.
+            on_complete: Called with (command, result) after each command
+        """
+        self.dispatcher = dispatcher
+        self.concurrency = {**DEFAULT_CONCURRENCY, **(concurrency or {})}
+        self.default_concurrency = default_concurrency
+        self.batch_max = batch_max
+        self.should_skip = should_skip
+        self.on_complete = on_complete
+
+        self._heap: List[QueuedCommand] = []
+        self._lane_heap: List[QueuedCommand] = []  # INPUT_LANE_TYPES
+        self._lane_busy = False
+        self._seq = itertools.count()
+        self._not_empty: Optional[asyncio.Event] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._max_in_flight = max_in_flight
+        self._type_limits: Dict[str, asyncio.Semaphore] = {}
+        self._tasks: set = set()
+        self._in_flight = 0
+
+        self._wait = _LatencyWindow()
+        self._run = _LatencyWindow()
+        self._stats: Dict[str, int] = defaultdict(int)
+        self._by_type: Dict[str, Dict[str, int]] = defaultdict(lambda: defaultdict(int))
+
+    def _ensure_primitives(self):
+        # Created lazily so they bind to the running loop, not the import-time one
+        if self._not_empty is None:
+            self._not_empty = asyncio.Event()
+            self._slots = asyncio.Semaphore(self._max_in_flight)
+
+    def _heap_for(self, command_type: str) -> List[QueuedCommand]:
+        return self._lane_heap if command_type in INPUT_LANE_TYPES else self._heap
+
+    def _type_limit(self, command_type: str) -> asyncio.Semaphore:
+        limit = self._type_limits.get(command_type)
+        if limit is None:
+            limit = asyncio.Semaphore(self.concurrency.get(command_type, self.default_concurrency))
+            self._type_limits[command_type] = limit
+        return limit
+
+    async def put(self, command_type: str, action: str, params: Optional[Dict[str, Any]] = None,
+                  priority: int = 1) -> QueuedCommand:
+        """Queue a command; raises UnknownCommandError if nothing handles it."""
+        self.dispatcher.resolve(command_type, action)
+        self._ensure_primitives()
+        command = QueuedCommand(priority, next(self._seq), command_type, action, dict(params or {}))
+        heapq.heappush(self._heap_for(command_type), command)
+        self._stats["queued"] += 1
+        self._not_empty.set()
+        return command
+
+    def qsize(self) -> int:
+        return len(self._heap) + len(self._lane_heap)
+
+    def position(self, command: QueuedCommand) -> int:
+        """1-based position of a queued command in run order."""
+        return sum(1 for queued in self._heap + self._lane_heap if queued < command) + 1
+
+    def _next_heap(self) -> Optional[List[QueuedCommand]]:
+        """Heap holding the next command to start, or None if nothing can start."""
+        lane = self._lane_heap if self._lane_heap and not self._lane_busy else None
+        if lane and (not self._heap or lane[0] < self._heap[0]):
+            return lane
+        return self._heap or None
+
+    def _take_batch(self, heap: List[QueuedCommand]) -> List[QueuedCommand]:
+        first = heapq.heappop(heap)
+        batch = [first]
+        if first.type in INPUT_TYPES:
+            while (heap and len(batch) < self.batch_max
+                   and heap[0].type == first.type
+                   and heap[0].priority == first.priority):
+                batch.append(heapq.heappop(heap))
+        return batch
+
+    async def run(self):
+        """
+        Worker loop: pop by priority and start batches within the limits.
+
+        Input-lane commands stay queued while the lane is busy, so they
+        never hold one of the max_in_flight slots while they wait.
+        """
+        self._ensure_primitives()
+        logger.info("Command scheduler started")
+        try:
+            while True:
+                await self._slots.acquire()
+                heap = self._next_heap()
+                while heap is None:
+                    self._not_empty.clear()
+                    await self._not_empty.wait()
+                    heap = self._next_heap()
+                batch = self._take_batch(heap)
+                if heap is self._lane_heap:
+                    self._lane_busy = True
+                task = asyncio.create_task(self._run_batch(batch))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+        except asyncio.CancelledError:
+            for task in list(self._tasks):
+                task.cancel()
+            logger.info("Command scheduler cancelled")
+            raise
+
+    async def _run_batch(self, batch: List[QueuedCommand]):
+        lane = batch[0].type in INPUT_LANE_TYPES
+        try:
+            if lane:
+                await self._execute(batch)
+            else:
+                async with self._type_limit(batch[0].type):
+                    await self._execute(batch)
+        finally:
+            if lane:
+                self._lane_busy = False
+                self._not_empty.set()
+            self._slots.release()
+
+    async def _execute(self, batch: List[QueuedCommand]):
+        self._stats["batches"] += 1
+        for i, command in enumerate(batch):
+            if self.should_skip():
+                for skipped in batch[i:]:
+                    logger.warning(f"Skipping command {skipped.type}/{skipped.action} due to Kill Switch")
+                    self._record(skipped, {"error": "kill switch active"}, "skipped")
+                return
+            await self._run_one(command)
+
+    async def _run_one(self, command: QueuedCommand):
+        started = time.perf_counter()
+        self._wait.add(started - command.enqueued_at)
+        self._in_flight += 1
+        try:
+            result = await self.dispatcher.dispatch(command.type, command.action, command.params)
+            outcome = "completed"
+            logger.info(f"Command {command.type}/{command.action} completed")
+        except HTTPException as e:
+            result = {"error": e.detail, "status_code": e.status_code}
+            outcome = "failed"
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Command {command.type}/{command.action} failed: {e}")
+            result = {"error": str(e)}
+            outcome = "failed"
+        finally:
+            self._in_flight -= 1
+        self._run.add(time.perf_counter() - started)
+        self._record(command, result, outcome)
+
+    def _record(self, command: QueuedCommand, result: Any, outcome: str):
+        self._stats[outcome] += 1
+        self._by_type[command.type][outcome] += 1
+        if self.on_complete:
+            try:
+                self.on_complete(command, result)
+            except Exception as e:
+                logger.error(f"Command completion hook failed: {e}")
+
+    async def join(self, timeout: Optional[float] = None):
+        """Wait until the queue is empty and nothing is running."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while self._heap or self._lane_heap or self._tasks:
+            if deadline is not None and time.monotonic() > deadline:
+                raise asyncio.TimeoutError("command queue did not drain")
+            await asyncio.sleep(0.005)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Queue depth, throughput counters and latency for /queue/status."""
+        by_priority: Dict[int, int] = defaultdict(int)
+        for command in self._heap + self._lane_heap:
+            by_priority[command.priority] += 1
+        batches = self._stats["batches"]
+        return {
+            "size": self.qsize(),
+            "input_lane": {"queued": len(self._lane_heap), "busy": self._lane_busy},
+            "by_priority": dict(sorted(by_priority.items())),
+            "in_flight": self._in_flight,
+            "queued": self._stats["queued"],
+            "completed": self._stats["completed"],
+            "failed": self._stats["failed"],
+            "skipped": self._stats["skipped"],
+            "batches": batches,
+            "avg_batch_size": round((self._stats["completed"] + self._stats["failed"]
+                                     + self._stats["skipped"]) / batches, 2) if batches else 0.0,
+            "queue_wait": self._wait.summary(),
+            "run_time": self._run.summary(),
+            "by_type": {t: dict(v) for t, v in self._by_type.items()},
+            "handlers": len(self.dispatcher),
+        }
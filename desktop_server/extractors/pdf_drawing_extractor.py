@@ -14,6 +14,14 @@ from typing import Dict, List, Any, Optional, Tuple
 from pathlib import Path
 from enum import Enum
 
+try:
+    from agents.cad_agent.extraction_cache import ExtractionCache, get_extraction_cache
+except ImportError:
+    ExtractionCache = None
+    get_extraction_cache = None
+
+from .text_scanner import DrawingTextScanner, ScanRule
+
 logger = logging.getLogger("vulcan.extractor.pdf_drawing")
 
 
@@ -231,11 +239,116 @@ class PDFDrawingExtractor:
         "general_note": re.compile(r'GENERAL\s*NOTE[S]?[:\s]*', re.I),
         "shop_note": re.compile(r'SHOP\s*NOTE[S]?[:\s]*', re.I),
         "weld_note": re.compile(r'WELD(?:ING)?\s*NOTE[S]?[:\s]*', re.I),
+
+        # BOM table rows: ITEM | PART NO | DESCRIPTION | MATERIAL | QTY
+        "bom_row": re.compile(
+            r'^\s*(\d+)\s+'  # Item number
+            r'([A-Z0-9\-]+)\s+'  # Part number
+            r'(.+?)\s+'  # Description
+            r'((?:SA|A|SB)-\d{3}[^\s]*)\s+'  # Material spec
+            r'(\d+)',  # Quantity
+            re.MULTILINE | re.I
+        ),
+
+        # Weld callouts: size, type, modifiers, procedure
+        "weld_callout": re.compile(
+            r'(\d+/\d+|\d+(?:\.\d+)?)\s*(?:"|IN)?\s*'  # Size
+            r'(FILLET|FIL|GROOVE|GRV|PLUG|SLOT|BUTT)\s*'  # Type
+            r'(?:WELD)?\s*'
+            r'(?:(ALL\s*AROUND|FIELD))?\s*'  # Modifiers
+            r'(?:WPS|PROC)?[:\s]*(P\d+[A-Z\-\d]+)?',  # Procedure
+            re.I
+        ),
+
+        # Revision table rows: REV | DATE | DESCRIPTION | BY
+        "revision_row": re.compile(
+            r'^\s*([A-Z]|NC|0)\s+'  # Revision letter/number
+            r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s+'  # Date
+            r'(.+?)\s+'  # Description
+            r'([A-Z]{2,4})',  # By initials
+            re.MULTILINE | re.I
+        ),
+        "ecn": re.compile(r'ECN[:\s#]*(\d+)', re.I),
+
+        # Heat treatment and radiography
+        "pwht": re.compile(r'PWHT\s*(?:REQ|REQUIRED)', re.I),
+        "full_rt": re.compile(r'FULL\s*(?:RT|RADIOGRAPHY)', re.I),
+        "spot_rt": re.compile(r'SPOT\s*(?:RT|RADIOGRAPHY)', re.I),
     }
 
-    def __init__(self, dpi: int = 300):
-        """Initialize the PDF drawing extractor."""
+    # How each pattern is scanned; requires lists keywords the pattern
+    # cannot match without, so absent sections are skipped
+    SCAN_RULES = (
+        ScanRule("part_number_cs", first_only=True, requires=("CS",)),
+        ScanRule("part_number_m", first_only=True, requires=("M",)),
+        ScanRule("part_number_s", first_only=True, requires=("S",)),
+        ScanRule("part_number_generic", first_only=True, requires=("PART",)),
+        ScanRule("revision", first_only=True, requires=("REV",)),
+        ScanRule("customer", first_only=True, requires=("CUSTOMER",)),
+        ScanRule("project", first_only=True, requires=("PROJECT",)),
+        ScanRule("job_number", first_only=True, requires=("JOB", "ORDER")),
+        ScanRule("drawn_by", first_only=True, requires=("DRAWN", "DRN")),
+        ScanRule("checked_by", first_only=True, requires=("CHECKED", "CHK", "CK")),
+        ScanRule("approved_by", first_only=True, requires=("AP",)),
+        ScanRule("date", first_only=True, requires=("DATE",)),
+        ScanRule("scale", first_only=True, requires=("SCALE",)),
+        ScanRule("sheet", first_only=True, requires=("SHEET",)),
+        ScanRule("bom_row", requires=("A-", "SB-")),
+        ScanRule("material_spec", requires=("A-", "B-")),
+        ScanRule("weld_procedure", requires=("P",)),
+        ScanRule("weld_size", requires=("FIL",)),
+        ScanRule("weld_callout", requires=("FIL", "GROOVE", "GRV", "PLUG", "SLOT", "BUTT")),
+        ScanRule("dimension_dual", requires=("[", "(")),
+        ScanRule("dimension_imperial"),
+        ScanRule("revision_row"),
+        ScanRule("ecn", requires=("ECN",)),
+        ScanRule("mawp", first_only=True, requires=("MAWP",)),
+        ScanRule("design_pressure", first_only=True, requires=("DESIGN",)),
+        ScanRule("design_temp", first_only=True, requires=("DESIGN",)),
+        ScanRule("mdmt", first_only=True, requires=("MDMT",)),
+        ScanRule("test_pressure", first_only=True, requires=("HYDRO", "TEST")),
+        ScanRule("corrosion_allowance", first_only=True, requires=("CORR", "CA", "C.A")),
+        ScanRule("design_code", first_only=True, requires=("ASME", "API", "TEMA")),
+        ScanRule("pwht", first_only=True, requires=("PWHT",)),
+        ScanRule("full_rt", first_only=True, requires=("FULL",)),
+        ScanRule("spot_rt", first_only=True, requires=("SPOT",)),
+        ScanRule("numbered_note"),
+        ScanRule("shop_note", first_only=True, requires=("SHOP",)),
+    )
+
+    # Patterns each section builder reads
+    SECTION_RULES = {
+        "drawing_type": ("part_number_cs", "part_number_m", "part_number_s"),
+        "title_block": (
+            "part_number_cs", "part_number_m", "part_number_s", "part_number_generic",
+            "revision", "customer", "project", "job_number", "drawn_by",
+            "checked_by", "approved_by", "date", "scale", "sheet",
+        ),
+        "bom_items": ("bom_row", "material_spec"),
+        "weld_symbols": ("weld_procedure", "weld_size", "weld_callout"),
+        "dimensions": ("dimension_dual", "dimension_imperial"),
+        "revisions": ("revision_row", "ecn"),
+        "design_data": (
+            "mawp", "design_pressure", "design_temp", "mdmt", "test_pressure",
+            "corrosion_allowance", "design_code", "pwht", "full_rt", "spot_rt",
+        ),
+        "notes": ("numbered_note", "shop_note"),
+    }
+
+    def __init__(self, dpi: int = 300, cache: Optional["ExtractionCache"] = None):
+        """
+        Initialize the PDF drawing extractor.
+
+        Args:
+            dpi: Rasterization resolution for OCR
+            cache: Extraction cache (default: the shared one). Pass
+                ExtractionCache(cache_dir=None) to extract without caching.
+        """
         self.dpi = dpi
+        self.scanner = DrawingTextScanner(self.PATTERNS, self.SCAN_RULES)
+        self.cache = cache
+        if self.cache is None and get_extraction_cache is not None:
+            self.cache = get_extraction_cache()
         self._ocr_available = False
         self._pypdf_available = False
         self._check_dependencies()
@@ -289,24 +402,27 @@ class PDFDrawingExtractor:
             result.extraction_errors.append("Failed to extract text from PDF")
             return result
 
-        # Detect drawing type
-        result.drawing_type = self._detect_drawing_type(raw_text)
-
-        # Extract all components
-        result.title_block = self._extract_title_block(raw_text)
+        sections = self._extract_sections(raw_text)
+        result.drawing_type = sections["drawing_type"]
+        result.title_block = sections["title_block"]
         result.title_block.drawing_type = result.drawing_type
-
-        result.bom_items = self._extract_bom(raw_text)
-        result.weld_symbols = self._extract_weld_symbols(raw_text)
-        result.dimensions = self._extract_dimensions(raw_text)
-        result.revisions = self._extract_revisions(raw_text)
-        result.design_data = self._extract_design_data(raw_text)
-        result.notes = self._extract_notes(raw_text)
+        result.bom_items = sections["bom_items"]
+        result.weld_symbols = sections["weld_symbols"]
+        result.dimensions = sections["dimensions"]
+        result.revisions = sections["revisions"]
+        result.design_data = sections["design_data"]
+        result.notes = sections["notes"]
 
         return result
 
     def _extract_text_pypdf(self, pdf_path: str, result: DrawingExtractionResult) -> str:
         """Extract text using pypdf."""
+        if self.cache is not None:
+            record = self.cache.get_record(pdf_path)
+            if record is not None:
+                result.page_count = record.page_count
+                return record.text
+
         try:
             import pypdf
             reader = pypdf.PdfReader(pdf_path)
@@ -329,6 +445,20 @@ class PDFDrawingExtractor:
             from pdf2image import convert_from_path
             import pytesseract
 
+            if self.cache is not None and result.page_count:
+                def run_ocr(pages: List[int]) -> Dict[int, str]:
+                    texts = {}
+                    for n in pages:
+                        for img in convert_from_path(pdf_path, dpi=self.dpi, first_page=n, last_page=n):
+                            texts[n] = pytesseract.image_to_string(img)
+                            img.close()
+                        logger.debug(f"OCR page {n}: {len(texts.get(n, ''))} chars")
+                    return texts
+
+                pages = range(1, result.page_count + 1)
+                texts = self.cache.get_ocr(pdf_path, pages, self.dpi, run_ocr)
+                return "\n".join(texts.get(n, "") for n in pages)
+
             images = convert_from_path(pdf_path, dpi=self.dpi)
             result.page_count = len(images)
 
@@ -344,95 +474,139 @@ class PDFDrawingExtractor:
             result.extraction_errors.append(f"OCR error: {str(e)}")
             return ""
 
+    def _extract_sections(self, text: str) -> Dict[str, Any]:
+        """Scan the text once and build every section from the matches."""
+        matches = self.scanner.scan(text)
+        return {
+            "drawing_type": self._build_drawing_type(matches),
+            "title_block": self._build_title_block(matches),
+            "bom_items": self._build_bom(matches),
+            "weld_symbols": self._build_weld_symbols(matches),
+            "dimensions": self._build_dimensions(matches),
+            "revisions": self._build_revisions(matches),
+            "design_data": self._build_design_data(matches),
+            "notes": self._build_notes(matches, text),
+        }
+
+    def _scan_section(self, text: str, section: str) -> Dict[str, List[re.Match]]:
+        return self.scanner.scan(text, self.SECTION_RULES[section])
+
     def _detect_drawing_type(self, text: str) -> DrawingType:
         """Detect the drawing type from part number prefix."""
-        if self.PATTERNS["part_number_cs"].search(text):
+        return self._build_drawing_type(self._scan_section(text, "drawing_type"))
+
+    def _extract_title_block(self, text: str) -> TitleBlockData:
+        """Extract title block information."""
+        return self._build_title_block(self._scan_section(text, "title_block"))
+
+    def _extract_bom(self, text: str) -> List[BOMItem]:
+        """Extract BOM (Bill of Materials) items."""
+        return self._build_bom(self._scan_section(text, "bom_items"))
+
+    def _extract_weld_symbols(self, text: str) -> List[WeldSymbol]:
+        """Extract weld symbols and specifications."""
+        return self._build_weld_symbols(self._scan_section(text, "weld_symbols"))
+
+    def _extract_dimensions(self, text: str) -> List[Dimension]:
+        """Extract dimensions with imperial and metric values."""
+        return self._build_dimensions(self._scan_section(text, "dimensions"))
+
+    def _extract_revisions(self, text: str) -> List[RevisionEntry]:
+        """Extract revision history entries."""
+        return self._build_revisions(self._scan_section(text, "revisions"))
+
+    def _extract_design_data(self, text: str) -> DesignData:
+        """Extract pressure vessel design data."""
+        return self._build_design_data(self._scan_section(text, "design_data"))
+
+    def _extract_notes(self, text: str) -> GeneralNotes:
+        """Extract general and shop notes."""
+        return self._build_notes(self._scan_section(text, "notes"), text)
+
+    # -------------------------------------------------------------------------
+    # Section builders (consume scanner matches)
+    # -------------------------------------------------------------------------
+
+    @staticmethod
+    def _first(matches: Dict[str, List[re.Match]], name: str) -> Optional[re.Match]:
+        found = matches[name]
+        return found[0] if found else None
+
+    def _build_drawing_type(self, matches: Dict[str, List[re.Match]]) -> DrawingType:
+        if matches["part_number_cs"]:
             return DrawingType.SHIPPING
-        elif self.PATTERNS["part_number_m"].search(text):
+        elif matches["part_number_m"]:
             return DrawingType.HEADER
-        elif self.PATTERNS["part_number_s"].search(text):
+        elif matches["part_number_s"]:
             return DrawingType.STRUCTURE
         return DrawingType.UNKNOWN
 
-    def _extract_title_block(self, text: str) -> TitleBlockData:
-        """Extract title block information."""
+    def _build_title_block(self, matches: Dict[str, List[re.Match]]) -> TitleBlockData:
         tb = TitleBlockData()
 
         # Part number - try specific patterns first
         for pattern_name in ["part_number_cs", "part_number_m", "part_number_s", "part_number_generic"]:
-            match = self.PATTERNS[pattern_name].search(text)
+            match = self._first(matches, pattern_name)
             if match:
                 tb.part_number = match.group(0).upper()
                 break
 
         # Revision
-        match = self.PATTERNS["revision"].search(text)
+        match = self._first(matches, "revision")
         if match:
             tb.revision = match.group(1).upper()
 
         # Customer
-        match = self.PATTERNS["customer"].search(text)
+        match = self._first(matches, "customer")
         if match:
             tb.customer = match.group(1).strip()
 
         # Project
-        match = self.PATTERNS["project"].search(text)
+        match = self._first(matches, "project")
         if match:
             tb.project = match.group(1).strip()
 
         # Job number
-        match = self.PATTERNS["job_number"].search(text)
+        match = self._first(matches, "job_number")
         if match:
             tb.job_number = match.group(1).strip()
 
         # Drawn by
-        match = self.PATTERNS["drawn_by"].search(text)
+        match = self._first(matches, "drawn_by")
         if match:
             tb.drawn_by = match.group(1).upper()
 
         # Checked by
-        match = self.PATTERNS["checked_by"].search(text)
+        match = self._first(matches, "checked_by")
         if match:
             tb.checked_by = match.group(1).upper()
 
         # Approved by
-        match = self.PATTERNS["approved_by"].search(text)
+        match = self._first(matches, "approved_by")
         if match:
             tb.approved_by = match.group(1).upper()
 
         # Date
-        match = self.PATTERNS["date"].search(text)
+        match = self._first(matches, "date")
         if match:
             tb.drawing_date = match.group(1)
 
         # Scale
-        match = self.PATTERNS["scale"].search(text)
+        match = self._first(matches, "scale")
         if match:
             tb.scale = match.group(1).upper()
 
         # Sheet
-        match = self.PATTERNS["sheet"].search(text)
+        match = self._first(matches, "sheet")
         if match:
             tb.sheet = f"{match.group(1)} OF {match.group(2)}"
 
         return tb
 
-    def _extract_bom(self, text: str) -> List[BOMItem]:
-        """Extract BOM (Bill of Materials) items."""
+    def _build_bom(self, matches: Dict[str, List[re.Match]]) -> List[BOMItem]:
         bom_items = []
 
-        # Look for BOM table patterns
-        # Typical format: ITEM | PART NO | DESCRIPTION | MATERIAL | QTY
-        bom_pattern = re.compile(
-            r'^\s*(\d+)\s+'  # Item number
-            r'([A-Z0-9\-]+)\s+'  # Part number
-            r'(.+?)\s+'  # Description
-            r'((?:SA|A|SB)-\d{3}[^\s]*)\s+'  # Material spec
-            r'(\d+)',  # Quantity
-            re.MULTILINE | re.I
-        )
-
-        for match in bom_pattern.finditer(text):
+        for match in matches["bom_row"]:
             item = BOMItem()
             item.item_number = int(match.group(1))
             item.part_number = match.group(2).upper()
@@ -446,15 +620,17 @@ class PDFDrawingExtractor:
             bom_items.append(item)
 
         # Also extract individual material specs from text
-        for match in self.PATTERNS["material_spec"].finditer(text):
+        seen_specs = {item.material_spec for item in bom_items}
+        for match in matches["material_spec"]:
             spec = match.group(0).upper()
             # Check if this spec is already in a BOM item
-            if not any(item.material_spec == spec for item in bom_items):
+            if spec not in seen_specs:
                 # Create a "found material" entry
                 item = BOMItem()
                 item.material_spec = spec
                 item.material = self._parse_material_spec(spec)
                 bom_items.append(item)
+                seen_specs.add(spec)
 
         return bom_items
 
@@ -485,34 +661,24 @@ class PDFDrawingExtractor:
 
         return spec_upper
 
-    def _extract_weld_symbols(self, text: str) -> List[WeldSymbol]:
-        """Extract weld symbols and specifications."""
+    def _build_weld_symbols(self, matches: Dict[str, List[re.Match]]) -> List[WeldSymbol]:
         welds = []
 
-        # Find weld procedures
-        for match in self.PATTERNS["weld_procedure"].finditer(text):
+        # Weld procedures
+        for match in matches["weld_procedure"]:
             weld = WeldSymbol()
             weld.procedure = match.group(1).upper()
             welds.append(weld)
 
-        # Find weld sizes
-        for match in self.PATTERNS["weld_size"].finditer(text):
+        # Weld sizes
+        for match in matches["weld_size"]:
             weld = WeldSymbol()
             weld.size = match.group(1)
             weld.weld_type = "FILLET"
             welds.append(weld)
 
-        # Look for specific weld callouts
-        weld_callout = re.compile(
-            r'(\d+/\d+|\d+(?:\.\d+)?)\s*(?:"|IN)?\s*'  # Size
-            r'(FILLET|FIL|GROOVE|GRV|PLUG|SLOT|BUTT)\s*'  # Type
-            r'(?:WELD)?\s*'
-            r'(?:(ALL\s*AROUND|FIELD))?\s*'  # Modifiers
-            r'(?:WPS|PROC)?[:\s]*(P\d+[A-Z\-\d]+)?',  # Procedure
-            re.I
-        )
-
-        for match in weld_callout.finditer(text):
+        # Specific weld callouts
+        for match in matches["weld_callout"]:
             weld = WeldSymbol()
             weld.size = match.group(1)
             weld.weld_type = match.group(2).upper()
@@ -526,12 +692,11 @@ class PDFDrawingExtractor:
 
         return welds
 
-    def _extract_dimensions(self, text: str) -> List[Dimension]:
-        """Extract dimensions with imperial and metric values."""
+    def _build_dimensions(self, matches: Dict[str, List[re.Match]]) -> List[Dimension]:
         dimensions = []
 
         # Dual dimension pattern (imperial [metric])
-        for match in self.PATTERNS["dimension_dual"].finditer(text):
+        for match in matches["dimension_dual"]:
             dim = Dimension()
             dim.value_imperial = float(match.group(1))
             dim.value_metric = float(match.group(2))
@@ -540,7 +705,7 @@ class PDFDrawingExtractor:
             dimensions.append(dim)
 
         # Single imperial dimensions
-        for match in self.PATTERNS["dimension_imperial"].finditer(text):
+        for match in matches["dimension_imperial"]:
             dim = Dimension()
             dim.value_imperial = float(match.group(1))
             dim.value_metric = dim.value_imperial * 25.4  # Convert to mm
@@ -551,21 +716,10 @@ class PDFDrawingExtractor:
 
         return dimensions
 
-    def _extract_revisions(self, text: str) -> List[RevisionEntry]:
-        """Extract revision history entries."""
+    def _build_revisions(self, matches: Dict[str, List[re.Match]]) -> List[RevisionEntry]:
         revisions = []
 
-        # Look for revision table pattern
-        # REV | DATE | DESCRIPTION | BY
-        rev_pattern = re.compile(
-            r'^\s*([A-Z]|NC|0)\s+'  # Revision letter/number
-            r'(\d{1,2}[-/]\d{1,2}[-/]\d{2,4})\s+'  # Date
-            r'(.+?)\s+'  # Description
-            r'([A-Z]{2,4})',  # By initials
-            re.MULTILINE | re.I
-        )
-
-        for match in rev_pattern.finditer(text):
+        for match in matches["revision_row"]:
             rev = RevisionEntry()
             rev.revision = match.group(1).upper()
             rev.date = match.group(2)
@@ -573,74 +727,71 @@ class PDFDrawingExtractor:
             rev.by = match.group(4).upper()
             revisions.append(rev)
 
-        # Look for ECN numbers
-        ecn_pattern = re.compile(r'ECN[:\s#]*(\d+)', re.I)
-        for i, match in enumerate(ecn_pattern.finditer(text)):
+        # ECN numbers, in table order
+        for i, match in enumerate(matches["ecn"]):
             if i < len(revisions):
                 revisions[i].ecn_number = match.group(1)
 
         return revisions
 
-    def _extract_design_data(self, text: str) -> DesignData:
-        """Extract pressure vessel design data."""
+    def _build_design_data(self, matches: Dict[str, List[re.Match]]) -> DesignData:
         data = DesignData()
 
         # MAWP
-        match = self.PATTERNS["mawp"].search(text)
+        match = self._first(matches, "mawp")
         if match:
             data.mawp_psi = float(match.group(1))
             data.mawp_bar = data.mawp_psi * 0.0689476
 
         # Design pressure
-        match = self.PATTERNS["design_pressure"].search(text)
+        match = self._first(matches, "design_pressure")
         if match:
             data.design_pressure_psi = float(match.group(1))
 
         # Design temperature
-        match = self.PATTERNS["design_temp"].search(text)
+        match = self._first(matches, "design_temp")
         if match:
             data.design_temperature_f = float(match.group(1))
             data.design_temperature_c = (data.design_temperature_f - 32) * 5/9
 
         # MDMT
-        match = self.PATTERNS["mdmt"].search(text)
+        match = self._first(matches, "mdmt")
         if match:
             data.mdmt_f = float(match.group(1))
             data.mdmt_c = (data.mdmt_f - 32) * 5/9
 
         # Test pressure
-        match = self.PATTERNS["test_pressure"].search(text)
+        match = self._first(matches, "test_pressure")
         if match:
             data.test_pressure_psi = float(match.group(1))
 
         # Corrosion allowance
-        match = self.PATTERNS["corrosion_allowance"].search(text)
+        match = self._first(matches, "corrosion_allowance")
         if match:
             data.corrosion_allowance_in = float(match.group(1))
 
         # Design code
-        match = self.PATTERNS["design_code"].search(text)
+        match = self._first(matches, "design_code")
         if match:
             data.design_code = match.group(0).upper()
 
-        # Check for PWHT requirement
-        if re.search(r'PWHT\s*(?:REQ|REQUIRED)', text, re.I):
+        # PWHT requirement
+        if matches["pwht"]:
             data.pwht_required = True
 
-        # Check for radiography
-        if re.search(r'FULL\s*(?:RT|RADIOGRAPHY)', text, re.I):
+        # Radiography
+        if matches["full_rt"]:
             data.radiography = "FULL"
-        elif re.search(r'SPOT\s*(?:RT|RADIOGRAPHY)', text, re.I):
+        elif matches["spot_rt"]:
             data.radiography = "SPOT"
 
         return data
 
-    def _extract_notes(self, text: str) -> GeneralNotes:
-        """Extract general and shop notes."""
+    def _build_notes(self, matches: Dict[str, List[re.Match]], text: str) -> GeneralNotes:
         notes = GeneralNotes()
 
-        # Find all numbered notes
-        for match in self.PATTERNS["numbered_note"].finditer(text):
+        # Numbered notes
+        for match in matches["numbered_note"]:
             note_text = match.group(2).strip()
             note_lower = note_text.lower()
 
@@ -656,8 +807,8 @@ class PDFDrawingExtractor:
             else:
                 notes.general_notes.append(note_text)
 
-        # Look for specific note sections
-        shop_match = self.PATTERNS["shop_note"].search(text)
+        # Shop note section
+        shop_match = self._first(matches, "shop_note")
         if shop_match:
             # Get text after "SHOP NOTES:" until next section
             start = shop_match.end()
@@ -741,3 +892,19 @@ class PDFDrawingExtractor:
             "extraction_errors": result.extraction_errors,
             "extraction_warnings": result.extraction_warnings,
         }
+
+
+def extract_pdf(pdf_path: str) -> Dict[str, Any]:
+    """
+    Extract a PDF drawing and return results as dictionary.
+
+    Module-level so it can run as a process-pool job.
+
+    Args:
+        pdf_path: Path to the PDF file
+
+    Returns:
+        Dictionary with extracted drawing data
+    """
+    extractor = PDFDrawingExtractor()
+    return extractor.to_dict(extractor.extract(pdf_path))
@@ -0,0 +1,82 @@
+"""
+Drawing Text Scanner
+====================
+Run the drawing extraction patterns over a text and hand the matches to
+the section builders.
+
+Every pattern is still its own search()/finditer() over the whole text.
+What the scanner adds is keyword gating: patterns that need a keyword
+(MAWP, FILLET, ECN, ...) are skipped when none of their keywords occurs in
+the text, so a section the drawing does not have costs a substring check
+instead of a regex scan. Ungated patterns cost the same as before. Results
+are the same as calling ``search``/``finditer`` on each pattern directly.
+"""
+
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Pattern, Sequence, Tuple
+
+logger = logging.getLogger("vulcan.extractor.text_scanner")
+
+
+@dataclass(frozen=True)
+class ScanRule:
+    """How one pattern is scanned."""
+    name: str
+    first_only: bool = False  # True = search(), False = finditer()
+    requires: Tuple[str, ...] = ()  # Uppercase keywords, one must occur in the text
+
+
+class DrawingTextScanner:
+    """
+    Runs a fixed set of compiled patterns over drawing text.
+
+    Usage:
+        scanner = DrawingTextScanner(PATTERNS, rules)
+        matches = scanner.scan(text)
+        mawp = matches["mawp"][0] if matches["mawp"] else None
+    """
+
+    def __init__(self, patterns: Dict[str, Pattern], rules: Sequence[ScanRule]):
+        missing = [rule.name for rule in rules if rule.name not in patterns]
+        if missing:
+            raise ValueError(f"No pattern for scan rules: {missing}")
+        self.patterns = patterns
+        self.rules = {rule.name: rule for rule in rules}
+
+    def scan(
+        self,
+        text: str,
+        names: Optional[Iterable[str]] = None,
+    ) -> Dict[str, List[re.Match]]:
+        """
+        Run the given patterns over the text, skipping gated ones whose
+        keywords are absent.
+
+        Args:
+            text: Drawing text
+            names: Rule names to scan (default: all rules)
+
+        Returns:
+            Rule name -> matches (at most one for first_only rules)
+        """
+        # Keyword gates are only exact for ASCII text: under re.I some
+        # non-ASCII characters match ASCII letters that str.upper() keeps apart
+        upper = text.upper() if text.isascii() else None
+        results: Dict[str, List[re.Match]] = {}
+
+        for name in (self.rules if names is None else names):
+            rule = self.rules[name]
+            if upper is not None and rule.requires and not any(kw in upper for kw in rule.requires):
+                results[name] = []
+                continue
+
+            pattern = self.patterns[name]
+            if rule.first_only:
+                match = pattern.search(text)
+                results[name] = [match] if match else []
+            else:
+                results[name] = list(pattern.finditer(text))
+
+        return results
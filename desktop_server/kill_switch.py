@@ -0,0 +1,135 @@
+"""
+Kill Switch
+===========
+Mouse-in-corner emergency stop, sampled on a background thread.
+
+Requests and queued commands read ``KillSwitch.active`` (a flag) instead
+of querying the cursor position themselves. The sampler trips the switch
+when the cursor enters the top-left corner; it stays tripped until a reset
+is requested while the cursor is away from the corner.
+
+Usage:
+    kill_switch = KillSwitch(pyautogui.position)
+    kill_switch.start()
+    if kill_switch.active:
+        ...
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+logger = logging.getLogger("vulcan.kill_switch")
+
+
+class KillSwitch:
+    """Background-sampled emergency stop."""
+
+    def __init__(
+        self,
+        position: Callable[[], Tuple[int, int]],
+        interval: float = 0.05,
+        corner: int = 10,
+        release: int = 50,
+    ):
+        """
+        Args:
+            position: Returns the cursor (x, y), e.g. pyautogui.position
+            interval: Seconds between samples
+            corner: Cursor within this many pixels of (0, 0) trips the switch
+            release: Cursor beyond this many pixels on either axis allows a reset
+        """
+        self._position = position
+        self.interval = interval
+        self.corner = corner
+        self.release = release
+
+        self._active = False
+        self._reason: Optional[str] = None
+        self._tripped_at: Optional[float] = None
+        self._last_position: Optional[Tuple[int, int]] = None
+        self._last_sample: Optional[float] = None
+        self._samples = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def active(self) -> bool:
+        return self._active
+
+    def trip(self, reason: str = "manual"):
+        """Activate the switch."""
+        with self._lock:
+            if not self._active:
+                self._active = True
+                self._reason = reason
+                self._tripped_at = time.time()
+                logger.warning(f"KILL SWITCH ACTIVATED ({reason})")
+
+    def _read_position(self) -> Optional[Tuple[int, int]]:
+        try:
+            x, y = self._position()
+        except Exception as e:
+            logger.debug(f"Cursor position unavailable: {e}")
+            return None
+        self._last_position = (x, y)
+        self._last_sample = time.time()
+        self._samples += 1
+        return x, y
+
+    def sample(self) -> bool:
+        """Read the cursor once, tripping the switch if it is in the corner."""
+        pos = self._read_position()
+        if pos is not None and pos[0] <= self.corner and pos[1] <= self.corner:
+            self.trip("mouse in corner")
+        return self._active
+
+    def try_reset(self) -> bool:
+        """
+        Deactivate the switch if the cursor is away from the corner.
+
+        Returns:
+            True if the switch is now inactive
+        """
+        if not self._active:
+            return True
+        pos = self._read_position()
+        if pos is None or (pos[0] <= self.release and pos[1] <= self.release):
+            return False
+        with self._lock:
+            self._active = False
+            self._reason = None
+            self._tripped_at = None
+        logger.info("Kill switch DEACTIVATED")
+        return True
+
+    def start(self):
+        """Start the sampler thread (idempotent)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vulcan-kill-switch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def get_status(self) -> Dict[str, Any]:
+        return {
+            "active": self._active,
+            "reason": self._reason,
+            "tripped_at": self._tripped_at,
+            "last_position": self._last_position,
+            "last_sample": self._last_sample,
+            "samples": self._samples,
+            "sampler_running": self._thread is not None and self._thread.is_alive(),
+        }
@@ -18,7 +18,6 @@ Resources:
 
 import logging
 import asyncio
-from datetime import datetime
 from typing import Optional
 
 # Try to import FastMCP, handling potential version differences
@@ -37,6 +36,7 @@ from controllers.recorder import recorder
 
 # Import verifier
 from controllers.verifier import verifier
+from action_log import ActionLog
 
 # Setup Logging
 logging.basicConfig(level=logging.INFO)
@@ -47,7 +47,7 @@ mcp = FastMCP("Vulcan Desktop Control")
 
 # Global State
 KILL_SWITCH_ACTIVE = False
-ACTION_LOG = []
+ACTION_LOG = ActionLog(max_entries=1000)
 COMMAND_QUEUE = asyncio.Queue()
 
 # --- Helper Functions ---
@@ -66,12 +66,7 @@ def check_kill_switch() -> bool:
 
 def log_action(action_type: str, details: dict):
     """Log an action to the internal log."""
-    entry = {
-        "timestamp": datetime.now().isoformat(),
-        "type": action_type,
-        "details": details,
-    }
-    ACTION_LOG.append(entry)
+    ACTION_LOG.record(action_type, details=details)
     logger.info(f"Action: {action_type} - {details}")
 
 
@@ -177,7 +172,7 @@ def verify_visual_state(reference_path: str, threshold: float = 0.95) -> str:
 @mcp.resource("vulcan://logs")
 def get_recent_logs() -> str:
     """Get the specific logs of desktop actions."""
-    return str(ACTION_LOG[-20:])
+    return str(ACTION_LOG.query(limit=20))
 
 
 @mcp.resource("vulcan://status")
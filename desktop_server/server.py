@@ -21,7 +21,7 @@ from typing import Dict, Any, Optional, List
 from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from fastapi.middleware.cors import CORSMiddleware
-import httpx
+from fastapi.responses import JSONResponse
 import yaml
 import pyautogui
 import sys
@@ -38,9 +38,19 @@ except ImportError:
 
 sys.path.append(str(Path(__file__).parent.parent))
 
-# Configure logging
 from core.logging_config import setup_logging
+from action_log import ActionLog
+from kill_switch import KillSwitch
+from command_queue import CommandDispatcher, CommandScheduler, QueuedCommand, UnknownCommandError
+
+# PDF extraction runs on a process pool so OCR never blocks the event loop
+from agents.cad_agent.validators.extraction_service import (
+    ExtractionBusyError,
+    ExtractionTimeoutError,
+    get_extraction_service,
+)
 
+# Configure logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
@@ -154,11 +164,13 @@ try:
         properties_router,
         document_exporter_router,
         bom_router,
+        get_com_stats,
     )
 
     CAD_AVAILABLE = True
 except ImportError:
     CAD_AVAILABLE = False
+    get_com_stats = None
     solidworks_router = None
     solidworks_assembly_router = None
     solidworks_drawings_router = None
@@ -198,9 +210,15 @@ except ImportError:
     logger.warning("CAD COM adapters not available")
 
 # Global state
-KILL_SWITCH_ACTIVE = False
-ACTION_LOG = []
-COMMAND_QUEUE: asyncio.Queue = asyncio.Queue()
+KILL_SWITCH = KillSwitch(pyautogui.position)
+ACTION_LOG = ActionLog(
+    max_entries=int(os.environ.get("ACTION_LOG_MAX_ENTRIES", 5000)),
+    spill_file=(
+        Path(os.environ["ACTION_LOG_DIR"]) / "actions.jsonl"
+        if os.environ.get("ACTION_LOG_DIR")
+        else None
+    ),
+)
 QUEUE_WORKER_TASK = None
 
 
@@ -213,68 +231,31 @@ class CommandRequest(BaseModel):
     priority: int = 1  # 1=Normal, 0=High
 
 
-async def process_command_queue():
-    """Background worker to process commands sequentially."""
-    logger.info("Queue Worker Started")
-    # Store port locally to avoid relying on global port during startup
-    port = int(os.environ.get("PORT", 8000))
-    # Wait for server to be ready before processing queue
-    await asyncio.sleep(2)
+def _queue_should_skip() -> bool:
+    """Kill switch gate, checked before every queued command (a flag read)."""
+    return KILL_SWITCH.active
 
-    async with httpx.AsyncClient(
-        base_url=f"http://127.0.0.1:{port}", timeout=60.0
-    ) as client:
-        while True:
-            try:
-                # Get a "unit of work"
-                command: CommandRequest = await COMMAND_QUEUE.get()
-
-                # Check kill switch before processing
-                if KILL_SWITCH_ACTIVE:
-                    logger.warning(
-                        f"Skipping command {command.type}/{command.action} due to Kill Switch"
-                    )
-                    COMMAND_QUEUE.task_done()
-                    continue
-
-                logger.info(f"Processing command: {command.type}/{command.action}")
-
-                # Map command types to router prefixes
-                endpoint = f"/{command.type}/{command.action}"
-
-                # Execute command via local API call
-                try:
-                    resp = await client.post(endpoint, json=command.params)
-                    result = (
-                        resp.json() if resp.status_code < 400 else {"error": resp.text}
-                    )
-                    logger.info(
-                        f"Command {command.type}/{command.action} result: {resp.status_code}"
-                    )
-                except Exception as e:
-                    logger.error(f"Failed to execute command locally: {e}")
-                    result = {"error": str(e)}
-
-                # Log completion
-                ACTION_LOG.append(
-                    {
-                        "timestamp": datetime.now().isoformat(),
-                        "type": "queue_execution",
-                        "command": command.dict(),
-                        "result": result,
-                    }
-                )
 
-                # Notify queue that content is processed
-                COMMAND_QUEUE.task_done()
+def _log_queue_execution(command: QueuedCommand, result: Any):
+    ACTION_LOG.record("queue_execution", command=command.to_dict(), result=result)
 
-            except asyncio.CancelledError:
-                logger.info("Queue Worker Cancelled")
-                break
-            except Exception as e:
-                logger.error(f"Error in queue worker loop: {e}")
-                # Don't call task_done() here if we didn't successfully get a command
-                await asyncio.sleep(1)
+
+COMMAND_DISPATCHER = CommandDispatcher()
+COMMAND_SCHEDULER = CommandScheduler(
+    COMMAND_DISPATCHER,
+    should_skip=_queue_should_skip,
+    on_complete=_log_queue_execution,
+)
+
+
+async def process_command_queue():
+    """Background worker: run queued commands in-process by priority."""
+    count = COMMAND_DISPATCHER.register_app_routes(app)
+    logger.info(f"Queue Worker Started ({count} command handlers)")
+    try:
+        await COMMAND_SCHEDULER.run()
+    except asyncio.CancelledError:
+        logger.info("Queue Worker Cancelled")
 
 
 def get_tailscale_ip() -> str | None:
@@ -300,17 +281,8 @@ def load_config() -> dict:
 
 
 def check_kill_switch():
-    """Check if mouse is in corner (kill switch)."""
-    global KILL_SWITCH_ACTIVE
-    pos = pyautogui.position()
-    screen_width, screen_height = pyautogui.size()
-
-    # Kill switch: mouse in top-left corner (within 10 pixels)
-    if pos.x <= 10 and pos.y <= 10:
-        KILL_SWITCH_ACTIVE = True
-        logger.warning("KILL SWITCH ACTIVATED - Mouse in corner")
-        return True
-    return False
+    """Check if the kill switch is active (mouse in corner, sampled in the background)."""
+    return KILL_SWITCH.active
 
 
 @asynccontextmanager
@@ -334,6 +306,7 @@ async def lifespan(app: FastAPI):
     # Enable pyautogui failsafe (move to corner to abort)
     pyautogui.FAILSAFE = True
     logger.info("pyautogui failsafe ENABLED (move mouse to corner to abort)")
+    KILL_SWITCH.start()
 
     # Start Queue Worker
     global QUEUE_WORKER_TASK
@@ -356,10 +329,14 @@ async def lifespan(app: FastAPI):
     if watcher_task:
         try:
             get_watcher().stop()
+            get_watcher().hub.stop()
             watcher_task.cancel()
         except Exception:
             pass
 
+    # Stop PDF extraction workers
+    get_extraction_service().shutdown()
+
     # Cleanup
     if QUEUE_WORKER_TASK:
         QUEUE_WORKER_TASK.cancel()
@@ -368,6 +345,7 @@ async def lifespan(app: FastAPI):
         except asyncio.CancelledError:
             pass
 
+    KILL_SWITCH.stop()
     logger.info("Desktop Control Server shutting down")
 
 
@@ -396,36 +374,23 @@ app.add_middleware(
 @app.middleware("http")
 async def log_and_check_killswitch(request: Request, call_next):
     """Middleware to log actions and check kill switch."""
-    global KILL_SWITCH_ACTIVE
-
-    # Check kill switch before every action
-    if check_kill_switch():
-        raise HTTPException(
-            status_code=503,
-            detail="KILL SWITCH ACTIVE - Move mouse away from corner to resume",
-        )
-
-    if KILL_SWITCH_ACTIVE:
-        # Allow reset via health check
-        if request.url.path == "/health":
-            pos = pyautogui.position()
-            if pos.x > 50 or pos.y > 50:
-                KILL_SWITCH_ACTIVE = False
-                logger.info("Kill switch DEACTIVATED")
-        else:
-            raise HTTPException(
+    if KILL_SWITCH.active:
+        # Allow reset via health check or /resume once the mouse has left the corner
+        if request.url.path not in ("/health", "/resume") or not KILL_SWITCH.try_reset():
+            return JSONResponse(
                 status_code=503,
-                detail="KILL SWITCH ACTIVE - Move mouse away from corner and call /health to resume",
+                content={
+                    "detail": "KILL SWITCH ACTIVE - Move mouse away from corner and call /health to resume"
+                },
             )
 
     # Log the action
-    action = {
-        "timestamp": datetime.now().isoformat(),
-        "method": request.method,
-        "path": request.url.path,
-        "client": request.client.host if request.client else "unknown",
-    }
-    ACTION_LOG.append(action)
+    ACTION_LOG.record(
+        "request",
+        method=request.method,
+        path=request.url.path,
+        client=request.client.host if request.client else "unknown",
+    )
     logger.info(f"Action: {request.method} {request.url.path}")
 
     response = await call_next(request)
@@ -593,7 +558,7 @@ async def root():
         "name": "Project Vulcan Desktop Control Server",
         "version": "1.0.0",
         "status": "running",
-        "kill_switch": KILL_SWITCH_ACTIVE,
+        "kill_switch": KILL_SWITCH.active,
     }
 
 
@@ -655,18 +620,20 @@ async def health():
                 "is_running": watcher.state.is_running,
                 "document_name": watcher.state.document_name,
                 "document_type": watcher.state.document_type.value,
+                "hub": watcher.hub.get_stats(),
             }
         except Exception:
             pass
 
     return {
-        "status": "ok" if not KILL_SWITCH_ACTIVE else "kill_switch_active",
+        "status": "ok" if not KILL_SWITCH.active else "kill_switch_active",
         "tailscale_ip": tailscale_ip,
         "timestamp": datetime.now().isoformat(),
-        "actions_logged": len(ACTION_LOG),
+        "actions_logged": ACTION_LOG.total_recorded,
         "solidworks": cad_status["solidworks"],
         "inventor": cad_status["inventor"],
-        "queue_depth": COMMAND_QUEUE.qsize(),
+        "queue_depth": COMMAND_SCHEDULER.qsize(),
+        "com_executors": get_com_stats() if get_com_stats else {},
         "watcher": watcher_state,
     }
 
@@ -1033,20 +1000,18 @@ async def validate_pdf_drawing(request: PDFValidationRequest):
         Validation results including extraction and all standard checks
     """
     try:
-        # Import PDF validation engine
-        from extractors.pdf_drawing_extractor import PDFDrawingExtractor
-
-        # Import validators from agents
-        import sys
-        sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent"))
-        from validators.pdf_validation_engine import PDFValidationEngine
+        from agents.cad_agent.validators.pdf_validation_engine import validate_pdf
 
-        engine = PDFValidationEngine()
-        result = engine.validate(request.file_path, request.standards)
-        return engine.to_dict(result)
+        return await get_extraction_service().submit(
+            validate_pdf, request.file_path, request.standards
+        )
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {request.file_path}")
+    except ExtractionBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ExtractionTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"PDF validation error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -1064,14 +1029,16 @@ async def extract_pdf_data(file_path: str):
         Extracted drawing data (title block, BOM, dimensions, etc.)
     """
     try:
-        from extractors.pdf_drawing_extractor import PDFDrawingExtractor
+        from extractors.pdf_drawing_extractor import extract_pdf
 
-        extractor = PDFDrawingExtractor()
-        result = extractor.extract(file_path)
-        return extractor.to_dict(result)
+        return await get_extraction_service().submit(extract_pdf, file_path)
 
     except FileNotFoundError:
         raise HTTPException(status_code=404, detail=f"File not found: {file_path}")
+    except ExtractionBusyError as e:
+        raise HTTPException(status_code=503, detail=str(e))
+    except ExtractionTimeoutError as e:
+        raise HTTPException(status_code=504, detail=str(e))
     except Exception as e:
         logger.error(f"PDF extraction error: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -3476,8 +3443,7 @@ async def export_bom_csv(request: dict):
 @app.post("/kill")
 async def kill():
     """Emergency stop - activate kill switch."""
-    global KILL_SWITCH_ACTIVE
-    KILL_SWITCH_ACTIVE = True
+    KILL_SWITCH.trip("manual /kill")
     logger.warning("KILL SWITCH MANUALLY ACTIVATED via /kill endpoint")
     return {"status": "kill_switch_activated"}
 
@@ -3485,10 +3451,7 @@ async def kill():
 @app.post("/resume")
 async def resume():
     """Resume after kill switch (if mouse is away from corner)."""
-    global KILL_SWITCH_ACTIVE
-    pos = pyautogui.position()
-    if pos.x > 50 or pos.y > 50:
-        KILL_SWITCH_ACTIVE = False
+    if KILL_SWITCH.try_reset():
         logger.info("Kill switch DEACTIVATED via /resume endpoint")
         return {"status": "resumed"}
     else:
@@ -3496,26 +3459,41 @@ async def resume():
 
 
 @app.get("/logs")
-async def get_logs(limit: int = 100):
-    """Get recent action logs."""
-    return {"logs": ACTION_LOG[-limit:]}
+async def get_logs(
+    limit: int = 100,
+    type: Optional[str] = None,
+    path: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+):
+    """Get recent action logs, optionally filtered by type, path prefix and time."""
+    return {
+        "logs": ACTION_LOG.query(limit=limit, type=type, path=path, since=since, until=until),
+        "stats": ACTION_LOG.get_stats(),
+        "kill_switch": KILL_SWITCH.get_status(),
+    }
 
 
 @app.post("/queue/add")
 async def add_to_queue(command: CommandRequest):
     """Add a command to the execution queue."""
-    if KILL_SWITCH_ACTIVE:
+    if KILL_SWITCH.active:
         raise HTTPException(status_code=503, detail="Kill switch active")
 
-    await COMMAND_QUEUE.put(command)
-    return {"status": "queued", "position": COMMAND_QUEUE.qsize(), "command": command}
+    try:
+        queued = await COMMAND_SCHEDULER.put(
+            command.type, command.action, command.params, priority=command.priority
+        )
+    except UnknownCommandError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    return {"status": "queued", "position": COMMAND_SCHEDULER.position(queued), "command": command}
 
 
 @app.get("/queue/status")
 async def get_queue_status():
-    """Get current queue status."""
+    """Get current queue status, throughput and latency."""
     return {
-        "size": COMMAND_QUEUE.qsize(),
+        **COMMAND_SCHEDULER.get_stats(),
         "worker_active": QUEUE_WORKER_TASK is not None and not QUEUE_WORKER_TASK.done(),
     }
 
@@ -4599,8 +4577,8 @@ try:
     sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent"))
     from data_hub import (
         get_standards_hub,
-        ComponentLookup,
-        RulesEngine,
+        get_component_lookup,
+        get_rules_engine,
         TemplateEngine,
     )
     DATA_HUB_AVAILABLE = True
@@ -4631,6 +4609,13 @@ class RulesEvaluationRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
+class RulesBatchEvaluationRequest(BaseModel):
+    """Request model for evaluating rules over many records."""
+    records: List[Dict[str, Any]]
+    standard: Optional[str] = None
+    tags: Optional[List[str]] = None
+
+
 class ReportRenderRequest(BaseModel):
     """Request model for report rendering."""
     template_id: str
@@ -4646,8 +4631,8 @@ async def get_data_hub_status():
 
     try:
         hub = get_standards_hub()
-        components = ComponentLookup()
-        rules = RulesEngine()
+        components = get_component_lookup()
+        rules = get_rules_engine()
         templates = TemplateEngine()
 
         return {
@@ -4780,7 +4765,7 @@ async def search_components(request: ComponentSearchRequest):
         raise HTTPException(status_code=501, detail="Data Hub not available")
 
     try:
-        lookup = ComponentLookup()
+        lookup = get_component_lookup()
         if request.fuzzy:
             results = lookup.fuzzy_search(request.query)
         else:
@@ -4797,6 +4782,32 @@ async def search_components(request: ComponentSearchRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/data-hub/components/filter")
+async def filter_components(
+    property: str,
+    min_value: Optional[float] = None,
+    max_value: Optional[float] = None,
+    category: Optional[str] = None,
+):
+    """Find components by numeric property range (e.g. beams with Zx >= 100)."""
+    if not DATA_HUB_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Data Hub not available")
+
+    try:
+        lookup = get_component_lookup()
+        results = lookup.filter_by_property(property, min_value, max_value, category)
+        return {
+            "property": property,
+            "min_value": min_value,
+            "max_value": max_value,
+            "count": len(results),
+            "results": [r.to_dict() for r in results]
+        }
+    except Exception as e:
+        logger.error(f"Component filter error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/data-hub/components/weight")
 async def calculate_weight(designation: str, length_ft: float):
     """Calculate component weight."""
@@ -4804,7 +4815,7 @@ async def calculate_weight(designation: str, length_ft: float):
         raise HTTPException(status_code=501, detail="Data Hub not available")
 
     try:
-        lookup = ComponentLookup()
+        lookup = get_component_lookup()
         result = lookup.calculate_beam_weight(designation, length_ft)
         if result:
             return result
@@ -4822,7 +4833,7 @@ async def list_rules(standard: Optional[str] = None, tag: Optional[str] = None):
         raise HTTPException(status_code=501, detail="Data Hub not available")
 
     try:
-        engine = RulesEngine()
+        engine = get_rules_engine()
         if standard:
             rules = engine.get_rules_by_standard(standard)
         elif tag:
@@ -4848,7 +4859,7 @@ async def evaluate_rules(request: RulesEvaluationRequest):
         raise HTTPException(status_code=501, detail="Data Hub not available")
 
     try:
-        engine = RulesEngine()
+        engine = get_rules_engine()
         violations = engine.evaluate(
             data=request.data,
             standard=request.standard,
@@ -4866,6 +4877,31 @@ async def evaluate_rules(request: RulesEvaluationRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/data-hub/rules/evaluate-batch")
+async def evaluate_rules_batch(request: RulesBatchEvaluationRequest):
+    """Evaluate validation rules against many records at once."""
+    if not DATA_HUB_AVAILABLE:
+        raise HTTPException(status_code=501, detail="Data Hub not available")
+
+    try:
+        engine = get_rules_engine()
+        results = engine.evaluate_batch(
+            records=request.records,
+            standard=request.standard,
+            tags=request.tags
+        )
+
+        return {
+            "evaluated": True,
+            "records_count": len(request.records),
+            "violations_count": sum(len(v) for v in results),
+            "results": [[v.to_dict() for v in violations] for violations in results]
+        }
+    except Exception as e:
+        logger.error(f"Rules batch evaluation error: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @app.get("/data-hub/templates")
 async def list_templates():
     """List available report templates."""
@@ -5,5 +5,13 @@ Process and application watchers for auto-launch functionality.
 """
 
 from .solidworks_watcher import SolidWorksWatcher, get_watcher
+from .state_hub import SolidWorksStateHub, StateChange, StateEvent, get_state_hub
 
-__all__ = ["SolidWorksWatcher", "get_watcher"]
+__all__ = [
+    "SolidWorksWatcher",
+    "get_watcher",
+    "SolidWorksStateHub",
+    "StateChange",
+    "StateEvent",
+    "get_state_hub",
+]
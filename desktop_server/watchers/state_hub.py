@@ -0,0 +1,525 @@
+"""
+SolidWorks State Hub
+====================
+One owner for "is SolidWorks running, and which document is active".
+
+The watcher, the ACHE listener and WebSocket clients used to poll
+SolidWorks independently. The hub watches once and fans state changes
+out to every subscriber:
+
+- while SolidWorks is running and pywin32 is available, application and
+  document COM events drive updates; the hub thread only pumps messages
+  and checks the cached PID now and then
+- otherwise it polls, checking the cached PID with a single pid_exists
+  syscall and scanning the process table only when no PID is known, with
+  the interval backing off while nothing changes
+
+Subscribers are called on the hub thread. ``StateChange.document`` is the
+live ModelDoc2 when the source has one; it is only valid during the
+callback.
+
+Usage:
+    hub = get_state_hub()
+    hub.subscribe(lambda change: print(change.event, change.state.document_path))
+    hub.start()
+"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass, field, replace
+from enum import Enum
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger("vulcan.watcher.state_hub")
+
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+try:
+    import pythoncom
+    import win32com.client
+    import win32event
+    PYWIN32_AVAILABLE = True
+except ImportError:
+    PYWIN32_AVAILABLE = False
+
+
+class DocumentType(Enum):
+    """SolidWorks document types."""
+    PART = "part"
+    ASSEMBLY = "assembly"
+    DRAWING = "drawing"
+    UNKNOWN = "unknown"
+
+
+DOCUMENT_TYPES = {1: DocumentType.PART, 2: DocumentType.ASSEMBLY, 3: DocumentType.DRAWING}
+
+
+@dataclass
+class SolidWorksState:
+    """Current state of SolidWorks application."""
+    is_running: bool = False
+    process_id: Optional[int] = None
+    document_path: Optional[str] = None
+    document_type: DocumentType = DocumentType.UNKNOWN
+    document_name: Optional[str] = None
+    last_change: float = field(default_factory=time.time)
+
+
+@dataclass
+class DocumentInfo:
+    """The active document as read from SolidWorks."""
+    path: Optional[str]
+    name: Optional[str]
+    type: DocumentType = DocumentType.UNKNOWN
+
+
+class StateEvent(str, Enum):
+    """Why the hub published a change."""
+    STARTED = "started"
+    EXITED = "exited"
+    OPENED = "opened"
+    ACTIVATED = "activated"
+    CLOSED = "closed"
+    SAVED = "saved"
+    REFRESH = "refresh"
+
+
+@dataclass
+class StateChange:
+    """A state transition delivered to subscribers."""
+    event: StateEvent
+    state: SolidWorksState
+    previous: SolidWorksState
+    document: Any = field(default=None, repr=False)
+
+    @property
+    def started(self) -> bool:
+        return self.state.is_running and not self.previous.is_running
+
+    @property
+    def document_changed(self) -> bool:
+        return (self.state.document_path != self.previous.document_path
+                or self.state.document_type != self.previous.document_type)
+
+
+class StateSource:
+    """
+    Where the hub gets its observations. Methods are called on the hub thread.
+
+    The base class never finds SolidWorks; SolidWorksComSource is the real
+    implementation and tests supply fakes.
+    """
+
+    name = "none"
+
+    def open(self):
+        """Thread setup (e.g. COM apartment initialisation)."""
+
+    def close(self):
+        """Thread teardown."""
+
+    def find_process(self) -> Optional[int]:
+        """Scan for the SolidWorks process; the expensive path."""
+        return None
+
+    def process_alive(self, pid: int) -> bool:
+        """Cheap check that a previously found PID still exists."""
+        return False
+
+    def read_active_document(self) -> Optional[Tuple[DocumentInfo, Any]]:
+        """Return (info, live document) for the active document, or None."""
+        return None
+
+    def subscribe_events(self, notify: Callable[..., None]) -> bool:
+        """Hook application events; return True if events will be delivered."""
+        return False
+
+    def unsubscribe_events(self):
+        """Release event hooks (SolidWorks exited or hub stopping)."""
+
+    def wait(self, timeout: float, stop: threading.Event):
+        """Block for up to timeout seconds, delivering any pending events."""
+        stop.wait(timeout)
+
+    def interrupt(self):
+        """Wake a blocked wait() early."""
+
+
+class SolidWorksComSource(StateSource):
+    """psutil for the process, pywin32 for documents and COM events."""
+
+    name = "com"
+    PROCESS_NAMES = ("SLDWORKS.exe", "sldworks.exe")
+
+    def __init__(self):
+        self._app = None
+        self._app_events = None
+        self._doc_events = None
+        self._hooked_doc = None
+        self._notify: Optional[Callable[..., None]] = None
+        self._wake = None
+
+    def open(self):
+        if PYWIN32_AVAILABLE:
+            pythoncom.CoInitialize()
+            self._wake = win32event.CreateEvent(None, False, False, None)
+
+    def close(self):
+        self.unsubscribe_events()
+        self._app = None
+        if PYWIN32_AVAILABLE:
+            pythoncom.CoUninitialize()
+
+    def find_process(self) -> Optional[int]:
+        if not PSUTIL_AVAILABLE:
+            return None
+        for proc in psutil.process_iter(["name", "pid"]):
+            try:
+                if proc.info["name"] in self.PROCESS_NAMES:
+                    return proc.info["pid"]
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+        return None
+
+    def process_alive(self, pid: int) -> bool:
+        if not PSUTIL_AVAILABLE:
+            return False
+        if psutil.pid_exists(pid):
+            return True
+        self._app = None
+        return False
+
+    def _get_app(self):
+        if self._app is None and PYWIN32_AVAILABLE:
+            try:
+                self._app = win32com.client.GetActiveObject("SldWorks.Application")
+            except Exception as e:
+                logger.debug(f"SolidWorks not attachable yet: {e}")
+        return self._app
+
+    def read_active_document(self) -> Optional[Tuple[DocumentInfo, Any]]:
+        app = self._get_app()
+        if app is None:
+            return None
+        try:
+            doc = app.ActiveDoc
+            if not doc:
+                self._hook_document(None)
+                return None
+            info = DocumentInfo(
+                path=doc.GetPathName(),
+                name=doc.GetTitle(),
+                type=DOCUMENT_TYPES.get(doc.GetType(), DocumentType.UNKNOWN),
+            )
+            self._hook_document(doc)
+            return info, doc
+        except Exception as e:
+            logger.debug(f"Could not get active document: {e}")
+            self._app = None
+            return None
+
+    def subscribe_events(self, notify: Callable[..., None]) -> bool:
+        if not PYWIN32_AVAILABLE:
+            return False
+        app = self._get_app()
+        if app is None:
+            return False
+        try:
+            from com.events import SolidWorksAppEvents
+
+            self._app_events = win32com.client.WithEvents(app, SolidWorksAppEvents)
+            self._app_events.notify = notify
+            self._notify = notify
+            logger.info("Hooked SolidWorks application events")
+            return True
+        except Exception as e:
+            logger.warning(f"SolidWorks events unavailable, polling instead: {e}")
+            self._app_events = None
+            return False
+
+    def _hook_document(self, doc):
+        """Follow the active document so its save events reach the hub."""
+        if self._app_events is None or doc is self._hooked_doc:
+            return
+        if self._doc_events is not None:
+            self._doc_events.close()
+            self._doc_events = None
+        self._hooked_doc = doc
+        if doc is None:
+            return
+        try:
+            from com.events import DocumentEvents
+
+            self._doc_events = win32com.client.WithEvents(doc, DocumentEvents)
+            self._doc_events.notify = self._notify
+        except Exception as e:
+            logger.debug(f"Could not hook document events: {e}")
+
+    def unsubscribe_events(self):
+        for sink in (self._doc_events, self._app_events):
+            if sink is not None:
+                try:
+                    sink.close()
+                except Exception:
+                    pass
+        self._app_events = self._doc_events = self._hooked_doc = None
+        self._notify = None
+
+    def wait(self, timeout: float, stop: threading.Event):
+        if self._app_events is None or self._wake is None:
+            stop.wait(timeout)
+            return
+        # Sleep in the kernel until a COM event, a wake-up or the timeout
+        deadline = time.monotonic() + timeout
+        while not stop.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            rc = win32event.MsgWaitForMultipleObjects(
+                [self._wake], False, int(remaining * 1000), win32event.QS_ALLINPUT
+            )
+            if rc == win32event.WAIT_OBJECT_0 + 1:
+                pythoncom.PumpWaitingMessages()
+            else:
+                return
+
+    def interrupt(self):
+        if self._wake is not None:
+            win32event.SetEvent(self._wake)
+
+
+class SolidWorksStateHub:
+    """
+    Watches SolidWorks once and fans state changes out to subscribers.
+    """
+
+    def __init__(
+        self,
+        source: Optional[StateSource] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 15.0,
+        event_interval: float = 10.0,
+        backoff: float = 2.0,
+    ):
+        """
+        Args:
+            source: Observation source (default: SolidWorksComSource)
+            min_interval: Poll interval right after a change, seconds
+            max_interval: Poll interval after a long idle period, seconds
+            event_interval: PID liveness check interval while COM events are hooked
+            backoff: Interval multiplier for each poll that sees no change
+        """
+        self.source = source or SolidWorksComSource()
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.event_interval = event_interval
+        self.backoff = backoff
+
+        self._state = SolidWorksState()
+        self._lock = threading.RLock()
+        self._subscribers: List[Callable[[StateChange], None]] = []
+        self._interval = min_interval
+        self._events_hooked = False
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._stats = {"polls": 0, "process_scans": 0, "events": 0, "changes": 0}
+
+    @property
+    def state(self) -> SolidWorksState:
+        """Snapshot of the current state."""
+        with self._lock:
+            return replace(self._state)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def subscribe(self, callback: Callable[[StateChange], None]):
+        """Register a callback for state changes (called on the hub thread)."""
+        with self._lock:
+            if callback not in self._subscribers:
+                self._subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[StateChange], None]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start(self):
+        """Start the hub thread (idempotent)."""
+        if self.is_running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="vulcan-sw-state", daemon=True)
+        self._thread.start()
+        logger.info("SolidWorks state hub started")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the hub thread and release event hooks."""
+        self._stop.set()
+        self.source.interrupt()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info("SolidWorks state hub stopped")
+
+    def _run(self):
+        self.source.open()
+        try:
+            while not self._stop.is_set():
+                try:
+                    timeout = self.poll_once()
+                except Exception as e:
+                    logger.error(f"State hub poll error: {e}")
+                    timeout = self.max_interval
+                self.source.wait(timeout, self._stop)
+        finally:
+            if self._events_hooked:
+                self.source.unsubscribe_events()
+                self._events_hooked = False
+            self.source.close()
+
+    def poll_once(self) -> float:
+        """
+        Check the process and the active document once.
+
+        Returns:
+            Seconds to wait before the next poll
+        """
+        self._stats["polls"] += 1
+        pid = self._state.process_id
+        if pid is None or not self.source.process_alive(pid):
+            self._stats["process_scans"] += 1
+            pid = self.source.find_process()
+
+        if pid is None:
+            was_running = self._state.is_running
+            if was_running:
+                self._exited()
+            return self._next_interval(changed=was_running)
+
+        if self._state.is_running and pid != self._state.process_id:
+            self._exited()  # restarted between polls; the old session is gone
+
+        if not self._events_hooked:
+            self._events_hooked = self.source.subscribe_events(self.notify)
+
+        if not self._state.is_running:
+            changed = self._refresh(StateEvent.STARTED, is_running=True, process_id=pid)
+        else:
+            changed = self._refresh(StateEvent.ACTIVATED)
+        if self._events_hooked:
+            # Events report changes; this slow read only catches any they miss
+            return self.event_interval
+        return self._next_interval(changed)
+
+    def _next_interval(self, changed: bool) -> float:
+        """Reset to min_interval after a change, otherwise back off towards max_interval."""
+        if changed:
+            self._interval = self.min_interval
+        interval = self._interval
+        self._interval = min(self.max_interval, interval * self.backoff)
+        return interval
+
+    def notify(self, event: str, path: Optional[str] = None):
+        """
+        Entry point for COM event sinks.
+
+        Args:
+            event: A StateEvent value
+            path: File the event refers to, when SolidWorks provides one
+        """
+        self._stats["events"] += 1
+        event = StateEvent(event)
+        if event == StateEvent.EXITED:
+            self._exited()
+            return
+        if not self._state.is_running:
+            self.poll_once()
+            return
+        self._refresh(event, force=event in (StateEvent.OPENED, StateEvent.SAVED))
+
+    def _exited(self):
+        if self._events_hooked:
+            self.source.unsubscribe_events()
+            self._events_hooked = False
+        self._apply(
+            StateEvent.EXITED,
+            is_running=False,
+            process_id=None,
+            document_path=None,
+            document_name=None,
+            document_type=DocumentType.UNKNOWN,
+        )
+
+    def _refresh(self, event: StateEvent, force: bool = False, **changes) -> bool:
+        """Read the active document and publish if it changed (or force)."""
+        found = self.source.read_active_document()
+        info, document = found if found else (DocumentInfo(None, None), None)
+        if not found and self._state.document_path is not None and event != StateEvent.STARTED:
+            event = StateEvent.CLOSED
+        return self._apply(
+            event,
+            document=document,
+            force=force,
+            document_path=info.path,
+            document_name=info.name,
+            document_type=info.type,
+            **changes,
+        )
+
+    def _apply(self, event: StateEvent, document: Any = None, force: bool = False, **changes) -> bool:
+        with self._lock:
+            previous = replace(self._state)
+            updated = replace(self._state, **changes)
+            changed = (
+                updated.is_running != previous.is_running
+                or updated.process_id != previous.process_id
+                or updated.document_path != previous.document_path
+                or updated.document_type != previous.document_type
+            )
+            if not changed and not force:
+                return False
+            updated.last_change = time.time()
+            self._state = updated
+            subscribers = list(self._subscribers)
+            self._stats["changes"] += 1
+
+        change = StateChange(event, replace(updated), previous, document)
+        for callback in subscribers:
+            try:
+                callback(change)
+            except Exception as e:
+                logger.error(f"State hub subscriber error: {e}")
+        return True
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Hub activity counters."""
+        return {
+            **self._stats,
+            "source": self.source.name,
+            "events_hooked": self._events_hooked,
+            "next_poll_s": self._interval,
+            "subscribers": len(self._subscribers),
+            "hub_running": self.is_running,
+        }
+
+
+# Singleton instance
+_hub: Optional[SolidWorksStateHub] = None
+_hub_lock = threading.Lock()
+
+
+def get_state_hub() -> SolidWorksStateHub:
+    """Get the singleton state hub."""
+    global _hub
+    if _hub is None:
+        with _hub_lock:
+            if _hub is None:
+                _hub = SolidWorksStateHub()
+    return _hub
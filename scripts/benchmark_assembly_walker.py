@@ -0,0 +1,147 @@
+"""
+Benchmark assembly analysis against a fake COM tree.
+
+Compares the previous per-component approach (one ModelDoc2 read per
+instance, one Get3 per custom property, O(n^2) related-part search) with
+the component walker (one read per referenced document, batched
+properties, cached across runs, indexed related-part lookup).
+
+COM round-trips are counted; --round-trip-us converts them to an
+estimated wall time, since real late-bound calls into SolidWorks cost far
+more than the Python fake.
+
+Usage:
+    python scripts/benchmark_assembly_walker.py [--components 5000] [--unique-parts 500]
+"""
+
+import argparse
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from com.assembly_analyzer import (
+    RelatedPartsIndex,
+    fetch_document_data,
+    get_bounding_box,
+    get_feature_summary,
+    get_mass_properties,
+    get_mates_info,
+    get_material_info,
+)
+from com.component_walker import ComponentWalker, DocumentCache, component_name
+from com.fake_solidworks import build_fake_assembly
+
+
+def legacy_find_related_parts(part_name, all_parts):
+    """The previous O(n) per-call related-part search."""
+    related = []
+    base_pattern = re.sub(r'[-_]\d+$', '', part_name)
+    for part in all_parts:
+        other_name = part.get("part_number", "")
+        if other_name != part_name:
+            other_base = re.sub(r'[-_]\d+$', '', other_name)
+            if base_pattern in other_name or other_base in part_name:
+                related.append(other_name)
+            if len(base_pattern) > 5 and base_pattern[:5] == other_base[:5]:
+                if other_name not in related:
+                    related.append(other_name)
+    return related[:5]
+
+
+def legacy_properties(ref_model):
+    props = {}
+    cpm = ref_model.Extension.CustomPropertyManager("")
+    for name in cpm.GetNames():
+        result = cpm.Get3(name, False)
+        val = result[0] if result[0] else result[1]
+        if val:
+            props[name] = str(val)
+    return props
+
+
+def legacy_analysis(app):
+    """Per-instance reads over the full tree, as the old code did per top-level child."""
+    root = app.ActiveDoc.ConfigurationManager.ActiveConfiguration.GetRootComponent3(True)
+    parts = []
+    stack = list(root.GetChildren())
+    while stack:
+        comp = stack.pop()
+        stack.extend(comp.GetChildren())
+        ref_model = comp.GetModelDoc2()
+        ref_model.GetPathName()
+        parts.append({
+            "part_number": component_name(comp),
+            "properties": legacy_properties(ref_model),
+            "geometry": get_mass_properties(ref_model),
+            "bbox": get_bounding_box(ref_model),
+            "material": get_material_info(ref_model),
+            "features": get_feature_summary(ref_model),
+            "mates": get_mates_info(comp),
+        })
+    return parts
+
+
+def walker_analysis(app, walker):
+    root = app.ActiveDoc.ConfigurationManager.ActiveConfiguration.GetRootComponent3(True)
+    result = walker.walk(root)
+    for doc in result.documents:
+        get_mates_info(doc.instances[0].component)
+    return result
+
+
+def report(label, app, seconds, round_trip_us):
+    calls = app.call_count
+    estimate = seconds + calls * round_trip_us / 1e6
+    print(f"{label:<34}{calls:>9,} COM calls {seconds * 1000:>9.1f} ms python  "
+          f"~{estimate:>7.1f} s at {round_trip_us:g} us/call")
+    app.reset_calls()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, default=5000)
+    parser.add_argument("--unique-parts", type=int, default=500)
+    parser.add_argument("--round-trip-us", type=float, default=200.0)
+    args = parser.parse_args()
+
+    app = build_fake_assembly(args.components, args.unique_parts)
+    print(f"fake tree: {args.components:,} components, {args.unique_parts:,} documents\n")
+
+    start = time.perf_counter()
+    parts = legacy_analysis(app)
+    report("per-component reads", app, time.perf_counter() - start, args.round_trip_us)
+
+    cache = DocumentCache(Path(tempfile.mkdtemp(prefix="walker_bench_")) / "cache.json")
+    walker = ComponentWalker(fetch_document_data, cache=cache, mtime=lambda path: 1.0)
+
+    start = time.perf_counter()
+    result = walker_analysis(app, walker)
+    report("walker, cold cache", app, time.perf_counter() - start, args.round_trip_us)
+
+    start = time.perf_counter()
+    walker_analysis(app, walker)
+    report("walker, warm cache", app, time.perf_counter() - start, args.round_trip_us)
+    print(f"  {result.get_stats()}\n")
+
+    sample = parts[:1000]
+    start = time.perf_counter()
+    for part in sample:
+        legacy_find_related_parts(part["part_number"], parts)
+    legacy = (time.perf_counter() - start) * len(parts) / len(sample)
+    print(f"{'related parts, O(n^2) scan':<34}{legacy * 1000:>9.1f} ms (extrapolated from {len(sample)})")
+
+    names = [p["part_number"] for p in parts]
+    start = time.perf_counter()
+    index = RelatedPartsIndex(names)
+    for name in names:
+        index.related(name)
+    print(f"{'related parts, prefix index':<34}{(time.perf_counter() - start) * 1000:>9.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""
+Benchmark BOM verification on large synthetic BOMs.
+
+Compares the previous greedy all-pairs matcher (every BOM item scored
+against every unused drawing, first best wins) with BOMChecker.verify_bom
+(blocked candidates and optimal assignment). The synthetic drawing set has
+revision suffixes, reworded descriptions, missing drawings and extra
+drawings.
+
+Usage:
+    python scripts/benchmark_bom_checker.py [--items 500 2000 5000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from agents.cad_agent.adapters.bom_cross_checker import (
+    BOMChecker,
+    BOMItem,
+    DrawingPart,
+    MatchStatus,
+)
+
+KINDS = ["PLATE", "ANGLE", "CHANNEL", "TUBE", "BOLT", "NUT", "WASHER", "BRACKET", "FIN", "HEADER"]
+MATERIALS = ["A36", "A572-50", "SS304", "SS316", "6061-T6", "A193 B7"]
+FINISHES = ["", "GALV", "PAINT", "HDG"]
+
+
+def build_bom(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    items, drawings = [], []
+    for k in range(count):
+        kind = rng.choice(KINDS)
+        pn = f"ACHE-{kind[:3]}-{10000 + k}"
+        desc = f"{kind} {rng.randint(1, 12)}x{rng.randint(1, 48)} {rng.choice(['LH', 'RH', 'TYP'])}"
+        material, finish = rng.choice(MATERIALS), rng.choice(FINISHES)
+        weight = round(rng.uniform(0.1, 400), 1)
+        items.append(BOMItem(k + 1, pn, desc, rng.randint(1, 24), material, weight, finish=finish))
+
+        roll = rng.random()
+        if roll < 0.05:
+            continue  # drawing missing
+        if roll < 0.15:
+            pn = pn + "-" + rng.choice("ABC")  # revision suffix on the drawing
+        if roll > 0.9:
+            desc = desc.replace("TYP", "TYPICAL")
+            weight = round(weight * rng.uniform(0.9, 1.1), 1)
+        drawings.append(DrawingPart(pn, desc, material, weight, finish, page_number=k // 4 + 1))
+
+    for k in range(count // 20):
+        drawings.append(DrawingPart(f"ACHE-EXT-{90000 + k}", "SHIPPING SKID", "A36", 120.0))
+    rng.shuffle(drawings)
+    return items, drawings
+
+
+def legacy_verify(checker: BOMChecker, bom_items, drawing_parts):
+    """Previous greedy matching; returns {item index: drawing index}."""
+    used, pairs = set(), {}
+    for i, item in enumerate(bom_items):
+        best, best_score = None, 0.0
+        for j, drawing in enumerate(drawing_parts):
+            if j in used:
+                continue
+            score = checker._calculate_match_score(item, drawing)
+            if score > best_score:
+                best, best_score = j, score
+        if best is not None and best_score >= 0.5:
+            used.add(best)
+            pairs[i] = best
+    return pairs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--items", type=int, nargs="+", default=[500, 2000, 5000])
+    parser.add_argument("--legacy-limit", type=int, default=2000,
+                        help="Run the greedy all-pairs matcher up to this many items")
+    args = parser.parse_args()
+
+    checker = BOMChecker()
+    for count in args.items:
+        items, drawings = build_bom(count)
+        start = time.perf_counter()
+        result = checker.verify_bom(items, drawings)
+        new_s = time.perf_counter() - start
+        matched = sum(1 for m in result.matches if m.status != MatchStatus.MISSING)
+        print(f"{count:>6,} items x {len(drawings):,} drawings")
+        print(f"  {'blocked + assignment':<24}{new_s * 1000:>10.1f} ms  {matched:,} matched, "
+              f"{len(result.missing_from_drawings)} missing, {len(result.missing_from_bom)} extra")
+
+        if count <= args.legacy_limit:
+            start = time.perf_counter()
+            pairs = legacy_verify(checker, items, drawings)
+            old_s = time.perf_counter() - start
+            print(f"  {'greedy all pairs':<24}{old_s * 1000:>10.1f} ms  {len(pairs):,} matched")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,132 @@
+"""
+Benchmark PDF drawing text extraction.
+
+Compares running every extraction pattern over the text (what the
+per-section extractors did) with the keyword-gated scanner, and checks
+that both produce identical sections. Runs on synthetic drawing text
+shaped like the M/S/CS-series sheets, so no PDFs or OCR are needed.
+
+Usage:
+    python scripts/benchmark_drawing_extraction.py [--sheets 50] [--repeat 5]
+"""
+
+import argparse
+import sys
+import time
+from functools import partial
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from extractors.pdf_drawing_extractor import PDFDrawingExtractor
+from extractors.text_scanner import DrawingTextScanner, ScanRule
+
+HEADER_SHEET = """M169-6A HEADER DETAIL REV: B CUSTOMER: ACME REFINING
+PROJECT: UNIT 4 AIR COOLER JOB NO: 23456
+DRAWN BY: JS CHECKED BY: MK APPROVED BY: RT DATE: 01/15/2024 SCALE: 1:4 SHEET 1 OF 3
+1  M169-6A-1  TUBESHEET PLATE 1.5 THK  SA-516-70  2
+2  M169-6A-2  PLUG SHEET  SA-516-70  2
+3  NZ-100  NOZZLE 6" 300# WN FLG  SA-105  4
+MAWP: 450 PSIG DESIGN PRESSURE: 450 PSI DESIGN TEMP: 650 F MDMT: -20 F
+HYDRO TEST PRESSURE: 675 PSI CORROSION ALLOWANCE: 0.125"
+ASME SEC VIII DIV 1 PWHT REQUIRED SPOT RT
+1/4 FILLET WELD ALL AROUND WPS P1A-4 3/8" FILLET P1TM-1
+12.50" [317.5] 24.000 +/- 0.03 6.25 IN
+1. ALL WELDS PER WPS P1A-4 GTAW ROOT
+2. MATERIAL SA-516-70 NORMALIZED
+3. PAINT PER SSPC-SP6 PRIMER
+4. INSPECT 100% MT ALL NOZZLE WELDS
+5. REMOVE ALL BURRS
+A  01/15/2024  INITIAL RELEASE  JS  ECN 1234
+B  03/02/2024  REVISED NOZZLE  MK ECN 1301
+SHOP NOTES:
+DEBURR ALL EDGES
+STAMP U
+
+"""
+
+STRUCTURE_SHEET = """S24400-10AS PLENUM STRUCTURE
+DRN: KL CHK: JS SCALE: NTS SHEET 2 OF 4
+1  S24400-11  COLUMN W8X31  A572-50  4
+2  S24400-12  BEAM C8X11.5  A36  6
+ALL BOLTS A325 GALV 3/4 DIA
+1. STRUCTURAL STEEL PER AISC
+2. FINISH HOT DIP GALVANIZED
+96.00 48.00 1.25 0.75 144.000 72.50
+
+"""
+
+SHIPPING_SHEET = """CS23456-7A-SWLA SHIPPING AND LIFTING
+LIFT WEIGHT 18500 LBS CG LOCATION 120.5 60.25
+SWL 10000 LBS EACH LUG
+1. LIFT ONLY AT DESIGNATED LUGS
+2. TEST LOAD 125% SWL
+
+"""
+
+
+def build_samples(sheets: int):
+    return {
+        "header": HEADER_SHEET * sheets,
+        "structure": STRUCTURE_SHEET * sheets,
+        "shipping": SHIPPING_SHEET * sheets,
+    }
+
+
+def ungated_extractor():
+    """An extractor whose scanner runs every pattern, keywords or not."""
+    extractor = PDFDrawingExtractor(cache=None)
+    rules = [ScanRule(rule.name, rule.first_only) for rule in extractor.SCAN_RULES]
+    extractor.scanner = DrawingTextScanner(extractor.PATTERNS, rules)
+    return extractor
+
+
+def extract(extractor, text):
+    sections = extractor._extract_sections(text)
+    return (
+        sections["drawing_type"],
+        sections["title_block"],
+        sections["bom_items"],
+        sections["weld_symbols"],
+        sections["dimensions"],
+        sections["revisions"],
+        sections["design_data"],
+        sections["notes"],
+    )
+
+
+def best_of(fn, repeat):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sheets", type=int, default=50, help="Sheets per sample")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per measurement (best is kept)")
+    args = parser.parse_args()
+
+    gated = PDFDrawingExtractor(cache=None)
+    ungated = ungated_extractor()
+
+    print(f"{'sample':<12}{'chars':>10}{'all patterns ms':>17}{'gated ms':>17}{'speedup':>10}")
+    for name, text in build_samples(args.sheets).items():
+        old_s, old = best_of(partial(extract, ungated, text), args.repeat)
+        new_s, new = best_of(partial(extract, gated, text), args.repeat)
+        if new != old:
+            print(f"{name}: gated output differs from running every pattern")
+            return 1
+        print(
+            f"{name:<12}{len(text):>10}{old_s * 1000:>17.1f}"
+            f"{new_s * 1000:>17.1f}{old_s / new_s:>9.1f}x"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
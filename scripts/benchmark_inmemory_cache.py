@@ -0,0 +1,85 @@
+"""
+Benchmark the in-memory cache fallback once it is full.
+
+Fills the cache to max_size, then times a stream of inserts of new keys
+(each one evicts) and mixed gets, for the previous implementation (eviction
+by scanning all expiry times) and the current InMemoryCache. Also shows
+memory accounting against a byte cap.
+
+Usage:
+    python scripts/benchmark_inmemory_cache.py [--ops 20000] [--sizes 1000,10000,50000]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.redis_adapter import InMemoryCache
+
+
+class ScanEvictionCache:
+    """The previous InMemoryCache: min() over every expiry on each full insert."""
+
+    def __init__(self, max_size: int = 1000):
+        self._cache = {}
+        self._expiry = {}
+        self._max_size = max_size
+
+    def get(self, key):
+        if key in self._cache:
+            if self._expiry.get(key, float("inf")) > time.time():
+                return self._cache[key]
+            del self._cache[key]
+            del self._expiry[key]
+        return None
+
+    def set(self, key, value, ttl=3600):
+        if len(self._cache) >= self._max_size:
+            oldest = min(self._expiry, key=self._expiry.get)
+            del self._cache[oldest]
+            del self._expiry[oldest]
+        self._cache[key] = value
+        self._expiry[key] = time.time() + ttl
+
+
+def run(cache, size, ops, value):
+    rng = random.Random(3)
+    for i in range(size):
+        cache.set(f"fill{i}", value, 3600)
+    start = time.perf_counter()
+    for i in range(ops):
+        cache.set(f"new{i}", value, rng.choice((300, 3600, 86400)))
+        cache.get(f"new{rng.randrange(i + 1)}")
+    return (time.perf_counter() - start) / ops
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--ops", type=int, default=20000)
+    parser.add_argument("--sizes", default="1000,10000,50000")
+    args = parser.parse_args()
+    value = "j" + "x" * 400
+
+    print(f"{args.ops:,} evicting inserts + gets on a full cache (µs per insert+get)")
+    print(f"  {'max_size':>9}  {'scan eviction':>14}  {'InMemoryCache':>14}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        ops = min(args.ops, 2000) if size > 10000 else args.ops  # The scan is slow
+        old = run(ScanEvictionCache(max_size=size), size, ops, value)
+        new = run(InMemoryCache(max_size=size, sweep_interval=0), size, args.ops, value)
+        print(f"  {size:>9,}  {old * 1e6:>14,.1f}  {new * 1e6:>14,.1f}")
+
+    cache = InMemoryCache(max_size=1_000_000, max_memory=8 * 1024 * 1024, sweep_interval=0)
+    for i in range(100_000):
+        cache.set(f"k{i}", value, 3600)
+    stats = cache.stats()
+    print(f"  8 MiB cap, 100,000 inserts of {len(value)}-char entries: {stats['keys']:,} kept, "
+          f"{stats['used_memory'] / 1024 / 1024:.2f} MiB accounted, {stats['evictions']:,} evicted")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,131 @@
+"""
+Benchmark assembly interference and 2D clearance checks.
+
+Compares the previous all-pairs loop with the NumPy broad phase in
+interference_detector on a synthetic ACHE layout: tube rows running the
+length of the bundle, side frames, tube supports and scattered hardware.
+Results are checked for equality; the all-pairs time is extrapolated from a
+sample of rows for large assemblies.
+
+Usage:
+    python scripts/benchmark_interference.py [--components 10000 100000] [--tolerance 0.125]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent" / "adapters"))
+
+import interference_detector as detector
+from interference_detector import (
+    BoundingBox,
+    Component,
+    check_2d_clearances,
+    check_assembly_interference,
+    check_box_overlap,
+)
+
+
+def build_layout(count: int, seed: int = 7) -> list[Component]:
+    """Tubes on a 2.5" pitch, frames, supports under the bundle every 48" and random hardware (inches)."""
+    rng = random.Random(seed)
+    tubes_per_row = 40
+    length = 360.0
+    components = []
+    n_tubes = count * 7 // 10
+    for k in range(n_tubes):
+        row, col = divmod(k, tubes_per_row)
+        bundle, row = divmod(row, 6)
+        y = bundle * 110.0 + col * 2.5
+        z = row * 2.165
+        components.append(Component(f"TUBE-{k}", "TUBE", BoundingBox(0, length, y, y + 1.0, z, z + 1.0), "tube"))
+    bundles = n_tubes // (tubes_per_row * 6) + 1
+    n_supports = count // 10
+    for k in range(n_supports):
+        # Supports under each bundle, staggered along the length
+        bundle, slot = divmod(k, n_supports // bundles + 1)
+        x = slot * (length / (n_supports / bundles + 1))
+        y = bundle * 110.0 - 2
+        components.append(Component(f"SUPPORT-{k}", "SUP", BoundingBox(x, x + 0.25, y, y + 104, -6, -0.5), "structural"))
+    while len(components) < count:
+        # Hardware on the plenum above the bundles
+        k = len(components)
+        x, y, z = rng.uniform(-20, length + 20), rng.uniform(-10, bundles * 110.0), rng.uniform(16, 40)
+        size = rng.choice([0.5, 0.75, 1.0, 4.0])
+        components.append(Component(f"HW-{k}", "HW", BoundingBox(x, x + size, y, y + size, z, z + size / 4), "hardware"))
+    rng.shuffle(components)
+    return components
+
+
+def legacy_rows(components, tolerance, rows, check=check_box_overlap, attr="bounds"):
+    """The old nested loop over the first ``rows`` rows; returns the number reported."""
+    reported = 0
+    for i in range(rows):
+        a = getattr(components[i], attr)
+        for j in range(i + 1, len(components)):
+            overlaps, dist = check(a, getattr(components[j], attr))
+            if overlaps or dist < tolerance:
+                reported += 1
+    return reported
+
+
+def key(results):
+    return [(r.component_a, r.component_b, r.overlap_distance, r.severity) for r in results]
+
+
+def run(count: int, tolerance: float, exact_limit: int):
+    components = build_layout(count)
+    print(f"{count:,} components, tolerance {tolerance}\"")
+
+    start = time.perf_counter()
+    fast = check_assembly_interference(components, tolerance)
+    fast_s = time.perf_counter() - start
+    print(f"  {'3D broad phase':<22}{fast_s * 1000:>10.1f} ms  {len(fast.interferences):,} findings")
+
+    if count <= exact_limit:
+        detector.NUMPY_AVAILABLE = False
+        start = time.perf_counter()
+        slow = check_assembly_interference(components, tolerance)
+        slow_s = time.perf_counter() - start
+        detector.NUMPY_AVAILABLE = True
+        assert key(slow.interferences) == key(fast.interferences), "broad phase results differ"
+        print(f"  {'3D all pairs':<22}{slow_s * 1000:>10.1f} ms  (identical results)")
+    else:
+        rows = 200
+        start = time.perf_counter()
+        legacy_rows(components, tolerance, rows)
+        per_row = (time.perf_counter() - start) / rows
+        # Row i checks n - i - 1 pairs; scale by total pairs over sampled pairs
+        sampled = sum(count - i - 1 for i in range(rows))
+        slow_s = per_row * rows * (count * (count - 1) / 2) / sampled
+        print(f"  {'3D all pairs':<22}{slow_s * 1000:>10.1f} ms  (extrapolated from {rows} rows)")
+
+    entities = [
+        {"name": c.name, "bounds": {"x_min": c.bounds.x_min, "x_max": c.bounds.x_max,
+                                     "y_min": c.bounds.y_min, "y_max": c.bounds.y_max}}
+        for c in components if c.component_type != "tube"
+    ]
+    start = time.perf_counter()
+    results = check_2d_clearances(entities, tolerance)
+    print(f"  {'2D broad phase':<22}{(time.perf_counter() - start) * 1000:>10.1f} ms  "
+          f"{len(results):,} findings over {len(entities):,} entities")
+    print()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--components", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--tolerance", type=float, default=0.125)
+    parser.add_argument("--exact-limit", type=int, default=10000,
+                        help="Run the full all-pairs loop (and compare) up to this size")
+    args = parser.parse_args()
+    for count in args.components:
+        run(count, args.tolerance, args.exact_limit)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,110 @@
+"""
+Benchmark KnowledgeGraph at scale.
+
+Builds a synthetic graph (default 100k nodes, 1M edges) in a temporary
+directory and times edge inserts, duplicate-edge updates, typed lookups,
+search, neighbor/incoming traversal, pruning, compaction and reload.
+
+Usage:
+    python scripts/benchmark_knowledge_graph.py [--nodes 100000] [--edges 1000000]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.memory.knowledge_graph import KnowledgeGraph
+
+NODE_TYPES = ["strategy", "part", "standard", "material", "error"]
+
+
+@contextmanager
+def timed(label, count=None):
+    start = time.perf_counter()
+    yield
+    elapsed = time.perf_counter() - start
+    rate = f"  ({count / elapsed:,.0f}/s)" if count else ""
+    print(f"{label:<34}{elapsed * 1000:>10.1f} ms{rate}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--nodes", type=int, default=100_000)
+    parser.add_argument("--edges", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    logging.disable(logging.INFO)
+    rng = random.Random(args.seed)
+    workdir = tempfile.mkdtemp(prefix="kg_bench_")
+    graph_file = str(Path(workdir) / "graph.json")
+    graph = KnowledgeGraph(graph_file=graph_file, compact_every=10 ** 9)
+
+    with timed(f"add {args.nodes:,} nodes", args.nodes):
+        with graph.batch():
+            for i in range(args.nodes):
+                graph.add_node(
+                    f"n{i}", NODE_TYPES[i % len(NODE_TYPES)], f"Component {i}",
+                    {"spec": f"SA-{100 + i % 400}", "rev": chr(65 + i % 26)},
+                )
+
+    pairs = [
+        (f"n{rng.randrange(args.nodes)}", f"n{rng.randrange(args.nodes)}")
+        for _ in range(args.edges)
+    ]
+    with timed(f"add {args.edges:,} edges", args.edges):
+        with graph.batch():
+            for source, target in pairs:
+                graph.add_edge(source, target, "related_to")
+
+    repeats = pairs[:100_000]
+    with timed(f"re-add {len(repeats):,} existing edges", len(repeats)):
+        with graph.batch():
+            for source, target in repeats:
+                graph.add_edge(source, target, "related_to", weight=2.0)
+
+    with timed("get_related x1000", 1000):
+        for i in range(1000):
+            graph.get_related(NODE_TYPES[i % len(NODE_TYPES)], limit=10)
+
+    queries = [f"component {rng.randrange(args.nodes)}" for _ in range(1000)]
+    with timed("search (unique label) x1000", 1000):
+        for query in queries:
+            graph.search(query)
+
+    with timed("search (spec, typed) x100", 100):
+        for i in range(100):
+            graph.search(f"SA-{100 + i}", node_type="part")
+
+    with timed("get_neighbors + get_incoming x10k", 10_000):
+        for i in range(10_000):
+            graph.get_neighbors(f"n{i}")
+            graph.get_incoming(f"n{i}")
+
+    with timed("compact (snapshot write)"):
+        graph.compact()
+
+    with timed("reload snapshot"):
+        KnowledgeGraph(graph_file=graph_file)
+
+    stale = datetime.utcnow() - timedelta(days=365)
+    for i in range(0, args.nodes, 10):
+        graph.nodes[f"n{i}"].last_accessed = stale
+    with timed("prune 10% of nodes"):
+        graph.prune_old(days=90)
+
+    stats = graph.get_stats()
+    print(f"final graph: {stats['total_nodes']:,} nodes, {stats['total_edges']:,} edges ({workdir})")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
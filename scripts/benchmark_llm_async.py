@@ -0,0 +1,117 @@
+"""
+Benchmark concurrent chat calls from one event loop.
+
+Starts a local fake Messages API with a fixed round-trip and sends a burst
+of distinct chat requests from a single asyncio loop (as FastAPI does):
+first through the synchronous SDK client called inside the coroutine (the
+previous llm_async behavior, which blocks the loop), then through
+core.llm_async.LLMClient. Reports wall time, the longest event-loop stall
+and how many connections the server saw.
+
+Usage:
+    python scripts/benchmark_llm_async.py [--requests 32] [--latency 0.2] [--concurrency 8]
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_async import LLMClient
+from core.llm_cache import ResponseCache
+from core.redis_adapter import InMemoryCache
+
+MODEL = "claude-3-haiku-20240307"
+
+
+class FakeAPI(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.connections.add(self.client_address)
+        time.sleep(self.server.latency)
+        body = json.dumps({
+            "id": "msg_1", "type": "message", "role": "assistant", "model": request["model"],
+            "content": [{"type": "text", "text": "ok"}], "stop_reason": "end_turn", "stop_sequence": None,
+            "usage": {"input_tokens": 10, "output_tokens": 2},
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+async def measure(calls):
+    """Run the calls concurrently; return (seconds, longest loop stall)."""
+    stall = 0.0
+
+    async def watchdog():
+        nonlocal stall
+        while True:
+            before = time.perf_counter()
+            await asyncio.sleep(0.005)
+            stall = max(stall, time.perf_counter() - before - 0.005)
+
+    dog = asyncio.ensure_future(watchdog())
+    await asyncio.sleep(0)  # Let the watchdog start its first sleep
+    start = time.perf_counter()
+    await asyncio.gather(*calls)
+    elapsed = time.perf_counter() - start
+    await asyncio.sleep(0.01)  # Let the watchdog record the last stall
+    dog.cancel()
+    return elapsed, stall
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=32)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAPI)
+    server.daemon_threads = True
+    server.latency = args.latency
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}"
+    questions = [[{"role": "user", "content": f"question {i}"}] for i in range(args.requests)]
+
+    import anthropic
+
+    sync_client = anthropic.Anthropic(api_key="test", base_url=base_url)
+
+    async def blocking(messages):
+        return sync_client.messages.create(model=MODEL, max_tokens=64, messages=messages)
+
+    client = LLMClient(api_key="test", base_url=base_url, model_concurrency={MODEL: args.concurrency})
+    client.cache = ResponseCache(backend=InMemoryCache())
+
+    async def run_async():
+        result = await measure([client.chat(m, force_model=MODEL, use_cache=False) for m in questions])
+        await client.aclose()
+        return result
+
+    print(f"{args.requests} chat calls, {args.latency * 1000:.0f} ms upstream, cap {args.concurrency}/model")
+    for name, run in (("sync SDK in coroutine", lambda: measure([blocking(m) for m in questions])),
+                      ("async client", run_async)):
+        server.connections = set()
+        elapsed, stall = asyncio.run(run())
+        print(f"  {name:<24}{elapsed * 1000:>8,.0f} ms  longest loop stall {stall * 1000:>6,.0f} ms  "
+              f"connections {len(server.connections)}")
+    server.shutdown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
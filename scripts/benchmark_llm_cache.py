@@ -0,0 +1,95 @@
+"""
+Benchmark the LLM response cache across simulated workers.
+
+Replays a synthetic request log (repeated CAD check prompts with a shared
+prefix, some multi-turn, two models) through several "workers", each with
+its own string-hash salt, against one shared in-memory backend. Compares
+the previous keys (hash() of the last message, salted per process; and the
+100-character prefix key) with the content-addressed request_key, and
+reports correct hits, wrong answers served and stored bytes.
+
+Usage:
+    python scripts/benchmark_llm_cache.py [--requests 5000] [--workers 4]
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_cache import ResponseCache, request_key
+from core.redis_adapter import InMemoryCache
+
+PREFIX = "Check the following SolidWorks part against AISC 360-16 and AWS D1.1 and list every issue: "
+
+
+def synthetic_log(count: int, seed: int = 3):
+    rng = random.Random(seed)
+    parts = [f"PART-{i:04d} plate {rng.choice(['1/4', '3/8', '1/2'])} in A36" for i in range(count // 8)]
+    log = []
+    for _ in range(count):
+        part = rng.choice(parts)
+        history = [{"role": "user", "content": PREFIX + part}]
+        if rng.random() < 0.3:
+            history += [{"role": "assistant", "content": f"Issues for {part}: none."},
+                        {"role": "user", "content": "Are you sure?"}]
+        model = rng.choice(["claude-3-haiku-20240307", "claude-sonnet-4-20250514"])
+        log.append((model, history, "You are a CAD checker.", 1024, 0.2))
+    return log
+
+
+def answer(request) -> str:
+    model, messages, system, max_tokens, temperature = request
+    return f"{model}:{request_key(*request)[-12:]} " + "No issues found. " * 60
+
+
+def replay(log, workers: int, key_fn):
+    cache = ResponseCache(backend=InMemoryCache(max_size=len(log) + 1))
+    wrong = 0
+    for index, request in enumerate(log):
+        key = key_fn(request, index % workers)
+        entry = cache.get(key)
+        if entry is None:
+            cache.set(key, {"content": answer(request)})
+        elif entry["content"] != answer(request):
+            wrong += 1
+    return cache.stats(), wrong
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=4)
+    args = parser.parse_args()
+
+    log = synthetic_log(args.requests)
+
+    def legacy_hash_key(request, worker):
+        # hash() is salted per process (PYTHONHASHSEED); model a worker's salt explicitly
+        model, messages, system, _, _ = request
+        return f"llm:{hash((worker, messages[-1]['content'] + system + 'general'))}"
+
+    def legacy_prefix_key(request, worker):
+        return f"llm:general:{request[1][-1]['content'][:100]}"
+
+    def digest_key(request, worker):
+        return request_key(*request)
+
+    print(f"{args.requests:,} requests over {args.workers} workers")
+    for name, key_fn in (("hash(last message)", legacy_hash_key), ("message[:100]", legacy_prefix_key),
+                         ("request_key", digest_key)):
+        start = time.perf_counter()
+        stats, wrong = replay(log, args.workers, key_fn)
+        elapsed = time.perf_counter() - start
+        correct = (stats["hits"] - wrong) / len(log)
+        print(f"  {name:<20} correct hits {correct:>6.1%}  wrong answers {wrong:>5,}  "
+              f"stored {stats['bytes_written'] / 1024:>7,.0f} KiB (raw {stats['bytes_uncompressed'] / 1024:,.0f})  "
+              f"{elapsed * 1000:,.0f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+"""
+Benchmark request coalescing for bursts of identical LLM calls.
+
+Simulates a validation run where many validators ask the assistant for
+explanations at once, most of them for the same few rules. Upstream is a
+simulated API with a fixed round-trip; the script counts upstream calls
+and wall time with and without SingleFlight, then sends a burst of small
+prompts through MicroBatcher against a simulated batch endpoint.
+
+Usage:
+    python scripts/benchmark_llm_coalesce.py [--callers 64] [--distinct 6] [--latency 0.3]
+"""
+
+import argparse
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_cache import request_key
+from core.llm_coalesce import MicroBatcher, SingleFlight
+
+
+class SimulatedUpstream:
+    def __init__(self, latency: float):
+        self.latency = latency
+        self.calls = 0
+        self._lock = threading.Lock()
+
+    def call(self, question: str) -> str:
+        with self._lock:
+            self.calls += 1
+        time.sleep(self.latency)
+        return f"Explanation of {question}"
+
+
+def run(questions, latency: float, coalesce: bool):
+    upstream = SimulatedUpstream(latency)
+    flight = SingleFlight()
+
+    def ask(question):
+        if not coalesce:
+            return upstream.call(question)
+        key = request_key("claude-3-haiku-20240307", [{"role": "user", "content": question}], "", 512, 0.2)
+        return flight.do(key, lambda: upstream.call(question))[0]
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(len(questions)) as pool:
+        list(pool.map(ask, questions))
+    return upstream.calls, time.perf_counter() - start, flight.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--callers", type=int, default=64)
+    parser.add_argument("--distinct", type=int, default=6)
+    parser.add_argument("--latency", type=float, default=0.3)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    rules = [f"ACHE rule {i}" for i in range(args.distinct)]
+    questions = [rng.choice(rules) for _ in range(args.callers)]
+
+    print(f"{args.callers} concurrent callers, {args.distinct} distinct questions, "
+          f"{args.latency * 1000:.0f} ms upstream")
+    for name, coalesce in (("independent calls", False), ("single-flight", True)):
+        calls, seconds, stats = run(questions, args.latency, coalesce)
+        extra = f"  coalesce rate {stats['coalesce_rate']:.0%}" if coalesce else ""
+        print(f"  {name:<20}{calls:>5} upstream calls  {seconds * 1000:>8,.0f} ms{extra}")
+
+    sent = []
+    batcher = MicroBatcher(send=lambda requests: sent.append(len(requests)) or ["ok"] * len(requests),
+                           max_batch=32, max_wait=0.05)
+    start = time.perf_counter()
+    futures = [batcher.submit({"messages": [{"role": "user", "content": q}], "max_tokens": 256})
+               for q in questions]
+    [future.result() for future in futures]
+    batcher.close()
+    stats = batcher.stats()
+    print(f"  {'micro-batched':<20}{stats['batches']:>5} batch calls     {(time.perf_counter() - start) * 1000:>8,.0f} ms"
+          f"  ({stats['batched']} prompts sent, {stats['coalesced']} duplicates folded)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+"""
+Benchmark the semantic response cache on paraphrased engineering questions.
+
+Replays a question log where users ask the same CAD/ACHE questions in
+different words. For each question the cache is checked first; a miss
+"calls the LLM" and stores the answer. Reports, per similarity threshold,
+how many calls were saved and how many hits returned the answer to a
+different question (wrong hits), next to the exact-request cache. Also
+times a lookup against a full cache.
+
+Uses the sentence-transformers model from core.memory.embeddings when it
+is installed, otherwise a character-trigram hashing embedder (much weaker
+on paraphrases; the numbers are then only a lower bound).
+
+Usage:
+    python scripts/benchmark_llm_semantic_cache.py [--repeats 4] [--entries 5000]
+"""
+
+import argparse
+import hashlib
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_semantic_cache import SemanticCache, normalize_query
+
+# Groups of paraphrases: one answer per group
+QUESTIONS = [
+    ["min edge distance for 3/4 bolt", "edge distance 0.75in bolt AISC",
+     "minimum edge distance for a 3/4\" bolt", "what's the AISC min edge distance for 3/4 in bolts"],
+    ["minimum bolt spacing for 7/8 bolts", "bolt spacing 0.875 in bolt minimum",
+     "min spacing between 7/8\" bolts AISC", "what is the minimum center to center spacing for 7/8 bolts"],
+    ["minimum fillet weld size for 1/2 in plate", "min fillet weld 0.5 in thick plate AWS",
+     "smallest fillet weld for 1/2\" plate", "AWS D1.1 minimum fillet weld size 1/2 plate"],
+    ["ACHE header plug spacing rule", "plug spacing in API 661 header box",
+     "API 661 header box plug pitch", "what plug spacing does the ACHE header need"],
+    ["tube pitch for 1 in tubes in an air cooler", "air cooled exchanger tube pitch 1\" tubes",
+     "ACHE tube pitch 1 in OD", "recommended tube pitch for 1 inch ACHE tubes"],
+    ["bend radius for 1/4 in A36 plate", "min bend radius 0.25 in A36",
+     "inside bend radius for 1/4\" A36 steel plate", "A36 plate 1/4 in minimum inside bend radius"],
+    ["hole size for 3/4 bolt standard hole", "standard hole diameter 0.75 in bolt",
+     "what size hole for a 3/4\" bolt", "AISC standard hole for 3/4 in bolt"],
+    ["max fan tip clearance API 661", "fan tip clearance limit air cooler",
+     "API 661 fan ring tip clearance", "how much tip clearance is allowed for ACHE fans"],
+]
+
+
+class TrigramEmbedding:
+    """Character-trigram counts hashed into a fixed vector."""
+
+    def __init__(self, dims: int = 512):
+        self.dims = dims
+
+    def __call__(self, texts):
+        vectors = []
+        for text in texts:
+            vector = [0.0] * self.dims
+            padded = f"  {text}  "
+            for i in range(len(padded) - 2):
+                vector[int(hashlib.md5(padded[i:i + 3].encode()).hexdigest()[:8], 16) % self.dims] += 1.0
+            vectors.append(vector)
+        return vectors
+
+
+def embedder():
+    try:
+        from core.memory.embeddings import get_embedding_function
+
+        embed = get_embedding_function()
+        embed(["warm up"])
+        return embed, "all-MiniLM-L6-v2"
+    except Exception:
+        return TrigramEmbedding(), "trigram hashing (sentence-transformers not installed)"
+
+
+def label(i):
+    """Digit-free query name; numbers would put every entry in its own scope."""
+    return "q" + "".join("abcdefghij"[int(d)] for d in str(i))
+
+
+def replay(log, embed, threshold):
+    cache = SemanticCache(embed=embed, threshold=threshold, watch_paths=None)
+    calls = wrong = 0
+    for group, text in log:
+        query = normalize_query(text)
+        hit = cache.get(query, agent_type="cad", version="v1")
+        if hit is None:
+            calls += 1
+            cache.set(query, {"content": group}, agent_type="cad", version="v1")
+        elif hit["content"] != group:
+            wrong += 1
+    return calls, wrong, cache.stats()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeats", type=int, default=4)
+    parser.add_argument("--entries", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    log = [(g, q) for _ in range(args.repeats) for g, group in enumerate(QUESTIONS)
+           for q in rng.sample(group, len(group))]
+    rng.shuffle(log)
+    embed, name = embedder()
+
+    exact_calls = len({text for _, text in log})
+    print(f"{len(log)} questions, {len(QUESTIONS)} distinct topics, embedder: {name}")
+    print(f"  {'exact-request cache':<24}{exact_calls:>5} LLM calls   0 wrong hits")
+    for threshold in (0.95, 0.9, 0.85, 0.8, 0.7):
+        calls, wrong, stats = replay(log, embed, threshold)
+        print(f"  {'semantic @ ' + format(threshold, '.2f'):<24}{calls:>5} LLM calls {wrong:>3} wrong hits"
+              f"  hit rate {stats['hit_rate']:.0%}  avg hit similarity {stats['avg_hit_similarity']:.3f}")
+
+    cache = SemanticCache(embed=embed, watch_paths=None, max_entries=args.entries)
+    rng = random.Random(1)
+    dims = len(embed(["x"])[0])
+    for i in range(args.entries):
+        cache._vectors[label(i)] = [rng.gauss(0, 1) for _ in range(dims)]
+        cache.set(label(i), {"content": str(i)}, agent_type="cad")
+    cache.get(label(0), agent_type="cad")  # Builds the matrix
+    start = time.perf_counter()
+    for i in range(100):
+        cache._vectors.pop("probe", None)
+        cache.get("probe", agent_type="cad")
+    per_lookup = (time.perf_counter() - start) / 100
+    print(f"  lookup incl. embedding against {args.entries:,} entries: {per_lookup * 1000:.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""
+Benchmark data hub rule evaluation over large part batches.
+
+Evaluates the built-in rules plus a synthetic rule set (constants, field
+multiples, dotted paths, lookups, IN/MATCHES) against synthetic part records
+three ways: the previous interpreter (rule re-read on every call), compiled
+plans through RulesEngine.evaluate per record, and RulesEngine.evaluate_batch.
+
+Usage:
+    python scripts/benchmark_rules_engine.py [--records 1000 10000]
+"""
+
+import argparse
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent"))
+
+from data_hub.rules_engine import (
+    FORMULAS,
+    LOOKUP_TABLES,
+    NUMPY_AVAILABLE,
+    RuleOperator,
+    RulesEngine,
+    RuleSeverity,
+    RuleViolation,
+    ValidationRule,
+)
+
+FIELDS = ["bolt_spacing", "bolt_diameter", "edge_distance", "fillet_weld_size", "base_metal_thickness",
+          "wall_thickness", "design_pressure", "weight_lbs", "hole_diameter", "plate_thickness",
+          "bend_radius", "material_thickness", "position_tolerance"]
+
+
+def synthetic_rules(count: int, seed: int = 5):
+    rng = random.Random(seed)
+    rules = []
+    sized = [f for f in FIELDS if f != "bolt_diameter"] + ["geometry.flange_width", "geometry.web_depth"]
+    for k in range(count):
+        field = rng.choice(sized)
+        kind = rng.random()
+        # Thresholds are set so that most parts pass, as in a real batch
+        if kind < 0.5:
+            op, value = rng.choice([(RuleOperator.GREATER_THAN_OR_EQUAL, rng.uniform(0.01, 2)),
+                                    (RuleOperator.LESS_THAN, rng.uniform(590, 700))])
+        elif kind < 0.8:
+            op, value = RuleOperator.GREATER_THAN_OR_EQUAL, {"multiplier": rng.uniform(0.0001, 0.02), "base_field": rng.choice(FIELDS)}
+        elif kind < 0.9:
+            op, field, value = RuleOperator.IN, "bolt_diameter", [0.5, 0.625, 0.75, 0.875, 1.0]
+        else:
+            op, field, value = RuleOperator.MATCHES, "material", r"^A\d+"
+        rules.append(ValidationRule(
+            id=f"SYN-{k:03d}", name=f"Synthetic {k}", description="", standard=f"SYN-{k % 4}",
+            section=None, severity=RuleSeverity.WARNING, field=field, operator=op, value=value,
+            message="synthetic", tags=[f"group{k % 5}", "synthetic"],
+        ))
+    return rules
+
+
+def synthetic_records(count: int, seed: int = 9):
+    rng = random.Random(seed)
+    records = []
+    for _ in range(count):
+        record = {f: round(rng.uniform(0.05, 600), 3) for f in FIELDS if rng.random() < 0.8}
+        record["bolt_diameter"] = rng.choice([0.5, 0.625, 0.75, 0.875, 1.0])
+        record["geometry"] = {"flange_width": rng.uniform(2, 16), "web_depth": rng.uniform(4, 40)}
+        record["material"] = rng.choice(["A36", "A572-50", "A516-70", "A106-B", "SS304"])
+        records.append(record)
+    return records
+
+
+def legacy_evaluate(rules, data):
+    """The previous per-call interpretation of every rule."""
+    def get(path, source):
+        if "." in path:
+            value = source
+            for part in path.split("."):
+                if not isinstance(value, dict):
+                    return None
+                value = value.get(part)
+            return value
+        return source.get(path)
+
+    def resolve(value):
+        if isinstance(value, dict):
+            if "multiplier" in value and "base_field" in value:
+                base = get(value["base_field"], data)
+                if base is not None:
+                    return value["multiplier"] * base
+            if "lookup" in value:
+                return LOOKUP_TABLES.get(value["lookup"], lambda d: None)(data)
+            if "formula" in value:
+                return FORMULAS.get(value["formula"], lambda d: None)(data)
+        return value
+
+    def compare(op, actual, expected):
+        try:
+            if op == RuleOperator.EQUALS:
+                return actual == expected
+            elif op == RuleOperator.GREATER_THAN_OR_EQUAL:
+                return actual >= expected
+            elif op == RuleOperator.LESS_THAN:
+                return actual < expected
+            elif op == RuleOperator.IN:
+                return actual in expected
+            elif op == RuleOperator.MATCHES:
+                return bool(re.match(expected, str(actual)))
+        except (TypeError, ValueError):
+            return False
+        return False
+
+    failed = []
+    for rule in rules:
+        if not rule.enabled:
+            continue
+        actual = get(rule.field, data)
+        if actual is None:
+            continue
+        expected = resolve(rule.value)
+        if not compare(rule.operator, actual, expected):
+            failed.append(RuleViolation(
+                rule_id=rule.id, rule_name=rule.name, severity=rule.severity, message=rule.message,
+                suggestion=rule.suggestion, field=rule.field, actual_value=actual, expected_value=expected,
+                standard_reference=f"{rule.standard} {rule.section}" if rule.section else rule.standard,
+            ))
+    return failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, nargs="+", default=[1000, 10000])
+    parser.add_argument("--rules", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = RulesEngine(rules_dir=Path("/nonexistent"))
+    for rule in synthetic_rules(args.rules):
+        engine.add_rule(rule)
+    all_rules = list(engine._rules.values())
+    print(f"{len(all_rules)} rules, NumPy {'available' if NUMPY_AVAILABLE else 'not installed'}")
+
+    for count in args.records:
+        records = synthetic_records(count)
+
+        start = time.perf_counter()
+        legacy = [legacy_evaluate(all_rules, record) for record in records]
+        legacy_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        compiled = [engine.evaluate(record) for record in records]
+        compiled_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        batch = engine.evaluate_batch(records)
+        batch_s = time.perf_counter() - start
+
+        assert [len(v) for v in compiled] == [len(v) for v in legacy] == [len(v) for v in batch]
+        violations = sum(len(v) for v in batch)
+        print(f"{count:>7,} records, {violations:,} violations")
+        for name, seconds in (("interpreted", legacy_s), ("compiled evaluate", compiled_s), ("evaluate_batch", batch_s)):
+            print(f"  {name:<20}{seconds * 1000:>10.1f} ms  {count / seconds:>10,.0f} records/s")
+
+        start = time.perf_counter()
+        engine.evaluate_batch(records, tags=["group1", "group3"])
+        print(f"  {'batch, two tags':<20}{(time.perf_counter() - start) * 1000:>10.1f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
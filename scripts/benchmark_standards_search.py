@@ -0,0 +1,160 @@
+"""
+Benchmark data hub search at full AISC shapes table size.
+
+Builds a synthetic shapes table (W, HSS, C, L, WT designations with the
+usual ~40 section properties each) and times StandardsHub.search,
+ComponentLookup.search/fuzzy_search and the numeric range filter against
+the previous per-query scans over every item.
+
+Usage:
+    python scripts/benchmark_standards_search.py [--shapes 2300]
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent"))
+
+from data_hub import ComponentLookup, StandardsHub
+
+PROPERTIES = [
+    "area", "depth", "flange_width", "web_thickness", "flange_thickness", "kdes", "kdet", "k1",
+    "bf_2tf", "h_tw", "Ix", "Zx", "Sx", "rx", "Iy", "Zy", "Sy", "ry", "J", "Cw", "Wno", "Sw1",
+    "Qf", "Qw", "rts", "ho", "PA", "PB", "PC", "PD", "T", "WGi", "WGo", "x_bar", "y_bar", "eo",
+    "xp", "yp", "ro", "H",
+]
+QUERIES = ["w", "w1", "w14x", "w14x90", "hss6x", "zx", "0.25", "c12x", "w-shape", "l4x4x"]
+TYPO_QUERIES = ["W14X09", "W41X90", "HSS6X6X1/", "C12X2O", "L4X4X1/2"]
+
+
+def build_shapes(count: int, seed: int = 11) -> dict:
+    rng = random.Random(seed)
+    shapes = {}
+    families = [("W", "W-Shape"), ("HSS", "HSS"), ("C", "Channel"), ("L", "Angle"), ("WT", "Tee")]
+    while len(shapes) < count:
+        prefix, kind = rng.choice(families)
+        if prefix == "HSS":
+            name = f"HSS{rng.randint(2, 20)}X{rng.randint(2, 20)}X{rng.choice(['1/8', '1/4', '3/8', '1/2'])}"
+        elif prefix == "L":
+            name = f"L{rng.randint(2, 8)}X{rng.randint(2, 8)}X{rng.choice(['1/4', '3/8', '1/2', '3/4'])}"
+        else:
+            name = f"{prefix}{rng.randint(4, 44)}X{rng.randint(5, 900)}"
+        props = {"designation": name, "type": kind, "weight_per_ft": round(rng.uniform(2, 900), 1)}
+        props.update({p: round(rng.uniform(0.01, 20000), 3) for p in PROPERTIES})
+        shapes[name] = props
+    return shapes
+
+
+def legacy_hub_search(hub: StandardsHub, query: str, limit: int = 20) -> list:
+    query_lower = query.lower()
+    results = []
+    for items in hub._index.values():
+        for item in items:
+            designation = item.designation.lower()
+            if query_lower == designation:
+                score = 1.0
+            elif query_lower in designation:
+                score = 0.7
+            elif query_lower in item.category.lower():
+                score = 0.3
+            elif query_lower in str(item.properties).lower():
+                score = 0.2
+            else:
+                continue
+            results.append((score, item))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return results[:limit]
+
+
+def legacy_levenshtein(s1: str, s2: str) -> float:
+    if s1 == s2:
+        return 1.0
+    len1, len2 = len(s1), len(s2)
+    if len1 == 0 or len2 == 0:
+        return 0.0
+    d = [[0] * (len2 + 1) for _ in range(len1 + 1)]
+    for i in range(len1 + 1):
+        d[i][0] = i
+    for j in range(len2 + 1):
+        d[0][j] = j
+    for i in range(1, len1 + 1):
+        for j in range(1, len2 + 1):
+            cost = 0 if s1[i - 1] == s2[j - 1] else 1
+            d[i][j] = min(d[i - 1][j] + 1, d[i][j - 1] + 1, d[i - 1][j - 1] + cost)
+    return 1.0 - d[len1][len2] / max(len1, len2)
+
+
+def legacy_component_search(lookup: ComponentLookup, query: str) -> list:
+    query_upper = query.upper().replace(" ", "")
+    results = []
+    for key, spec in lookup._components.items():
+        if query_upper == key or query_upper == spec.designation.upper():
+            results.append((1.0, spec))
+        elif query_upper in key or query_upper in spec.designation.upper():
+            results.append((0.7, spec))
+        elif query_upper in str(spec.properties).upper():
+            results.append((0.3, spec))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return results
+
+
+def legacy_fuzzy(lookup: ComponentLookup, query: str, threshold: float = 0.5) -> list:
+    query_upper = query.upper().replace(" ", "")
+    results = []
+    for spec in lookup._components.values():
+        similarity = legacy_levenshtein(query_upper, spec.designation.upper().replace(" ", ""))
+        if similarity >= threshold:
+            results.append((similarity, spec))
+    results.sort(key=lambda x: x[0], reverse=True)
+    return results[:10]
+
+
+def per_query_us(fn, queries, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for query in queries:
+            fn(query)
+    return (time.perf_counter() - start) / (repeat * len(queries)) * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--shapes", type=int, default=2300, help="Synthetic AISC shapes (v16 table has ~2,300)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    shapes = build_shapes(args.shapes)
+    with tempfile.TemporaryDirectory() as tmp:
+        Path(tmp, "aisc_shapes.json").write_text(json.dumps(shapes))
+        start = time.perf_counter()
+        hub = StandardsHub(Path(tmp))
+        print(f"StandardsHub with {args.shapes:,} shapes built in {(time.perf_counter() - start) * 1000:.0f} ms")
+
+    ComponentLookup.W_SHAPES = {name: props for name, props in shapes.items() if name.startswith("W")}
+    start = time.perf_counter()
+    lookup = ComponentLookup()
+    print(f"ComponentLookup with {len(lookup._components):,} components built in "
+          f"{(time.perf_counter() - start) * 1000:.0f} ms")
+
+    rows = [
+        ("StandardsHub.search", lambda q: hub.search(q), lambda q: legacy_hub_search(hub, q), QUERIES),
+        ("ComponentLookup.search", lookup.search, lambda q: legacy_component_search(lookup, q), QUERIES),
+        ("ComponentLookup.fuzzy_search", lookup.fuzzy_search, lambda q: legacy_fuzzy(lookup, q), TYPO_QUERIES),
+    ]
+    for name, indexed, legacy, queries in rows:
+        new_us = per_query_us(indexed, queries, args.repeat)
+        old_us = per_query_us(legacy, queries, max(1, args.repeat // 10))
+        print(f"  {name:<30}{old_us:>12,.0f} us -> {new_us:>8,.0f} us per query")
+
+    range_us = per_query_us(lambda lo: lookup.filter_by_property("Zx", lo, lo + 500), [100, 5000, 15000], args.repeat)
+    print(f"  {'filter_by_property Zx range':<30}{range_us:>27,.0f} us per query")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,102 @@
+"""
+Action Log and Kill Switch Tests
+
+Tests for the bounded desktop-server action log and the background
+kill-switch sampler.
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from action_log import ActionLog
+from kill_switch import KillSwitch
+
+
+def test_ring_buffer_evicts_oldest_and_keeps_type_index_in_step():
+    log = ActionLog(max_entries=100)
+    for i in range(1000):
+        if i % 10 == 0:
+            log.record("queue_execution", command={"i": i})
+        else:
+            log.record("request", method="GET", path=f"/mouse/{i}")
+
+    assert len(log) == 100
+    assert log.total_recorded == 1000
+    stats = log.get_stats()
+    assert stats["by_type"] == {"queue_execution": 10, "request": 90}
+    queued = log.query(type="queue_execution", limit=1000)
+    assert [e["command"]["i"] for e in queued] == list(range(900, 1000, 10))
+
+
+def test_query_filters_by_path_time_and_limit():
+    log = ActionLog()
+    log.record("request", method="POST", path="/mouse/move", client="a")
+    log.record("request", method="POST", path="/keyboard/type", client="a")
+    cutoff = time.time()
+    time.sleep(0.01)
+    log.record("request", method="POST", path="/mouse/click", client="b")
+    log.record("request", method="GET", path="/health", client="b")
+
+    assert [e["path"] for e in log.query(path="/mouse")] == ["/mouse/move", "/mouse/click"]
+    assert [e["path"] for e in log.query(since=cutoff)] == ["/mouse/click", "/health"]
+    assert [e["path"] for e in log.query(until=cutoff)] == ["/mouse/move", "/keyboard/type"]
+    assert [e["path"] for e in log.query(limit=1)] == ["/health"]
+    assert set(log.query(limit=1)[0]) == {"timestamp", "type", "method", "path", "client"}
+
+
+def test_large_payloads_truncated_in_memory_but_spilled_whole(tmp_path):
+    spill = tmp_path / "actions.jsonl"
+    log = ActionLog(max_payload_chars=100, spill_file=spill, spill_max_bytes=2000, spill_backups=2)
+    result = {"image": "x" * 5000}
+    log.record("queue_execution", command={"type": "screen", "action": "capture"}, result=result)
+    for i in range(50):
+        log.record("request", method="GET", path=f"/screen/{i}")
+
+    entry = log.query(type="queue_execution")[0]
+    assert entry["command"] == {"type": "screen", "action": "capture"}
+    assert entry["result"].endswith("...[truncated]") and len(entry["result"]) < 200
+
+    backups = sorted(tmp_path.glob("actions.jsonl*"))
+    assert len(backups) == 3  # current file plus two rotations
+    assert all(p.stat().st_size <= 2000 + 6000 for p in backups)
+    last = json.loads(spill.read_text().strip().splitlines()[-1])
+    assert last["path"] == "/screen/49"
+
+
+def test_kill_switch_sampler_trips_and_resets_only_away_from_corner():
+    cursor = {"pos": (500, 400)}
+    switch = KillSwitch(lambda: cursor["pos"], interval=0.005)
+    switch.start()
+    try:
+        time.sleep(0.03)
+        assert not switch.active
+
+        cursor["pos"] = (3, 4)
+        deadline = time.time() + 2
+        while not switch.active and time.time() < deadline:
+            time.sleep(0.005)
+        assert switch.active
+        assert not switch.try_reset()  # still in the corner
+
+        cursor["pos"] = (30, 300)
+        assert switch.try_reset()
+        assert not switch.active
+    finally:
+        switch.stop()
+
+    switch.trip("manual")
+    assert switch.get_status()["reason"] == "manual"
+
+
+def test_unavailable_cursor_does_not_trip():
+    def no_display():
+        raise OSError("no display")
+
+    switch = KillSwitch(no_display)
+    assert switch.sample() is False
+    switch.trip()
+    assert switch.try_reset() is False  # can't confirm the mouse moved away
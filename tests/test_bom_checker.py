@@ -0,0 +1,107 @@
+"""
+BOM Checker Tests
+
+Tests for blocked candidate generation and optimal one-to-one assignment
+in BOMChecker.verify_bom, and for the shared sparse assignment solver.
+"""
+
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cad_agent.adapters.assignment import solve_assignment
+from agents.cad_agent.adapters.bom_cross_checker import (
+    BOMChecker,
+    BOMItem,
+    CheckResult,
+    DrawingPart,
+    MatchStatus,
+)
+
+
+def synthetic_bom(count, seed=7):
+    """BOM items with one drawing each, some carrying a revision suffix."""
+    rng = random.Random(seed)
+    items, drawings = [], []
+    for k in range(count):
+        pn = f"ACHE-PL-{10000 + k}"
+        desc = f"PLATE {rng.randint(1, 12)}x{rng.randint(1, 48)}"
+        items.append(BOMItem(k + 1, pn, desc, material="A36", weight_each=10.0 + k))
+        if k % 7 == 0:
+            pn = pn + "-A"
+        drawings.append(DrawingPart(pn, desc, "A36", 10.0 + k))
+    return items, drawings
+
+
+def pairing(result):
+    return {
+        m.bom_item.part_number: m.drawing_part.part_number
+        for m in result.matches if m.drawing_part is not None
+    }
+
+
+def test_exact_and_revised_part_numbers_match():
+    items, drawings = synthetic_bom(30)
+    result = BOMChecker().verify_bom(items, drawings)
+    assert result.status == CheckResult.PASS
+    assert all(d.startswith(b) for b, d in pairing(result).items())
+
+
+def test_assignment_beats_greedy_order():
+    # Greedy in BOM order gives "P-100" the drawing "P-100-A" (contains it),
+    # leaving "P-100-A" with nothing; the optimal pairing matches both exactly
+    items = [BOMItem(1, "P-100", "PLATE"), BOMItem(2, "P-100-A", "PLATE")]
+    drawings = [DrawingPart("P-100-A", "PLATE"), DrawingPart("P-100", "PLATE")]
+    result = BOMChecker().verify_bom(items, drawings)
+    assert pairing(result) == {"P-100": "P-100", "P-100-A": "P-100-A"}
+    assert result.status == CheckResult.PASS
+
+
+def test_result_does_not_depend_on_order():
+    items, drawings = synthetic_bom(150)
+    checker = BOMChecker()
+    expected = pairing(checker.verify_bom(items, drawings))
+
+    rng = random.Random(2)
+    rng.shuffle(items)
+    rng.shuffle(drawings)
+    assert pairing(checker.verify_bom(items, drawings)) == expected
+
+
+def test_blocked_matches_exhaustive_on_large_set():
+    items, drawings = synthetic_bom(300)
+    drawings = drawings[:-10] + [DrawingPart(f"SKID-{k}", "SHIPPING SKID") for k in range(5)]
+
+    blocked = BOMChecker(exhaustive_below=0).verify_bom(items, drawings)
+    exhaustive = BOMChecker(exhaustive_below=len(drawings)).verify_bom(items, drawings)
+    assert pairing(blocked) == pairing(exhaustive)
+    assert len(blocked.missing_from_drawings) == 10
+    assert {d.part_number for d in blocked.missing_from_bom} == {f"SKID-{k}" for k in range(5)}
+    assert blocked.status == CheckResult.FAIL
+
+
+def test_missing_items_keep_bom_order():
+    items = [BOMItem(1, "A-1"), BOMItem(2, "ZZZ-9"), BOMItem(3, "B-2")]
+    drawings = [DrawingPart("B-2"), DrawingPart("A-1")]
+    result = BOMChecker().verify_bom(items, drawings)
+    assert [m.bom_item.part_number for m in result.matches] == ["A-1", "ZZZ-9", "B-2"]
+    assert result.matches[1].status == MatchStatus.MISSING
+
+
+def test_solver_prefers_more_pairs_then_lower_cost():
+    # Cheapest edge (0, 0) alone would leave row 1 unpaired
+    chosen = sorted(solve_assignment([(0, 0, 0.1), (0, 1, 0.5), (1, 0, 0.2)]))
+    assert chosen == [(0, 1, 0.5), (1, 0, 0.2)]
+
+    # With an unpaired cost, negative scores give maximum total score instead
+    chosen = solve_assignment([(0, 0, -0.9), (0, 1, -0.5), (1, 0, -0.2)], unpaired_cost=0.0)
+    assert sorted(chosen) == [(0, 0, -0.9)]
+
+
+def test_solver_terminates_on_rounding_ties():
+    # Potentials that differ only by float rounding once cycled forever
+    edges = [(1, 0, 0.565), (2, 1, 0.143), (1, 1, 0.361), (3, 3, 0.138), (0, 0, 0.894), (1, 3, 0.349)]
+    chosen = solve_assignment(edges)
+    assert sorted(chosen) == [(1, 0, 0.565), (2, 1, 0.143), (3, 3, 0.138)]
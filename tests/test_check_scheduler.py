@@ -0,0 +1,138 @@
+"""
+Check Scheduler Tests
+
+Tests for dependency-ordered, concurrent execution of validation checks.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.cad_agent.validators.check_scheduler import CheckScheduler, CheckSpec
+from agents.cad_agent.validators.drawing_analyzer import DrawingAnalysis
+from agents.cad_agent.validators.orchestrator import ValidationOrchestrator
+from agents.cad_agent.validators.validation_models import (
+    ValidationRequest,
+    ValidationStatus,
+)
+
+
+def _sleeper(seconds, log=None, name=None):
+    async def run():
+        if log is not None:
+            log.append(("start", name))
+        time.sleep(seconds)  # blocking, like a CPU-bound validator
+        if log is not None:
+            log.append(("end", name))
+        return name
+    return run
+
+
+class TestCheckScheduler:
+    """Test CheckScheduler ordering and concurrency."""
+
+    def test_order_levels(self):
+        specs = [
+            CheckSpec("a", _sleeper(0)),
+            CheckSpec("b", _sleeper(0), depends_on=("a",)),
+            CheckSpec("c", _sleeper(0)),
+            CheckSpec("d", _sleeper(0), depends_on=("b", "c")),
+        ]
+        assert CheckScheduler.order(specs) == [["a", "c"], ["b"], ["d"]]
+
+    def test_missing_dependency_ignored(self):
+        specs = [CheckSpec("a", _sleeper(0), depends_on=("not_requested",))]
+        assert CheckScheduler.order(specs) == [["a"]]
+
+    def test_cycle_rejected(self):
+        specs = [
+            CheckSpec("a", _sleeper(0), depends_on=("b",)),
+            CheckSpec("b", _sleeper(0), depends_on=("a",)),
+        ]
+        with pytest.raises(ValueError):
+            CheckScheduler.order(specs)
+
+    def test_independent_checks_run_concurrently(self):
+        # Every check blocks until all four are running at once
+        barrier = threading.Barrier(4, timeout=5)
+
+        def meet(name):
+            async def run():
+                barrier.wait()
+                return name
+            return run
+
+        scheduler = CheckScheduler(max_workers=4)
+        specs = [CheckSpec(name, meet(name)) for name in "abcd"]
+        outcomes = asyncio.run(scheduler.run(specs))
+        scheduler.shutdown()
+
+        assert list(outcomes) == ["a", "b", "c", "d"]
+        assert all(o.result == o.name for o in outcomes.values())
+        assert not barrier.broken
+
+    def test_dependencies_respected(self):
+        log = []
+        scheduler = CheckScheduler(max_workers=4)
+        specs = [
+            CheckSpec("late", _sleeper(0.01, log, "late"), depends_on=("early",)),
+            CheckSpec("early", _sleeper(0.05, log, "early")),
+        ]
+        asyncio.run(scheduler.run(specs))
+        scheduler.shutdown()
+
+        assert log.index(("end", "early")) < log.index(("start", "late"))
+
+    def test_progress_counts_monotonic(self):
+        completed = []
+        scheduler = CheckScheduler(max_workers=3)
+        specs = [CheckSpec(name, _sleeper(0.01 * i, name=name)) for i, name in enumerate("xyz")]
+        asyncio.run(
+            scheduler.run(specs, on_complete=lambda spec, outcome, n: completed.append(n))
+        )
+        scheduler.shutdown()
+
+        assert completed == [1, 2, 3]
+
+    def test_check_error_propagates(self):
+        async def boom():
+            raise RuntimeError("validator crashed")
+
+        scheduler = CheckScheduler(max_workers=2)
+        with pytest.raises(RuntimeError):
+            asyncio.run(scheduler.run([CheckSpec("bad", boom, blocking=False)]))
+        scheduler.shutdown()
+
+
+def test_orchestrator_reports_check_timings():
+    """Report carries per-check timing and progress reaches 100%."""
+    class StubExtractionService:
+        async def analyze_pdf(self, file_path, enable_ocr=True, timeout=None):
+            return DrawingAnalysis(file_path=file_path, file_type="pdf")
+
+    orchestrator = ValidationOrchestrator(
+        max_workers=4, extraction_service=StubExtractionService()
+    )
+    updates = []
+    orchestrator.register_progress_callback(updates.append)
+
+    request = ValidationRequest(
+        type="drawing",
+        file_path="sample.pdf",
+        checks=["holes", "bom", "osha"],
+        user_id="test",
+    )
+    report = asyncio.run(orchestrator.validate(request))
+
+    assert report.status == ValidationStatus.COMPLETE
+    expected = [c for c in ["holes", "bom", "osha"] if orchestrator._is_check_available(c)]
+    assert list(report.check_timings) == expected
+    percents = [u.progress_percent for u in updates]
+    assert percents == sorted(percents)
+    assert percents[-1] == 100
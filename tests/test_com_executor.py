@@ -0,0 +1,192 @@
+"""
+COM Executor Tests
+
+Tests for the shared STA executor that owns the SolidWorks session, using
+a fake COM application so they run without Windows.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from com import com_executor
+from com.com_executor import ComConnectionError, ComExecutor, com_route, get_solidworks
+from com.solidworks_materials import router as materials_router
+
+
+class FakeComError(Exception):
+    def __init__(self, hresult):
+        super().__init__(hresult, "fake COM failure")
+        self.hresult = hresult
+
+
+class FakeDoc:
+    def __init__(self, app):
+        self.app = app
+
+    def GetType(self):
+        return 1
+
+    def GetMaterialPropertyName2(self, config, db):
+        self.app.calls.append(threading.current_thread().name)
+        if self.app.dead:
+            raise FakeComError(-2147417848)  # RPC_E_DISCONNECTED
+        return "AISI 304"
+
+    @property
+    def Extension(self):
+        raise AttributeError("no mass properties in the fake")
+
+
+class FakeSolidWorks:
+    """Stands in for SldWorks.Application."""
+
+    def __init__(self):
+        self.calls = []
+        self.dead = False
+        self.ActiveDoc = FakeDoc(self)
+
+    @property
+    def Visible(self):
+        if self.dead:
+            raise FakeComError(-2147023174)  # RPC_S_SERVER_UNAVAILABLE
+        return True
+
+
+@pytest.fixture
+def fake_executor():
+    apps = []
+
+    def connect():
+        app = FakeSolidWorks()
+        apps.append(app)
+        return app
+
+    executor = ComExecutor("solidworks", connect, health_interval=0.0)
+    previous = com_executor.set_com_executor("solidworks", executor)
+    yield executor, apps
+    executor.shutdown(timeout=5)
+    com_executor.set_com_executor("solidworks", previous)
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.include_router(materials_router)
+    return TestClient(app)
+
+
+def test_router_calls_share_one_session_on_sta_thread(fake_executor, client):
+    executor, apps = fake_executor
+
+    for _ in range(3):
+        response = client.get("/solidworks-materials/current")
+        assert response.status_code == 200
+        assert response.json()["material_name"] == "AISI 304"
+
+    assert len(apps) == 1
+    assert apps[0].calls == ["vulcan-com-solidworks"] * 3
+    stats = executor.get_stats()
+    assert stats["completed"] == 3
+    assert stats["connects"] == 1
+    assert stats["queue_depth"] == 0
+
+
+def test_dead_session_reconnects(fake_executor, client):
+    executor, apps = fake_executor
+    client.get("/solidworks-materials/current")
+    apps[0].dead = True
+
+    # Health check fails before the handler runs, so the request succeeds on a new session
+    response = client.get("/solidworks-materials/current")
+    assert response.status_code == 200
+    assert len(apps) == 2
+    assert executor.get_stats()["reconnects"] == 1
+    assert executor.get_stats()["health_failures"] == 1
+
+
+def test_disconnect_error_drops_session(fake_executor):
+    executor, apps = fake_executor
+    executor.health_interval = 3600
+
+    def read_material(sw):
+        return sw.ActiveDoc.GetMaterialPropertyName2("", "")
+
+    assert executor.submit(read_material).result(timeout=5) == "AISI 304"
+    apps[0].dead = True
+    with pytest.raises(FakeComError):
+        executor.submit(read_material).result(timeout=5)
+    assert executor.submit(read_material).result(timeout=5) == "AISI 304"
+    assert len(apps) == 2
+
+
+def test_not_running_maps_to_http_500(client):
+    def connect():
+        raise ComConnectionError("Operation unavailable")
+
+    executor = ComExecutor("solidworks", connect)
+    previous = com_executor.set_com_executor("solidworks", executor)
+    try:
+        response = client.get("/solidworks-materials/current")
+    finally:
+        executor.shutdown(timeout=5)
+        com_executor.set_com_executor("solidworks", previous)
+
+    assert response.status_code == 500
+    assert "SolidWorks not running" in response.json()["detail"]
+
+
+def test_event_loop_not_blocked(fake_executor):
+    executor, _ = fake_executor
+
+    def slow(sw):
+        time.sleep(0.3)
+        return "done"
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await executor.run(slow)
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(main())
+    assert result == "done"
+    assert ticks >= 10
+
+
+def test_nested_com_routes_run_inline(fake_executor):
+    @com_route()
+    async def inner():
+        return threading.current_thread().name
+
+    @com_route()
+    async def outer():
+        get_solidworks()
+        return await inner()
+
+    assert asyncio.run(outer()) == "vulcan-com-solidworks"
+
+
+def test_handler_that_awaits_io_is_rejected(fake_executor):
+    @com_route()
+    async def awaits_io():
+        await asyncio.sleep(0)  # yields to the (absent) loop
+
+    with pytest.raises(RuntimeError, match="must not await"):
+        asyncio.run(awaits_io())
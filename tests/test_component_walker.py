@@ -0,0 +1,120 @@
+"""
+Component Walker Tests
+
+Tests for the single-pass assembly walker, the per-document cache and the
+indexed related-part lookup, run against the fake SolidWorks COM tree.
+"""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from com import assembly_analyzer
+from com.assembly_analyzer import (
+    RelatedPartsIndex,
+    _analyze_assembly_sync,
+    fetch_document_data,
+    get_custom_properties,
+)
+from com.component_walker import ComponentWalker, DocumentCache
+from com.fake_solidworks import FakeCustomPropertyManager, FakeModelDoc, _CallMeter, build_fake_assembly
+
+
+def root_of(app):
+    return app.ActiveDoc.ConfigurationManager.ActiveConfiguration.GetRootComponent3(True)
+
+
+@pytest.fixture
+def app():
+    return build_fake_assembly(components=200, unique_parts=20, subassemblies=4)
+
+
+def test_walk_visits_tree_once_and_fetches_each_document_once(app):
+    result = ComponentWalker(fetch_document_data).walk(root_of(app))
+
+    assert result.component_count == 204  # 4 sub-assemblies + 200 parts
+    assert len(result.documents) == 24
+    assert app.calls["Component2.GetModelDoc2"] == 24
+    assert app.calls["Component2.GetChildren"] == 205  # plus the root
+    assert sum(len(d.instances) for d in result.documents) == 204
+    bolt = next(d for d in result.documents if d.part_number == "HEX-BOLT-0003")
+    assert len(bolt.instances) == 10
+    assert bolt.data["properties"]["Description"] == "Hex Bolt 0003"
+
+
+def test_max_depth_limits_walk(app):
+    result = ComponentWalker(fetch_document_data).walk(root_of(app), max_depth=1)
+    assert [d.part_number for d in result.documents] == [f"SUB-{i:03d}" for i in range(4)]
+
+
+def test_cache_skips_unchanged_documents(app, tmp_path):
+    mtimes = {}
+    cache = DocumentCache(tmp_path / "cache.json")
+    walker = ComponentWalker(fetch_document_data, cache=cache, mtime=lambda p: mtimes.get(p, 1.0))
+
+    first = walker.walk(root_of(app))
+    app.reset_calls()
+    second = walker.walk(root_of(app))
+
+    assert first.fetched == 24 and second.cache_hits == 24
+    assert app.calls["Component2.GetModelDoc2"] == 0
+    assert [d.data for d in second.documents] == [d.data for d in first.documents]
+
+    # A modified file is re-read; the cache persists across instances
+    mtimes[first.documents[0].path] = 2.0
+    reloaded = ComponentWalker(fetch_document_data, cache=DocumentCache(tmp_path / "cache.json"),
+                               mtime=lambda p: mtimes.get(p, 1.0))
+    third = reloaded.walk(root_of(app))
+    assert (third.fetched, third.cache_hits) == (1, 23)
+
+
+def test_batched_properties_match_per_property_reads(monkeypatch):
+    meter = _CallMeter()
+    model = FakeModelDoc(meter, "C:\\p.SLDPRT", properties={"Description": "Plate", "Finish": "", "Rev": "B"})
+    batched = get_custom_properties(model)
+    assert meter.calls["CustomPropertyManager.Get3"] == 0
+
+    monkeypatch.delattr(FakeCustomPropertyManager, "GetAll3")  # older API
+    assert get_custom_properties(model) == batched == {"Description": "Plate", "Rev": "B"}
+    assert meter.calls["CustomPropertyManager.Get3"] == 3
+
+
+def legacy_related(part_name, names):
+    related = []
+    base = re.sub(r'[-_]\d+$', '', part_name)
+    for other in names:
+        if other != part_name:
+            other_base = re.sub(r'[-_]\d+$', '', other)
+            if other.startswith(base) or part_name.startswith(other_base):
+                related.append(other)
+            if len(base) > 5 and base[:5] == other_base[:5] and other not in related:
+                related.append(other)
+    return related[:5]
+
+
+def test_related_parts_index_matches_prefix_scan():
+    names = ["M169-6A", "M169-6A-1", "M169-6A_2", "M169", "FRAME-RAIL-1", "FRAME-RAIL-2",
+             "FRAMEWORK", "FRAMING-7", "SEAL", "SEAL-10", "PLATE", "PLATE-A", "LUG-1"]
+    index = RelatedPartsIndex(names)
+    for name in names:
+        assert index.related(name) == legacy_related(name, names), name
+
+
+def test_analysis_reports_each_document_with_quantity(app, monkeypatch, tmp_path):
+    monkeypatch.setattr(assembly_analyzer, "KNOWLEDGE_BASE_PATH", tmp_path)
+
+    result = _analyze_assembly_sync(app, cache=DocumentCache())
+
+    assert result["status"] == "ok"
+    assert result["total_components"] == 204
+    assert result["total_parts_analyzed"] == 24
+    assert sum(a["quantity"] for a in result["part_analyses"]) == 204
+    lug = next(a for a in result["part_analyses"] if a["part_number"] == "LIFT-LUG-0002")
+    assert lug["part_type"] == "lifting"
+    assert lug["features"]["holes"] == 1
+    assert len(lug["mates"]) == 3
+    assert "LIFT-LUG-0012" in lug["related_parts"]
@@ -0,0 +1,114 @@
+"""
+Data Hub Search Tests
+
+Indexed StandardsHub and ComponentLookup search must return what the
+previous full scans returned, in the same order, plus numeric ranges.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cad_agent.data_hub import ComponentLookup, SearchIndex, StandardsHub
+
+
+def scan_levenshtein(s1, s2):
+    """Similarity as computed by the previous per-component scan."""
+    if s1 == s2:
+        return 1.0
+    if not s1 or not s2:
+        return 0.0
+    previous = list(range(len(s2) + 1))
+    for i, c1 in enumerate(s1, 1):
+        current = [i]
+        for j, c2 in enumerate(s2, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (c1 != c2)))
+        previous = current
+    return 1.0 - previous[-1] / max(len(s1), len(s2))
+
+
+@pytest.fixture(scope="module")
+def lookup():
+    return ComponentLookup()
+
+
+@pytest.fixture(scope="module")
+def hub(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("standards")
+    shapes = {
+        "W8X31": {"designation": "W8X31", "type": "W-Shape", "Zx": 30.4},
+        "W14X90": {"designation": "W14X90", "type": "W-Shape", "Zx": 157},
+        "W14X68": {"designation": "W14X68", "type": "W-Shape", "Zx": 115},
+    }
+    (data_dir / "aisc_shapes.json").write_text(json.dumps(shapes))
+    (data_dir / "fasteners.json").write_text(json.dumps({"bolts": {"3/4": {"nominal_diameter": 0.75}}}))
+    return StandardsHub(Path(data_dir))
+
+
+def test_component_search_tiers_and_order(lookup):
+    designations = [spec.designation for spec in lookup.search("w14")]
+    assert designations == ["W14X68", "W14X90"]
+
+    results = lookup.search("W14X90")
+    assert results[0].designation == "W14X90"
+
+    # Property-only matches come after designation matches
+    stainless = lookup.search("stainless")
+    assert [spec.designation for spec in stainless] == ["304", "316"]
+    assert lookup.search("stainless", category="beam") == []
+
+
+@pytest.mark.parametrize("query", ["W14X09", "W41X90", "A572", "1-1/", "W", "", "XYZ123"])
+@pytest.mark.parametrize("threshold", [0.0, 0.5, 0.8])
+def test_fuzzy_search_matches_full_scan(lookup, query, threshold):
+    scored = [
+        (scan_levenshtein(query.upper(), spec.designation.upper()), spec)
+        for spec in lookup._components.values()
+    ]
+    scored = [item for item in scored if item[0] >= threshold]
+    scored.sort(key=lambda item: item[0], reverse=True)
+    expected = [spec.designation for _, spec in scored[:10]]
+    assert [spec.designation for spec in lookup.fuzzy_search(query, threshold)] == expected
+
+
+def test_component_property_range(lookup):
+    beams = lookup.filter_by_property("Zx", min_value=100, max_value=200)
+    assert [spec.designation for spec in beams] == ["W14X68", "W16X77", "W14X90", "W16X100"]
+    assert lookup.filter_by_property("Fy", min_value=60000, category="beam") == []
+    assert lookup.filter_by_property("no_such_property", 0) == []
+
+
+def test_standards_search_scores_and_limit(hub):
+    results = hub.search("W14X90")
+    assert [(r.designation, r.relevance_score) for r in results] == [("W14X90", 1.0)]
+
+    partial = hub.search("w14")
+    assert [(r.designation, r.relevance_score) for r in partial] == [("W14X90", 0.7), ("W14X68", 0.7)]
+
+    # Category text, then property text
+    assert {r.relevance_score for r in hub.search("fasteners")} == {0.3}
+    assert [r.designation for r in hub.search("w-shape", limit=2)] == ["W8X31", "W14X90"]
+    assert hub.search("w14", standard="ASTM") == []
+    assert hub.search("3/4", category="beams") == []
+
+
+def test_standards_property_range(hub):
+    results = hub.filter_by_property("Zx", min_value=100)
+    assert [r.designation for r in results] == ["W14X68", "W14X90"]
+
+
+def test_search_index_short_and_long_queries():
+    index = SearchIndex()
+    index.add(["ab"], text="{'x': 1}")
+    index.add(["abc", "alias"], text="{'y': 22}")
+    assert index.exact("alias") == [1]
+    assert index.name_contains("a") == [0, 1]
+    assert index.name_contains("lia") == [1]
+    assert index.text_contains("22") == [1]
+    assert index.text_contains("'y'") == [1]
+    assert index.similar("abd", 0.6) == [(pytest.approx(2 / 3), 0), (pytest.approx(2 / 3), 1)]
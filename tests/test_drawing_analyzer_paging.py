@@ -0,0 +1,106 @@
+"""
+Drawing Analyzer Paging Tests
+
+Tests that rasterization is lazy and per page: only pages without a text
+layer are rasterized and OCR'd, and each page image is released after use.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.cad_agent.validators import drawing_analyzer as da
+
+
+class FakeImage:
+    open_count = 0
+
+    def __init__(self, page):
+        self.page = page
+        self.closed = False
+        FakeImage.open_count += 1
+
+    def close(self):
+        self.closed = True
+        FakeImage.open_count -= 1
+
+
+@pytest.fixture
+def fake_raster(monkeypatch):
+    calls = []
+    peak = {"open": 0}
+
+    def convert_from_path(path, dpi, first_page, last_page):
+        calls.append((first_page, last_page, dpi))
+        image = FakeImage(first_page)
+        peak["open"] = max(peak["open"], FakeImage.open_count)
+        return [image]
+
+    class FakeTesseract:
+        @staticmethod
+        def image_to_string(image):
+            return f"OCR PAGE {image.page} DWG NO: M169-6A"
+
+    monkeypatch.setattr(da, "PDF2IMAGE_AVAILABLE", True)
+    monkeypatch.setattr(da, "PYTESSERACT_AVAILABLE", True)
+    monkeypatch.setattr(da, "convert_from_path", convert_from_path, raising=False)
+    monkeypatch.setattr(da, "pytesseract", FakeTesseract, raising=False)
+    return calls, peak
+
+
+@pytest.fixture
+def drawing(tmp_path):
+    path = tmp_path / "drawing.pdf"
+    path.write_bytes(b"%PDF-1.4\n")
+    return str(path)
+
+
+def test_pages_with_text_layer_skip_ocr(fake_raster, drawing, monkeypatch):
+    calls, peak = fake_raster
+    good_page = "GENERAL NOTES: ALL WELDS PER AWS D1.1 " * 5
+    analyzer = da.DrawingAnalyzer(enable_ocr=True, dpi=200, use_cache=False)
+    monkeypatch.setattr(
+        analyzer, "_extract_page_texts", lambda path: [good_page, "", good_page, "  "]
+    )
+
+    analysis = analyzer.analyze_pdf(drawing)
+
+    assert [c[0] for c in calls] == [2, 4]
+    assert all(c[2] == 200 for c in calls)
+    assert analysis.ocr_pages == [2, 4]
+    assert analysis.ocr_used
+    assert analysis.page_count == 4
+    assert analysis.page_images == []
+    assert peak["open"] == 1
+    assert FakeImage.open_count == 0
+    assert analysis.extracted_text.index("OCR PAGE 2") < analysis.extracted_text.index(
+        "OCR PAGE 4"
+    )
+    assert good_page.strip() in analysis.extracted_text
+
+
+def test_full_text_layer_never_rasterizes(fake_raster, drawing, monkeypatch):
+    calls, _ = fake_raster
+    analyzer = da.DrawingAnalyzer(enable_ocr=True, use_cache=False)
+    monkeypatch.setattr(analyzer, "_extract_page_texts", lambda path: ["X" * 200] * 3)
+
+    analysis = analyzer.analyze_pdf(drawing)
+
+    assert calls == []
+    assert not analysis.ocr_used
+    assert analysis.sheet_count == 3
+
+
+def test_iter_page_images_is_lazy(fake_raster, drawing):
+    calls, _ = fake_raster
+    analyzer = da.DrawingAnalyzer(use_cache=False)
+    pages = analyzer.iter_page_images(drawing, [1, 2, 3])
+
+    assert calls == []
+    page_number, image = next(pages)
+    assert page_number == 1
+    assert len(calls) == 1
+    image.close()
@@ -0,0 +1,139 @@
+"""
+Drawing Text Scanner Tests
+
+Tests that the keyword-gated scanner returns exactly what per-pattern
+search/finditer returns, and that extraction output matches the output of
+the original per-section extractors, recorded in
+fixtures/drawing_sections.json.
+"""
+
+import json
+import sys
+from dataclasses import fields, is_dataclass
+from enum import Enum
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from extractors.pdf_drawing_extractor import DrawingType, PDFDrawingExtractor
+from extractors.text_scanner import DrawingTextScanner, ScanRule
+
+GOLDEN = json.loads((Path(__file__).parent / "fixtures" / "drawing_sections.json").read_text(encoding="utf-8"))
+
+HEADER_TEXT = """M169-6A HEADER DETAIL REV: B CUSTOMER: ACME REFINING
+PROJECT: UNIT 4 AIR COOLER JOB NO: 23456
+DRAWN BY: JS CHECKED BY: MK APPROVED BY: RT DATE: 01/15/2024 SCALE: 1:4 SHEET 1 OF 3
+1  M169-6A-1  TUBESHEET PLATE 1.5 THK  SA-516-70  2
+3  NZ-100  NOZZLE 6" 300# WN FLG  SA-105  4
+MAWP: 450 PSIG DESIGN TEMP: 650 F MDMT: -20 F
+HYDRO TEST PRESSURE: 675 PSI CORROSION ALLOWANCE: 0.125"
+ASME SEC VIII DIV 1 PWHT REQUIRED SPOT RT
+1/4 FILLET WELD ALL AROUND WPS P1A-4
+12.50" [317.5] 24.000 +/- 0.03
+1. ALL WELDS PER WPS P1A-4 GTAW ROOT
+2. PAINT PER SSPC-SP6 PRIMER
+A  01/15/2024  INITIAL RELEASE  JS  ECN 1234
+SHOP NOTES:
+DEBURR ALL EDGES
+
+"""
+
+SAMPLES = [
+    HEADER_TEXT,
+    "",
+    "S24400-10AS PLENUM\nDRN: KL CHK: JS SCALE: NTS\n1  S24400-11  COLUMN  A572-50  4\n",
+    "CHECKED: 12 CKED",  # keyword inside a longer word
+    "CHEKED BY: AB 1/4 FİLLET",  # non-ASCII case folding under re.I
+    "SA-51670 GR B\n 1 X-1 thing SA-516 2\nC.A. 0.0625",
+]
+
+
+@pytest.fixture(scope="module")
+def extractor():
+    return PDFDrawingExtractor(cache=None)
+
+
+def _direct(pattern, first_only, text):
+    if first_only:
+        match = pattern.search(text)
+        return [match] if match else []
+    return list(pattern.finditer(text))
+
+
+@pytest.mark.parametrize("text", SAMPLES)
+def test_scan_matches_direct_regex(extractor, text):
+    matches = extractor.scanner.scan(text)
+    for rule in extractor.SCAN_RULES:
+        expected = _direct(extractor.PATTERNS[rule.name], rule.first_only, text)
+        got = matches[rule.name]
+        assert [m.span() for m in got] == [m.span() for m in expected], rule.name
+        assert [m.groups() for m in got] == [m.groups() for m in expected], rule.name
+
+
+def _plain(value):
+    """Dataclasses and enums as the JSON the golden file stores."""
+    if isinstance(value, Enum):
+        return value.value
+    if is_dataclass(value):
+        return {f.name: _plain(getattr(value, f.name)) for f in fields(value)}
+    if isinstance(value, (list, tuple)):
+        return [_plain(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _plain(v) for k, v in value.items()}
+    return value
+
+
+def test_golden_covers_samples():
+    assert [case["text"] for case in GOLDEN] == SAMPLES
+
+
+@pytest.mark.parametrize("case", GOLDEN, ids=range(len(GOLDEN)))
+def test_sections_match_recorded_output(extractor, case):
+    text, expected = case["text"], case["sections"]
+    sections = _plain(extractor._extract_sections(text))
+    for name, value in expected.items():
+        assert sections[name] == value, name
+    assert _plain(extractor._extract_bom(text)) == expected["bom_items"]
+
+
+def test_header_sections(extractor):
+    sections = extractor._extract_sections(HEADER_TEXT)
+
+    assert sections["drawing_type"] == DrawingType.HEADER
+    tb = sections["title_block"]
+    assert (tb.part_number, tb.revision, tb.sheet) == ("M169-6A", "B", "1 OF 3")
+    assert [b.material_spec for b in sections["bom_items"]][:2] == ["SA-516-70", "SA-105"]
+    assert sections["design_data"].mawp_psi == 450
+    assert sections["design_data"].radiography == "SPOT"
+    assert sections["revisions"][0].ecn_number == "1234"
+    assert sections["notes"].shop_notes == ["DEBURR ALL EDGES"]
+    assert any(w.all_around and w.procedure == "P1A-4" for w in sections["weld_symbols"])
+
+
+def test_keyword_gate_skips_absent_sections(extractor):
+    class CountingPattern:
+        def __init__(self, pattern):
+            self.pattern = pattern
+            self.calls = 0
+
+        def finditer(self, text):
+            self.calls += 1
+            return self.pattern.finditer(text)
+
+    counting = CountingPattern(extractor.PATTERNS["weld_callout"])
+    scanner = DrawingTextScanner(
+        {"weld_callout": counting},
+        [ScanRule("weld_callout", requires=("FIL", "GROOVE"))],
+    )
+
+    assert scanner.scan("NO WELDS HERE 12.5")["weld_callout"] == []
+    assert counting.calls == 0
+    assert len(scanner.scan("1/4 FILLET")["weld_callout"]) == 1
+    assert counting.calls == 1
+
+
+def test_rule_without_pattern_rejected():
+    with pytest.raises(ValueError):
+        DrawingTextScanner({}, [ScanRule("missing")])
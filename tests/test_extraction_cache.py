@@ -0,0 +1,193 @@
+"""
+Extraction Cache Tests
+
+Tests for the content-hash keyed PDF extraction cache shared by the
+drawing parsers.
+"""
+
+import shutil
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+pytest.importorskip("pypdf")
+
+from agents.cad_agent import extraction_cache as ec
+from agents.cad_agent.extraction_cache import ExtractionCache
+
+
+def make_pdf(path, pages):
+    """Write a minimal PDF with one line of Helvetica text per page."""
+    body = {
+        1: b"<< /Type /Catalog /Pages 2 0 R >>",
+        3: b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    }
+    kids = []
+    n = 4
+    for text in pages:
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+        body[n] = (
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {n + 1} 0 R >>"
+        ).encode()
+        body[n + 1] = b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        kids.append(f"{n} 0 R")
+        n += 2
+    body[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>".encode()
+
+    out = b"%PDF-1.4\n"
+    offsets = {}
+    for i in sorted(body):
+        offsets[i] = len(out)
+        out += f"{i} 0 obj\n".encode() + body[i] + b"\nendobj\n"
+    xref = len(out)
+    out += f"xref\n0 {len(body) + 1}\n0000000000 65535 f \n".encode()
+    for i in sorted(body):
+        out += f"{offsets[i]:010d} 00000 n \n".encode()
+    out += f"trailer\n<< /Size {len(body) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode()
+    Path(path).write_bytes(out)
+    return str(path)
+
+
+class CountingReader:
+    """Wraps the PDF library to count how often a PDF is opened."""
+
+    def __init__(self, lib):
+        self.lib = lib
+        self.opens = 0
+
+    def PdfReader(self, *args, **kwargs):
+        self.opens += 1
+        return self.lib.PdfReader(*args, **kwargs)
+
+
+@pytest.fixture
+def reader(monkeypatch):
+    counting = CountingReader(ec._pdf_lib)
+    monkeypatch.setattr(ec, "_pdf_lib", counting)
+    return counting
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ExtractionCache(cache_dir=str(tmp_path / "cache"))
+
+
+@pytest.fixture
+def drawing(tmp_path):
+    return make_pdf(tmp_path / "M169-6A.pdf", ["DWG NO: M169-6A REV: B", "NOTE 1: WELD PER AWS D1.1"])
+
+
+class TestExtractionCache:
+    """Test ExtractionCache hits, misses and eviction."""
+
+    def test_second_read_does_no_pdf_work(self, cache, drawing, reader):
+        first = cache.get_record(drawing)
+        second = cache.get_record(drawing)
+
+        assert reader.opens == 1
+        assert first.page_texts == second.page_texts
+        assert second.page_count == 2
+        assert second.pages[0].width == 612
+        assert "M169-6A" in second.text
+        assert cache.get_stats()["hits"] == 1
+
+    def test_keyed_by_content_not_path(self, cache, drawing, reader, tmp_path):
+        copy = tmp_path / "renamed.pdf"
+        shutil.copy(drawing, copy)
+
+        cache.get_record(drawing)
+        cache.get_record(str(copy))
+        assert reader.opens == 1
+
+        make_pdf(copy, ["DWG NO: M169-6A REV: C"])
+        assert "REV: C" in cache.get_record(str(copy)).text
+        assert reader.opens == 2
+
+    def test_shared_across_instances(self, cache, drawing, reader):
+        cache.get_record(drawing)
+        other = ExtractionCache(cache_dir=str(cache.cache_dir))
+        other.get_record(drawing)
+        assert reader.opens == 1
+
+    def test_version_bump_invalidates(self, cache, drawing, reader):
+        cache.get_record(drawing)
+        ExtractionCache(cache_dir=str(cache.cache_dir), version="2").get_record(drawing)
+        assert reader.opens == 2
+
+    def test_ocr_runs_only_for_missing_pages(self, cache, drawing):
+        calls = []
+
+        def run_ocr(pages):
+            calls.append(list(pages))
+            return {n: f"ocr {n}" for n in pages}
+
+        assert cache.get_ocr(drawing, [2], 300, run_ocr) == {2: "ocr 2"}
+        assert cache.get_ocr(drawing, [1, 2], 300, run_ocr) == {1: "ocr 1", 2: "ocr 2"}
+        assert cache.get_ocr(drawing, [1, 2], 300, run_ocr) == {1: "ocr 1", 2: "ocr 2"}
+        assert cache.get_ocr(drawing, [1], 200, run_ocr) == {1: "ocr 1"}
+        assert calls == [[2], [1], [1]]
+
+    def test_lru_eviction(self, tmp_path, reader):
+        files = [make_pdf(tmp_path / f"d{i}.pdf", [f"DRAWING {i} " * 20]) for i in range(3)]
+        probe = ExtractionCache(cache_dir=str(tmp_path / "probe"))
+        probe.get_record(files[0])
+        entry_size = probe.get_stats()["bytes"]
+
+        cache = ExtractionCache(cache_dir=str(tmp_path / "lru"), max_bytes=int(entry_size * 2.5))
+        cache.get_record(files[0])
+        cache.get_record(files[1])
+        cache.get_record(files[0])  # touch: files[1] is now least recently used
+        cache.get_record(files[2])
+
+        stats = cache.get_stats()
+        assert stats["entries"] == 2
+        assert stats["evictions"] == 1
+        assert stats["bytes"] <= cache.max_bytes
+
+        opens = reader.opens
+        cache.get_record(files[0])
+        assert reader.opens == opens
+        cache.get_record(files[1])
+        assert reader.opens == opens + 1
+
+
+def test_parsers_share_cache(cache, drawing, reader):
+    """DrawingParser and extract_pdf_metadata reuse one extraction."""
+    from agents.cad_agent.drawing_parser import DrawingParser
+    from agents.cad_agent.pdf_parser_impl import extract_pdf_metadata
+    from agents.cad_agent.validators.drawing_analyzer import DrawingAnalyzer
+
+    data = DrawingParser(cache=cache).parse_file(drawing)
+    meta = extract_pdf_metadata(drawing, cache=cache)
+    analysis = DrawingAnalyzer(enable_ocr=False, cache=cache).analyze_pdf(drawing)
+
+    assert reader.opens == 1
+    assert "M169-6A" in data.raw_text
+    assert meta["page_count"] == 2
+    assert analysis.page_count == 2
+    assert analysis.raw_text == data.raw_text
+
+
+def test_parsers_can_opt_out_of_the_shared_cache(drawing, reader, monkeypatch, tmp_path):
+    """A cache without a directory extracts every time and writes nothing."""
+    from agents.cad_agent.drawing_parser import DrawingParser
+    from agents.cad_agent.pdf_parser_impl import extract_pdf_metadata
+
+    shared = ExtractionCache(cache_dir=str(tmp_path / "shared"))
+    monkeypatch.setattr(ec, "_cache", shared)
+    uncached = ExtractionCache(cache_dir=None)
+
+    parser = DrawingParser(cache=uncached)
+    assert parser.cache is uncached
+    parser.parse_file(drawing)
+    parser.parse_file(drawing)
+    extract_pdf_metadata(drawing, cache=uncached)
+
+    assert reader.opens == 3
+    assert uncached.get_stats()["entries"] == 0
+    assert shared.get_stats()["entries"] == 0
+    assert DrawingParser().cache is shared
@@ -0,0 +1,124 @@
+"""
+Extraction Service Tests
+
+Tests for the process-pool PDF extraction service: offloading, timeouts,
+backpressure and cancellation.
+"""
+
+import asyncio
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from agents.cad_agent.validators.drawing_analyzer import DrawingAnalysis
+from agents.cad_agent.validators.extraction_service import (
+    ExtractionBusyError,
+    ExtractionService,
+    ExtractionTimeoutError,
+)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    from agents.cad_agent import extraction_cache
+
+    monkeypatch.setenv("VULCAN_EXTRACTION_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setattr(extraction_cache, "_cache", None)
+
+
+@pytest.fixture
+def blank_pdf(tmp_path):
+    pypdf = pytest.importorskip("pypdf")
+    writer = pypdf.PdfWriter()
+    writer.add_blank_page(width=612, height=792)
+    path = tmp_path / "blank.pdf"
+    with open(path, "wb") as f:
+        writer.write(f)
+    return str(path)
+
+
+class TestExtractionService:
+    """Test ExtractionService job handling."""
+
+    def test_analyze_pdf_in_process_pool(self, blank_pdf):
+        service = ExtractionService(max_workers=1)
+        try:
+            analysis = asyncio.run(service.analyze_pdf(blank_pdf, enable_ocr=False))
+        finally:
+            service.shutdown(wait=True)
+
+        assert isinstance(analysis, DrawingAnalysis)
+        assert analysis.file_path == blank_pdf
+        assert analysis.page_images == []
+        assert service.get_stats()["completed"] == 1
+
+    def test_missing_file_raises(self):
+        service = ExtractionService(max_workers=1)
+        try:
+            with pytest.raises(FileNotFoundError):
+                asyncio.run(service.analyze_pdf("does_not_exist.pdf"))
+        finally:
+            service.shutdown(wait=True)
+
+        assert service.get_stats()["failed"] == 1
+
+    def test_event_loop_not_blocked(self):
+        service = ExtractionService(max_workers=1, executor=ThreadPoolExecutor(1))
+
+        async def scenario():
+            ticks = 0
+            job = asyncio.ensure_future(service.submit(time.sleep, 0.3))
+            while not job.done():
+                ticks += 1
+                await asyncio.sleep(0.01)
+            return ticks
+
+        assert asyncio.run(scenario()) > 10
+
+    def test_timeout(self):
+        service = ExtractionService(max_workers=1, executor=ThreadPoolExecutor(1))
+        with pytest.raises(ExtractionTimeoutError):
+            asyncio.run(service.submit(time.sleep, 0.5, timeout=0.05))
+        assert service.get_stats()["timed_out"] == 1
+
+    def test_backpressure_rejects_when_queue_full(self):
+        service = ExtractionService(
+            max_workers=1, max_pending=1, executor=ThreadPoolExecutor(1)
+        )
+
+        async def scenario():
+            running = asyncio.ensure_future(service.submit(time.sleep, 0.2))
+            await asyncio.sleep(0.01)
+            waiting = asyncio.ensure_future(service.submit(time.sleep, 0.01))
+            await asyncio.sleep(0.01)
+            with pytest.raises(ExtractionBusyError):
+                await service.submit(time.sleep, 0.01)
+            await asyncio.gather(running, waiting)
+
+        asyncio.run(scenario())
+        stats = service.get_stats()
+        assert stats["rejected"] == 1
+        assert stats["completed"] == 2
+
+    def test_cancel_queued_job(self):
+        calls = []
+        service = ExtractionService(max_workers=1, executor=ThreadPoolExecutor(1))
+
+        async def scenario():
+            running = asyncio.ensure_future(service.submit(time.sleep, 0.1))
+            await asyncio.sleep(0.01)
+            queued = asyncio.ensure_future(service.submit(calls.append, "ran"))
+            await asyncio.sleep(0.01)
+            queued.cancel()
+            await running
+            await asyncio.sleep(0.05)
+            return queued.cancelled()
+
+        assert asyncio.run(scenario())
+        assert calls == []
+        assert service.get_stats()["cancelled"] == 1
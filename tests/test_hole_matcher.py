@@ -0,0 +1,112 @@
+"""
+Hole Matcher Tests
+
+Tests for grid-indexed, one-to-one hole matching and pattern registration
+as used by HolePatternChecker and CrossPartValidator.
+"""
+
+import math
+import os
+import random
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cad_agent.adapters.hole_matcher import (
+    NUMPY_AVAILABLE,
+    RigidTransform2D,
+    match_points,
+    register_points,
+)
+from agents.cad_agent.adapters.hole_pattern_checker import (
+    CheckStatus,
+    HoleLocation,
+    HolePatternChecker,
+)
+from agents.cad_agent.validators.cross_part_validator import (
+    CrossPartValidator,
+    HolePattern,
+    InterfaceType,
+    PartInterface,
+)
+
+
+def tube_sheet(rows=40, cols=40, pitch=1.25):
+    """Triangular-pitch tube sheet hole centres."""
+    return [
+        (c * pitch + (pitch / 2 if r % 2 else 0.0), r * pitch * math.sqrt(3) / 2)
+        for r in range(rows) for c in range(cols)
+    ]
+
+
+def test_matching_is_one_to_one_and_optimal():
+    # Greedy nearest-first would pair A0-B0 and leave A1 without a partner
+    a = [(0.0, 0.0), (0.05, 0.0)]
+    b = [(0.04, 0.0), (0.1, 0.0)]
+    result = match_points(a, b, tolerance=0.0625)
+    assert result.pairs == [(0, 0), (1, 1)]
+    assert result.unmatched_a == [] and result.unmatched_b == []
+
+    # Two holes of A over one hole of B: only one may claim it
+    result = match_points([(0.0, 0.0), (0.01, 0.0)], [(0.005, 0.0)], tolerance=0.0625)
+    assert len(result.pairs) == 1 and result.unmatched_a == [1]
+
+
+def test_large_pattern_matches_shuffled_copy():
+    rng = random.Random(4)
+    a = tube_sheet()
+    b = [(x + rng.uniform(-0.03, 0.03), y + rng.uniform(-0.03, 0.03)) for x, y in a]
+    order = list(range(len(b)))
+    rng.shuffle(order)
+    result = match_points(a, [b[k] for k in order], tolerance=0.0625)
+    assert len(result.pairs) == len(a)
+    assert all(order[j] == i for i, j in result.pairs)
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="registration needs numpy")
+def test_registration_recovers_rotation_and_offset():
+    a = tube_sheet(20, 20)
+    moved = RigidTransform2D(math.radians(90), 30.0, -12.5).apply(a)
+    transform = register_points(a, moved, tolerance=0.0625)
+    result = match_points(a, transform.apply(moved), tolerance=0.0625)
+    assert len(result.pairs) == len(a)
+    assert register_points(a, a, tolerance=0.0625).is_identity
+
+
+def test_checker_reports_duplicate_holes_instead_of_double_matching():
+    checker = HolePatternChecker()
+    holes_a = [HoleLocation(0.8125, x=0.0), HoleLocation(0.8125, x=0.02), HoleLocation(0.8125, x=4.0)]
+    holes_b = [HoleLocation(0.8125, x=0.01), HoleLocation(0.8125, x=4.0)]
+    result = checker.verify_mating_patterns(holes_a, holes_b)
+    assert sum(m.is_aligned for m in result.matches) == 2
+    assert result.unmatched_a == [holes_a[1]]
+    assert result.status == CheckStatus.FAIL
+    assert "No free mating hole" in result.matches[1].message
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="registration needs numpy")
+def test_checker_registers_patterns_in_part_coordinates():
+    checker = HolePatternChecker()
+    points = tube_sheet(6, 6)
+    holes_a = [HoleLocation(1.0, x=x, y=y) for x, y in points]
+    moved = RigidTransform2D(math.radians(45), 5.0, 5.0).apply(points)
+    holes_b = [HoleLocation(1.0, x=x, y=y) for x, y in moved]
+
+    assert checker.verify_mating_patterns(holes_a, holes_b).status == CheckStatus.FAIL
+    registered = checker.verify_mating_patterns(holes_a, holes_b, register=True)
+    assert registered.status == CheckStatus.PASS
+    assert "after registering B" in registered.message
+
+
+def test_cross_part_alignment_uses_optimal_pairing():
+    def interface(part, holes):
+        return PartInterface(part, "flange", InterfaceType.BOLTED,
+                             holes=HolePattern([{"x": x, "y": y, "diameter": 0.75} for x, y in holes]))
+
+    # First-fit would pair A0 with B0 and strand A1
+    a = interface("A", [(0.0, 0.0), (0.05, 0.0)])
+    b = interface("B", [(0.04, 0.0), (0.1, 0.0)])
+    result = CrossPartValidator().validate_interface_pair(a, b)
+    assert not [i for i in result.issues if i.check_type == "hole_alignment"]
@@ -0,0 +1,107 @@
+"""
+Interference Broad Phase Tests
+
+The NumPy broad phase in interference_detector must report exactly what
+the all-pairs loop reports, and the COM analyzer's box prefilter must keep
+every pair that could fall under the clearance.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "agents" / "cad_agent" / "adapters"))
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+import interference_detector as detector
+from interference_detector import (
+    BoundingBox,
+    Component,
+    check_2d_clearances,
+    check_assembly_interference,
+    find_candidate_pairs,
+)
+from analyzers.interference_analyzer import nearby_pairs
+
+pytestmark = pytest.mark.skipif(not detector.NUMPY_AVAILABLE, reason="numpy not installed")
+
+
+def random_components(count, seed, flat=False, snap=False):
+    rng = random.Random(seed)
+    components = []
+    for k in range(count):
+        x, y, z = rng.uniform(0, 200), rng.uniform(0, 100), 0.0 if flat else rng.uniform(0, 50)
+        if snap:  # shared edges and touching faces
+            x, y, z = round(x), round(y), round(z)
+        width = rng.choice([0.0, 0.5, 1.0, 3.0, 20.0])
+        depth = rng.uniform(0, 4)
+        height = 0.0 if flat else rng.uniform(0, 4)
+        components.append(Component(f"C{k}", "P", BoundingBox(x, x + width, y, y + depth, z, z + height)))
+    return components
+
+
+def all_pairs(function, *args):
+    detector.NUMPY_AVAILABLE = False
+    try:
+        return function(*args)
+    finally:
+        detector.NUMPY_AVAILABLE = True
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 0.125, 1.0])
+@pytest.mark.parametrize("flat,snap", [(False, False), (False, True), (True, False)])
+def test_assembly_interference_matches_all_pairs(tolerance, flat, snap, monkeypatch):
+    monkeypatch.setattr(detector, "_PAIR_CHUNK", 64)  # exercise chunking
+    components = random_components(250, seed=3, flat=flat, snap=snap)
+
+    def findings(analysis):
+        return [(r.component_a, r.component_b, r.overlap_distance, r.severity, r.location, r.message)
+                for r in analysis.interferences]
+
+    fast = check_assembly_interference(components, tolerance)
+    assert findings(fast) == findings(all_pairs(check_assembly_interference, components, tolerance))
+
+
+@pytest.mark.parametrize("tolerance", [0.0, 0.25])
+def test_2d_clearances_match_all_pairs(tolerance):
+    entities = [
+        {"name": c.name, "bounds": {"x_min": c.bounds.x_min, "x_max": c.bounds.x_max,
+                                     "y_min": c.bounds.y_min, "y_max": c.bounds.y_max}}
+        for c in random_components(250, seed=5, snap=True)
+    ]
+
+    def findings(results):
+        return [(r.measured, r.severity, r.location, r.message) for r in results]
+
+    fast = check_2d_clearances(entities, tolerance)
+    assert findings(fast) == findings(all_pairs(check_2d_clearances, entities, tolerance))
+
+
+def test_candidate_pairs_expand_by_reach():
+    import numpy as np
+    lo = np.array([[0.0, 0.0], [1.1, 0.0], [5.0, 5.0]])
+    hi = np.array([[1.0, 1.0], [2.0, 1.0], [6.0, 6.0]])
+    assert find_candidate_pairs(lo, hi).tolist() == []
+    assert find_candidate_pairs(lo, hi, reach=0.2).tolist() == [[0, 1]]
+
+
+def test_analyzer_prefilter_keeps_pairs_within_clearance():
+    rng = random.Random(11)
+    boxes = []
+    for _ in range(120):
+        x, y, z = (rng.uniform(0, 2) for _ in range(3))
+        boxes.append((x, y, z, x + rng.uniform(0, 0.3), y + rng.uniform(0, 0.3), z + rng.uniform(0, 0.3)))
+    boxes[7] = None  # GetBox failed: measured against everything
+
+    def near(a, b, reach):
+        return all(min(a[k + 3], b[k + 3]) - max(a[k], b[k]) > -reach for k in range(3))
+
+    expected = [
+        (i, j) for i in range(len(boxes)) for j in range(i + 1, len(boxes))
+        if boxes[i] is None or boxes[j] is None or near(boxes[i], boxes[j], 0.01)
+    ]
+    pairs = nearby_pairs(boxes, 0.01)
+    assert pairs == expected
+    assert len(pairs) < len(boxes) * (len(boxes) - 1) // 2 // 4
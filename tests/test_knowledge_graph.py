@@ -0,0 +1,157 @@
+"""
+Knowledge Graph Persistence Tests
+
+Tests for the snapshot + append-only log storage of the knowledge graph.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.memory.knowledge_graph import KnowledgeGraph
+
+
+def make_graph(tmp_path, **kwargs):
+    return KnowledgeGraph(graph_file=str(tmp_path / "graph.json"), **kwargs)
+
+
+STRATEGY = {
+    "id": "42",
+    "name": "Header Box",
+    "product_type": "weldment",
+    "material": {"name": "SA-516-70"},
+    "constraints": [{"standard": "ASME VIII"}, {"standard": "TEMA"}],
+}
+
+
+def test_changes_replay_from_log(tmp_path):
+    graph = make_graph(tmp_path)
+    graph.add_strategy_knowledge(STRATEGY)
+    graph.add_edge("strategy_42", "material_SA-516-70", "uses_material", weight=3.0)
+
+    assert not graph.graph_file.exists()  # nothing compacted yet
+    reloaded = make_graph(tmp_path)
+
+    assert set(reloaded.nodes) == set(graph.nodes)
+    assert reloaded.get_stats() == graph.get_stats()
+    edge = reloaded._edge_index[("strategy_42", "material_SA-516-70", "uses_material")]
+    assert edge.weight == 3.0
+    assert len(reloaded.get_neighbors("strategy_42")) == 3
+
+
+def test_batch_appends_once(tmp_path):
+    graph = make_graph(tmp_path)
+    with graph.batch():
+        for i in range(50):
+            graph.add_node(f"n{i}", "part", f"Part {i}")
+            graph.add_node(f"n{i}", "part", f"Part {i}", {"rev": "B"})  # coalesced
+        assert not graph.log_file.exists()
+
+    lines = graph.log_file.read_text().splitlines()
+    assert len(lines) == 50
+    assert json.loads(lines[0])["data"]["properties"] == {"rev": "B"}
+
+
+def test_compaction_writes_snapshot_and_truncates_log(tmp_path):
+    graph = make_graph(tmp_path, compact_every=10)
+    for i in range(12):
+        graph.add_node(f"n{i}", "part", f"Part {i}")
+
+    snapshot = json.loads(graph.graph_file.read_text())
+    assert snapshot["metadata"]["node_count"] == 10
+    assert len(graph.log_file.read_text().splitlines()) == 2
+    assert len(make_graph(tmp_path).nodes) == 12
+
+
+def test_torn_log_line_skipped(tmp_path):
+    graph = make_graph(tmp_path)
+    graph.add_node("a", "part", "A")
+    with open(graph.log_file, "a") as f:
+        f.write('{"op": "node", "data": {"id": "b", "ty')  # crash mid-append
+
+    reloaded = make_graph(tmp_path)
+    assert set(reloaded.nodes) == {"a"}
+
+    # The torn tail is cut off, so the next append is not glued onto it
+    reloaded.add_node("c", "part", "C")
+    assert set(make_graph(tmp_path).nodes) == {"a", "c"}
+
+
+def test_unterminated_last_line_kept(tmp_path):
+    graph = make_graph(tmp_path)
+    graph.add_node("a", "part", "A")
+    graph.log_file.write_bytes(graph.log_file.read_bytes().rstrip(b"\n"))
+
+    reloaded = make_graph(tmp_path)
+    reloaded.add_node("b", "part", "B")
+    assert set(make_graph(tmp_path).nodes) == {"a", "b"}
+
+
+def test_failed_append_is_retried(tmp_path):
+    graph = make_graph(tmp_path)
+    log_file = graph.log_file
+    graph.log_file = tmp_path / "unwritable"
+    graph.log_file.mkdir()
+
+    graph.add_node("a", "part", "A")
+    assert graph._dirty_nodes == {"a"}
+
+    graph.log_file = log_file
+    graph.add_node("b", "part", "B")
+    assert set(make_graph(tmp_path).nodes) == {"a", "b"}
+
+
+def test_prune_persists_deletions(tmp_path):
+    graph = make_graph(tmp_path)
+    graph.add_node("old", "part", "Old")
+    graph.add_node("new", "part", "New")
+    graph.add_edge("new", "old", "replaces")
+    graph.prune_old(days=-1)  # everything is older than tomorrow
+
+    assert make_graph(tmp_path).get_stats()["total_nodes"] == 0
+    assert graph.log_file.read_text() == ""
+
+
+def test_indexed_lookups_match_full_scan(tmp_path):
+    graph = make_graph(tmp_path)
+    with graph.batch():
+        for i in range(300):
+            graph.add_node(
+                f"n{i}", ["part", "standard", "material"][i % 3], f"Item {i} flange",
+                {"spec": f"SA-{100 + i % 7}", "grade": i % 5},
+            )
+        for i in range(300):
+            graph.add_edge(f"n{i}", f"n{(i * 7) % 300}", "uses")
+        graph.add_node("n5", "standard", "ignored", {"note": "Updated NOTE"})
+
+    def scan(query, node_type=None):
+        q = query.lower()
+        return [
+            n.id for n in graph.nodes.values()
+            if (not node_type or n.type == node_type)
+            and (q in n.label.lower() or any(q in str(v).lower() for v in n.properties.values()))
+        ]
+
+    for query, node_type in [("item 1", None), ("SA-10", "part"), ("updated note", None),
+                             ("fl", "material"), ("", None), ("zzz", None), ("3", "standard")]:
+        assert [n.id for n in graph.search(query, node_type)] == scan(query, node_type)
+
+    def most_recent(g, node_type):
+        return [
+            n.id for n in sorted(
+                (n for n in g.nodes.values() if n.type == node_type),
+                key=lambda n: n.last_accessed, reverse=True,
+            )[:5]
+        ]
+
+    graph.get_node("n2")
+    assert [n.id for n in graph.get_related("material", limit=5)] == most_recent(graph, "material")
+    assert graph.get_related("material", limit=1)[0].id == "n2"
+    reloaded = make_graph(tmp_path)
+    assert [n.id for n in reloaded.get_related("part", limit=5)] == most_recent(reloaded, "part")
+
+    assert [n["node"]["id"] for n in graph.get_incoming("n7")] == ["n1"]
+    graph.add_edge("n1", "n7", "uses", weight=4.0)
+    assert graph.get_neighbors("n1")[0]["weight"] == 4.0  # strengthened weight is visible
@@ -0,0 +1,216 @@
+"""
+Async LLM Client Tests
+
+Runs core.llm_async.LLMClient against a local fake Messages API server:
+calls must not block the event loop, reuse pooled connections, respect
+per-model concurrency caps, stream tokens and poll batches with backoff.
+"""
+
+import asyncio
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_async import LLMClient
+from core.llm_cache import ResponseCache
+from core.llm_coalesce import SingleFlight
+from core.redis_adapter import InMemoryCache
+
+MODEL = "claude-3-haiku-20240307"
+
+
+def message(text, model=MODEL):
+    return {
+        "id": "msg_1", "type": "message", "role": "assistant", "model": model,
+        "content": [{"type": "text", "text": text}], "stop_reason": "end_turn", "stop_sequence": None,
+        "usage": {"input_tokens": 12, "output_tokens": 4},
+    }
+
+
+def batch(status, results_url=None):
+    return {
+        "id": "batch_1", "type": "message_batch", "processing_status": status,
+        "request_counts": {"processing": 0, "succeeded": 3, "errored": 0, "canceled": 0, "expired": 0},
+        "created_at": "2026-01-01T00:00:00Z", "expires_at": "2026-01-02T00:00:00Z",
+        "ended_at": None, "archived_at": None, "cancel_initiated_at": None, "results_url": results_url,
+    }
+
+
+class FakeAPI(BaseHTTPRequestHandler):
+    """Just enough of the Messages and Batches API for the client."""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body: bytes, content_type="application/json"):
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        server = self.server
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        with server.lock:
+            server.connections.add(self.client_address)
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.requests.append(request)
+        try:
+            if self.path == "/v1/messages/batches":
+                server.batch_requests = request["requests"]
+                return self._send(json.dumps(batch("in_progress")).encode())
+            time.sleep(server.delay)
+            text = f"reply to {request['messages'][-1]['content']}"
+            if not request.get("stream"):
+                return self._send(json.dumps(message(text, request["model"])).encode())
+            events = [("message_start", {"type": "message_start", "message": {**message("", request["model"]), "content": []}}),
+                      ("content_block_start", {"type": "content_block_start", "index": 0,
+                                               "content_block": {"type": "text", "text": ""}})]
+            for word in text.split(" "):
+                events.append(("content_block_delta", {"type": "content_block_delta", "index": 0,
+                                                       "delta": {"type": "text_delta", "text": word + " "}}))
+            events += [("content_block_stop", {"type": "content_block_stop", "index": 0}),
+                       ("message_delta", {"type": "message_delta", "delta": {"stop_reason": "end_turn", "stop_sequence": None},
+                                          "usage": {"output_tokens": 4}}),
+                       ("message_stop", {"type": "message_stop"})]
+            body = "".join(f"event: {name}\ndata: {json.dumps(data)}\n\n" for name, data in events)
+            self._send(body.encode(), "text/event-stream")
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def do_GET(self):
+        server = self.server
+        if self.path.startswith("/v1/messages/batches/batch_1/results"):
+            lines = [
+                json.dumps({"custom_id": r["custom_id"],
+                            "result": {"type": "succeeded", "message": message(r["custom_id"])}})
+                for r in reversed(server.batch_requests)
+            ]
+            return self._send("\n".join(lines).encode(), "application/binary")
+        server.polls.append(time.monotonic())
+        done = len(server.polls) >= 3
+        url = f"http://127.0.0.1:{server.server_port}/v1/messages/batches/batch_1/results"
+        self._send(json.dumps(batch("ended" if done else "in_progress", url if done else None)).encode())
+
+
+@pytest.fixture
+def api():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FakeAPI)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connections, server.requests, server.polls = set(), [], []
+    server.active = server.peak = 0
+    server.delay = 0.1
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def make_client(api, **kwargs):
+    client = LLMClient(api_key="test", base_url=f"http://127.0.0.1:{api.server_port}", **kwargs)
+    client.cache = ResponseCache(backend=InMemoryCache())
+    client.inflight = SingleFlight()
+    return client
+
+
+def ask(text):
+    return [{"role": "user", "content": text}]
+
+
+def test_chat_does_not_block_the_event_loop(api):
+    client = make_client(api)
+
+    async def main():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.ensure_future(ticker())
+        response = await client.chat(ask("hello"), force_model=MODEL)
+        task.cancel()
+        await client.aclose()
+        return response, ticks
+
+    response, ticks = asyncio.run(main())
+    assert response.content == "reply to hello"
+    assert (response.input_tokens, response.output_tokens) == (12, 4)
+    assert ticks >= 5  # The loop kept running through the 100 ms round-trip
+
+
+def test_connections_are_reused_and_concurrency_is_capped(api):
+    client = make_client(api, model_concurrency={MODEL: 2})
+
+    async def main():
+        responses = await asyncio.gather(*(client.chat(ask(f"q{i}"), force_model=MODEL) for i in range(8)))
+        await client.aclose()
+        return responses
+
+    start = time.monotonic()
+    responses = asyncio.run(main())
+    assert [r.content for r in responses] == [f"reply to q{i}" for i in range(8)]
+    assert api.peak == 2
+    assert len(api.connections) <= 2
+    assert time.monotonic() - start >= 0.4  # Four rounds of two
+
+
+def test_stream_yields_tokens_and_fills_the_cache(api):
+    client = make_client(api)
+
+    async def main():
+        chunks = [text async for text in client.stream(ask("stream me"), force_model=MODEL)]
+        again = [text async for text in client.stream(ask("stream me"), force_model=MODEL)]
+        cached = await client.chat(ask("stream me"), force_model=MODEL)
+        await client.aclose()
+        return chunks, again, cached
+
+    chunks, again, cached = asyncio.run(main())
+    assert chunks == ["reply ", "to ", "stream ", "me "]
+    assert again == ["reply to stream me "]
+    assert cached.cached and cached.content == "reply to stream me "
+    assert sum(1 for r in api.requests if r.get("stream")) == 1
+
+
+def test_batch_polls_with_backoff_and_keeps_order(api):
+    client = make_client(api)
+    requests = [{"messages": ask(f"b{i}"), "model": MODEL, "max_tokens": 64} for i in range(3)]
+
+    async def main():
+        results = await client.generate_batch(requests, poll_interval=0.05, max_poll_interval=1.0)
+        await client.aclose()
+        return results
+
+    assert asyncio.run(main()) == ["req_0", "req_1", "req_2"]
+    # Status polls until "ended" (results() retrieves the batch once more)
+    polls = api.polls[:3]
+    gaps = [b - a for a, b in zip(polls, polls[1:])]
+    assert gaps[1] > gaps[0] * 1.5
+    assert api.batch_requests[0]["params"]["max_tokens"] == 64
+
+
+def test_clients_are_per_event_loop(api):
+    client = make_client(api)
+
+    async def main(text):
+        response = await client.chat(ask(text), force_model=MODEL, use_cache=False)
+        return response.content
+
+    # A pooled connection from a closed loop must not be reused
+    assert asyncio.run(main("one")) == "reply to one"
+    assert asyncio.run(main("two")) == "reply to two"
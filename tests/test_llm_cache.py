@@ -0,0 +1,153 @@
+"""
+LLM Response Cache Tests
+
+Cache keys must be stable across processes and cover the whole request;
+both LLM clients must serve repeated requests from the cache.
+"""
+
+import asyncio
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_cache import ResponseCache, request_key
+from core.redis_adapter import InMemoryCache
+
+ROOT = Path(__file__).parent.parent
+
+MESSAGES = [
+    {"role": "user", "content": "Minimum edge distance for a 3/4 bolt?"},
+    {"role": "assistant", "content": "1 inch for rolled edges."},
+    {"role": "user", "content": "And sheared?"},
+]
+
+
+class FakeMessages:
+    """Stands in for anthropic.Anthropic().messages."""
+
+    def __init__(self, text="1-1/4 inch."):
+        self.text = text
+        self.calls = []
+
+    def create(self, **request):
+        self.calls.append(request)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=self.text)],
+            usage=SimpleNamespace(input_tokens=40, output_tokens=8),
+        )
+
+
+class FakeAsyncMessages(FakeMessages):
+    """Stands in for anthropic.AsyncAnthropic().messages."""
+
+    async def create(self, **request):
+        return FakeMessages.create(self, **request)
+
+
+def test_key_is_stable_across_processes():
+    code = (
+        "from core.llm_cache import request_key;"
+        "print(request_key('m', [{'role': 'user', 'content': 'hi'}], 'sys', 100, 0.2))"
+    )
+    keys = {
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True,
+                       env={**os.environ, "PYTHONHASHSEED": seed}).stdout.strip().splitlines()[-1]
+        for seed in ("1", "2")
+    }
+    assert keys == {request_key("m", [{"role": "user", "content": "hi"}], "sys", 100, 0.2)}
+
+
+def test_key_covers_the_whole_request():
+    base = request_key("sonnet", MESSAGES, "You are an engineer.", 1024, 0.2)
+    variants = [
+        request_key("haiku", MESSAGES, "You are an engineer.", 1024, 0.2),
+        request_key("sonnet", MESSAGES, "You are a trader.", 1024, 0.2),
+        request_key("sonnet", MESSAGES, "You are an engineer.", 512, 0.2),
+        request_key("sonnet", MESSAGES, "You are an engineer.", 1024, 0.7),
+        request_key("sonnet", MESSAGES, "You are an engineer.", 1024, 0.2, tools=[{"name": "lookup"}]),
+        # Same last message, different earlier turn
+        request_key("sonnet", [MESSAGES[0], {"role": "assistant", "content": "7/8 inch."}, MESSAGES[2]],
+                    "You are an engineer.", 1024, 0.2),
+    ]
+    assert len({base, *variants}) == len(variants) + 1
+
+
+def test_key_ignores_prompt_cache_markers():
+    structured = [{"type": "text", "text": "You are an engineer.", "cache_control": {"type": "ephemeral"}}]
+    blocks = [{"role": m["role"], "content": [{"type": "text", "text": m["content"]}]} for m in MESSAGES]
+    assert request_key("sonnet", blocks, structured, 1024, 0.2) == \
+        request_key("sonnet", MESSAGES, "You are an engineer.", 1024, 0.2)
+
+
+def test_round_trip_compression_and_stats():
+    cache = ResponseCache(backend=InMemoryCache(), compress_min_bytes=256)
+    long_answer = "Use 5/16 fillet welds on both sides. " * 200
+    assert cache.get("k1") is None
+    assert cache.set("k1", {"content": long_answer, "model": "m"})
+    assert cache.set("k2", {"content": "short", "model": "m"})
+    assert cache.get("k1") == {"content": long_answer, "model": "m"}
+    assert cache.get("k2") == {"content": "short", "model": "m"}
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["stores"]) == (2, 1, 2)
+    assert stats["bytes_written"] < stats["bytes_uncompressed"] / 5
+    assert stats["hit_rate"] == 0.6667
+
+
+def test_ttl_policies():
+    backend = InMemoryCache()
+    cache = ResponseCache(backend=backend, ttl_policies={"scratch": 0, "brief": 0.05})
+    assert cache.ttl_for("trading") == 300
+    assert cache.ttl_for("unknown_agent") == cache.ttl_for("default")
+    assert not cache.set("k", {"content": "x"}, agent_type="scratch")
+    assert cache.stats()["skipped"] == 1
+
+    # Expired entries are misses
+    cache.set("k", {"content": "x"}, agent_type="brief")
+    time.sleep(0.1)
+    assert cache.get("k") is None
+
+
+def test_corrupt_entries_are_misses():
+    backend = InMemoryCache()
+    backend.setex("k", 60, "not an entry")
+    cache = ResponseCache(backend=backend)
+    assert cache.get("k") is None
+    assert cache.stats()["errors"] == 1
+
+
+def test_generate_serves_repeats_from_cache():
+    from core.llm import LLMClient
+
+    client = LLMClient(api_key="test")
+    client.client = SimpleNamespace(messages=FakeMessages())
+    client._cache = ResponseCache(backend=InMemoryCache())
+
+    kwargs = dict(system="You are an engineer.", model="m", max_tokens=256, temperature=0.2,
+                  optimize_tokens=False)
+    assert client.generate(MESSAGES, **kwargs) == "1-1/4 inch."
+    assert client.generate(MESSAGES, **kwargs) == "1-1/4 inch."
+    assert len(client.client.messages.calls) == 1
+
+    client.generate(MESSAGES, **{**kwargs, "temperature": 0.9})
+    assert len(client.client.messages.calls) == 2
+
+
+def test_async_chat_serves_repeats_from_cache():
+    from core.llm_async import LLMClient
+
+    fake = FakeAsyncMessages()
+    client = LLMClient(api_key="test", client=SimpleNamespace(messages=fake))
+    client.cache = ResponseCache(backend=InMemoryCache())
+
+    first = asyncio.run(client.chat(MESSAGES, system_prompt="You are an engineer.", agent_type="cad_agent"))
+    second = asyncio.run(client.chat(MESSAGES, system_prompt="You are an engineer.", agent_type="cad_agent"))
+    assert (first.cached, second.cached) == (False, True)
+    assert second.content == first.content
+    assert len(fake.calls) == 1
+    assert "system" in fake.calls[0] and all(m["role"] != "system" for m in fake.calls[0]["messages"])
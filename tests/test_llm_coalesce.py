@@ -0,0 +1,206 @@
+"""
+LLM Request Coalescing Tests
+
+Concurrent identical requests must share one upstream call, and small
+prompts submitted together must go out as one batch.
+"""
+
+import asyncio
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.llm_cache import ResponseCache
+from core.llm_coalesce import MicroBatcher, SingleFlight
+from core.redis_adapter import InMemoryCache
+
+MESSAGES = [{"role": "user", "content": "Explain the ACHE header box plug spacing rule."}]
+
+
+class SlowMessages:
+    """Stands in for anthropic.Anthropic().messages with a slow round-trip."""
+
+    def __init__(self, delay=0.2):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def create(self, **request):
+        with self._lock:
+            self.calls.append(request)
+        time.sleep(self.delay)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"answer {len(self.calls)}")],
+            usage=SimpleNamespace(input_tokens=50, output_tokens=10),
+        )
+
+
+class SlowAsyncMessages(SlowMessages):
+    """Stands in for anthropic.AsyncAnthropic().messages."""
+
+    async def create(self, **request):
+        self.calls.append(request)
+        await asyncio.sleep(self.delay)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"answer {len(self.calls)}")],
+            usage=SimpleNamespace(input_tokens=50, output_tokens=10),
+        )
+
+
+def test_concurrent_calls_share_one_upstream_call():
+    flight = SingleFlight()
+    calls = []
+
+    def fetch():
+        calls.append(1)
+        time.sleep(0.2)
+        return "result"
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(lambda _: flight.do("k", fetch), range(8)))
+
+    assert len(calls) == 1
+    assert sorted(shared for _, shared in results) == [False] + [True] * 7
+    assert {result for result, _ in results} == {"result"}
+    stats = flight.stats()
+    assert (stats["calls"], stats["upstream"], stats["coalesced"]) == (8, 1, 7)
+    assert flight.in_flight() == 0
+
+    # Finished calls aren't reused
+    flight.do("k", fetch)
+    assert len(calls) == 2
+
+
+def test_errors_reach_every_waiter():
+    flight = SingleFlight()
+
+    def fail():
+        time.sleep(0.1)
+        raise TimeoutError("upstream timed out")
+
+    def call(_):
+        try:
+            flight.do("k", fail)
+        except TimeoutError as e:
+            return str(e)
+
+    with ThreadPoolExecutor(4) as pool:
+        assert list(pool.map(call, range(4))) == ["upstream timed out"] * 4
+    assert flight.stats()["failures"] == 1
+
+
+def test_async_calls_share_one_task_and_survive_cancellation():
+    flight = SingleFlight()
+    calls = []
+
+    async def fetch():
+        calls.append(1)
+        await asyncio.sleep(0.1)
+        return "result"
+
+    async def main():
+        waiters = [asyncio.ensure_future(flight.do_async("k", fetch)) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        waiters[0].cancel()
+        return await asyncio.gather(*waiters[1:])
+
+    results = asyncio.run(main())
+    assert len(calls) == 1
+    assert [result for result, _ in results] == ["result"] * 4
+    assert all(shared for _, shared in results)
+
+
+def test_micro_batcher_groups_and_dedupes():
+    sent = []
+
+    def send(requests):
+        sent.append(requests)
+        return [r["messages"][0]["content"].upper() for r in requests]
+
+    batcher = MicroBatcher(send=send, max_batch=8, max_wait=0.2)
+    prompts = ["a", "b", "a", "c", "b", "d"]
+    futures = [batcher.submit({"messages": [{"role": "user", "content": p}]}) for p in prompts]
+    assert [f.result(timeout=5) for f in futures] == [p.upper() for p in prompts]
+    assert len(sent) == 1 and len(sent[0]) == 4
+
+    # A full batch goes out without waiting for the window
+    batcher.max_wait = 5.0
+    start = time.monotonic()
+    futures = [batcher.submit({"messages": [{"role": "user", "content": str(i)}]}) for i in range(8)]
+    [f.result(timeout=5) for f in futures]
+    assert time.monotonic() - start < 2.0
+    batcher.close()
+
+    stats = batcher.stats()
+    assert (stats["calls"], stats["batches"], stats["batched"], stats["coalesced"]) == (14, 2, 12, 2)
+
+
+def test_micro_batch_errors_reach_every_request():
+    def send(requests):
+        raise ConnectionError("batch API down")
+
+    batcher = MicroBatcher(send=send, max_wait=0.05)
+    futures = [batcher.submit({"messages": [{"role": "user", "content": str(i)}]}) for i in range(3)]
+    for future in futures:
+        with pytest.raises(ConnectionError):
+            future.result(timeout=5)
+    batcher.close()
+
+
+def test_generate_coalesces_concurrent_identical_requests():
+    from core.llm import LLMClient
+
+    client = LLMClient(api_key="test")
+    client.client = SimpleNamespace(messages=SlowMessages())
+    client._cache = ResponseCache(backend=InMemoryCache())
+    client._inflight = SingleFlight()
+
+    def ask(_):
+        return client.generate(MESSAGES, model="m", max_tokens=256, temperature=0.2, optimize_tokens=False)
+
+    with ThreadPoolExecutor(6) as pool:
+        answers = list(pool.map(ask, range(6)))
+    assert answers == ["answer 1"] * 6
+    assert len(client.client.messages.calls) == 1
+    assert client.coalescing_stats()["in_flight"]["coalesced"] == 5
+
+
+def test_async_chat_coalesces_concurrent_identical_requests():
+    from core.llm_async import LLMClient
+
+    fake = SlowAsyncMessages()
+    client = LLMClient(api_key="test", client=SimpleNamespace(messages=fake))
+    client.cache = ResponseCache(backend=InMemoryCache())
+    client.inflight = SingleFlight()
+
+    async def main():
+        return await asyncio.gather(*(client.chat(MESSAGES, agent_type="general") for _ in range(4)))
+
+    responses = asyncio.run(main())
+    assert len(fake.calls) == 1
+    assert {r.content for r in responses} == {"answer 1"}
+    assert sorted(r.coalesced for r in responses) == [False, True, True, True]
+    assert sum(r.input_tokens for r in responses) == 50
+
+
+def test_generate_batch_keeps_request_order():
+    from core.llm import LLMClient
+
+    def result(custom_id):
+        return SimpleNamespace(custom_id=custom_id, result=SimpleNamespace(
+            type="succeeded", message=SimpleNamespace(content=[SimpleNamespace(text=custom_id)])))
+
+    batches = SimpleNamespace(
+        create=lambda requests: SimpleNamespace(id="b1", processing_status="ended", requests=requests),
+        results=lambda batch_id: [result("req_2"), result("req_0"), result("req_1")],
+    )
+    client = LLMClient(api_key="test")
+    client.client = SimpleNamespace(messages=SimpleNamespace(batches=batches))
+    assert client.generate_batch([{"messages": MESSAGES}] * 3) == ["req_0", "req_1", "req_2"]
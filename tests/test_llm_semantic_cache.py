@@ -0,0 +1,210 @@
+"""
+Semantic LLM Cache Tests
+
+Paraphrased questions must reuse an answer only within the same agent and
+system prompt version, and entries must be evicted, expired and invalidated
+when the rules or standards data change.
+"""
+
+import asyncio
+import hashlib
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core import llm_semantic_cache
+from core.llm_cache import ResponseCache
+from core.llm_coalesce import SingleFlight
+from core.llm_semantic_cache import SemanticCache, normalize_query, query_numbers, semantic_query
+from core.redis_adapter import InMemoryCache
+
+
+def bag_of_words(texts):
+    """Word-count vectors: similarity is word overlap, no model needed."""
+    vectors = []
+    for text in texts:
+        vector = [0.0] * 64
+        for word in text.split():
+            vector[int(hashlib.md5(word.encode()).hexdigest(), 16) % 64] += 1.0
+        vectors.append(vector)
+    return vectors
+
+
+def make_cache(**kwargs):
+    kwargs.setdefault("watch_paths", None)
+    return SemanticCache(embed=bag_of_words, threshold=0.75, **kwargs)
+
+
+EDGE = normalize_query('Min edge distance for 3/4" bolt?')
+EDGE_PARAPHRASE = normalize_query("edge distance 0.75in bolt AISC")
+WELD = normalize_query("Minimum fillet weld size for 1/2 in plate")
+
+
+def test_normalize_query_unifies_notation():
+    assert EDGE == "min edge distance for 0.75 in bolt"
+    assert EDGE_PARAPHRASE == "edge distance 0.75 in bolt aisc"
+    assert normalize_query("Section J3.4, table J3.4!") == "section j3.4 table j3.4"
+
+
+def test_query_numbers_keep_units_and_designations():
+    assert query_numbers(EDGE) == query_numbers(EDGE_PARAPHRASE) == ("0.75 in",)
+    assert query_numbers(normalize_query("A325 bolt, 20mm hole per J3.4")) == ("20 mm", "a325", "j3.4")
+    assert query_numbers("spacing 3.0 in or 03 ft") == ("3 ft", "3 in")
+    assert query_numbers("bolt spacing rule") == ()
+
+
+def test_questions_differing_only_in_a_number_do_not_match():
+    cache = make_cache()
+    cache.set(EDGE, {"content": "1 in"}, agent_type="cad")
+
+    # Word overlap alone would clear the threshold for all of these
+    assert cache.get(normalize_query("min edge distance for 1 in bolt"), agent_type="cad") is None
+    assert cache.get(normalize_query("min edge distance for 0.75 mm bolt"), agent_type="cad") is None
+    assert cache.get(normalize_query("min edge distance for 0.75 in A490 bolt"), agent_type="cad") is None
+    assert cache.get(normalize_query("min edge distance for 0.750 in bolt"), agent_type="cad")["content"] == "1 in"
+
+
+def test_only_single_question_conversations_are_cached():
+    assert semantic_query([{"role": "user", "content": "Bolt spacing?"}]) == "bolt spacing"
+    follow_up = [
+        {"role": "user", "content": "Bolt spacing for 3/4 bolts?"},
+        {"role": "assistant", "content": "2.0 in"},
+        {"role": "user", "content": "And for 1 in?"},
+    ]
+    assert semantic_query(follow_up) is None
+    assert semantic_query([{"role": "user", "content": [{"type": "image"}]}]) is None
+
+
+def test_paraphrases_hit_within_scope_only():
+    cache = make_cache()
+    assert cache.set(EDGE, {"content": "1 in", "model": "m"}, agent_type="cad", version="v1")
+
+    hit = cache.get(EDGE_PARAPHRASE, agent_type="cad", version="v1")
+    assert hit["content"] == "1 in" and hit["similarity"] >= 0.75
+    assert hit["matched_query"] == EDGE
+
+    assert cache.get(WELD, agent_type="cad", version="v1") is None
+    assert cache.get(EDGE_PARAPHRASE, agent_type="cad", version="v2") is None
+    assert cache.get(EDGE_PARAPHRASE, agent_type="general", version="v1") is None
+
+    # Trading answers depend on the market, not just the words
+    assert not cache.set(EDGE, {"content": "x"}, agent_type="trading")
+    assert cache.get(EDGE, agent_type="trading") is None
+
+    stats = cache.stats()
+    assert (stats["lookups"], stats["hits"], stats["misses"], stats["skipped"]) == (4, 1, 3, 1)
+    assert stats["hit_rate"] == 0.25
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = make_cache(max_entries=2)
+    questions = ["bolt spacing rule", "weld size rule", "plug spacing rule"]
+    cache.set(questions[0], {"content": "a"}, agent_type="cad")
+    cache.set(questions[1], {"content": "b"}, agent_type="cad")
+    assert cache.get(questions[0], agent_type="cad")["content"] == "a"  # Now most recent
+
+    cache.set(questions[2], {"content": "c"}, agent_type="cad")
+    assert len(cache) == 2
+    assert cache.get(questions[1], agent_type="cad") is None
+    assert cache.get(questions[0], agent_type="cad")["content"] == "a"
+    assert cache.stats()["evictions"] == 1
+
+    # Storing the same question again replaces it
+    cache.set(questions[2], {"content": "c2"}, agent_type="cad")
+    assert len(cache) == 2 and cache.get(questions[2], agent_type="cad")["content"] == "c2"
+
+
+def test_entries_expire():
+    cache = make_cache(ttl_policies={"cad": 0.05})
+    cache.set(EDGE, {"content": "1 in"}, agent_type="cad")
+    time.sleep(0.1)
+    assert cache.get(EDGE, agent_type="cad") is None
+    assert cache.stats()["expirations"] == 1 and len(cache) == 0
+
+
+def test_expired_best_match_does_not_hide_a_live_one():
+    cache = make_cache(ttl_policies={"cad": 0.05})
+    cache.set(EDGE_PARAPHRASE, {"content": "stale"}, agent_type="cad")
+    time.sleep(0.1)
+    cache.ttl_policies["cad"] = 3600
+    cache.set("edge distance 0.75 in bolt", {"content": "live"}, agent_type="cad")
+
+    hit = cache.get(EDGE_PARAPHRASE, agent_type="cad")
+    assert hit["content"] == "live"
+    assert cache.stats()["expirations"] == 1 and len(cache) == 1
+
+
+def test_data_changes_invalidate(tmp_path):
+    standards = tmp_path / "standards"
+    standards.mkdir()
+    (standards / "fasteners.json").write_text('{"edge": 1.0}')
+    cache = make_cache(watch_paths=[standards], check_interval=0)
+    cache.set(EDGE, {"content": "1 in"}, agent_type="cad")
+    cache.set(WELD, {"content": "3/16 in"}, agent_type="general")
+    assert cache.get(EDGE, agent_type="cad") is not None
+
+    (standards / "fasteners.json").write_text('{"edge": 1.25}')
+    assert cache.get(EDGE, agent_type="cad") is None
+    assert cache.stats()["invalidations"] == 2
+
+    cache.set(EDGE, {"content": "1.25 in"}, agent_type="cad")
+    cache.set(WELD, {"content": "3/16 in"}, agent_type="general")
+    assert cache.invalidate(agent_type="general") == 1
+    assert cache.get(EDGE, agent_type="cad")["content"] == "1.25 in"
+
+
+def test_pure_python_scoring_matches_numpy(monkeypatch):
+    questions = [EDGE, WELD, "bolt spacing 2.67 d", "ache header plug spacing"]
+    results = []
+    for numpy in (True, False):
+        if numpy and not llm_semantic_cache.NUMPY_AVAILABLE:
+            continue
+        monkeypatch.setattr(llm_semantic_cache, "NUMPY_AVAILABLE", numpy)
+        cache = make_cache()
+        for i, question in enumerate(questions):
+            cache.set(question, {"content": str(i)}, agent_type="cad")
+        hit = cache.get(EDGE_PARAPHRASE, agent_type="cad")
+        results.append((hit["content"], round(hit["similarity"], 5)))
+    assert len(set(results)) == 1
+
+
+class FakeAsyncMessages:
+    def __init__(self):
+        self.calls = []
+
+    async def create(self, **request):
+        self.calls.append(request)
+        return SimpleNamespace(
+            content=[SimpleNamespace(text=f"answer {len(self.calls)}")],
+            usage=SimpleNamespace(input_tokens=40, output_tokens=8),
+        )
+
+
+def test_async_chat_skips_the_api_for_paraphrases():
+    from core.llm_async import LLMClient
+
+    fake = FakeAsyncMessages()
+    client = LLMClient(api_key="test", client=SimpleNamespace(messages=fake), semantic_cache=make_cache())
+    client.cache = ResponseCache(backend=InMemoryCache())
+    client.inflight = SingleFlight()
+
+    async def ask(text, **kwargs):
+        return await client.chat([{"role": "user", "content": text}], system_prompt="CAD prompt",
+                                 agent_type="cad", **kwargs)
+
+    async def main():
+        return [
+            await ask('Min edge distance for 3/4" bolt?'),
+            await ask("edge distance 0.75in bolt AISC"),
+            await ask("edge distance 0.75in bolt AISC", system_version="cad-v2"),
+        ]
+
+    first, paraphrase, new_prompt = asyncio.run(main())
+    assert len(fake.calls) == 2
+    assert first.content == paraphrase.content == "answer 1"
+    assert paraphrase.cached and paraphrase.semantic and paraphrase.cost_estimate == 0.0
+    assert new_prompt.content == "answer 2" and not new_prompt.semantic
+    assert client.semantic_cache.stats()["hits"] == 1
@@ -0,0 +1,189 @@
+"""
+Memory / RAG Tests
+
+Tests that RAG retrieval embeds each query once and fans the vector out
+to every collection, and that ingestion is batched and deduplicated.
+"""
+
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+pytest.importorskip("chromadb")
+
+from chromadb.api.types import EmbeddingFunction
+
+from core.memory import chroma_store
+from core.memory.batch_ingest import IngestPipeline
+from core.memory.ingest import LessonIngestor
+from core.memory.rag_engine import RAGEngine
+
+
+class CountingEmbedding(EmbeddingFunction):
+    """Deterministic 3-d embedding that counts model calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, input):
+        self.calls += 1
+        return [[float(len(t)), float(t.count("a")), 1.0] for t in input]
+
+
+@pytest.fixture
+def memory(tmp_path, monkeypatch):
+    embedding = CountingEmbedding()
+    monkeypatch.setattr(chroma_store, "get_embedding_function", lambda: embedding)
+    mem = chroma_store.VulcanMemory(persist_dir=str(tmp_path / "chroma"), query_cache_size=2)
+    mem.add_trade("t1", "long EURUSD breakout at london open", {"pair": "EURUSD"})
+    mem.add_lesson("l1", "wait for a retest before entering", {"category": "entries"})
+    mem.add_analysis("a1", "dollar weakness across majors", {"date": "2026-01-05"})
+    embedding.calls = 0
+    return mem, embedding
+
+
+def test_augment_prompt_embeds_query_once(memory):
+    mem, embedding = memory
+    rag = RAGEngine(mem)
+
+    prompt = rag.augment_prompt("london breakout setups")
+
+    assert embedding.calls == 1
+    assert "### Relevant Past Trades" in prompt
+    assert "### Relevant Lessons Learned" in prompt
+    assert "### Relevant Market Analyses" in prompt
+
+    # get_context_only for the same query reuses the cached embedding
+    context = rag.get_context_only("london breakout setups")
+    assert embedding.calls == 1
+    assert set(context) == {"trades", "lessons"}
+
+
+def test_search_many_matches_single_searches(memory):
+    mem, _ = memory
+    many = mem.search_many("retest entries", ("trades", "lessons"), n_results=1)
+
+    assert many["trades"]["ids"] == mem.search_trades("retest entries", n_results=1)["ids"]
+    assert many["lessons"]["ids"] == mem.search_lessons("retest entries", n_results=1)["ids"]
+
+
+def test_query_embedding_lru(memory):
+    mem, embedding = memory
+    for query in ["a", "b", "a", "c", "b"]:
+        mem.embed_query(query)
+
+    # "a" and "b" cached, "a" refreshed, "c" evicts "b", "b" is recomputed
+    assert embedding.calls == 4
+    assert list(mem._query_cache) == ["c", "b"]
+
+
+def test_search_many_rejects_unknown_collection(memory):
+    mem, _ = memory
+    with pytest.raises(ValueError):
+        mem.search_many("anything", ("positions",))
+
+
+def test_pipeline_batches_and_deduplicates(memory):
+    mem, embedding = memory
+    pipeline = IngestPipeline(mem, batch_size=50, flush_interval=5.0)
+
+    futures = pipeline.submit_many(
+        "cad_jobs",
+        [(f"cad_{i}", f"bracket job {i % 80}", {"software": "SolidWorks"}) for i in range(100)],
+    )
+    assert pipeline.flush(timeout=10)
+    pipeline.close()
+
+    stats = pipeline.get_stats()
+    assert embedding.calls == 2  # two full batches, one model call each
+    assert stats["written"] == 80
+    assert stats["duplicates"] == 20
+    assert mem.cad_jobs.count() == 80
+    assert futures[85].result() == "cad_5"  # duplicate content resolves to the stored ID
+
+
+def test_pipeline_flush_deadline_for_single_add(memory):
+    mem, _ = memory
+    pipeline = IngestPipeline(mem, batch_size=100, flush_interval=0.05)
+
+    future = pipeline.submit("lessons", "l2", "size down after two losses", {"category": "risk"})
+    assert future.result(timeout=5) == "l2"  # written without an explicit flush
+    pipeline.close()
+
+    assert mem.get_lesson_count() == 2
+
+
+def test_ingestor_uses_pipeline(memory):
+    mem, _ = memory
+    pipeline = IngestPipeline(mem, flush_interval=0.01)
+    ingestor = LessonIngestor(mem, pipeline=pipeline)
+
+    ingestor.ingest_lesson("never move the stop loss further away", category="risk")
+    pipeline.close()
+
+    assert mem.get_lesson_count() == 2
+
+
+class CountingCollection:
+    """Counts reads against a Chroma collection."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.gets = 0
+
+    def get(self, *args, **kwargs):
+        self.gets += 1
+        return self.collection.get(*args, **kwargs)
+
+    def __getattr__(self, name):
+        return getattr(self.collection, name)
+
+
+def test_only_batch_flush_reads_for_duplicates(memory):
+    mem, _ = memory
+    mem.lessons = CountingCollection(mem.lessons)
+
+    mem.add_lesson("l2", "journal every trade", {"category": "process"})
+    assert mem.lessons.gets == 0
+
+    pipeline = IngestPipeline(mem, batch_size=10, flush_interval=5.0)
+    futures = pipeline.submit_many("lessons", [(f"d{i}", "journal every trade", {}) for i in range(10)])
+    pipeline.close()
+
+    assert mem.lessons.gets == 1  # one read for the whole batch
+    assert {future.result() for future in futures} == {"l2"}
+
+
+def test_submit_after_close_never_hangs(memory):
+    mem, _ = memory
+    pipeline = IngestPipeline(mem, flush_interval=0.01)
+    futures, refused = [], []
+    started = threading.Event()
+
+    def producer(n):
+        for i in range(200):
+            try:
+                futures.append(pipeline.submit("cad_jobs", f"job_{n}_{i}", f"job {n} {i}"))
+            except RuntimeError:
+                refused.append(i)
+                return
+            started.set()
+
+    threads = [threading.Thread(target=producer, args=(n,)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    started.wait(5)
+    pipeline.close()
+    for thread in threads:
+        thread.join()
+
+    # Everything accepted before close is written; everything after is refused
+    assert all(future.result(timeout=5) for future in futures)
+    assert len(futures) + sum(200 - i for i in refused) == 800
+    assert pipeline.flush(timeout=5)
+    with pytest.raises(RuntimeError):
+        pipeline.submit("lessons", "late", "too late")
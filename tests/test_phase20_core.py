@@ -156,12 +156,22 @@ class TestKnowledgeGraph:
 class TestTelemetry:
     """Tests for telemetry and cost tracking."""
 
-    def test_telemetry_initialization(self):
+    @pytest.fixture(autouse=True)
+    def telemetry_dir(self, tmp_path, monkeypatch):
+        """Keep telemetry logs out of data/telemetry."""
+        from core.metrics import telemetry
+
+        monkeypatch.setenv("VULCAN_TELEMETRY_DIR", str(tmp_path))
+        monkeypatch.setattr(telemetry, "_telemetry", None)
+        return tmp_path
+
+    def test_telemetry_initialization(self, telemetry_dir):
         """Test Telemetry initialization."""
         from core.metrics.telemetry import Telemetry
 
         telemetry = Telemetry()
         assert telemetry is not None
+        assert telemetry.telemetry_dir == telemetry_dir
 
     def test_telemetry_singleton(self):
         """Test telemetry singleton pattern."""
@@ -0,0 +1,110 @@
+"""
+In-Memory Cache Fallback Tests
+
+InMemoryCache stands in for Redis when it is unavailable: it must evict
+least recently used entries by count and by memory, expire entries in the
+background and keep working behind RedisCacheAdapter.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.redis_adapter import InMemoryCache, RedisCacheAdapter
+
+
+def test_least_recently_used_entries_are_evicted():
+    cache = InMemoryCache(max_size=3, sweep_interval=0)
+    for key in "abc":
+        cache.set(key, key.upper())
+    assert cache.get("a") == "A"  # Now most recent
+
+    cache.set("d", "D")
+    assert cache.get("b") is None
+    assert [cache.get(k) for k in "acd"] == ["A", "C", "D"]
+
+    stats = cache.stats()
+    assert (stats["keys"], stats["evictions"], stats["hits"], stats["misses"]) == (3, 1, 4, 1)
+    assert stats["hit_rate"] == 0.8
+
+
+def test_memory_cap_evicts_and_accounts():
+    entry = "x" * 1000
+    per_entry = InMemoryCache(sweep_interval=0)
+    per_entry.set("k0", entry)
+    size = per_entry.stats()["used_memory"]
+    assert size > 1000
+
+    cache = InMemoryCache(max_size=1000, max_memory=size * 4, sweep_interval=0)
+    for i in range(10):
+        cache.setex(f"k{i}", 60, entry)
+    stats = cache.stats()
+    assert stats["keys"] == 4 and stats["used_memory"] == size * 4
+    assert [cache.get(f"k{i}") is not None for i in range(10)] == [False] * 6 + [True] * 4
+
+    assert cache.delete("k9") == 1 and cache.delete("k9") == 0
+    assert cache.stats()["used_memory"] == size * 3
+
+    # An entry over the whole budget is refused rather than flushing everything
+    assert not cache.set("huge", "x" * (size * 5))
+    assert cache.stats()["rejected"] == 1 and len(cache) == 3
+
+
+def test_ttls():
+    cache = InMemoryCache(sweep_interval=0)
+    cache.set("short", "1", ttl=0.05)
+    cache.set("forever", "2", ttl=None)
+    cache.setex("long", 60, "3")
+    assert (cache.ttl("forever"), cache.ttl("missing")) == (-1, -2)
+    assert 59 <= cache.ttl("long") <= 60
+
+    time.sleep(0.1)
+    assert cache.get("short") is None
+    assert cache.get("forever") == "2" and cache.get("long") == "3"
+    assert cache.stats()["expirations"] == 1
+
+    # Overwriting with a longer TTL leaves a stale heap entry that must not expire the new value
+    cache.set("k", "old", ttl=0.05)
+    cache.set("k", "new", ttl=60)
+    time.sleep(0.1)
+    assert cache.expire() == 0
+    assert cache.get("k") == "new"
+
+
+def test_background_sweep_removes_expired_entries():
+    cache = InMemoryCache(sweep_interval=0.05)
+    for i in range(50):
+        cache.set(f"k{i}", "v", ttl=0.05)
+    cache.set("keep", "v", ttl=60)
+    deadline = time.monotonic() + 5
+    while len(cache) > 1 and time.monotonic() < deadline:
+        time.sleep(0.05)
+    cache.close()
+
+    assert len(cache) == 1
+    stats = cache.stats()
+    assert stats["expirations"] == 50 and stats["misses"] == 0  # Nothing was read
+
+
+def test_stale_heap_entries_stay_bounded():
+    cache = InMemoryCache(max_size=10, sweep_interval=0)
+    for i in range(5000):
+        cache.set(f"k{i % 10}", str(i), ttl=60)
+    assert len(cache._heap) <= 2 * len(cache) + 64 + 1
+
+
+def test_drop_in_behind_the_adapter():
+    adapter = RedisCacheAdapter(url="redis://unused")
+    adapter._client = InMemoryCache(sweep_interval=0)
+    adapter._available = False
+
+    assert adapter.set("config", {"units": "in"}, ttl=60)
+    assert adapter.get("config") == {"units": "in"}
+    assert adapter.delete("config")
+    assert adapter.get("config") is None
+
+    health = adapter.health()
+    assert health["type"] == "in-memory-fallback" and "items" in health["used_memory"]
+    assert adapter.client.info("memory")["maxmemory_policy"] == "allkeys-lru"
@@ -0,0 +1,125 @@
+"""
+Rules Engine Tests
+
+Compiled rule plans and batch evaluation must report the same violations
+as evaluating every rule against every record.
+"""
+
+import os
+import random
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.cad_agent.data_hub.rules_engine import (
+    VECTORIZE_MIN_RECORDS,
+    CompiledRule,
+    RuleOperator,
+    RulesEngine,
+    RuleSeverity,
+    ValidationRule,
+)
+
+
+def make_rule(rule_id, field, operator, value, tags=(), standard="TEST"):
+    return ValidationRule(
+        id=rule_id, name=rule_id, description="", standard=standard, section="1.1",
+        severity=RuleSeverity.ERROR, field=field, operator=operator, value=value,
+        message=f"{rule_id} failed", tags=list(tags),
+    )
+
+
+def violation_keys(violations):
+    # repr so NaN values compare equal
+    return [(v.rule_id, repr(v.actual_value), repr(v.expected_value)) for v in violations]
+
+
+@pytest.fixture
+def engine():
+    engine = RulesEngine(rules_dir=Path("/nonexistent"))
+    engine.add_rule(make_rule("MIN", "thickness", RuleOperator.GREATER_THAN_OR_EQUAL, 0.25, tags=["plate"]))
+    engine.add_rule(make_rule("SPACING", "spacing", RuleOperator.GREATER_THAN_OR_EQUAL,
+                              {"multiplier": 3, "base_field": "bolt.diameter"}, tags=["bolt", "plate"]))
+    engine.add_rule(make_rule("GRADE", "material", RuleOperator.MATCHES, r"^A\d+", tags=["plate"]))
+    engine.add_rule(make_rule("SIZE", "bolt.diameter", RuleOperator.IN, [0.5, 0.75, 1.0], tags=["bolt"]))
+    return engine
+
+
+def test_compiled_rule_reports_violation(engine):
+    plan = CompiledRule(engine.get_rule("MIN"))
+    assert plan.evaluate({"thickness": 0.5}) is None
+    assert plan.evaluate({}) is None
+
+    violation = plan.evaluate({"thickness": 0.1})
+    assert (violation.rule_id, violation.actual_value, violation.expected_value) == ("MIN", 0.1, 0.25)
+    assert violation.standard_reference == "TEST 1.1"
+
+
+def test_dotted_fields_and_multipliers(engine):
+    data = {"spacing": 2.0, "bolt": {"diameter": 0.875}, "material": "SS304", "thickness": 0.5}
+    violations = engine.evaluate(data)
+    assert [(v.rule_id, v.actual_value, v.expected_value) for v in violations] == [
+        ("SPACING", 2.0, 2.625), ("GRADE", "SS304", r"^A\d+"), ("SIZE", 0.875, [0.5, 0.75, 1.0]),
+    ]
+    # Non-dict in the middle of a path reads as absent
+    assert engine.evaluate({"bolt": 5}, rules=[engine.get_rule("SIZE")]) == []
+
+
+def test_value_resolution_order():
+    # Multiplier wins when its base field is present, then lookup, then formula
+    rule = make_rule("X", "edge", RuleOperator.GREATER_THAN_OR_EQUAL,
+                     {"multiplier": 2, "base_field": "d", "lookup": "edge_distance_table"})
+    plan = CompiledRule(rule)
+    assert plan.evaluate({"edge": 0, "d": 1.5}).expected_value == 3.0
+    assert plan.evaluate({"edge": 0, "bolt_diameter": 0.5}).expected_value == 0.75
+
+    unknown = CompiledRule(make_rule("Y", "edge", RuleOperator.EQUALS, {"formula": "no_such_formula"}))
+    assert unknown.evaluate({"edge": 1}).expected_value is None
+
+
+def test_type_errors_and_unknown_operators_fail_the_rule():
+    assert CompiledRule(make_rule("A", "x", RuleOperator.GREATER_THAN, 1)).evaluate({"x": "big"}) is not None
+    assert CompiledRule(make_rule("B", "x", "approximately", 1)).evaluate({"x": 1}) is not None
+
+
+def test_tag_selection_dedupes_rules(engine):
+    violations = engine.evaluate({"spacing": 0.1, "bolt": {"diameter": 1.0}}, tags=["plate", "bolt"])
+    assert [v.rule_id for v in violations] == ["SPACING"]
+    assert [v.rule_id for v in engine.evaluate({"thickness": 0}, standard="TEST")] == ["MIN"]
+
+
+def test_replacing_a_rule_updates_indexes_and_plan(engine):
+    engine.add_rule(make_rule("MIN", "thickness", RuleOperator.GREATER_THAN_OR_EQUAL, 1.0, tags=["bolt"]))
+    assert [r.id for r in engine.get_rules_by_tag("plate")] == ["SPACING", "GRADE"]
+    assert [r.id for r in engine.get_rules_by_standard("TEST")].count("MIN") == 1
+    assert [v.rule_id for v in engine.evaluate({"thickness": 0.5}, tags=["bolt"])] == ["MIN"]
+
+
+def test_disabled_rules_are_skipped(engine):
+    engine.get_rule("MIN").enabled = False
+    assert engine.evaluate({"thickness": 0}) == []
+    assert engine.evaluate_batch([{"thickness": 0}]) == [[]]
+
+
+@pytest.mark.parametrize("count", [5, VECTORIZE_MIN_RECORDS * 4])
+def test_batch_matches_per_record_evaluate(engine, count):
+    rng = random.Random(count)
+    engine.add_rule(make_rule("NE", "thickness", RuleOperator.NOT_EQUALS, 0.5))
+    engine.add_rule(make_rule("BIG", "spacing", RuleOperator.LESS_THAN, {"multiplier": 1e300, "base_field": "scale"}))
+    pool = [None, 0, 0.5, 0.1, 2, True, "0.5", 2 ** 60, float("nan"), float("inf"), [1]]
+    records = []
+    for _ in range(count):
+        record = {"thickness": rng.choice(pool), "spacing": rng.choice(pool), "material": rng.choice(["A36", "SS304", 7]),
+                  "scale": rng.choice([None, 0, 1.5, 2 ** 60, 10 ** 300, float("inf")])}
+        if rng.random() < 0.7:
+            record["bolt"] = {"diameter": rng.choice(pool)}
+        records.append({k: v for k, v in record.items() if v is not None})
+
+    batch = engine.evaluate_batch(records)
+    assert [violation_keys(v) for v in batch] == [violation_keys(engine.evaluate(r)) for r in records]
+
+    tagged = engine.evaluate_batch(records, tags=["bolt"])
+    assert [violation_keys(v) for v in tagged] == [violation_keys(engine.evaluate(r, tags=["bolt"])) for r in records]
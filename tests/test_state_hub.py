@@ -0,0 +1,215 @@
+"""
+SolidWorks State Hub Tests
+
+Tests for the shared state hub that replaces the watcher and ACHE polling
+loops, driven by a fake event source so they run without SolidWorks.
+"""
+
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "desktop_server"))
+
+from ache.event_listener import ACHEEventListener
+from watchers.solidworks_watcher import SolidWorksWatcher
+from watchers.state_hub import (
+    DocumentInfo,
+    DocumentType,
+    SolidWorksStateHub,
+    StateEvent,
+    StateSource,
+)
+
+
+class FakeDoc:
+    def __init__(self, path, doc_type=DocumentType.ASSEMBLY):
+        self.path = path
+        self.doc_type = doc_type
+
+
+class FakeSource(StateSource):
+    """Scriptable SolidWorks: a PID, an active document and optional events."""
+
+    name = "fake"
+
+    def __init__(self, events=False):
+        self.pid = None
+        self.active = None
+        self.events = events
+        self.notify = None
+        self.scans = 0
+        self.liveness_checks = 0
+        self.document_reads = 0
+
+    def find_process(self):
+        self.scans += 1
+        return self.pid
+
+    def process_alive(self, pid):
+        self.liveness_checks += 1
+        return pid == self.pid
+
+    def read_active_document(self):
+        self.document_reads += 1
+        if self.active is None:
+            return None
+        info = DocumentInfo(self.active.path, Path(self.active.path).name, self.active.doc_type)
+        return info, self.active
+
+    def subscribe_events(self, notify):
+        self.notify = notify if self.events else None
+        return self.events
+
+    def unsubscribe_events(self):
+        self.notify = None
+
+    # Test helpers: what SolidWorks would do
+    def launch(self, pid=4242):
+        self.pid = pid
+
+    def open_document(self, path):
+        self.active = FakeDoc(path)
+        if self.notify:
+            self.notify("opened", path)
+
+    def switch_to(self, path):
+        self.active = FakeDoc(path)
+        if self.notify:
+            self.notify("activated")
+
+    def save(self):
+        if self.notify:
+            self.notify("saved", self.active.path)
+
+    def exit(self):
+        self.pid = None
+        self.active = None
+        if self.notify:
+            self.notify("exited")
+
+
+@pytest.fixture
+def source():
+    return FakeSource()
+
+
+@pytest.fixture
+def hub(source):
+    return SolidWorksStateHub(source, min_interval=1.0, max_interval=8.0, event_interval=30.0)
+
+
+def recorder(hub):
+    changes = []
+    hub.subscribe(changes.append)
+    return changes
+
+
+def test_idle_polling_backs_off_and_scans_only_without_pid(hub, source):
+    intervals = [hub.poll_once() for _ in range(6)]
+    assert intervals == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0]
+    assert source.scans == 6
+
+    source.launch()
+    assert hub.poll_once() == 1.0  # change resets the interval
+    for _ in range(5):
+        hub.poll_once()
+    assert source.scans == 7  # the cached PID is checked with pid_exists instead
+    assert source.liveness_checks == 5
+
+
+def test_poll_fallback_reports_document_changes(hub, source):
+    changes = recorder(hub)
+    source.launch()
+    source.open_document("C:/jobs/ACHE-100.SLDASM")
+    hub.poll_once()
+    source.switch_to("C:/jobs/HEADER.SLDPRT")
+    hub.poll_once()
+    hub.poll_once()  # nothing new
+    source.exit()
+    hub.poll_once()
+
+    assert [c.event for c in changes] == [StateEvent.STARTED, StateEvent.ACTIVATED, StateEvent.EXITED]
+    assert changes[0].state.document_path == "C:/jobs/ACHE-100.SLDASM"
+    assert changes[1].previous.document_path == "C:/jobs/ACHE-100.SLDASM"
+    assert changes[1].document.path == "C:/jobs/HEADER.SLDPRT"
+    assert hub.state.is_running is False and hub.state.document_path is None
+
+
+def test_events_replace_document_polling():
+    source = FakeSource(events=True)
+    hub = SolidWorksStateHub(source, event_interval=30.0)
+    changes = recorder(hub)
+
+    source.launch()
+    assert hub.poll_once() == 30.0
+    reads_after_hook = source.document_reads
+
+    source.open_document("C:/jobs/BUNDLE.SLDASM")
+    source.save()
+    source.exit()
+
+    assert [c.event for c in changes] == [
+        StateEvent.STARTED, StateEvent.OPENED, StateEvent.SAVED, StateEvent.EXITED,
+    ]
+    assert source.document_reads == reads_after_hook + 2  # one read per event, none per poll
+    assert hub.get_stats()["events_hooked"] is False
+
+
+def test_watcher_and_ache_listener_share_one_hub(hub, source):
+    hub.start = lambda: None  # drive polls from the test instead of the hub thread
+    watcher = SolidWorksWatcher(hub)
+    seen_by_watcher = []
+    watcher.register_callback(lambda state: seen_by_watcher.append(state.document_path))
+
+    listener = ACHEEventListener(hub=hub)
+    opened, activated, closed = [], [], []
+    listener.on_model_open(opened.append)
+    listener.on_model_activate(activated.append)
+    listener.on_model_close(closed.append)
+
+    async def run():
+        await watcher.start()
+        assert listener.start() is True
+        source.launch()
+        source.open_document("C:/jobs/ACHE-100.SLDASM")
+        hub.poll_once()
+        source.switch_to("C:/jobs/PLENUM.SLDPRT")
+        hub.poll_once()
+        source.exit()
+        hub.poll_once()
+        watcher.stop()
+        listener.stop()
+
+    watcher._on_solidworks_started = lambda: None  # don't open a browser
+    asyncio.run(run())
+
+    assert seen_by_watcher == ["C:/jobs/ACHE-100.SLDASM", "C:/jobs/PLENUM.SLDPRT", None]
+    assert [e.filename for e in opened] == ["ACHE-100.SLDASM"]
+    assert [e.model_type for e in opened] == ["assembly"]
+    assert [e.filename for e in activated] == ["PLENUM.SLDPRT"]
+    assert closed == ["C:/jobs/PLENUM.SLDPRT"]
+    assert hub.get_stats()["subscribers"] == 0
+
+
+def test_hub_thread_stops_promptly(hub):
+    hub.max_interval = 60.0
+    hub.start()
+    assert any(t.name == "vulcan-sw-state" for t in threading.enumerate())
+    hub.stop(timeout=2)
+    assert not hub.is_running
+
+
+def test_file_open_is_forwarded_once():
+    from com.events import SolidWorksAppEvents
+
+    sink = SolidWorksAppEvents()
+    events = []
+    sink.notify = lambda event, path: events.append((event, path))
+    sink.OnFileOpenNotify("C:/jobs/header.sldasm")
+    sink.OnFileOpenPostNotify("C:/jobs/header.sldasm")
+
+    assert events == [("opened", "C:/jobs/header.sldasm")]
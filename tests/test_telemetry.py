@@ -0,0 +1,142 @@
+"""
+Telemetry Tests
+
+Tests for the write-behind JSONL telemetry log and its rolling
+per-model aggregates.
+"""
+
+import json
+import sys
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from core.metrics.telemetry import Telemetry
+
+SONNET = "claude-sonnet-4-20250514"
+HAIKU = "claude-3-haiku-20240307"
+
+
+@pytest.fixture
+def make_telemetry(tmp_path):
+    instances = []
+
+    def make(**kwargs):
+        kwargs.setdefault("flush_interval", 60.0)
+        telemetry = Telemetry(telemetry_dir=tmp_path, **kwargs)
+        instances.append(telemetry)
+        return telemetry
+
+    yield make
+    for telemetry in instances:
+        telemetry.close()
+
+
+def record_some(telemetry):
+    for i in range(10):
+        telemetry.record(SONNET, "/api/chat", 1000, 500, 100.0 + i)
+    telemetry.record(HAIKU, "/api/chat", 200, 100, 50.0, success=False, error="timeout")
+
+
+def today_file(tmp_path, suffix):
+    return tmp_path / f"telemetry_{datetime.utcnow():%Y%m%d}{suffix}"
+
+
+def test_record_is_write_behind(make_telemetry, tmp_path):
+    telemetry = make_telemetry()
+    record_some(telemetry)
+
+    assert not today_file(tmp_path, ".jsonl").exists()
+    stats = telemetry.get_daily_stats()
+    assert stats["calls"] == 11
+    assert stats["errors"] == 1
+    assert stats["by_model"][SONNET]["tokens"] == 15000
+
+    telemetry.flush()
+    lines = today_file(tmp_path, ".jsonl").read_text().splitlines()
+    assert len(lines) == 11
+    assert json.loads(lines[-1])["error"] == "timeout"
+
+
+def test_background_flush_on_batch(make_telemetry, tmp_path):
+    telemetry = make_telemetry(flush_batch=5)
+    record_some(telemetry)
+
+    log_file = today_file(tmp_path, ".jsonl")
+    for _ in range(100):
+        if log_file.exists():
+            break
+        time.sleep(0.05)
+    assert log_file.exists()
+
+
+def test_reload_matches_and_replays_tail(make_telemetry, tmp_path):
+    telemetry = make_telemetry()
+    record_some(telemetry)
+    telemetry.flush()
+    expected = telemetry.get_daily_stats()
+
+    # A line written after the summary (e.g. crash before the summary rewrite)
+    extra = {
+        "timestamp": datetime.utcnow().isoformat(), "model": HAIKU, "endpoint": "/api/chat",
+        "input_tokens": 10, "output_tokens": 10, "latency_ms": 5.0, "success": True,
+        "error": None, "metadata": {},
+    }
+    with open(today_file(tmp_path, ".jsonl"), "a") as f:
+        f.write(json.dumps(extra) + "\n")
+        f.write('{"timestamp": "20')  # torn line
+
+    reloaded = make_telemetry()
+    stats = reloaded.get_daily_stats()
+    assert stats["calls"] == expected["calls"] + 1
+    assert stats["total_tokens"] == expected["total_tokens"] + 20
+    assert reloaded.get_model_breakdown()[SONNET] == telemetry.get_model_breakdown()[SONNET]
+    assert reloaded.estimate_monthly_cost() == pytest.approx(telemetry.estimate_monthly_cost())
+
+
+def test_legacy_daily_json_is_read(make_telemetry, tmp_path):
+    legacy = {
+        "date": datetime.utcnow().strftime("%Y-%m-%d"),
+        "calls": [{
+            "timestamp": datetime.utcnow().isoformat(), "model": SONNET, "endpoint": "/api/chat",
+            "input_tokens": 1_000_000, "output_tokens": 0, "latency_ms": 10.0, "success": True,
+            "error": None, "metadata": {},
+        }],
+    }
+    today_file(tmp_path, ".json").write_text(json.dumps(legacy))
+
+    telemetry = make_telemetry()
+    telemetry.record(SONNET, "/api/chat", 1_000_000, 0, 10.0)
+    telemetry.flush()
+
+    assert telemetry.get_daily_stats()["total_cost"] == pytest.approx(6.0)
+    assert make_telemetry().get_daily_stats()["total_cost"] == pytest.approx(6.0)
+
+
+def test_days_outside_window_read_from_disk(make_telemetry, tmp_path):
+    old = datetime.utcnow() - timedelta(days=30)
+    line = {
+        "timestamp": old.isoformat(), "model": SONNET, "endpoint": "/api/chat",
+        "input_tokens": 5, "output_tokens": 5, "latency_ms": 1.0, "success": True,
+        "error": None, "metadata": {},
+    }
+    (tmp_path / f"telemetry_{old:%Y%m%d}.jsonl").write_text(json.dumps(line) + "\n")
+
+    telemetry = make_telemetry()
+    assert telemetry.get_weekly_stats()["calls"] == 0
+    assert telemetry.get_daily_stats(old)["calls"] == 1
+
+
+def test_memory_is_bounded(make_telemetry):
+    telemetry = make_telemetry(flush_batch=10 ** 9)
+    for i in range(5000):
+        telemetry.record(SONNET if i % 2 else HAIKU, "/api/chat", 10, 10, 1.0)
+    telemetry.flush()
+
+    assert not hasattr(telemetry, "_calls")
+    assert len(telemetry._pending) == 0
+    assert sum(len(models) for models in telemetry._hours.values()) <= 4  # 2 models, <= 2 hours